@@ -117,6 +117,13 @@ class FluentUIBuilder:
 
         return True
 
+    def precompile_theme(self):
+        """Precompile theme tokens and stylesheets into the style cache"""
+        print("🎨 Precompiling theme styles...")
+        precompile_script = self.project_root / "tools" / "precompile_theme.py"
+        return self.run_command(f"{self.python_exe} {precompile_script}",
+                                "Precompiling theme styles")
+
     def generate_docs(self):
         """Generate documentation"""
         print("📚 Generating documentation...")
@@ -231,7 +238,8 @@ def main():
         description="Build and test Fluent UI Components")
     parser.add_argument('command', nargs='?', default='build',
                         choices=['build', 'test', 'benchmark', 'demo', 'docs', 'clean',
-                                 'lint', 'package', 'install-deps', 'check-deps'],
+                                 'lint', 'package', 'install-deps', 'check-deps',
+                                 'precompile-theme'],
                         help='Command to run')
 
     args = parser.parse_args()
@@ -247,7 +255,8 @@ def main():
         'lint': builder.lint_code,
         'package': builder.package,
         'install-deps': builder.install_dependencies,
-        'check-deps': builder.check_dependencies
+        'check-deps': builder.check_dependencies,
+        'precompile-theme': builder.precompile_theme
     }
 
     if args.command in commands:
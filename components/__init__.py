@@ -12,13 +12,31 @@ This package provides a comprehensive set of UI components organized by function
 - dialogs: Dialog and popup components
 """
 
-from . import basic
-from . import data
-from . import interface
-from . import layout
-from . import controls
-from . import composite
-from . import dialogs
+import os as _os
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+# Profile startup from the first import on (see core.startup_profile)
+if _os.environ.get("FLUENT_STARTUP_PROFILE"):
+    from core.startup_profile import install_from_env as _install_startup_profiler
+    _install_startup_profiler()
+
+if TYPE_CHECKING:
+    from . import basic
+    from . import data
+    from . import interface
+    from . import layout
+    from . import controls
+    from . import composite
+    from . import dialogs
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=[
+        "basic", "data", "interface", "layout", "controls", "composite", "dialogs",
+    ],
+)
 
 __all__ = [
     'basic', 'data', 'interface', 'layout', 'controls', 'composite', 'dialogs'
@@ -3,30 +3,53 @@ Base classes for Fluent Design components
 Provides consistent patterns for component behavior, styling, and interactions
 """
 
-from .fluent_control_base import (
-    FluentControlBase,
-    FluentInputBase, 
-    FluentContainerBase,
-    FluentNavigationBase,
-    FluentThemeAware,
-    # Type aliases
-    FluentWidget,
-)
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .fluent_control_base import (
+        FluentControlBase,
+        FluentInputBase,
+        FluentContainerBase,
+        FluentNavigationBase,
+        FluentThemeAware,
+        # Type aliases
+        FluentWidget,
+    )
+
+    from .fluent_component_interface import (
+        IFluentComponent,
+        IFluentThemeable,
+        IFluentAnimatable,
+        IFluentAccessible,
+        IFluentStateful,
+        IFluentValidatable,
+        IFluentResizable,
+        IFluentSelectable,
+        IFluentContainer,
+        FluentComponentMixin,
+        FluentComponentState,
+        FluentComponentSize,
+        FluentComponentVariant
+    )
 
-from .fluent_component_interface import (
-    IFluentComponent,
-    IFluentThemeable,
-    IFluentAnimatable,
-    IFluentAccessible,
-    IFluentStateful,
-    IFluentValidatable,
-    IFluentResizable,
-    IFluentSelectable,
-    IFluentContainer,
-    FluentComponentMixin,
-    FluentComponentState,
-    FluentComponentSize,
-    FluentComponentVariant
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["fluent_control_base", "fluent_component_interface"],
+    exports={
+        "fluent_control_base": [
+            "FluentControlBase", "FluentInputBase", "FluentContainerBase",
+            "FluentNavigationBase", "FluentThemeAware", "FluentWidget",
+        ],
+        "fluent_component_interface": [
+            "IFluentComponent", "IFluentThemeable", "IFluentAnimatable",
+            "IFluentAccessible", "IFluentStateful", "IFluentValidatable",
+            "IFluentResizable", "IFluentSelectable", "IFluentContainer",
+            "FluentComponentMixin", "FluentComponentState", "FluentComponentSize",
+            "FluentComponentVariant",
+        ],
+    },
 )
 
 __all__ = [
@@ -42,7 +42,7 @@ class FluentControlBase(FluentBaseWidget):
         # Theme integration
         self._theme_tokens = {}
         self._cached_styles = {}
-        self._theme_version = 0
+        self._theme_version = -1  # theme version the cached styles belong to
 
         # Animation system
         self._animations = {}
@@ -73,7 +73,7 @@ class FluentControlBase(FluentBaseWidget):
     def _connect_theme_changes(self):
         """Connect to theme change notifications"""
         if theme_manager:
-            theme_manager.theme_changed.connect(self._on_theme_changed)
+            self._register_theme_updates()
 
     def _setup_base_animations(self):
         """Setup common animations for state transitions"""
@@ -113,14 +113,12 @@ class FluentControlBase(FluentBaseWidget):
             "elevation": 2       # Fallback value for elevation
         }
 
-        # Update theme version for cache invalidation
-        self._theme_version = getattr(theme_manager, '_version', 0)
-
     def _apply_theme(self):
         """Apply theme to the control"""
         # Clear style cache if theme changed
         if self._should_invalidate_cache():
             self._cached_styles.clear()
+            self._theme_version = theme_manager.get_theme_version()
 
         # Apply themed styles
         self._apply_themed_styles()
@@ -128,8 +126,7 @@ class FluentControlBase(FluentBaseWidget):
 
     def _should_invalidate_cache(self) -> bool:
         """Check if style cache should be invalidated"""
-        current_version = getattr(theme_manager, '_version', 0)
-        return current_version != self._theme_version
+        return theme_manager.get_theme_version() != self._theme_version
 
     @abstractmethod
     def _apply_themed_styles(self):
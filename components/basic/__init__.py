@@ -9,33 +9,75 @@ This module provides basic UI components organized by functionality:
 - visual: Visual and media elements
 """
 
-# Import from organized submodules
-from .forms import *
-from .display import *
-from .navigation import *
-from .visual import *
-
-# Legacy imports for backward compatibility
-from .forms.button import FluentButton, FluentIconButton, FluentToggleButton
-from .forms.textbox import FluentLineEdit, FluentTextEdit, FluentPasswordEdit, FluentSearchBox
-from .forms.checkbox import FluentCheckBox, FluentRadioButton, FluentRadioGroup
-from .display.tooltip import FluentTooltip, TooltipMixin
-from .visual.rating import EnhancedFluentRating as FluentRating
-from .navigation.tabs import FluentTabWidget, FluentTabButton
-from .display.card import FluentCard
-from .navigation.accordion import FluentAccordion, FluentAccordionItem
-from .navigation.divider import FluentDivider, FluentSeparator, FluentSection
-from .visual.avatar import FluentAvatar, FluentAvatarGroup
-from .navigation.timeline import FluentTimeline, FluentTimelineItem
-from .forms.switch import FluentSwitch as FluentModernSwitch, FluentSwitchGroup
-from .display.loading import (FluentSpinner, FluentDotLoader, FluentProgressRing, 
-                      FluentLoadingOverlay, FluentPulseLoader)
-from .display.alert import EnhancedFluentAlert as FluentAlert, EnhancedFluentNotification as FluentNotification, FluentMessageBar, AlertType
-from .display.badge import FluentBadge, FluentTag
-from .navigation.pagination import FluentPagination, FluentSimplePagination
-from .display.label import (FluentLabel, FluentIconLabel, FluentStatusLabel, 
-                    FluentLinkLabel, FluentLabelGroup)
-from .forms.switch import FluentSwitch
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    # Import from organized submodules
+    from .forms import *
+    from .display import *
+    from .navigation import *
+    from .visual import *
+
+    # Legacy imports for backward compatibility
+    from .forms.button import FluentButton, FluentIconButton, FluentToggleButton
+    from .forms.textbox import FluentLineEdit, FluentTextEdit, FluentPasswordEdit, FluentSearchBox
+    from .forms.checkbox import FluentCheckBox, FluentRadioButton, FluentRadioGroup
+    from .display.tooltip import FluentTooltip, TooltipMixin
+    from .visual.rating import EnhancedFluentRating as FluentRating
+    from .navigation.tabs import FluentTabWidget, FluentTabButton
+    from .display.card import FluentCard
+    from .navigation.accordion import FluentAccordion, FluentAccordionItem
+    from .navigation.divider import FluentDivider, FluentSeparator, FluentSection
+    from .visual.avatar import FluentAvatar, FluentAvatarGroup
+    from .navigation.timeline import FluentTimeline, FluentTimelineItem
+    from .forms.switch import FluentSwitch as FluentModernSwitch, FluentSwitchGroup
+    from .display.loading import (FluentSpinner, FluentDotLoader, FluentProgressRing,
+                          FluentLoadingOverlay, FluentPulseLoader)
+    from .display.alert import EnhancedFluentAlert as FluentAlert, EnhancedFluentNotification as FluentNotification, FluentMessageBar, AlertType
+    from .display.badge import FluentBadge, FluentTag
+    from .navigation.pagination import FluentPagination, FluentSimplePagination
+    from .display.label import (FluentLabel, FluentIconLabel, FluentStatusLabel,
+                        FluentLinkLabel, FluentLabelGroup)
+    from .forms.switch import FluentSwitch
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["forms", "display", "navigation", "visual"],
+    exports={
+        "forms.button": ["FluentButton", "FluentIconButton", "FluentToggleButton"],
+        "forms.textbox": [
+            "FluentLineEdit", "FluentTextEdit", "FluentPasswordEdit", "FluentSearchBox",
+        ],
+        "forms.checkbox": ["FluentCheckBox", "FluentRadioButton", "FluentRadioGroup"],
+        "display.tooltip": ["FluentTooltip", "TooltipMixin"],
+        "navigation.tabs": ["FluentTabWidget", "FluentTabButton"],
+        "display.card": ["FluentCard"],
+        "navigation.accordion": ["FluentAccordion", "FluentAccordionItem"],
+        "navigation.divider": ["FluentDivider", "FluentSeparator", "FluentSection"],
+        "visual.avatar": ["FluentAvatar", "FluentAvatarGroup"],
+        "navigation.timeline": ["FluentTimeline", "FluentTimelineItem"],
+        "forms.switch": ["FluentSwitchGroup", "FluentSwitch"],
+        "display.loading": [
+            "FluentSpinner", "FluentDotLoader", "FluentProgressRing",
+            "FluentLoadingOverlay", "FluentPulseLoader",
+        ],
+        "display.alert": ["FluentMessageBar", "AlertType"],
+        "display.badge": ["FluentBadge", "FluentTag"],
+        "navigation.pagination": ["FluentPagination", "FluentSimplePagination"],
+        "display.label": [
+            "FluentLabel", "FluentIconLabel", "FluentStatusLabel", "FluentLinkLabel",
+            "FluentLabelGroup",
+        ],
+    },
+    aliases={
+        "FluentRating": ("visual.rating", "EnhancedFluentRating"),
+        "FluentModernSwitch": ("forms.switch", "FluentSwitch"),
+        "FluentAlert": ("display.alert", "EnhancedFluentAlert"),
+        "FluentNotification": ("display.alert", "EnhancedFluentNotification"),
+    },
+)
 
 __all__ = [
     'FluentButton', 'FluentIconButton', 'FluentToggleButton',
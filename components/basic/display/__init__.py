@@ -7,14 +7,62 @@ Visual display and feedback elements including:
 - Visual feedback elements
 """
 
-from .alert import *
-from .badge import *
-from .card import *
-from .chip import *
-from .label import *
-from .progress import *
-from .loading import *
-from .tooltip import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .alert import *
+    from .badge import *
+    from .card import *
+    from .chip import *
+    from .label import *
+    from .progress import *
+    from .loading import *
+    from .tooltip import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=[
+        "alert", "badge", "card", "chip", "label", "progress", "loading", "tooltip",
+    ],
+    exports={
+        "alert": [
+            "AlertType", "AlertPriority", "AlertObjectPool", "AlertManager",
+            "alert_manager", "EnhancedFluentAlert", "EnhancedFluentNotification",
+            "FluentMessageBar", "create_info_alert", "create_success_alert",
+            "create_warning_alert", "create_error_alert", "create_critical_alert",
+            "show_notification",
+        ],
+        "badge": ["FluentBadge", "FluentTag", "FluentStatusIndicator"],
+        "card": ["FluentCardMetrics", "FluentCard", "ExpandableFluentCard"],
+        "chip": ["FluentChip", "FluentChipGroup", "FluentFilterChip"],
+        "label": [
+            "FluentLabel", "FluentIconLabel", "FluentStatusLabel", "FluentLinkLabel",
+            "FluentLabelGroup",
+        ],
+        "progress": ["FluentProgressBar", "FluentSlider", "FluentRangeSlider"],
+        "loading": [
+            "FluentSpinner", "FluentDotLoader", "FluentProgressRing",
+            "FluentLoadingOverlay", "FluentPulseLoader",
+        ],
+        "tooltip": [
+            "FluentTooltip", "FluentTooltipManager", "tooltip_manager", "TooltipMixin",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "AnimationHelper": ("label", "AnimationHelper"),
+        "FluentAnimation": ("tooltip", "FluentAnimation"),
+        "FluentMicroInteraction": ("chip", "FluentMicroInteraction"),
+        "FluentRevealEffect": ("loading", "FluentRevealEffect"),
+        "FluentSequence": ("card", "FluentSequence"),
+        "FluentStateTransition": ("chip", "FluentStateTransition"),
+        "FluentTransition": ("loading", "FluentTransition"),
+        "ThemeMode": ("card", "ThemeMode"),
+        "theme_manager": ("tooltip", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all display classes and functions
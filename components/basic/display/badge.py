@@ -9,6 +9,7 @@ from PySide6.QtGui import QFont, QPainter, QPainterPath, QColor, QBrush, QPen
 from core.theme import theme_manager, ThemeMode
 from core.enhanced_animations import (FluentTransition, FluentMicroInteraction,
                                       FluentRevealEffect, FluentSequence)
+from core.performance_profile import get_performance_profile
 from typing import Optional, Dict
 import weakref
 
@@ -836,8 +837,8 @@ class FluentStatusIndicator(QWidget):
     def paintEvent(self, event):
         """Custom paint with enhanced styling and anti-aliasing"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, get_performance_profile().antialiasing())
 
         # Draw status indicator with subtle shadow
         color = QColor(self._get_status_color())
@@ -4,7 +4,7 @@ Advanced animations, performance optimization, responsive layout, and theme inte
 """
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
-                              QGraphicsDropShadowEffect, QSizePolicy, QStackedWidget,
+                              QSizePolicy, QStackedWidget,
                               QGraphicsOpacityEffect, QApplication, QScrollArea, QPushButton)
 from PySide6.QtCore import (Qt, Signal, QPropertyAnimation, Property, QByteArray, 
                            QTimer, QParallelAnimationGroup, QSequentialAnimationGroup,
@@ -15,6 +15,7 @@ from PySide6.QtGui import (QPainter, QPainterPath, QColor, QBrush, QPixmap, QFon
                           QResizeEvent, QMouseEvent, QFontMetrics)
 from core.theme import theme_manager, ThemeMode
 from core.animation import FluentAnimation
+from core.shadow import FluentShadowWidget
 from core.enhanced_animations import (FluentTransition, FluentMicroInteraction,
                                       FluentRevealEffect, FluentSequence)
 from typing import Optional, Dict, Any, List, Callable, Union, Tuple, Set
@@ -291,10 +292,9 @@ class FluentCard(QFrame):
         self._active_animations.add(entrance_sequence)
         
     def _setup_optimized_shadow(self):
-        """Setup optimized drop shadow effect with enhanced caching and performance"""
-        self._shadow = QGraphicsDropShadowEffect(self)
+        """Setup cached nine-patch shadow painted under the card"""
+        self._shadow = FluentShadowWidget(self, self._corner_radius)
         self._update_optimized_shadow()
-        self.setGraphicsEffect(self._shadow)
         
     def _update_optimized_shadow(self):
         """Update shadow with enhanced parameters and more efficient caching"""
@@ -313,21 +313,10 @@ class FluentCard(QFrame):
             self._shadow.setColor(cached['color'])
             return
 
-        # Calculate improved shadow parameters for better visuals
-        blur_radius = max(1, self._current_elevation * 2.0)  # More subtle blur
-        offset_y = max(0, int(self._current_elevation * 0.7))  # More natural offset
+        # Shadow parameters come from the theme's elevation tokens
+        blur_radius, offset_y, shadow_color = theme.get_elevation_shadow(self._current_elevation)
         offset_x = 0  # Keep horizontal offset at 0 for cleaner look
 
-        # Generate shadow color based on theme mode
-        if theme.get_theme_mode() == ThemeMode.LIGHT:
-            shadow_color = QColor(0, 0, 0)
-            alpha = min(80, int(30 + self._current_elevation * 6))
-        else:
-            shadow_color = QColor(0, 0, 0)
-            alpha = min(120, int(50 + self._current_elevation * 8))
-            
-        shadow_color.setAlpha(alpha)
-
         # Cache shadow parameters
         self._shadow_cache[elevation_key] = {
             'blur': blur_radius,
@@ -509,6 +498,7 @@ class FluentCard(QFrame):
             # Clear style cache to force refresh
             self._style_cache.clear()
             self._setup_optimized_style()
+            self._shadow.setCornerRadius(new_radius)
             
             # Animate radius change with subtle effect
             if self.isVisible():
@@ -871,6 +861,7 @@ class FluentCard(QFrame):
     def showEvent(self, event):
         """Enhanced show event with optimized animations"""
         super().showEvent(event)
+        self._shadow.sync()
         
         # Reset metrics collection
         self._render_times.clear()
@@ -883,6 +874,7 @@ class FluentCard(QFrame):
     def hideEvent(self, event):
         """Enhanced hide event with cleanup"""
         super().hideEvent(event)
+        self._shadow.sync()
         
         # Pause any running animations when hidden
         for group in [self._hover_group, self._press_group, 
@@ -890,6 +882,16 @@ class FluentCard(QFrame):
             if group and group.state() == QParallelAnimationGroup.State.Running:
                 group.pause()
                 
+    def moveEvent(self, event):
+        """Keep the shadow under the card"""
+        super().moveEvent(event)
+        self._shadow.sync()
+
+    def resizeEvent(self, event: QResizeEvent):
+        """Keep the shadow under the card"""
+        super().resizeEvent(event)
+        self._shadow.sync()
+
     def closeEvent(self, event):
         """Enhanced close event with proper cleanup"""
         # Clean up resources
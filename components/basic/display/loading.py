@@ -8,12 +8,14 @@ Based on Windows 11 Fluent Design principles.
 from typing import Optional
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QGraphicsOpacityEffect
 from PySide6.QtCore import (Qt, QPropertyAnimation, QRect, Property, QEasingCurve,
-                            QParallelAnimationGroup, QByteArray, Signal, QPoint)
+                            QByteArray, Signal, QPoint)
 from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QConicalGradient, QPaintEvent
 
 from core.theme import theme_manager
 from core.animation import FluentAnimation
+from core.animation_clock import FluentClockAnimation
 from core.enhanced_animations import FluentTransition, FluentRevealEffect
+from core.performance_profile import get_performance_profile
 
 
 class FluentSpinner(QWidget):
@@ -41,13 +43,8 @@ class FluentSpinner(QWidget):
 
     def _setup_animation(self):
         """Set up animation."""
-        self._rotation_animation = QPropertyAnimation(
-            self, QByteArray(b"angle"))
-        self._rotation_animation.setDuration(1200)
-        self._rotation_animation.setStartValue(0)
-        self._rotation_animation.setEndValue(360)
-        self._rotation_animation.setLoopCount(-1)  # Infinite loop
-        self._rotation_animation.setEasingCurve(QEasingCurve.Type.Linear)
+        self._rotation_animation = FluentClockAnimation(
+            self, self._on_rotation_frame, duration=1200, loop_count=-1)
 
     def _connect_theme(self):
         """Connect to theme changes."""
@@ -67,6 +64,11 @@ class FluentSpinner(QWidget):
     # Property definition for Qt property animation
     angle = Property(int, getAngle, setAngle, None, "Rotation angle")
 
+    def _on_rotation_frame(self, progress: float):
+        # The animation clock repaints after the frame
+        self._angle = int(progress * 360) % 360
+        self.angleChanged.emit()
+
     def start(self):
         """Start spinning."""
         if not self._running:
@@ -102,7 +104,7 @@ class FluentSpinner(QWidget):
     def paintEvent(self, _event: QPaintEvent):
         """Paint the spinner."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         current_color = self._color if self._color else theme_manager.get_color(
             'accent')
@@ -153,13 +155,10 @@ class FluentDotLoader(QWidget):
 
     def _setup_animation(self):
         """Set up animation."""
-        self._phase_animation = QPropertyAnimation(self, QByteArray(b"phase"))
-        self._phase_animation.setDuration(
-            self._dot_count * 400)  # Adjust speed as needed
-        self._phase_animation.setStartValue(0.0)
-        self._phase_animation.setEndValue(float(self._dot_count))
-        self._phase_animation.setLoopCount(-1)
-        self._phase_animation.setEasingCurve(QEasingCurve.Type.Linear)
+        self._phase_animation = FluentClockAnimation(
+            self, self._on_phase_frame,
+            duration=self._dot_count * 400,  # Adjust speed as needed
+            loop_count=-1)
 
     def _connect_theme(self):
         """Connect to theme changes."""
@@ -178,6 +177,11 @@ class FluentDotLoader(QWidget):
     # Property definition for Qt property animation
     phase = Property(float, getPhase, setPhase, None, "Animation phase")
 
+    def _on_phase_frame(self, progress: float):
+        # The animation clock repaints after the frame
+        self._phase = progress * self._dot_count
+        self.phaseChanged.emit()
+
     def start(self):
         """Start animation."""
         if not self._running:
@@ -197,7 +201,7 @@ class FluentDotLoader(QWidget):
     def paintEvent(self, _event: QPaintEvent):
         """Paint the dots."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         current_color = self._color if self._color else theme_manager.get_color(
             'accent')
@@ -270,13 +274,8 @@ class FluentProgressRing(QWidget):
 
     def _setup_animation(self):
         """Set up animations."""
-        self._rotation_animation = QPropertyAnimation(
-            self, QByteArray(b"angle"))
-        self._rotation_animation.setDuration(2000)
-        self._rotation_animation.setStartValue(0)
-        self._rotation_animation.setEndValue(360)
-        self._rotation_animation.setLoopCount(-1)
-        self._rotation_animation.setEasingCurve(QEasingCurve.Type.Linear)
+        self._rotation_animation = FluentClockAnimation(
+            self, self._on_rotation_frame, duration=2000, loop_count=-1)
 
     def _connect_theme(self):
         """Connect to theme changes."""
@@ -296,6 +295,11 @@ class FluentProgressRing(QWidget):
     # Property definition for Qt property animation
     angle = Property(int, getAngle, setAngle, None, "Ring rotation angle")
 
+    def _on_rotation_frame(self, progress: float):
+        # The animation clock repaints after the frame
+        self._angle = int(progress * 360) % 360
+        self.angleChanged.emit()
+
     def getProgressValue(self) -> float:
         return self._progress_value
 
@@ -364,7 +368,7 @@ class FluentProgressRing(QWidget):
     def paintEvent(self, _event: QPaintEvent):
         """Paint the progress ring."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         current_color = self._color if self._color else theme_manager.get_color(
             'accent')
@@ -505,7 +509,7 @@ class FluentLoadingOverlay(QWidget):
     def paintEvent(self, _event: QPaintEvent):
         """Paint the semi-transparent background."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         if theme_manager:
             main_background_color = theme_manager.get_color('background')
@@ -543,25 +547,11 @@ class FluentPulseLoader(QWidget):
 
     def _setup_animation(self):
         """Set up pulsing animation."""
-        self._scale_animation = QPropertyAnimation(
-            self, QByteArray(b"scaleValue"))
-        self._scale_animation.setDuration(1000)
-        self._scale_animation.setStartValue(0.8)
-        self._scale_animation.setEndValue(1.2)
+        # One clock animation drives both scale (0.8-1.2) and opacity (1.0-0.3)
         # FluentTransition.EASE_SMOOTH is OutCubic, InOutQuad is good for pulse
-        self._scale_animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
-
-        self._opacity_animation = QPropertyAnimation(
-            self, QByteArray(b"opacityValue"))
-        self._opacity_animation.setDuration(1000)
-        self._opacity_animation.setStartValue(1.0)
-        self._opacity_animation.setEndValue(0.3)
-        self._opacity_animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
-
-        self._animation_group = QParallelAnimationGroup(self)
-        self._animation_group.addAnimation(self._scale_animation)
-        self._animation_group.addAnimation(self._opacity_animation)
-        self._animation_group.setLoopCount(-1)
+        self._animation_group = FluentClockAnimation(
+            self, self._on_pulse_frame, duration=1000, loop_count=-1,
+            easing=QEasingCurve.Type.InOutQuad)
 
     def _connect_theme(self):
         """Connect to theme changes."""
@@ -592,6 +582,13 @@ class FluentPulseLoader(QWidget):
     opacityValue = Property(
         float, getOpacityValue, setOpacityValue, None, "", notify=opacityValueChanged)
 
+    def _on_pulse_frame(self, progress: float):
+        # The animation clock repaints after the frame
+        self._scale = 0.8 + 0.4 * progress
+        self._opacity = 1.0 - 0.7 * progress
+        self.scaleValueChanged.emit(self._scale)
+        self.opacityValueChanged.emit(self._opacity)
+
     def start(self):
         """Start pulsing animation."""
         if not self._running:
@@ -607,7 +604,7 @@ class FluentPulseLoader(QWidget):
     def paintEvent(self, _event: QPaintEvent):
         """Paint the pulsing dot."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         current_color = self._color if self._color else theme_manager.get_color(
             'accent')
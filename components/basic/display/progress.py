@@ -7,13 +7,16 @@ theme integration, and responsive behavior following QFluentWidget patterns.
 from PySide6.QtWidgets import (
     QProgressBar, QSlider, QWidget, QGraphicsDropShadowEffect)
 from PySide6.QtCore import (Qt, Signal, QPropertyAnimation, Property, QByteArray,
-                            QEasingCurve, QTimer, QRect, QSequentialAnimationGroup,
+                            QEasingCurve, QRect, QSequentialAnimationGroup,
                             QAbstractAnimation, QPoint, QPauseAnimation)
 from PySide6.QtGui import (QPainter, QBrush, QPen, QLinearGradient, QPaintEvent, QRadialGradient,
                            QColor, QPainterPath, QFont, QFontMetrics)
-from core.theme import theme_manager
+from core.theme import ThemeTokens, theme_manager
+from core.native_paint import apply_native_palette, is_native_paint_active
 from core.animation import FluentAnimation
+from core.animation_clock import FluentClockAnimation, get_animation_clock
 from core.enhanced_animations import FluentRevealEffect, FluentTransition
+from core.performance_profile import get_performance_profile
 from typing import Optional
 import weakref
 import math
@@ -29,6 +32,9 @@ class FluentProgressBar(QProgressBar):
     valueAnimationFinished = Signal()
     stateChanged = Signal(str)
 
+    ERROR_COLOR = QColor('#c42b1c')  # Fluent error red
+    SUCCESS_COLOR = QColor('#107c10')  # Fluent success green
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
@@ -47,11 +53,7 @@ class FluentProgressBar(QProgressBar):
         self._show_percentage = False
 
         # Performance optimization
-        self._cached_geometry = QRect()
         self._needs_repaint = True
-        self._animation_timer = QTimer()
-        self._animation_timer.timeout.connect(self._update_animation_cache)
-        self._animation_timer.setInterval(16)  # 60 FPS
 
         # Animation management
         self._animation_refs = weakref.WeakSet()
@@ -77,10 +79,7 @@ class FluentProgressBar(QProgressBar):
         self._cleanup_animations()
 
     def _cleanup_animations(self):
-        """Clean up animations and timers"""
-        if hasattr(self, '_animation_timer') and self._animation_timer:
-            self._animation_timer.stop()
-
+        """Clean up animations"""
         for animation in list(self._animation_refs):
             if animation and animation.state() == QAbstractAnimation.State.Running:
                 animation.stop()
@@ -88,6 +87,13 @@ class FluentProgressBar(QProgressBar):
 
     def _setup_fluent_style(self):
         """Setup Fluent Design visual styling"""
+        # paintEvent draws everything, so the stylesheet only matters for
+        # sizing and is skipped in native paint mode
+        if is_native_paint_active():
+            apply_native_palette(self)
+            self._needs_repaint = True
+            return
+
         theme = theme_manager
 
         # Fluent Design color palette
@@ -127,15 +133,10 @@ class FluentProgressBar(QProgressBar):
             self.valueAnimationFinished.emit)
         self._animation_refs.add(self._progress_animation)
 
-        # Indeterminate animation with smooth motion
-        self._indeterminate_animation = QPropertyAnimation(
-            self, QByteArray(b"animationPosition"))
-        self._indeterminate_animation.setDuration(2000)
-        self._indeterminate_animation.setLoopCount(-1)
-        self._indeterminate_animation.setEasingCurve(
-            QEasingCurve.Type.InOutSine)
-        self._indeterminate_animation.valueChanged.connect(
-            self._on_animation_frame)
+        # Indeterminate animation with smooth motion, on the shared clock
+        self._indeterminate_animation = FluentClockAnimation(
+            self, self._set_animation_position, duration=2000, loop_count=-1,
+            easing=QEasingCurve.Type.InOutSine)
         self._animation_refs.add(self._indeterminate_animation)
 
         # Hover animation for interactive feedback
@@ -143,6 +144,7 @@ class FluentProgressBar(QProgressBar):
             self, QByteArray(b"hoverOpacity"))
         self._hover_animation.setDuration(FluentAnimation.DURATION_FAST)
         self._hover_animation.setEasingCurve(QEasingCurve.Type.OutQuad)
+        self._hover_animation.valueChanged.connect(self._on_animation_frame)
         self._animation_refs.add(self._hover_animation)
 
         # Glow effect for milestones
@@ -150,6 +152,7 @@ class FluentProgressBar(QProgressBar):
             self, QByteArray(b"glowIntensity"))
         self._glow_animation.setDuration(FluentAnimation.DURATION_MEDIUM)
         self._glow_animation.setEasingCurve(QEasingCurve.Type.OutQuad)
+        self._glow_animation.valueChanged.connect(self._on_animation_frame)
         self._animation_refs.add(self._glow_animation)
 
         # Pulse for completion
@@ -157,6 +160,7 @@ class FluentProgressBar(QProgressBar):
             self, QByteArray(b"pulseScale"))
         self._pulse_animation.setDuration(FluentAnimation.DURATION_FAST)
         self._pulse_animation.setEasingCurve(QEasingCurve.Type.OutBack)
+        self._pulse_animation.valueChanged.connect(self._on_animation_frame)
         self._animation_refs.add(self._pulse_animation)
 
     def _setup_mouse_tracking(self):
@@ -164,17 +168,11 @@ class FluentProgressBar(QProgressBar):
         self.setMouseTracking(True)
         self.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
 
-    def _update_animation_cache(self):
-        """Update animation cache for smooth performance"""
-        if self._needs_repaint or self.geometry() != self._cached_geometry:
-            self._cached_geometry = self.geometry()
-            self._needs_repaint = False
-            self.update()
-
     def _on_animation_frame(self):
-        """Optimized animation frame update"""
-        if not self._animation_timer.isActive():
-            self._animation_timer.start()
+        """Repaint with the next frame of the shared animation clock"""
+        if self._needs_repaint:
+            self._needs_repaint = False
+            get_animation_clock().request_update(self)
 
     # Enhanced property system with Fluent Design properties
     def _get_animation_position(self) -> float:
@@ -339,8 +337,6 @@ class FluentProgressBar(QProgressBar):
         if indeterminate:
             self._state = 'indeterminate'
             if self._indeterminate_animation:
-                self._indeterminate_animation.setStartValue(0.0)
-                self._indeterminate_animation.setEndValue(1.0)
                 self._indeterminate_animation.start()
         else:
             self._state = 'normal'
@@ -404,10 +400,10 @@ class FluentProgressBar(QProgressBar):
     def paintEvent(self, event: QPaintEvent):
         """Enhanced Fluent Design paint event"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         rect = self.rect()
-        theme = theme_manager
+        tokens = theme_manager.tokens()
 
         # Apply pulse scale transform
         if abs(self._pulse_scale - 1.0) > 0.01:
@@ -419,22 +415,23 @@ class FluentProgressBar(QProgressBar):
 
         # Draw progress based on state
         if self._is_indeterminate:
-            self._paint_indeterminate_progress(painter, rect, theme)
+            self._paint_indeterminate_progress(painter, rect, tokens)
         else:
-            self._paint_determinate_progress(painter, rect, theme)
+            self._paint_determinate_progress(painter, rect, tokens)
 
         # Draw percentage text if enabled
         if self._show_percentage and not self._is_indeterminate:
-            self._paint_percentage_text(painter, rect, theme)
+            self._paint_percentage_text(painter, rect, tokens)
 
         if abs(self._pulse_scale - 1.0) > 0.01:
             painter.restore()
 
         # Draw glow effect
         if self._glow_intensity > 0.01:
-            self._paint_glow_effect(painter, rect, theme)
+            self._paint_glow_effect(painter, rect, tokens)
 
-    def _paint_determinate_progress(self, painter: QPainter, rect: QRect, theme):
+    def _paint_determinate_progress(self, painter: QPainter, rect: QRect,
+                                    tokens: ThemeTokens):
         """Paint determinate progress with Fluent Design styling"""
         painter.setPen(Qt.PenStyle.NoPen)
 
@@ -443,11 +440,10 @@ class FluentProgressBar(QProgressBar):
                            rect.width(), self._track_height)
 
         # Control fill color from theme
-        control_fill = theme.get_color('control_fill_default')
         if self._is_hovering:
-            control_fill = theme.get_color('control_fill_secondary')
-
-        painter.setBrush(QBrush(control_fill))
+            painter.setBrush(tokens.brush('control_fill_secondary'))
+        else:
+            painter.setBrush(tokens.brush('control_fill_default'))
         painter.drawRoundedRect(
             track_rect, self._corner_radius, self._corner_radius)
 
@@ -461,7 +457,7 @@ class FluentProgressBar(QProgressBar):
                                       progress_width, track_rect.height())
 
                 # State-based colors
-                fill_color = self._get_state_color(theme)
+                fill_color = self._get_state_color(tokens)
 
                 # Add hover effect
                 if self._hover_opacity > 0:
@@ -473,7 +469,8 @@ class FluentProgressBar(QProgressBar):
                 painter.drawRoundedRect(
                     progress_rect, self._corner_radius, self._corner_radius)
 
-    def _paint_indeterminate_progress(self, painter: QPainter, rect: QRect, theme):
+    def _paint_indeterminate_progress(self, painter: QPainter, rect: QRect,
+                                      tokens: ThemeTokens):
         """Paint indeterminate progress with Fluent animation"""
         painter.setPen(Qt.PenStyle.NoPen)
 
@@ -481,8 +478,7 @@ class FluentProgressBar(QProgressBar):
         track_rect = QRect(0, rect.height() // 2 - self._track_height // 2,
                            rect.width(), self._track_height)
 
-        control_fill = theme.get_color('control_fill_default')
-        painter.setBrush(QBrush(control_fill))
+        painter.setBrush(tokens.brush('control_fill_default'))
         painter.drawRoundedRect(
             track_rect, self._corner_radius, self._corner_radius)
 
@@ -494,12 +490,13 @@ class FluentProgressBar(QProgressBar):
         dot_rect = QRect(track_rect.x() + dot_position, track_rect.y(),
                          dot_width, track_rect.height())
 
-        fill_color = self._get_state_color(theme)
+        fill_color = self._get_state_color(tokens)
         painter.setBrush(QBrush(fill_color))
         painter.drawRoundedRect(
             dot_rect, self._corner_radius, self._corner_radius)
 
-    def _paint_percentage_text(self, painter: QPainter, rect: QRect, theme):
+    def _paint_percentage_text(self, painter: QPainter, rect: QRect,
+                               tokens: ThemeTokens):
         """Paint percentage text with Fluent typography"""
         if self.maximum() <= self.minimum():
             return
@@ -514,8 +511,7 @@ class FluentProgressBar(QProgressBar):
         painter.setFont(font)
 
         # Text color from theme
-        text_color = theme.get_color('text_primary')
-        painter.setPen(QPen(text_color))
+        painter.setPen(tokens.pen('text_primary'))
 
         # Center text
         font_metrics = QFontMetrics(font)
@@ -525,12 +521,14 @@ class FluentProgressBar(QProgressBar):
 
         painter.drawText(x, y, text)
 
-    def _paint_glow_effect(self, painter: QPainter, rect: QRect, theme):
+    def _paint_glow_effect(self, painter: QPainter, rect: QRect,
+                           tokens: ThemeTokens):
         """Paint glow effect for milestones"""
         if self._glow_intensity <= 0.01:
             return
 
-        glow_color = self._get_state_color(theme)
+        # State colors are shared theme tokens, so copy before changing alpha
+        glow_color = QColor(self._get_state_color(tokens))
         glow_color.setAlpha(int(self._glow_intensity * 60))
 
         # Glow around the entire progress bar
@@ -541,16 +539,15 @@ class FluentProgressBar(QProgressBar):
         painter.drawRoundedRect(
             glow_rect, self._corner_radius + 2, self._corner_radius + 2)
 
-    def _get_state_color(self, theme) -> QColor:
-        """Get color based on current state"""
-        state_colors = {
-            'normal': theme.get_color('accent_default'),
-            'indeterminate': theme.get_color('accent_default'),
-            'paused': theme.get_color('text_secondary'),
-            'error': QColor('#c42b1c'),  # Fluent error red
-            'success': QColor('#107c10')  # Fluent success green
-        }
-        return state_colors.get(self._state, theme.get_color('accent_default'))
+    def _get_state_color(self, tokens: ThemeTokens) -> QColor:
+        """Get the shared, read-only color for the current state"""
+        if self._state == 'paused':
+            return tokens.color('text_secondary')
+        if self._state == 'error':
+            return self.ERROR_COLOR
+        if self._state == 'success':
+            return self.SUCCESS_COLOR
+        return tokens.color('accent_default')
 
     def _blend_colors(self, color1: QColor, color2: QColor, ratio: float) -> QColor:
         """Blend two colors with given ratio"""
@@ -1255,8 +1252,8 @@ class FluentRangeSlider(QWidget):
         self._update_cache()
 
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, get_performance_profile().antialiasing())
 
         theme = theme_manager
         rect = self.rect()
@@ -11,6 +11,7 @@ from PySide6.QtCore import (Qt, QTimer, QPoint, QPropertyAnimation, QParallelAni
 from PySide6.QtGui import QPainter, QColor, QPainterPath, QPaintEvent, QResizeEvent
 from core.theme import theme_manager
 from core.animation import FluentAnimation
+from core.performance_profile import get_performance_profile, profile_effect
 from typing import Optional, Union, Callable, Dict, Any
 import weakref
 
@@ -129,7 +130,7 @@ class FluentTooltip(QWidget):
         self._shadow_effect.setOffset(0, 2)
         if theme_manager:
             self._shadow_effect.setColor(theme_manager.get_color('shadow'))
-        self.setGraphicsEffect(self._shadow_effect)
+        self.setGraphicsEffect(profile_effect(self._shadow_effect))
 
         # Prepare opacity effect for animations
         self._opacity_effect = QGraphicsOpacityEffect(self)
@@ -513,7 +514,7 @@ class FluentTooltip(QWidget):
     def paintEvent(self, event: QPaintEvent):
         """Custom paint for tooltip with optional arrow"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Get colors from theme
         if theme_manager:
@@ -615,7 +616,13 @@ class FluentTooltipManager:
     def _initialize(self):
         """Initialize the tooltip manager once"""
         self._active_tooltips = {}  # widget -> tooltip mapping
-        self._global_tooltip = FluentTooltip()  # Shared tooltip for simple text
+        self._global_tooltip = None  # Shared tooltip for simple text, built on first use
+
+    def _shared_tooltip(self) -> FluentTooltip:
+        """Get the shared tooltip, creating it once a QApplication exists"""
+        if self._global_tooltip is None:
+            self._global_tooltip = FluentTooltip()
+        return self._global_tooltip
 
     def showTooltip(self, text: str, position: QPoint,
                     source_widget: Optional[QWidget] = None,
@@ -634,11 +641,12 @@ class FluentTooltipManager:
             self._active_tooltips[source_widget].hideTooltip()
 
         # Use the global tooltip for simple text
-        self._global_tooltip.setText(text, rich_text=rich_text)
-        self._global_tooltip.showTooltip(position, source_widget)
+        tooltip = self._shared_tooltip()
+        tooltip.setText(text, rich_text=rich_text)
+        tooltip.showTooltip(position, source_widget)
 
         if source_widget:
-            self._active_tooltips[source_widget] = self._global_tooltip
+            self._active_tooltips[source_widget] = tooltip
 
     def hideTooltip(self, source_widget: Optional[QWidget] = None):
         """
@@ -650,7 +658,8 @@ class FluentTooltipManager:
         """
         if source_widget is None:
             # Hide all tooltips
-            self._global_tooltip.hideTooltip()
+            if self._global_tooltip is not None:
+                self._global_tooltip.hideTooltip()
             for tooltip in set(self._active_tooltips.values()):
                 tooltip.hideTooltip()
         elif source_widget in self._active_tooltips:
@@ -7,19 +7,71 @@ Interactive form elements for user input including:
 - Selection components
 """
 
-from .button import *
-from .checkbox import *
-from .combobox import *
-from .slider import *
-from .spinbox import *
-from .switch import *
-from .textbox import *
-from .toggle import *
-from .numberbox import *
-from .autosuggestbox import *
-from .passwordbox import *
-from .radio import *
-from .searchbox import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .button import *
+    from .checkbox import *
+    from .combobox import *
+    from .slider import *
+    from .spinbox import *
+    from .switch import *
+    from .textbox import *
+    from .toggle import *
+    from .numberbox import *
+    from .autosuggestbox import *
+    from .passwordbox import *
+    from .radio import *
+    from .searchbox import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=[
+        "button", "checkbox", "combobox", "slider", "spinbox", "switch", "textbox",
+        "toggle", "numberbox", "autosuggestbox", "passwordbox", "radio", "searchbox",
+    ],
+    exports={
+        "button": ["FluentButton", "FluentIconButton", "FluentToggleButton"],
+        "checkbox": ["FluentCheckBox"],
+        "combobox": [
+            "PerformanceConfig", "FluentComboBoxStyle", "FluentAnimationManager",
+            "FluentComboBox", "FluentMultiSelectComboBox", "FluentSearchableComboBox",
+            "FluentDropDownButton",
+        ],
+        "slider": ["FluentSlider", "FluentRangeSlider", "FluentVolumeSlider"],
+        "spinbox": [
+            "AnimatedProperty", "FluentSpinBox", "FluentDoubleSpinBox",
+            "FluentNumberInput",
+        ],
+        "switch": ["FluentSwitch", "FluentSwitchGroup"],
+        "textbox": [
+            "FluentInputBase", "FluentLineEdit", "FluentTextEdit", "FluentPasswordEdit",
+            "FluentNumericEdit",
+        ],
+        "toggle": ["FluentToggleSwitch", "FluentExpandableToggle"],
+        "numberbox": ["FluentNumberBox", "FluentNumberValidator"],
+        "autosuggestbox": ["FluentAutoSuggestBox", "FluentSuggestionItem"],
+        "passwordbox": ["FluentPasswordBox"],
+        "radio": [
+            "FluentComponentState", "FluentComponentVariant", "FluentRadioButton",
+            "FluentRadioGroup",
+        ],
+        "searchbox": ["FluentControlBase", "FluentComponentSize", "FluentSearchBox"],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentAnimation": ("toggle", "FluentAnimation"),
+        "FluentMicroInteraction": ("passwordbox", "FluentMicroInteraction"),
+        "FluentRevealEffect": ("textbox", "FluentRevealEffect"),
+        "FluentStandardButton": ("button", "FluentStandardButton"),
+        "FluentStateTransition": ("textbox", "FluentStateTransition"),
+        "FluentTransition": ("autosuggestbox", "FluentTransition"),
+        "ThemeMode": ("toggle", "ThemeMode"),
+        "theme_manager": ("passwordbox", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all form control classes and functions
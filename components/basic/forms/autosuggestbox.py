@@ -252,7 +252,7 @@ class FluentAutoSuggestBox(FluentBaseWidget):
         self._suggestions_list.itemClicked.connect(self._on_suggestion_clicked)
 
         # Theme changes
-        theme_manager.theme_changed.connect(self._on_theme_changed)
+        self._register_theme_updates()
 
     def _on_theme_changed(self):
         """Handle theme changes"""
@@ -10,89 +10,74 @@ from PySide6.QtCore import (Qt, Signal, QPropertyAnimation, QRect, QByteArray,
                             QTimer, QEasingCurve, QSignalBlocker)
 from PySide6.QtGui import QIcon, QColor, QPainter
 from core.theme import theme_manager
+from core.style_cache import get_style_cache
 from core.animation import FluentAnimation
-from typing import Optional, List, Any, Dict, Callable
+from core.memory import QOBJECT_BYTES, register_cache
+from core.performance_profile import get_performance_profile, profile_effect
+from typing import Optional, List, Any, Dict
 import weakref
 
 
-# Performance configuration to adjust based on device capabilities
+# Combo box overrides on top of the application's performance profile
 class PerformanceConfig:
-    """Configuration to optimize performance based on device capabilities"""
-    LOW_PERFORMANCE_MODE = False  # Set to True for low-end devices
+    """Combo box performance settings, applied on top of the performance profile"""
+    LOW_PERFORMANCE_MODE = False  # Force low performance behaviour for combo boxes
     ANIMATION_DURATION_SCALE = 1.0  # Reduce to speed up animations
-    USE_SHADOWS = True  # Disable for better performance on low-end devices
+    USE_SHADOWS = True  # Disable to never create shadow effects
     MAX_CACHED_ANIMATIONS = 100  # Limit animation cache size
 
+    @classmethod
+    def is_low_performance(cls) -> bool:
+        """Check if decorative animations should be skipped"""
+        return cls.LOW_PERFORMANCE_MODE or not get_performance_profile().animations_enabled()
+
     @classmethod
     def scale_duration(cls, duration: int) -> int:
-        """Scale animation duration based on performance settings"""
-        return int(duration * cls.ANIMATION_DURATION_SCALE)
+        """Scale animation duration by the combo box and profile scales"""
+        return get_performance_profile().scale_duration(int(duration * cls.ANIMATION_DURATION_SCALE))
 
     @classmethod
     def should_use_shadows(cls) -> bool:
-        """Check if shadows should be used based on performance settings"""
+        """Check if shadows should be created; the profile turns them on and off"""
         return cls.USE_SHADOWS
 
     @classmethod
     def should_use_advanced_effects(cls) -> bool:
         """Check if advanced effects should be used"""
-        return not cls.LOW_PERFORMANCE_MODE
-
-
-# Style caching system to avoid expensive QSS parsing
-class StyleCache:
-    """Cache for stylesheets to avoid regenerating them"""
-    _style_cache: Dict[str, str] = {}
-
-    @classmethod
-    def get_style(cls, key: str, generator: Callable[[], str]) -> str:
-        """Get cached style or generate it if not cached"""
-        if key not in cls._style_cache:
-            cls._style_cache[key] = generator()
-        return cls._style_cache[key]
-
-    @classmethod
-    def clear_cache(cls):
-        """Clear style cache, usually on theme change"""
-        cls._style_cache.clear()
+        return not cls.is_low_performance() and get_performance_profile().effects_enabled()
 
 
 class FluentComboBoxStyle:
     """Centralized style management for all ComboBox components"""
 
-    _cached_base_styles: Dict[str, Dict[str, str]] = {}
-
     @staticmethod
     def get_base_styles() -> Dict[str, str]:
         """Get base styles for consistency across all components with caching"""
-        theme_mode = theme_manager.get_theme_mode()
-
-        if theme_mode not in FluentComboBoxStyle._cached_base_styles:
-            theme = theme_manager
-            FluentComboBoxStyle._cached_base_styles[theme_mode] = {
-                "primary": theme.get_color('primary').name(),
-                "secondary": theme.get_color('secondary').name(),
-                "surface": theme.get_color('surface').name(),
-                "background": theme.get_color('background').name(),
-                "card": theme.get_color('card').name(),
-                "border": theme.get_color('border').name(),
-                "text_primary": theme.get_color('text_primary').name(),
-                "text_secondary": theme.get_color('text_secondary').name(),
-                "text_disabled": theme.get_color('text_disabled').name(),
-                "accent_light": theme.get_color('accent_light').name(),
-                "accent_medium": theme.get_color('accent_medium').name(),
-                "accent_dark": theme.get_color('accent_dark').name(),
-            }
-
-        return FluentComboBoxStyle._cached_base_styles[theme_mode]
+        return get_style_cache().get("combobox:base_styles", FluentComboBoxStyle._generate_base_styles)
+
+    @staticmethod
+    def _generate_base_styles() -> Dict[str, str]:
+        """Generate base styles without caching"""
+        theme = theme_manager
+        return {
+            "primary": theme.get_color('primary').name(),
+            "secondary": theme.get_color('secondary').name(),
+            "surface": theme.get_color('surface').name(),
+            "background": theme.get_color('background').name(),
+            "card": theme.get_color('card').name(),
+            "border": theme.get_color('border').name(),
+            "text_primary": theme.get_color('text_primary').name(),
+            "text_secondary": theme.get_color('text_secondary').name(),
+            "text_disabled": theme.get_color('text_disabled').name(),
+            "accent_light": theme.get_color('accent_light').name(),
+            "accent_medium": theme.get_color('accent_medium').name(),
+            "accent_dark": theme.get_color('accent_dark').name(),
+        }
 
     @staticmethod
     def get_combobox_style() -> str:
         """Get unified ComboBox style with caching"""
-        theme_mode = theme_manager.get_theme_mode()
-        cache_key = f"combobox_style_{theme_mode}"
-
-        return StyleCache.get_style(cache_key, lambda: FluentComboBoxStyle._generate_combobox_style())
+        return get_style_cache().get_style("combobox:combobox_style", FluentComboBoxStyle._generate_combobox_style)
 
     @staticmethod
     def _generate_combobox_style() -> str:
@@ -186,10 +171,7 @@ class FluentComboBoxStyle:
     @staticmethod
     def get_button_style() -> str:
         """Get unified button style with caching"""
-        theme_mode = theme_manager.get_theme_mode()
-        cache_key = f"button_style_{theme_mode}"
-
-        return StyleCache.get_style(cache_key, lambda: FluentComboBoxStyle._generate_button_style())
+        return get_style_cache().get_style("combobox:button_style", FluentComboBoxStyle._generate_button_style)
 
     @staticmethod
     def _generate_button_style() -> str:
@@ -226,10 +208,7 @@ class FluentComboBoxStyle:
     @staticmethod
     def get_list_style() -> str:
         """Get unified list widget style with caching"""
-        theme_mode = theme_manager.get_theme_mode()
-        cache_key = f"list_style_{theme_mode}"
-
-        return StyleCache.get_style(cache_key, lambda: FluentComboBoxStyle._generate_list_style())
+        return get_style_cache().get_style("combobox:list_style", FluentComboBoxStyle._generate_list_style)
 
     @staticmethod
     def _generate_list_style() -> str:
@@ -277,9 +256,8 @@ class FluentComboBoxStyle:
 
     @staticmethod
     def clear_style_cache():
-        """Clear all style caches when theme changes"""
-        FluentComboBoxStyle._cached_base_styles.clear()
-        StyleCache.clear_cache()
+        """Clear all ComboBox style caches"""
+        get_style_cache().invalidate("combobox:")
 
 
 class FluentAnimationManager:
@@ -348,7 +326,7 @@ class FluentAnimationManager:
     def create_smooth_dropdown_animation(cls, view_widget: QWidget) -> QPropertyAnimation:
         """Create optimized dropdown animation"""
         # Use simpler animations in low performance mode
-        if PerformanceConfig.LOW_PERFORMANCE_MODE:
+        if PerformanceConfig.is_low_performance():
             duration = FluentAnimation.DURATION_FAST // 2
         else:
             duration = FluentAnimation.DURATION_FAST
@@ -363,7 +341,7 @@ class FluentAnimationManager:
     def create_fade_animation(cls, widget: QWidget, duration: int = 200) -> QPropertyAnimation:
         """Create optimized fade animation with efficient caching"""
         # Skip fade animations in low performance mode
-        if PerformanceConfig.LOW_PERFORMANCE_MODE:
+        if PerformanceConfig.is_low_performance():
             # Return a dummy animation that completes immediately
             dummy = QPropertyAnimation(widget, QByteArray())
             dummy.setDuration(0)
@@ -388,6 +366,24 @@ class FluentAnimationManager:
         animation = cls.get_or_create_animation(effect, "opacity", duration)
         return animation
 
+    @classmethod
+    def animation_count(cls) -> int:
+        """Get the number of cached animations"""
+        return len(cls._animation_cache)
+
+    @classmethod
+    def animation_bytes(cls) -> int:
+        """Get the estimated bytes of the cached animations"""
+        return len(cls._animation_cache) * QOBJECT_BYTES
+
+    @classmethod
+    def trim_animations(cls, target_bytes: int):
+        """Drop the oldest animations until at most target_bytes remain"""
+        keep_count = max(0, target_bytes) // QOBJECT_BYTES
+        keys = list(cls._animation_cache.keys())
+        for key in keys[:max(0, len(keys) - keep_count)]:
+            cls._cleanup_animation(key)
+
     @classmethod
     def clear_caches(cls):
         """Clear all caches (useful for testing or low-memory situations)"""
@@ -405,6 +401,10 @@ class FluentAnimationManager:
         cls._cache_size = 0
 
 
+register_cache("combobox.animations", FluentAnimationManager.animation_count,
+               FluentAnimationManager.animation_bytes, FluentAnimationManager.trim_animations)
+
+
 class FluentSearchBox(QLineEdit):
     """Enhanced search box component with improved performance"""
 
@@ -435,10 +435,7 @@ class FluentSearchBox(QLineEdit):
 
     def _get_cached_style(self) -> str:
         """Get cached search box style"""
-        theme_mode = theme_manager.get_theme_mode()
-        cache_key = f"search_box_style_{theme_mode}"
-
-        return StyleCache.get_style(cache_key, lambda: self._generate_style())
+        return get_style_cache().get_style("combobox:search_box_style", self._generate_style)
 
     def _generate_style(self) -> str:
         """Generate search box style"""
@@ -524,7 +521,7 @@ class FluentComboBox(QComboBox):
             shadow.setBlurRadius(6)
             shadow.setColor(QColor(0, 0, 0, 25))
             shadow.setOffset(0, 2)
-            self.setGraphicsEffect(shadow)
+            self.setGraphicsEffect(profile_effect(shadow))
 
     def _get_cached_drop_animation(self) -> QPropertyAnimation:
         """Get cached dropdown animation"""
@@ -541,7 +538,7 @@ class FluentComboBox(QComboBox):
         super().showPopup()
 
         # Skip animation in low performance mode
-        if PerformanceConfig.LOW_PERFORMANCE_MODE:
+        if PerformanceConfig.is_low_performance():
             return
 
         # Queue animation for better performance
@@ -584,7 +581,7 @@ class FluentComboBox(QComboBox):
         self._is_expanded = False
 
         # Skip animation in low performance mode
-        if PerformanceConfig.LOW_PERFORMANCE_MODE or not self.view():
+        if PerformanceConfig.is_low_performance() or not self.view():
             super().hidePopup()
             return
 
@@ -633,13 +630,13 @@ class FluentComboBox(QComboBox):
         super().paintEvent(event)
 
         # Skip additional drawing in low performance mode
-        if PerformanceConfig.LOW_PERFORMANCE_MODE:
+        if PerformanceConfig.is_low_performance():
             return
 
         # Add visual indicator only when needed
         if self.currentText() and not self._is_expanded:
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
             # Draw subtle selection indicator
             rect = self.rect()
@@ -700,7 +697,7 @@ class FluentMultiSelectComboBox(QWidget):
             shadow.setBlurRadius(4)  # Reduced blur radius
             shadow.setColor(QColor(0, 0, 0, 20))  # Less opacity
             shadow.setOffset(0, 1)
-            self.main_button.setGraphicsEffect(shadow)
+            self.main_button.setGraphicsEffect(profile_effect(shadow))
 
     def add_item(self, text: str, data: Any = None):
         """Add item with optimized handling"""
@@ -786,7 +783,7 @@ class FluentMultiSelectComboBox(QWidget):
         self._is_expanded = True
 
         # Skip animation in low performance mode
-        if PerformanceConfig.LOW_PERFORMANCE_MODE:
+        if PerformanceConfig.is_low_performance():
             return
 
         # Setup animations
@@ -820,7 +817,7 @@ class FluentMultiSelectComboBox(QWidget):
         self._is_expanded = False
 
         # Skip animation in low performance mode
-        if PerformanceConfig.LOW_PERFORMANCE_MODE:
+        if PerformanceConfig.is_low_performance():
             self._dropdown_widget.close()
             self._dropdown_widget = None
             return
@@ -872,7 +869,7 @@ class FluentMultiSelectComboBox(QWidget):
             shadow.setBlurRadius(12)
             shadow.setColor(QColor(0, 0, 0, 30))
             shadow.setOffset(0, 4)
-            dropdown.setGraphicsEffect(shadow)
+            dropdown.setGraphicsEffect(profile_effect(shadow))
 
         # Create optimized scroll area
         scroll_area = QScrollArea()
@@ -1121,7 +1118,7 @@ class FluentSearchableComboBox(QWidget):
             shadow.setBlurRadius(8)  # Reduced blur radius
             shadow.setColor(QColor(0, 0, 0, 30))  # Reduced opacity
             shadow.setOffset(0, 3)
-            self.list_widget.setGraphicsEffect(shadow)
+            self.list_widget.setGraphicsEffect(profile_effect(shadow))
 
     def add_item(self, text: str, data: Any = None):
         """Add item efficiently"""
@@ -1178,7 +1175,7 @@ class FluentSearchableComboBox(QWidget):
     def _on_search_text_changed(self, text: str):
         """Handle search text change with optimized debouncing"""
         # Reset and restart the timer - use shorter delay for better responsiveness
-        debounce_time = 300 if PerformanceConfig.LOW_PERFORMANCE_MODE else 150
+        debounce_time = 300 if PerformanceConfig.is_low_performance() else 150
         self._search_debounce_timer.stop()
         self._search_debounce_timer.start(debounce_time)
 
@@ -1203,7 +1200,7 @@ class FluentSearchableComboBox(QWidget):
         self.list_widget.setVisible(True)
 
         # Skip animation in low performance mode
-        if PerformanceConfig.LOW_PERFORMANCE_MODE:
+        if PerformanceConfig.is_low_performance():
             return
 
         # Create optimized reveal animation
@@ -1231,7 +1228,7 @@ class FluentSearchableComboBox(QWidget):
     def _hide_list_with_animation(self):
         """Hide list with optimized animation"""
         # Skip animation in low performance mode
-        if PerformanceConfig.LOW_PERFORMANCE_MODE:
+        if PerformanceConfig.is_low_performance():
             self.list_widget.setVisible(False)
             return
 
@@ -1395,7 +1392,7 @@ class FluentDropDownButton(QPushButton):
             shadow.setBlurRadius(6)  # Reduced blur radius
             shadow.setColor(QColor(0, 0, 0, 20))  # Reduced opacity
             shadow.setOffset(0, 2)
-            self.setGraphicsEffect(shadow)
+            self.setGraphicsEffect(profile_effect(shadow))
 
         # Update button text
         self._update_button_text()
@@ -1451,7 +1448,7 @@ class FluentDropDownButton(QPushButton):
         self._is_expanded = True
 
         # Skip animation in low performance mode
-        if PerformanceConfig.LOW_PERFORMANCE_MODE:
+        if PerformanceConfig.is_low_performance():
             return
 
         # Setup animations
@@ -1486,7 +1483,7 @@ class FluentDropDownButton(QPushButton):
         self._is_expanded = False
 
         # Skip animation in low performance mode
-        if PerformanceConfig.LOW_PERFORMANCE_MODE:
+        if PerformanceConfig.is_low_performance():
             self._dropdown_widget.close()
             self._dropdown_widget = None
             return
@@ -1539,7 +1536,7 @@ class FluentDropDownButton(QPushButton):
             shadow.setBlurRadius(12)
             shadow.setColor(QColor(0, 0, 0, 40))
             shadow.setOffset(0, 4)
-            menu.setGraphicsEffect(shadow)
+            menu.setGraphicsEffect(profile_effect(shadow))
 
         # Create menu items efficiently
         self._create_menu_items(layout, colors)
@@ -287,7 +287,7 @@ class FluentNumberBox(FluentBaseWidget):
         self._spin_down_button.released.connect(self._stop_spin)
 
         # Theme changes
-        theme_manager.theme_changed.connect(self._on_theme_changed)
+        self._register_theme_updates()
 
     def _on_theme_changed(self):
         """Handle theme changes"""
@@ -241,7 +241,7 @@ class FluentPasswordBox(FluentBaseWidget):
             self._clear_button.clicked.connect(self._clear_password)
             
         # Theme changes
-        theme_manager.theme_changed.connect(self._on_theme_changed)
+        self._register_theme_updates()
         
     def _on_theme_changed(self):
         """Handle theme changes"""
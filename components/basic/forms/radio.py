@@ -9,6 +9,7 @@ from PySide6.QtWidgets import (QWidget, QAbstractButton, QButtonGroup, QVBoxLayo
 from PySide6.QtCore import Signal, Qt
 from PySide6.QtGui import QPainter, QPen, QBrush, QColor
 
+from core.performance_profile import get_performance_profile
 from components.base.fluent_control_base import FluentControlBase
 from components.base.fluent_component_interface import (
     FluentComponentState, FluentComponentSize, FluentComponentVariant
@@ -141,7 +142,7 @@ class FluentRadioButton(QAbstractButton, FluentControlBase):
     def paintEvent(self, event):
         """Custom paint event for radio button"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Get theme colors
         bg_color = self._theme_tokens.get("surface", QColor("#FFFFFF"))
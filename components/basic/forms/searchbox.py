@@ -10,6 +10,7 @@ from PySide6.QtWidgets import (QWidget, QLineEdit, QHBoxLayout, QPushButton,
 from PySide6.QtCore import Signal, Qt, QTimer
 from PySide6.QtGui import QIcon, QPainter, QPen, QColor, QPixmap
 
+from core.performance_profile import get_performance_profile
 from components.base.fluent_control_base import FluentControlBase
 from components.base.fluent_component_interface import (
     FluentComponentSize
@@ -134,7 +135,7 @@ class FluentSearchBox(FluentControlBase):
         pixmap = QPixmap(16, 16)
         pixmap.fill(Qt.GlobalColor.transparent)
         painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Draw search icon
         pen = QPen(QColor("#666666"), 2)
@@ -151,7 +152,7 @@ class FluentSearchBox(FluentControlBase):
         pixmap = QPixmap(16, 16)
         pixmap.fill(Qt.GlobalColor.transparent)
         painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Draw X icon
         pen = QPen(QColor("#666666"), 2)
@@ -10,6 +10,7 @@ from PySide6.QtGui import QPainter, QPen, QBrush
 from core.theme import theme_manager
 from core.enhanced_animations import (FluentMicroInteraction, FluentTransition,
                                       FluentStateTransition, FluentRevealEffect)
+from core.performance_profile import get_performance_profile
 from typing import Optional
 from functools import lru_cache
 
@@ -396,7 +397,7 @@ class FluentRangeSlider(QWidget):
         self._calculate_layout()
 
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         current_theme = theme_manager
 
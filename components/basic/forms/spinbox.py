@@ -11,6 +11,7 @@ from PySide6.QtGui import (QWheelEvent, QPainter, QPainterPath, QColor, QBrush)
 from core.theme import theme_manager
 from core.animation import FluentAnimation
 from core.enhanced_animations import FluentTransition
+from core.performance_profile import get_performance_profile
 from typing import Optional
 
 
@@ -442,7 +443,7 @@ class FluentSpinBox(QSpinBox):
             abs(self._animated_props.get_scale_factor() - 1.0) > 0.01):
             
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
             
             # Apply scale transform
             if abs(self._animated_props.get_scale_factor() - 1.0) > 0.01:
@@ -924,7 +925,7 @@ class FluentDoubleSpinBox(QDoubleSpinBox):
             abs(self._animated_props.get_scale_factor() - 1.0) > 0.01):
             
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
             
             # Apply scale transform
             if abs(self._animated_props.get_scale_factor() - 1.0) > 0.01:
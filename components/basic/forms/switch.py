@@ -11,6 +11,7 @@ from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Signal, QRect,
 from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QFontMetrics
 
 from core.theme import theme_manager
+from core.performance_profile import get_performance_profile
 
 
 class FluentSwitch(QWidget):
@@ -357,7 +358,7 @@ class FluentSwitch(QWidget):
     def paintEvent(self, _event):
         """Optimized paint event"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Update cached resources when needed
         if self._colors_dirty:
@@ -12,6 +12,7 @@ from PySide6.QtGui import (QPainter, QColor, QBrush, QPen, QPaintEvent,
 from core.theme import theme_manager, ThemeMode
 from core.animation import FluentAnimation
 from core.enhanced_animations import FluentTransition
+from core.performance_profile import get_performance_profile
 from typing import Optional, Union
 
 
@@ -218,7 +219,7 @@ class FluentToggleSwitch(QCheckBox):
             return  # Skip repainting if nothing has changed
 
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Get current theme colors
         theme = theme_manager
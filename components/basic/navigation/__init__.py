@@ -7,14 +7,60 @@ Navigation and structural elements including:
 - Step-by-step interfaces
 """
 
-from .accordion import *
-from .divider import *
-from .pagination import *
-from .segmented import *
-from .tabs import *
-from .stepper import *
-from .timeline import *
-from .treeview import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .accordion import *
+    from .divider import *
+    from .pagination import *
+    from .segmented import *
+    from .tabs import *
+    from .stepper import *
+    from .timeline import *
+    from .treeview import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=[
+        "accordion", "divider", "pagination", "segmented", "tabs", "stepper",
+        "timeline", "treeview",
+    ],
+    exports={
+        "accordion": [
+            "AccordionAnimationManager", "ContentLoader", "ThemeManager",
+            "FluentAccordionItem", "FluentAccordion",
+        ],
+        "divider": ["FluentDivider", "FluentSeparator", "FluentSection"],
+        "pagination": [
+            "AnimatedPaginationProperty", "EnhancedPaginationButton",
+            "FluentPagination", "FluentSimplePagination",
+        ],
+        "segmented": ["FluentSegmentedControl", "FluentTabBar", "FluentToggleGroup"],
+        "tabs": ["FluentTabButton", "FluentTabWidget"],
+        "stepper": [
+            "FluentStepper", "FluentStepWidget", "FluentStepConnector",
+            "FluentNumericStepper",
+        ],
+        "timeline": ["FluentTimelineItem", "FluentTimeline"],
+        "treeview": [
+            "FluentControlBase", "FluentComponentSize", "FluentTreeNode",
+            "FluentTreeItemDelegate", "FluentTreeView", "create_tree_node",
+            "create_tree_from_dict",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentAnimation": ("timeline", "FluentAnimation"),
+        "FluentMicroInteraction": ("timeline", "FluentMicroInteraction"),
+        "FluentParallel": ("timeline", "FluentParallel"),
+        "FluentRevealEffect": ("timeline", "FluentRevealEffect"),
+        "FluentStateTransition": ("segmented", "FluentStateTransition"),
+        "FluentTransition": ("timeline", "FluentTransition"),
+        "theme_manager": ("timeline", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all navigation classes and functions
@@ -214,9 +214,10 @@ class ThemeManager(QObject):
         """Get cached style for specific state"""
         cache_key = f"{base_style}_{state}"
         if cache_key not in self._cached_styles:
-            # Generate style based on state
-            self._cached_styles[cache_key] = self._generate_state_style(
-                base_style, state)
+            # Generated once per theme variant, then read from the style cache
+            self._cached_styles[cache_key] = theme_manager.cached_style(
+                f"accordion:{cache_key}",
+                lambda: self._generate_state_style(base_style, state))
         return self._cached_styles[cache_key]
 
     def _generate_state_style(self, base_style: str, state: str) -> str:
@@ -10,6 +10,7 @@ from PySide6.QtGui import QPainter, QPen, QColor, QFont, QLinearGradient, QPaint
 from core.theme import theme_manager
 from core.animation import FluentAnimation
 from core.enhanced_animations import FluentTransition
+from core.performance_profile import get_performance_profile
 from typing import Optional, Callable
 from enum import Enum
 
@@ -156,8 +157,8 @@ class FluentDivider(QFrame):
             self._update_theme_cache()
             
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, get_performance_profile().antialiasing())
 
         rect = self.rect()
 
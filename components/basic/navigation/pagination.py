@@ -14,12 +14,14 @@ from PySide6.QtWidgets import (QWidget, QHBoxLayout, QPushButton, QLabel,
                                QGraphicsDropShadowEffect, QSizePolicy)
 from PySide6.QtCore import (Qt, Signal, QPropertyAnimation, QParallelAnimationGroup,
                             QSequentialAnimationGroup, QEasingCurve, QTimer,
-                            Property, QObject, QRect, QByteArray, QEvent)
+                            Property, QObject, QRect, QRectF, QByteArray, QEvent)
 from PySide6.QtGui import QPainter, QPainterPath, QColor, QBrush, QPen
 
 from core.theme import theme_manager
+from core.native_paint import apply_native_palette, is_native_paint_active
 from core.enhanced_animations import FluentRevealEffect, FluentMicroInteraction, FluentTransition
 from core.animation import FluentAnimation
+from core.performance_profile import get_performance_profile
 
 
 class AnimatedPaginationProperty(QObject):
@@ -80,6 +82,9 @@ class EnhancedPaginationButton(QPushButton):
     # Class-level animation pool for better reuse
     _animation_pool = {}
 
+    # Text on primary-filled buttons in native paint mode
+    ON_PRIMARY_COLOR = QColor("#ffffff")
+
     def __init__(self, text: str = "", parent: Optional[QWidget] = None):
         super().__init__(text, parent)
 
@@ -113,11 +118,8 @@ class EnhancedPaginationButton(QPushButton):
         self._check_system_performance()
 
     def _check_system_performance(self):
-        """Check system capabilities and adjust animation settings"""
-        # This would be implemented based on system metrics
-        # For now using a simple approach
-        import os
-        if os.environ.get('LOW_PERFORMANCE_MODE') == '1':
+        """Adjust animation settings to the application's performance profile"""
+        if not get_performance_profile().animations_enabled():
             self._performance_mode = True
             self._should_animate = False
 
@@ -178,9 +180,13 @@ class EnhancedPaginationButton(QPushButton):
         if obj is self:
             if event.type() == QEvent.Type.HoverEnter:
                 self._handle_hover_enter()
+                if is_native_paint_active():
+                    self.update()
                 return True
             elif event.type() == QEvent.Type.HoverLeave:
                 self._handle_hover_leave()
+                if is_native_paint_active():
+                    self.update()
                 return True
         return super().eventFilter(obj, event)
 
@@ -329,7 +335,7 @@ class EnhancedPaginationButton(QPushButton):
 
         if abs(scale_value - 1.0) > 0.01:
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
             center = self.rect().center()
             painter.translate(center)
@@ -337,7 +343,7 @@ class EnhancedPaginationButton(QPushButton):
             painter.translate(-center)
 
             # Let the base class draw the button
-            super().paintEvent(event)
+            self._paint_button(event, painter)
 
             # Draw glow effect if needed
             if self._animated_props.glow_intensity > 0:
@@ -346,12 +352,48 @@ class EnhancedPaginationButton(QPushButton):
             painter.end()
         else:
             # No scaling needed, call normal paint
-            super().paintEvent(event)
+            self._paint_button(event)
 
             # Draw glow effect if needed
             if self._animated_props.glow_intensity > 0:
                 self._draw_glow_effect()
 
+    def _paint_button(self, event, existing_painter: Optional[QPainter] = None):
+        """Draw the button body, from theme tokens in native paint mode"""
+        if not is_native_paint_active():
+            super().paintEvent(event)
+            return
+
+        painter = existing_painter or QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
+        tokens = theme_manager.tokens()
+
+        if not self.isEnabled():
+            fill, border, text = (tokens.color('background'), tokens.color('border'),
+                                  tokens.color('text_disabled'))
+        elif self._is_current or self.isDown():
+            fill = border = tokens.color('primary')
+            text = self.ON_PRIMARY_COLOR
+        elif self.underMouse():
+            fill, border, text = (tokens.color('accent_light'), tokens.color('primary'),
+                                  tokens.color('text_primary'))
+        else:
+            fill, border, text = (tokens.color('surface'), tokens.color('border'),
+                                  tokens.color('text_primary'))
+
+        painter.setPen(QPen(border, 2 if self._is_current else 1))
+        painter.setBrush(QBrush(fill))
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(1, 1, -1, -1), 8, 8)
+
+        font = self.font()
+        font.setBold(self._is_current)
+        painter.setFont(font)
+        painter.setPen(text)
+        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.text())
+
+        if not existing_painter:
+            painter.end()
+
     def _draw_glow_effect(self, existing_painter=None):
         """Draw custom glow effect with performance optimization"""
         if not theme_manager:
@@ -359,7 +401,7 @@ class EnhancedPaginationButton(QPushButton):
 
         painter = existing_painter or QPainter(self)
         if not existing_painter:
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Cache theme colors for performance
         if not self._cached_colors:
@@ -484,10 +526,16 @@ class FluentPagination(QWidget):
         self._play_entrance_animation()
 
     def _check_performance_mode(self):
-        """Check system performance and adjust settings"""
-        import os
-        low_performance = os.environ.get('LOW_PERFORMANCE_MODE') == '1'
-        self._animations_enabled = not low_performance
+        """Follow the application's performance profile"""
+        profile = get_performance_profile()
+        self._animations_enabled = profile.animations_enabled()
+        profile.profile_changed.connect(self._on_performance_profile_changed)
+
+    def _on_performance_profile_changed(self, profile):
+        if get_performance_profile().animations_enabled():
+            self.enable_animations()
+        else:
+            self.disable_animations()
 
     def _setup_ui(self):
         """Setup enhanced UI with modern layout"""
@@ -623,6 +671,14 @@ class FluentPagination(QWidget):
             }
             self._last_theme_hash = theme_hash
 
+    def _style_button(self, button: EnhancedPaginationButton, is_current: bool,
+                      is_nav: bool = False):
+        """Style a button with QSS, or let it paint itself in native paint mode"""
+        if is_native_paint_active():
+            apply_native_palette(button)
+        else:
+            button.setStyleSheet(self._get_button_style(is_current, is_nav))
+
     @lru_cache(maxsize=8)
     def _get_button_style(self, is_current: bool, is_nav: bool = False) -> str:
         """Get cached button style"""
@@ -697,9 +753,8 @@ class FluentPagination(QWidget):
     def _update_style(self):
         """Update styles with cached colors and smooth transitions"""
         # Apply nav button styles from cache
-        nav_button_style = self._get_button_style(False, True)
-        self._prev_button.setStyleSheet(nav_button_style)
-        self._next_button.setStyleSheet(nav_button_style)
+        self._style_button(self._prev_button, False, True)
+        self._style_button(self._next_button, False, True)
 
         # Get colors
         if not self._cached_theme_colors:
@@ -853,7 +908,7 @@ class FluentPagination(QWidget):
 
         # Apply appropriate styling from cache
         is_current = page_num == self._current_page
-        button.setStyleSheet(self._get_button_style(is_current))
+        self._style_button(button, is_current)
 
         return button
 
@@ -1425,10 +1480,16 @@ class FluentSimplePagination(QWidget):
         self._play_entrance_animation()
 
     def _check_performance_mode(self):
-        """Check system performance and adjust settings"""
-        import os
-        low_performance = os.environ.get('LOW_PERFORMANCE_MODE') == '1'
-        self._animations_enabled = not low_performance
+        """Follow the application's performance profile"""
+        profile = get_performance_profile()
+        self._animations_enabled = profile.animations_enabled()
+        profile.profile_changed.connect(self._on_performance_profile_changed)
+
+    def _on_performance_profile_changed(self, profile):
+        if get_performance_profile().animations_enabled():
+            self.enable_animations()
+        else:
+            self.disable_animations()
 
     def _setup_ui(self):
         """Setup enhanced UI"""
@@ -1519,8 +1580,11 @@ class FluentSimplePagination(QWidget):
             }}
         """
 
-        self._prev_button.setStyleSheet(button_style)
-        self._next_button.setStyleSheet(button_style)
+        for button in (self._prev_button, self._next_button):
+            if is_native_paint_active():
+                apply_native_palette(button)
+            else:
+                button.setStyleSheet(button_style)
 
         self._page_label.setStyleSheet(f"""
             QLabel {{
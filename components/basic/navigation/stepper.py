@@ -10,6 +10,7 @@ from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, Propert
 from PySide6.QtGui import QPainter, QBrush, QFont, QColor
 from core.theme import theme_manager
 from core.enhanced_animations import (FluentMicroInteraction, FluentRevealEffect)
+from core.performance_profile import get_performance_profile
 from typing import Optional, List, Dict
 from functools import lru_cache
 
@@ -430,7 +431,7 @@ class FluentStepWidget(QWidget):
         # Only draw hover effect if opacity is non-zero
         if self._opacity > 0:
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
             # Get theme color with opacity
             current_theme = theme_manager
@@ -471,7 +472,7 @@ class FluentStepConnector(QWidget):
     def paintEvent(self, _event):
         """Custom paint for connector - optimized"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Use cached brush
         if not self._cached_brush:
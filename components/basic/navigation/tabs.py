@@ -15,6 +15,7 @@ from typing import Optional, List, Dict, Any
 from core.theme import theme_manager
 from core.animation import FluentAnimation
 from core.enhanced_animations import FluentTransition, FluentMicroInteraction, FluentRevealEffect
+from core.performance_profile import get_performance_profile
 
 
 class FluentTabButton(QPushButton):
@@ -173,7 +174,7 @@ class FluentTabButton(QPushButton):
         # Only draw when active or animating to/from active state
         if self._active_progress > 0.01 and theme_manager:
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
             theme = theme_manager
 
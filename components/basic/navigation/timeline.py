@@ -9,7 +9,9 @@ from PySide6.QtCore import Qt, Signal, QDateTime, QPropertyAnimation, Property,
 from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont
 from core.theme import theme_manager
 from core.animation import FluentAnimation
+from core.animation_clock import FluentClockAnimation
 from core.enhanced_animations import FluentRevealEffect, FluentMicroInteraction, FluentTransition, FluentParallel
+from core.performance_profile import get_performance_profile
 from typing import Optional, List, Union, cast, Dict
 from enum import Enum
 from datetime import datetime
@@ -57,7 +59,7 @@ class FluentTimelineItem(QFrame):
         self._desc_label: Optional[QLabel] = None
         self._timestamp_label: Optional[QLabel] = None
         self._dot_container: Optional[QFrame] = None
-        self._pulse_animation: Optional[QPropertyAnimation] = None
+        self._pulse_animation: Optional[FluentClockAnimation] = None
 
         # Setup
         self._setup_ui()
@@ -161,15 +163,10 @@ class FluentTimelineItem(QFrame):
         self.update()
 
     def _setup_animations(self):
-        """Setup optimized pulse animation"""
-        self._pulse_animation = QPropertyAnimation(
-            self, QByteArray(b"pulse_progress"))
-        self._pulse_animation.setDuration(FluentAnimation.DURATION_FAST)
-        self._pulse_animation.setEasingCurve(FluentAnimation.EASE_OUT)
-        # Use keyframes for smoother animation with less CPU usage
-        self._pulse_animation.setKeyValueAt(0.0, 0.0)
-        self._pulse_animation.setKeyValueAt(0.5, 1.0)
-        self._pulse_animation.setKeyValueAt(1.0, 0.0)
+        """Setup optimized pulse animation on the shared animation clock"""
+        self._pulse_animation = FluentClockAnimation(
+            self, self._on_pulse_frame, duration=FluentAnimation.DURATION_FAST,
+            easing=FluentAnimation.EASE_OUT)
 
     def resizeEvent(self, event):
         """Mark for redraw on resize"""
@@ -183,7 +180,7 @@ class FluentTimelineItem(QFrame):
         # Only redraw when necessary (status change, size change, or pulse animation)
         if self._needs_dot_redraw or self._status == self.Status.CURRENT:
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
             self._draw_timeline_elements(painter)
 
             # Reset redraw flag except for current status (needs continuous updates for pulse)
@@ -310,6 +307,12 @@ class FluentTimelineItem(QFrame):
     pulse_progress = Property(float, _get_pulse_progress, _set_pulse_progress, None, "",
                               notify=pulse_progress_changed)
 
+    def _on_pulse_frame(self, progress: float):
+        # Rise to 1.0 halfway through the pulse and fall back to 0.0; the
+        # animation clock repaints after the frame
+        self._pulse_progress = 1.0 - abs(2.0 * progress - 1.0)
+        self.pulse_progress_changed.emit()
+
     def setTitle(self, title: str):
         """Set item title with change check"""
         if self._title == title:
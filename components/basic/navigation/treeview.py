@@ -11,6 +11,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Signal, Qt, QPoint
 from PySide6.QtGui import QPainter, QColor, QIcon
 
+from core.performance_profile import get_performance_profile
 from components.base.fluent_control_base import FluentControlBase
 from components.base.fluent_component_interface import (
     FluentComponentSize
@@ -41,7 +42,7 @@ class FluentTreeItemDelegate(QStyledItemDelegate):
 
     def paint(self, painter, option, index):
         """Custom paint for tree items"""
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Get item rect
         rect = option.rect
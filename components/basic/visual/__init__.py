@@ -6,8 +6,35 @@ Visual and media elements including:
 - Interactive visual components
 """
 
-from .avatar import *
-from .rating import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .avatar import *
+    from .rating import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["avatar", "rating"],
+    exports={
+        "avatar": [
+            "AvatarPixmapCache", "get_avatar_pixmap_cache", "AvatarPresence",
+            "AvatarActivity", "FluentAvatar", "FluentAvatarGroup",
+        ],
+        "rating": ["EnhancedFluentRating"],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentAnimation": ("rating", "FluentAnimation"),
+        "FluentBaseWidget": ("avatar", "FluentBaseWidget"),
+        "FluentMicroInteraction": ("rating", "FluentMicroInteraction"),
+        "FluentRevealEffect": ("rating", "FluentRevealEffect"),
+        "FluentSequence": ("avatar", "FluentSequence"),
+        "FluentTransition": ("rating", "FluentTransition"),
+        "theme_manager": ("rating", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all visual classes and functions
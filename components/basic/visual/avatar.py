@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (QWidget, QHBoxLayout, QGraphicsDropShadowEffect,
                               QGraphicsEffect, QGraphicsOpacityEffect)
 from PySide6.QtCore import (Qt, Signal, QSize, Property, QPropertyAnimation,
                            QParallelAnimationGroup, QByteArray, QPoint,
-                           QEasingCurve, QTimer, QObject, QEvent, QRect)
+                           QEasingCurve, QTimer, QObject, QEvent, QRect, QPointF)
 from PySide6.QtGui import (QPainter, QPen, QBrush, QColor, QPixmap, QFont,
                             QPainterPath, QPaintEvent, QEnterEvent, QResizeEvent,
                             QLinearGradient, QFontMetrics, QMouseEvent, QFocusEvent,
@@ -22,12 +22,127 @@ from core.animation import FluentAnimation
 from core.enhanced_animations import (FluentTransition, FluentMicroInteraction,
                                       FluentRevealEffect, FluentSequence)
 from core.base import FluentBaseWidget
-from typing import Optional, List
+from core.memory import PRIORITY_EXPENSIVE, get_memory_registry, register_cache
+from core.performance_profile import get_performance_profile, profile_effect
+from typing import Optional, List, Tuple, Callable
+from collections import OrderedDict
 from enum import Enum
 import hashlib
 from functools import lru_cache
 
 
+class AvatarPixmapCache:
+    """Process-wide, byte-bounded LRU cache of rendered avatar pixmaps
+
+    Entries are keyed by the caller (for photos: image identity, size, shape
+    and device pixel ratio) and rendered at most once while they stay cached,
+    so every avatar showing the same user at the same size shares one pixmap.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self._entries: "OrderedDict[Tuple, QPixmap]" = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+    def pixmap(self, key: Tuple, render: Callable[[], QPixmap]) -> QPixmap:
+        """Get the pixmap for key, rendering and caching it on a miss"""
+        pixmap = self._entries.get(key)
+        if pixmap is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pixmap
+
+        self.misses += 1
+        pixmap = render()
+        size = self._pixmap_bytes(pixmap)
+        if size <= self._max_bytes:
+            self._entries[key] = pixmap
+            self._bytes += size
+            self._evict()
+            get_memory_registry().cache_grew()
+        return pixmap
+
+    def _evict(self, max_bytes: Optional[int] = None):
+        max_bytes = self._max_bytes if max_bytes is None else max_bytes
+        while self._bytes > max_bytes and self._entries:
+            _, pixmap = self._entries.popitem(last=False)
+            self._bytes -= self._pixmap_bytes(pixmap)
+
+    def trim(self, target_bytes: int):
+        """Evict least recently used entries until at most target_bytes remain"""
+        self._evict(max(0, target_bytes))
+
+    def setMaxBytes(self, max_bytes: int):
+        """Set the byte budget, evicting least recently used entries if needed"""
+        self._max_bytes = max(0, max_bytes)
+        self._evict()
+
+    def maxBytes(self) -> int:
+        return self._max_bytes
+
+    def bytesUsed(self) -> int:
+        return self._bytes
+
+    def count(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+
+_avatar_pixmap_cache = None
+
+
+@lru_cache(maxsize=1024)
+def _color_rgb_for_text(text: str) -> Tuple[int, int, int]:
+    """Consistent, readable RGB triple derived from a string"""
+    # Create hash from text
+    hex_dig = hashlib.md5(text.encode()).hexdigest()
+
+    # Extract RGB values with better distribution
+    r = int(hex_dig[0:2], 16)
+    g = int(hex_dig[2:4], 16)
+    b = int(hex_dig[4:6], 16)
+
+    #  color adjustment for better contrast and aesthetics
+    r = (r % 150) + 80
+    g = (g % 150) + 80
+    b = (b % 150) + 80
+
+    # Ensure color isn't too dark or too light
+    luminance = 0.299 * r + 0.587 * g + 0.114 * b
+    if luminance < 100:
+        # Too dark, lighten it
+        r = min(255, r + 50)
+        g = min(255, g + 50)
+        b = min(255, b + 50)
+    elif luminance > 200:
+        # Too light, darken it
+        r = max(0, r - 50)
+        g = max(0, g - 50)
+        b = max(0, b - 50)
+
+    return r, g, b
+
+
+def get_avatar_pixmap_cache() -> AvatarPixmapCache:
+    """Get the shared avatar pixmap cache"""
+    global _avatar_pixmap_cache
+    if _avatar_pixmap_cache is None:
+        _avatar_pixmap_cache = AvatarPixmapCache()
+        register_cache("avatar.pixmaps", _avatar_pixmap_cache.count,
+                       _avatar_pixmap_cache.bytesUsed, _avatar_pixmap_cache.trim,
+                       priority=PRIORITY_EXPENSIVE)
+    return _avatar_pixmap_cache
+
+
 class AvatarPresence(Enum):
     """Avatar presence status indicators"""
     NONE = "none"
@@ -107,6 +222,9 @@ class FluentAvatar(FluentBaseWidget):
         PLACEHOLDER = "placeholder"
         GRADIENT = "gradient"
 
+    # Paint initials/icon/placeholder avatars from shared pre-rendered sprites
+    SPRITE_CACHE_ENABLED = True
+
     #  signals
     clicked = Signal()
     double_clicked = Signal()
@@ -125,6 +243,7 @@ class FluentAvatar(FluentBaseWidget):
         self._shape = shape
         self._style = self.Style.PLACEHOLDER
         self._pixmap = None
+        self._image_key = None
         self._initials = ""
         self._name = ""
         self._icon = ""
@@ -153,7 +272,6 @@ class FluentAvatar(FluentBaseWidget):
         self._presence_progress = 0.0
         self._loading_progress = 0.0
         self._position_animation = None        # Performance optimization
-        self._cached_pixmap = None
         self._cached_colors = {}
         self._paint_cache_valid = False
         self._last_paint_size = QSize()
@@ -174,9 +292,6 @@ class FluentAvatar(FluentBaseWidget):
         self._setup_accessibility()
         self._setup_performance_monitoring()
 
-        # Connect to theme manager
-        theme_manager.theme_changed.connect(self._on_theme_changed)
-
         # Responsive layout support
         if parent:
             parent.installEventFilter(self)
@@ -204,7 +319,7 @@ class FluentAvatar(FluentBaseWidget):
         shadow.setBlurRadius(8)
         shadow.setColor(QColor(0, 0, 0, 60))
         shadow.setOffset(0, 2)
-        self.setGraphicsEffect(shadow)
+        self.setGraphicsEffect(profile_effect(shadow))
 
     def _setup_enhanced_theming(self):
         """Setup enhanced theming system with caching"""
@@ -213,17 +328,17 @@ class FluentAvatar(FluentBaseWidget):
 
     def _update_theme_colors(self):
         """Update and cache theme colors for performance"""
-        theme = theme_manager
+        tokens = theme_manager.tokens()
 
-        # Cache frequently used colors
+        # Shared, read-only theme colors; copy before modifying
         self._cached_colors = {
-            'accent': QColor(theme.get_color('primary')),
-            'accent_light': QColor(theme.get_color('accent_light')),
-            'background': QColor(theme.get_color('background')),
-            'surface': QColor(theme.get_color('surface')),
-            'border': QColor(theme.get_color('border')),
-            'text_primary': QColor(theme.get_color('text_primary')),
-            'text_secondary': QColor(theme.get_color('text_secondary')),
+            'accent': tokens.color('primary'),
+            'accent_light': tokens.color('accent_light'),
+            'background': tokens.color('background'),
+            'surface': tokens.color('surface'),
+            'border': tokens.color('border'),
+            'text_primary': tokens.color('text_primary'),
+            'text_secondary': tokens.color('text_secondary'),
         }
         
         # Apply theme-specific adjustments
@@ -306,7 +421,7 @@ class FluentAvatar(FluentBaseWidget):
 
     def _show_entrance_animation(self):
         """ entrance animation with multiple effects"""
-        if self._is_disposing:
+        if self._is_disposing or not get_performance_profile().animations_enabled():
             return
             
         entrance_sequence = FluentSequence(self)
@@ -361,8 +476,8 @@ class FluentAvatar(FluentBaseWidget):
             return
             
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, get_performance_profile().antialiasing())
 
         rect = self.rect()
         
@@ -379,11 +494,19 @@ class FluentAvatar(FluentBaseWidget):
 
         # Create  clipping path with shape support
         path = self._create_shape_path(rect)
-        painter.setClipPath(path)
 
         # Draw layered components with  styling
-        self._draw__background(painter, rect)
-        self._draw_content(painter, rect)
+        sprite_key = self._sprite_key(rect)
+        if sprite_key is not None:
+            dpr = self.devicePixelRatioF()
+            sprite = get_avatar_pixmap_cache().pixmap(
+                sprite_key + (dpr,), lambda: self._render_sprite(rect.size(), dpr))
+            painter.drawPixmap(rect, sprite)
+            painter.setClipPath(path)
+        else:
+            painter.setClipPath(path)
+            self._draw__background(painter, rect)
+            self._draw_content(painter, rect)
         
         # Draw overlays and effects
         if self._border_width > 0:
@@ -481,10 +604,45 @@ class FluentAvatar(FluentBaseWidget):
 
         painter.fillRect(rect, bg_color)
 
-    @lru_cache(maxsize=100)
     def _get_cached_color(self, text: str) -> QColor:
-        """Get cached color for text with LRU caching"""
-        return self._generate_color_from_string(text)
+        """Get cached color for text (hashing is shared across all avatars)"""
+        return QColor(*_color_rgb_for_text(text))
+
+    def _sprite_key(self, rect: QRect) -> Optional[Tuple]:
+        """Cache key for the pre-rendered background and content, if cacheable
+
+        Initials, icon and placeholder avatars at rest depend only on the key
+        fields, so they are painted from a shared sprite. Photos have their own
+        cache; hover/press transitions and custom gradients paint directly.
+        """
+        if (not self.SPRITE_CACHE_ENABLED or self._style == self.Style.PHOTO
+                or self._custom_gradient is not None
+                or self._hover_progress > 0 or self._press_progress > 0):
+            return None
+
+        text = self._name or self._initials
+        color = self._get_cached_color(text) if text else self._bg_color
+        # The theme colors the sprite is painted with, not the theme mode: a
+        # custom primary color changes them without changing the mode
+        theme_colors = tuple(theme_color.rgba() for theme_color in self._cached_colors.values())
+        return ('sprite', self._style, self._initials, self._icon, color.rgba(),
+                self._size, rect.width(), rect.height(), self._shape, theme_colors)
+
+    def _render_sprite(self, size: QSize, dpr: float) -> QPixmap:
+        """Render background and content, clipped to the avatar shape"""
+        sprite = QPixmap(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+        sprite.setDevicePixelRatio(dpr)
+        sprite.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, get_performance_profile().antialiasing())
+        rect = QRect(QPoint(0, 0), size)
+        painter.setClipPath(self._create_shape_path(rect))
+        self._draw__background(painter, rect)
+        self._draw_content(painter, rect)
+        painter.end()
+        return sprite
 
     def _draw_content(self, painter: QPainter, rect: QRect):
         """Draw main content based on style"""
@@ -505,10 +663,6 @@ class FluentAvatar(FluentBaseWidget):
     def _cleanup_cache(self):
         """Cleanup cached resources"""
         if not self._is_disposing:
-            # Clear cached pixmap if not in use
-            if self._cached_pixmap and self._style != self.Style.PHOTO:
-                self._cached_pixmap = None
-            
             # Clear color cache if theme changed
             if self._cached_colors and len(self._cached_colors) > 10:
                 self._cached_colors.clear()
@@ -549,21 +703,22 @@ class FluentAvatar(FluentBaseWidget):
                 self._setup_shadow_effect()  # Adjust shadow for new size
 
     def _draw__photo(self, painter: QPainter, rect: QRect):
-        """Draw photo with  rendering and caching"""
+        """Draw photo from the shared, shape-clipped avatar pixmap cache"""
         if not self._pixmap:
             return
 
-        # Use cached scaled pixmap for performance
-        if not self._cached_pixmap or self._cached_pixmap.size() != rect.size():
-            self._cached_pixmap = self._pixmap.scaled(
-                rect.size(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        # While a size animation runs, scale the final-size pixmap instead of
+        # rendering (and caching) one pixmap per intermediate frame
+        photo_size = rect.size()
+        size_animation = getattr(self, '_size_animation', None)
+        if size_animation and size_animation.state() == QPropertyAnimation.State.Running:
+            photo_size = size_animation.endValue()
 
-        # Center the pixmap
-        x = (rect.width() - self._cached_pixmap.width()) // 2
-        y = (rect.height() - self._cached_pixmap.height()) // 2
+        dpr = self.devicePixelRatioF()
+        key = ('photo', self._image_key, photo_size.width(), photo_size.height(),
+               self._shape, dpr)
+        photo = get_avatar_pixmap_cache().pixmap(
+            key, lambda: self._render_clipped_photo(photo_size, dpr))
 
         # Apply effects based on interaction state
         if self._hover_progress > 0:
@@ -571,9 +726,35 @@ class FluentAvatar(FluentBaseWidget):
         if self._press_progress > 0:
             painter.setOpacity(0.7 + 0.3 * (1 - self._press_progress))
 
-        painter.drawPixmap(x, y, self._cached_pixmap)
+        painter.drawPixmap(rect, photo)
         painter.setOpacity(1.0)
 
+    def _render_clipped_photo(self, size: QSize, dpr: float) -> QPixmap:
+        """Render the photo scaled to fill size and clipped to the avatar shape"""
+        canvas = QPixmap(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+        canvas.setDevicePixelRatio(dpr)
+        canvas.fill(Qt.GlobalColor.transparent)
+
+        scaled = self._pixmap.scaled(
+            canvas.size(),
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        scaled.setDevicePixelRatio(dpr)
+
+        painter = QPainter(canvas)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, get_performance_profile().antialiasing())
+        rect = QRect(QPoint(0, 0), size)
+        painter.setClipPath(self._create_shape_path(rect))
+
+        # Center the scaled photo
+        x = (size.width() - scaled.width() / dpr) / 2
+        y = (size.height() - scaled.height() / dpr) / 2
+        painter.drawPixmap(QPointF(x, y), scaled)
+        painter.end()
+        return canvas
+
     def _draw__initials(self, painter: QPainter, rect: QRect):
         """Draw initials with  typography and effects"""
         # Calculate responsive font size
@@ -854,34 +1035,7 @@ class FluentAvatar(FluentBaseWidget):
 
     def _generate_color_from_string(self, text: str) -> QColor:
         """Generate a consistent color from string with  algorithm"""
-        # Create hash from text
-        hash_object = hashlib.md5(text.encode())
-        hex_dig = hash_object.hexdigest()
-
-        # Extract RGB values with better distribution
-        r = int(hex_dig[0:2], 16)
-        g = int(hex_dig[2:4], 16)
-        b = int(hex_dig[4:6], 16)
-
-        #  color adjustment for better contrast and aesthetics
-        r = (r % 150) + 80
-        g = (g % 150) + 80
-        b = (b % 150) + 80
-
-        # Ensure color isn't too dark or too light
-        luminance = 0.299 * r + 0.587 * g + 0.114 * b
-        if luminance < 100:
-            # Too dark, lighten it
-            r = min(255, r + 50)
-            g = min(255, g + 50)
-            b = min(255, b + 50)
-        elif luminance > 200:
-            # Too light, darken it
-            r = max(0, r - 50)
-            g = max(0, g - 50)
-            b = max(0, b - 50)
-
-        return QColor(r, g, b)
+        return QColor(*_color_rgb_for_text(text))
 
     def _blend_colors(self, base: QColor, overlay: QColor) -> QColor:
         """Blend two colors with alpha blending"""
@@ -995,8 +1149,6 @@ class FluentAvatar(FluentBaseWidget):
                 lambda: self._complete_size_change(new_widget_size))
             self._size_animation.start()
             
-            # Update cached resources
-            self._cached_pixmap = None
             self._invalidate_paint_cache()
             
             # Emit signal
@@ -1029,11 +1181,16 @@ class FluentAvatar(FluentBaseWidget):
         """Get current avatar shape"""
         return self._shape
 
-    def setPixmap(self, pixmap: Optional[QPixmap]):
-        """Set avatar photo with  loading and transition"""
+    def setPixmap(self, pixmap: Optional[QPixmap], image_key: Optional[str] = None):
+        """Set avatar photo with  loading and transition
+
+        Rendered photos are shared through the avatar pixmap cache. Copies of
+        one QPixmap share an entry automatically; pass the same image_key
+        (for example a user id) to share across separately loaded pixmaps.
+        """
         if pixmap and not pixmap.isNull():
             self._pixmap = pixmap
-            self._cached_pixmap = None  # Clear cache
+            self._image_key = image_key if image_key is not None else f"pixmap:{pixmap.cacheKey()}"
             self._style = self.Style.PHOTO
             
             # Add loading animation
@@ -1043,7 +1200,7 @@ class FluentAvatar(FluentBaseWidget):
             QTimer.singleShot(150, lambda: self._complete_photo_loading(True))
         else:
             self._pixmap = None
-            self._cached_pixmap = None
+            self._image_key = None
             self._style = self.Style.PLACEHOLDER
             self._complete_photo_loading(False)
 
@@ -1078,9 +1235,6 @@ class FluentAvatar(FluentBaseWidget):
         if self._initials != new_initials:
             self._initials = new_initials
             self._style = self.Style.INITIALS if new_initials else self.Style.PLACEHOLDER
-              # Clear cached colors for regeneration
-            if hasattr(self, '_get_cached_color'):
-                self._get_cached_color.cache_clear()
             
             # Add transition effect
             if not self._is_disposing:
@@ -1108,9 +1262,6 @@ class FluentAvatar(FluentBaseWidget):
                 self._initials = ""
                 self._style = self.Style.PLACEHOLDER
 
-            # Clear cached colors
-            if hasattr(self, '_get_cached_color'):
-                self._get_cached_color.cache_clear()
               # Update accessibility
             self.setAccessibleName(f"Avatar for {name}" if name else "Avatar")
             
@@ -1306,7 +1457,7 @@ class FluentAvatar(FluentBaseWidget):
                 
     def borderColor(self) -> QColor:
         """Get border color"""
-        return self._border_color if self._border_color else self._border_col
+        return QColor(self._border_color if self._border_color else self._border_col)
 
     def setBackgroundColor(self, color: Optional[QColor]):
         """Set background color with transition"""
@@ -1318,7 +1469,7 @@ class FluentAvatar(FluentBaseWidget):
 
     def backgroundColor(self) -> QColor:
         """Get background color"""
-        return self._background_color if self._background_color else self._bg_color
+        return QColor(self._background_color if self._background_color else self._bg_color)
 
     def setCustomGradient(self, gradient: Optional[QLinearGradient]):
         """Set custom gradient for background"""
@@ -1342,10 +1493,11 @@ class FluentAvatar(FluentBaseWidget):
             self._hover_animation.start()
 
             # Subtle scale effect for better feedback
-            self._scale_animation.stop()
-            self._scale_animation.setStartValue(self._scale_progress)
-            self._scale_animation.setEndValue(1.08)
-            self._scale_animation.start()
+            if get_performance_profile().animations_enabled():
+                self._scale_animation.stop()
+                self._scale_animation.setStartValue(self._scale_progress)
+                self._scale_animation.setEndValue(1.08)
+                self._scale_animation.start()
             
             # Emit hover signal
             self.hovered.emit(True)
@@ -1487,14 +1639,10 @@ class FluentAvatar(FluentBaseWidget):
         self._timers.clear()
         
         # Clear cached resources
-        self._cached_pixmap = None
         self._cached_colors.clear()
         
-        # Disconnect from theme manager
-        try:
-            theme_manager.theme_changed.disconnect(self._on_theme_changed)
-        except:
-            pass
+        # Stop theme updates
+        theme_manager.unregister_component(self)
 
 
 class FluentAvatarGroup(QWidget):
@@ -1525,6 +1673,7 @@ class FluentAvatarGroup(QWidget):
         # Animation state
         self._group_hover_progress = 0.0
         self._expansion_progress = 0.0
+        self._avatar_base_positions = None
         
         # Performance optimization
         self._layout_cache_valid = False
@@ -1825,6 +1974,7 @@ class FluentAvatarGroup(QWidget):
 
         self._layout.addStretch()
         self._layout_cache_valid = True
+        self._avatar_base_positions = None
 
     def _create_overflow_indicator(self, count: int) -> Optional[FluentAvatar]:
         """Create overflow indicator avatar"""
@@ -1875,32 +2025,24 @@ class FluentAvatarGroup(QWidget):
             self._update_avatar_positions()
 
     def _update_avatar_positions(self):
-        """Update avatar positions based on expansion progress"""
-        if self._expansion_progress > 0:
-            # Animate avatars to spread out
-            base_spacing = self._spacing
-            expanded_spacing = base_spacing * (1 + self._expansion_progress * 2)
-            
-            for i, avatar in enumerate(self._avatars[:self._max_visible]):
-                if i > 0:
-                    # Animate position change
-                    current_pos = avatar.pos()
-                    new_x = current_pos.x() + int(expanded_spacing * i)
-                    target_pos = QPoint(new_x, current_pos.y())
-                    
-                    # Use smooth animation for position change
-                    if hasattr(avatar, '_position_animation'):
-                        # Create position animation with proper initialization
-                        animation = QPropertyAnimation(avatar, QByteArray(b"pos"), avatar)
-                        animation.setDuration(200)
-                        animation.setEasingCurve(FluentTransition.EASE_SMOOTH)
-                        animation.setEndValue(target_pos)
-                        
-                        # Store animation and start
-                        if hasattr(avatar, '_position_animation') and avatar._position_animation:
-                            avatar._position_animation.stop()
-                        setattr(avatar, '_position_animation', animation)
-                        animation.start()
+        """Update avatar positions based on expansion progress
+
+        Runs on every expansion animation tick, so avatars are offset directly
+        from their laid-out positions instead of starting an animation per tick.
+        """
+        visible = self._avatars[:self._max_visible]
+        if self._avatar_base_positions is None:
+            if self._expansion_progress <= 0:
+                return
+            self._avatar_base_positions = [(avatar, avatar.pos()) for avatar in visible]
+
+        extra_spacing = self._spacing * self._expansion_progress * 2
+        for i, (avatar, base_pos) in enumerate(self._avatar_base_positions):
+            if i > 0:
+                avatar.move(base_pos.x() + int(extra_spacing * i), base_pos.y())
+
+        if self._expansion_progress <= 0:
+            self._avatar_base_positions = None
 
     # Qt properties for animations
     # Group properties
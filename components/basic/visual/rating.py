@@ -13,6 +13,7 @@ from PySide6.QtGui import (QPainter, QPainterPath, QColor, QPen, QBrush, QLinear
 from core.theme import theme_manager
 from core.animation import FluentAnimation
 from core.enhanced_animations import FluentRevealEffect, FluentMicroInteraction, FluentTransition
+from core.performance_profile import get_performance_profile
 from typing import Optional, List, Callable, Dict, Any
 
 
@@ -383,7 +384,7 @@ class EnhancedFluentRating(QWidget):
     def paintEvent(self, event):
         """Paint the rating component"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Get colors
         filled_color = self._cached_colors.get('primary', QColor('#0078d4'))
@@ -15,49 +15,79 @@ Enhanced with:
 - Memory-efficient state management
 """
 
-# Import from organized submodules
-from .forms import *
-from .interface import *
-from .containers import *
+from typing import TYPE_CHECKING
 
-# Legacy imports for backward compatibility
-from .containers.panels import (
-    FluentSettingsPanel,
-    FluentPropertiesEditor,
-    FluentFormDialog,
-    FluentConfirmationDialog
-)
+from components.lazy_import import attach as _attach
 
-from .interface.navigation import (
-    FluentSidebar,
-    FluentHeaderNavigation,
-    FluentBreadcrumbBar,
-    # Modern type definitions
-    NavigationItem,
-    NavigationSection,
-    HeaderAction,
-    NavigationComponentState,
-    NavigationMode
-)
+if TYPE_CHECKING:
+    # Import from organized submodules
+    from .forms import *
+    from .interface import *
+    from .containers import *
 
-from .forms.forms import (
-    FluentFieldGroup,
-    FluentValidationForm,
-    FluentQuickForm,
-    # Modern type definitions
-    FieldType,
-    ValidationResult,
-    FieldDefinition,
-    FormState,
-    ValidationProtocol,
-    FormFieldData
-)
+    # Legacy imports for backward compatibility
+    from .containers.panels import (
+        FluentSettingsPanel,
+        FluentPropertiesEditor,
+        FluentFormDialog,
+        FluentConfirmationDialog
+    )
+
+    from .interface.navigation import (
+        FluentSidebar,
+        FluentHeaderNavigation,
+        FluentBreadcrumbBar,
+        # Modern type definitions
+        NavigationItem,
+        NavigationSection,
+        HeaderAction,
+        NavigationComponentState,
+        NavigationMode
+    )
+
+    from .forms.forms import (
+        FluentFieldGroup,
+        FluentValidationForm,
+        FluentQuickForm,
+        # Modern type definitions
+        FieldType,
+        ValidationResult,
+        FieldDefinition,
+        FormState,
+        ValidationProtocol,
+        FormFieldData
+    )
+
+    from .interface.toolbars import (
+        FluentActionToolbar,
+        FluentSearchToolbar,
+        FluentViewToolbar,
+        FluentStatusToolbar
+    )
 
-from .interface.toolbars import (
-    FluentActionToolbar,
-    FluentSearchToolbar,
-    FluentViewToolbar,
-    FluentStatusToolbar
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["forms", "interface", "containers"],
+    exports={
+        "containers.panels": [
+            "FluentSettingsPanel", "FluentPropertiesEditor", "FluentFormDialog",
+            "FluentConfirmationDialog",
+        ],
+        "interface.navigation": [
+            "FluentSidebar", "FluentHeaderNavigation", "FluentBreadcrumbBar",
+            "NavigationItem", "NavigationSection", "HeaderAction",
+            "NavigationComponentState", "NavigationMode",
+        ],
+        "forms.forms": [
+            "FluentFieldGroup", "FluentValidationForm", "FluentQuickForm", "FieldType",
+            "ValidationResult", "FieldDefinition", "FormState", "ValidationProtocol",
+            "FormFieldData",
+        ],
+        "interface.toolbars": [
+            "FluentActionToolbar", "FluentSearchToolbar", "FluentViewToolbar",
+            "FluentStatusToolbar",
+        ],
+    },
 )
 
 __all__ = [
@@ -4,7 +4,37 @@ Composite Container Components
 Complex container components including panels, dialogs, and settings management.
 """
 
-from .panels import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .panels import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["panels"],
+    exports={
+        "panels": [
+            "FluentLineEdit", "FluentCheckBox", "SettingValue", "ValidationCallback",
+            "ChangeCallback", "FormData", "T", "P", "SettingConfig", "ChoiceConfig",
+            "PropertyDescriptor", "PanelState", "ValidatorProtocol", "CacheManager",
+            "FluentSettingsPanel", "FluentPropertiesEditor", "FluentFormDialog",
+            "FluentConfirmationDialog",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentCompositeWidget": ("panels", "FluentCompositeWidget"),
+        "FluentFormGroup": ("panels", "FluentFormGroup"),
+        "FluentLayoutBuilder": ("panels", "FluentLayoutBuilder"),
+        "FluentMicroInteraction": ("panels", "FluentMicroInteraction"),
+        "FluentPanel": ("panels", "FluentPanel"),
+        "FluentStandardButton": ("panels", "FluentStandardButton"),
+        "FluentTransition": ("panels", "FluentTransition"),
+        "theme_manager": ("panels", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all composite container classes and functions
@@ -12,7 +12,7 @@ from __future__ import annotations
 from typing import Any, Callable, TypeVar, TypeAlias, Protocol, Optional, Dict, List, Union
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from functools import lru_cache, partial
+from functools import partial
 from contextlib import contextmanager
 import weakref
 from collections.abc import Sequence
@@ -29,6 +29,7 @@ from core.enhanced_base import (FluentPanel, FluentStandardButton,
                                 FluentFormGroup)
 from core.enhanced_animations import FluentTransition, FluentMicroInteraction
 from core.theme import theme_manager
+from core.style_cache import get_style_cache
 from components.basic.forms.textbox import FluentLineEdit
 from components.basic.forms.checkbox import FluentCheckBox
 
@@ -109,33 +110,18 @@ class ValidatorProtocol(Protocol):
 
 
 class CacheManager:
-    """Optimized cache manager for panel resources"""
+    """Panel style cache, a namespaced view onto the shared theme-versioned cache"""
     
-    def __init__(self, max_size: int = 256):
-        self._cache: Dict[str, Any] = {}
-        self._max_size = max_size
+    def __init__(self, namespace: str = "panels"):
+        self._prefix = f"{namespace}:"
     
-    @lru_cache(maxsize=256)
-    def get_cached_style(self, theme_name: str, component_type: str) -> str:
-        """Get cached style for component"""
-        key = f"{theme_name}_{component_type}"
-        return self._cache.get(key, "")
-    
-    def set_cached_style(self, theme_name: str, component_type: str, style: str) -> None:
-        """Set cached style with size management"""
-        if len(self._cache) >= self._max_size:
-            # Remove oldest entries
-            oldest_keys = list(self._cache.keys())[:self._max_size // 4]
-            for key in oldest_keys:
-                self._cache.pop(key, None)
-        
-        key = f"{theme_name}_{component_type}"
-        self._cache[key] = style
+    def get_style(self, component_type: str, generator: Callable[[], str]) -> str:
+        """Get cached style for component, generating it on a miss"""
+        return get_style_cache().get_style(self._prefix + component_type, generator)
     
     def clear_cache(self) -> None:
         """Clear the cache"""
-        self._cache.clear()
-        self.get_cached_style.cache_clear()
+        get_style_cache().invalidate(self._prefix)
 
 
 # Global cache instance
@@ -222,21 +208,16 @@ class FluentSettingsPanel(FluentPanel):
 
     def _apply_enhanced_styling(self) -> None:
         """Apply enhanced styling with caching"""
-        theme_key = getattr(theme_manager, 'get_current_theme_name', lambda: 'default')()
-        cached_style = _cache_manager.get_cached_style(theme_key, 'settings_panel')
-        
-        if not cached_style:
-            cached_style = f"""
-                FluentSettingsPanel {{
-                    background-color: {theme_manager.get_color("surface")};
-                    border: 1px solid {theme_manager.get_color("border")};
-                    border-radius: 8px;
-                }}
-                QFrame {{
-                    background-color: transparent;
-                }}
-            """
-            _cache_manager.set_cached_style(theme_key, 'settings_panel', cached_style)
+        cached_style = _cache_manager.get_style('settings_panel', lambda: f"""
+            FluentSettingsPanel {{
+                background-color: {theme_manager.get_color("surface")};
+                border: 1px solid {theme_manager.get_color("border")};
+                border-radius: 8px;
+            }}
+            QFrame {{
+                background-color: transparent;
+            }}
+        """)
         
         self.setStyleSheet(cached_style)
 
@@ -692,22 +673,17 @@ class FluentPropertiesEditor(FluentCompositeWidget):
 
     def _apply_enhanced_styling(self) -> None:
         """Apply enhanced styling with caching"""
-        theme_key = getattr(theme_manager, 'get_current_theme_name', lambda: 'default')()
-        cached_style = _cache_manager.get_cached_style(theme_key, 'properties_editor')
-        
-        if not cached_style:
-            cached_style = f"""
-                FluentPropertiesEditor {{
-                    background-color: {theme_manager.get_color("surface")};
-                    border: 1px solid {theme_manager.get_color("border")};
-                    border-radius: 8px;
-                }}
-                QScrollArea {{
-                    background-color: transparent;
-                    border: none;
-                }}
-            """
-            _cache_manager.set_cached_style(theme_key, 'properties_editor', cached_style)
+        cached_style = _cache_manager.get_style('properties_editor', lambda: f"""
+            FluentPropertiesEditor {{
+                background-color: {theme_manager.get_color("surface")};
+                border: 1px solid {theme_manager.get_color("border")};
+                border-radius: 8px;
+            }}
+            QScrollArea {{
+                background-color: transparent;
+                border: none;
+            }}
+        """)
         
         self.setStyleSheet(cached_style)
 
@@ -1171,22 +1147,17 @@ class FluentFormDialog(FluentCompositeWidget):
 
     def _apply_enhanced_styling(self) -> None:
         """Apply enhanced styling with caching"""
-        theme_key = getattr(theme_manager, 'get_current_theme_name', lambda: 'default')()
-        cached_style = _cache_manager.get_cached_style(theme_key, 'form_dialog')
-        
-        if not cached_style:
-            cached_style = f"""
-                FluentFormDialog {{
-                    background-color: {theme_manager.get_color("surface")};
-                    border: 1px solid {theme_manager.get_color("border")};
-                    border-radius: 12px;
-                }}
-                QScrollArea {{
-                    background-color: transparent;
-                    border: none;
-                }}
-            """
-            _cache_manager.set_cached_style(theme_key, 'form_dialog', cached_style)
+        cached_style = _cache_manager.get_style('form_dialog', lambda: f"""
+            FluentFormDialog {{
+                background-color: {theme_manager.get_color("surface")};
+                border: 1px solid {theme_manager.get_color("border")};
+                border-radius: 12px;
+            }}
+            QScrollArea {{
+                background-color: transparent;
+                border: none;
+            }}
+        """)
         
         self.setStyleSheet(cached_style)
 
@@ -1757,21 +1728,16 @@ class FluentConfirmationDialog(FluentCompositeWidget):
 
     def _apply_enhanced_styling(self) -> None:
         """Apply enhanced styling with theme awareness"""
-        theme_key = getattr(theme_manager, 'get_current_theme_name', lambda: 'default')()
-        cached_style = _cache_manager.get_cached_style(theme_key, 'confirmation_dialog')
-        
-        if not cached_style:
-            border_color = theme_manager.get_color("error") if self._config.danger_mode else theme_manager.get_color("border")
-            
-            cached_style = f"""
-                FluentConfirmationDialog {{
-                    background-color: {theme_manager.get_color("surface")};
-                    border: 2px solid {border_color};
-                    border-radius: 12px;
-                    padding: 16px;
-                }}
-            """
-            _cache_manager.set_cached_style(theme_key, 'confirmation_dialog', cached_style)
+        border_color = theme_manager.get_color("error") if self._config.danger_mode else theme_manager.get_color("border")
+
+        cached_style = _cache_manager.get_style(f'confirmation_dialog:{self._config.danger_mode}', lambda: f"""
+            FluentConfirmationDialog {{
+                background-color: {theme_manager.get_color("surface")};
+                border: 2px solid {border_color};
+                border-radius: 12px;
+                padding: 16px;
+            }}
+        """)
         
         self.setStyleSheet(cached_style)
 
@@ -4,7 +4,36 @@ Composite Form Components
 Complex form systems with validation, field management, and advanced form controls.
 """
 
-from .forms import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .forms import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["forms"],
+    exports={
+        "forms": [
+            "FluentLineEdit", "FluentTextEdit", "FluentButton",
+            "FluentComboBox", "FieldType", "ValidationResult", "FieldDefinition",
+            "FormState", "ValidationProtocol", "FormFieldData", "FluentFieldGroup",
+            "FluentValidationForm", "FluentQuickForm",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentAnimation": ("forms", "FluentAnimation"),
+        "FluentCompositeWidget": ("forms", "FluentCompositeWidget"),
+        "FluentFormGroup": ("forms", "FluentFormGroup"),
+        "FluentLayoutBuilder": ("forms", "FluentLayoutBuilder"),
+        "FluentMicroInteraction": ("forms", "FluentMicroInteraction"),
+        "FluentStandardButton": ("forms", "FluentStandardButton"),
+        "FluentTransition": ("forms", "FluentTransition"),
+        "theme_manager": ("forms", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all composite form classes and functions
@@ -163,9 +163,6 @@ class FluentFieldGroup(FluentFormGroup):
         self._setup_animations()
         self._setup_accessibility()
 
-        # Connect theme changes
-        theme_manager.theme_changed.connect(self._on_theme_changed)
-
     def _setup_error_display(self):
         """Setup enhanced error message display with modern styling"""
         self.error_label = QLabel()
@@ -599,11 +596,8 @@ class FluentFieldGroup(FluentFormGroup):
         self._field_cache.clear()
         self._style_cache.clear()
 
-        # Disconnect theme manager
-        try:
-            theme_manager.theme_changed.disconnect(self._on_theme_changed)
-        except RuntimeError:
-            pass  # Already disconnected
+        # Stop theme updates
+        theme_manager.unregister_component(self)
 
     # Legacy method - keeping for backward compatibility
     def add_choice_field_legacy(self, field_name: str, label: str,
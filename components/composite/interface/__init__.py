@@ -4,8 +4,43 @@ Composite Interface Components
 Complex interface management components including navigation systems and specialized toolbars.
 """
 
-from .navigation import *
-from .toolbars import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .navigation import *
+    from .toolbars import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["navigation", "toolbars"],
+    exports={
+        "navigation": [
+            "FluentLineEdit", "FluentButton", "NavigationCallback", "ItemId",
+            "SectionId", "BreadcrumbPath", "N", "NavigationItem", "NavigationSection",
+            "HeaderAction", "NavigationComponentState", "NavigationMode",
+            "SearchableProtocol", "FluentSidebar", "HeaderConfig",
+            "FluentHeaderNavigation", "BreadcrumbConfig", "FluentBreadcrumbBar",
+        ],
+        "toolbars": [
+            "ActionCallback", "FilterValue", "OptionTuple", "ButtonRef", "T",
+            "ActionConfig", "FilterConfig", "ViewConfig", "ToolbarState",
+            "ThemeAwareProtocol", "CacheManager", "FluentActionToolbar",
+            "FluentSearchToolbar", "FluentViewToolbar", "FluentStatusToolbar",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentCompositeWidget": ("navigation", "FluentCompositeWidget"),
+        "FluentLayoutBuilder": ("toolbars", "FluentLayoutBuilder"),
+        "FluentMicroInteraction": ("toolbars", "FluentMicroInteraction"),
+        "FluentStandardButton": ("toolbars", "FluentStandardButton"),
+        "FluentToolbar": ("toolbars", "FluentToolbar"),
+        "FluentTransition": ("toolbars", "FluentTransition"),
+        "theme_manager": ("toolbars", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all composite interface classes and functions
@@ -8,7 +8,7 @@ from __future__ import annotations
 from typing import Any, Callable, TypeVar, TypeAlias, Protocol, Optional, Dict, List
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from functools import lru_cache, partial
+from functools import partial
 from contextlib import contextmanager
 import weakref
 from collections.abc import Sequence
@@ -22,6 +22,7 @@ from PySide6.QtGui import QIcon, QAction
 from core.enhanced_base import FluentLayoutBuilder, FluentStandardButton, FluentToolbar
 from core.enhanced_animations import FluentTransition, FluentMicroInteraction
 from core.theme import theme_manager
+from core.style_cache import get_style_cache
 
 # Type aliases for better readability
 ActionCallback: TypeAlias = Callable[[], None]
@@ -91,22 +92,18 @@ class ThemeAwareProtocol(Protocol):
 
 
 class CacheManager:
-    """Simple cache manager for toolbar resources"""
+    """Toolbar style cache, a namespaced view onto the shared theme-versioned cache"""
 
-    def __init__(self, max_size: int = 128):
-        self._cache: dict[str, Any] = {}
-        self._max_size = max_size
+    def __init__(self, namespace: str = "toolbars"):
+        self._prefix = f"{namespace}:"
 
-    @lru_cache(maxsize=128)
-    def get_cached_style(self, theme_name: str, component_type: str) -> str:
-        """Get cached style for component"""
-        key = f"{theme_name}_{component_type}"
-        return self._cache.get(key, "")
+    def get_style(self, component_type: str, generator: Callable[[], str]) -> str:
+        """Get cached style for component, generating it on a miss"""
+        return get_style_cache().get_style(self._prefix + component_type, generator)
 
     def clear_cache(self) -> None:
         """Clear the cache"""
-        self._cache.clear()
-        self.get_cached_style.cache_clear()
+        get_style_cache().invalidate(self._prefix)
 
 
 # Global cache instance
@@ -138,20 +135,13 @@ class FluentActionToolbar(FluentToolbar):
 
     def _setup_enhanced_styling(self) -> None:
         """Apply enhanced styling with animations and caching"""
-        theme_key = theme_manager.get_current_theme_name() if hasattr(
-            theme_manager, 'get_current_theme_name') else 'default'
-        cached_style = _cache_manager.get_cached_style(
-            theme_key, 'action_toolbar')
-
-        if not cached_style:
-            cached_style = f"""
-                FluentActionToolbar {{
-                    background: {theme_manager.get_color("surface")};
-                    border-bottom: 1px solid {theme_manager.get_color("border")};
-                    border-radius: 0px;
-                }}
-            """
-            _cache_manager._cache[f"{theme_key}_action_toolbar"] = cached_style
+        cached_style = _cache_manager.get_style('action_toolbar', lambda: f"""
+            FluentActionToolbar {{
+                background: {theme_manager.get_color("surface")};
+                border-bottom: 1px solid {theme_manager.get_color("border")};
+                border-radius: 0px;
+            }}
+        """)
 
         self.setStyleSheet(cached_style)
 
@@ -303,7 +293,6 @@ class FluentActionToolbar(FluentToolbar):
 
     def _on_theme_changed(self, theme_name: str = "") -> None:
         """Handle theme changes with optimized updates"""
-        _cache_manager.clear_cache()
         self._style_update_timer.start(100)  # Debounce style updates
 
 
@@ -364,27 +353,20 @@ class FluentSearchToolbar(FluentToolbar):
         if not self._search_input:
             return
 
-        theme_key = theme_manager.get_current_theme_name() if hasattr(
-            theme_manager, 'get_current_theme_name') else 'default'
-        cached_style = _cache_manager.get_cached_style(
-            theme_key, 'search_input')
-
-        if not cached_style:
-            cached_style = f"""
-                QLineEdit {{
-                    background: {theme_manager.get_color("input_background")};
-                    border: 1px solid {theme_manager.get_color("border")};
-                    border-radius: 6px;
-                    padding: 6px 12px;
-                    font-size: 13px;
-                    min-width: 200px;
-                }}
-                QLineEdit:focus {{
-                    border-color: {theme_manager.get_color("accent")};
-                    background: {theme_manager.get_color("surface")};
-                }}
-            """
-            _cache_manager._cache[f"{theme_key}_search_input"] = cached_style
+        cached_style = _cache_manager.get_style('search_input', lambda: f"""
+            QLineEdit {{
+                background: {theme_manager.get_color("input_background")};
+                border: 1px solid {theme_manager.get_color("border")};
+                border-radius: 6px;
+                padding: 6px 12px;
+                font-size: 13px;
+                min-width: 200px;
+            }}
+            QLineEdit:focus {{
+                border-color: {theme_manager.get_color("accent")};
+                background: {theme_manager.get_color("surface")};
+            }}
+        """)
 
         self._search_input.setStyleSheet(cached_style)
 
@@ -401,19 +383,12 @@ class FluentSearchToolbar(FluentToolbar):
 
     def _setup_enhanced_styling(self) -> None:
         """Apply enhanced styling with caching"""
-        theme_key = theme_manager.get_current_theme_name() if hasattr(
-            theme_manager, 'get_current_theme_name') else 'default'
-        cached_style = _cache_manager.get_cached_style(
-            theme_key, 'search_toolbar')
-
-        if not cached_style:
-            cached_style = f"""
-                FluentSearchToolbar {{
-                    background: {theme_manager.get_color("surface")};
-                    border-bottom: 1px solid {theme_manager.get_color("border")};
-                }}
-            """
-            _cache_manager._cache[f"{theme_key}_search_toolbar"] = cached_style
+        cached_style = _cache_manager.get_style('search_toolbar', lambda: f"""
+            FluentSearchToolbar {{
+                background: {theme_manager.get_color("surface")};
+                border-bottom: 1px solid {theme_manager.get_color("border")};
+            }}
+        """)
 
         self.setStyleSheet(cached_style)
 
@@ -604,7 +579,6 @@ class FluentSearchToolbar(FluentToolbar):
 
     def _on_theme_changed(self, theme_name: str = "") -> None:
         """Handle theme changes with optimized updates"""
-        _cache_manager.clear_cache()
         self._setup_enhanced_styling()
         self._apply_search_styling()
 
@@ -780,19 +754,12 @@ class FluentViewToolbar(FluentToolbar):
 
     def _setup_enhanced_styling(self) -> None:
         """Apply enhanced styling with caching"""
-        theme_key = theme_manager.get_current_theme_name() if hasattr(
-            theme_manager, 'get_current_theme_name') else 'default'
-        cached_style = _cache_manager.get_cached_style(
-            theme_key, 'view_toolbar')
-
-        if not cached_style:
-            cached_style = f"""
-                FluentViewToolbar {{
-                    background: {theme_manager.get_color("surface")};
-                    border-bottom: 1px solid {theme_manager.get_color("border")};
-                }}
-            """
-            _cache_manager._cache[f"{theme_key}_view_toolbar"] = cached_style
+        cached_style = _cache_manager.get_style('view_toolbar', lambda: f"""
+            FluentViewToolbar {{
+                background: {theme_manager.get_color("surface")};
+                border-bottom: 1px solid {theme_manager.get_color("border")};
+            }}
+        """)
 
         self.setStyleSheet(cached_style)
 
@@ -961,7 +928,6 @@ class FluentViewToolbar(FluentToolbar):
 
     def _on_theme_changed(self, theme_name: str = "") -> None:
         """Handle theme changes with comprehensive updates"""
-        _cache_manager.clear_cache()
         self._setup_enhanced_styling()
         self._style_sort_controls()
 
@@ -1028,20 +994,13 @@ class FluentStatusToolbar(FluentToolbar):
 
     def _setup_enhanced_styling(self) -> None:
         """Apply enhanced styling with caching"""
-        theme_key = theme_manager.get_current_theme_name() if hasattr(
-            theme_manager, 'get_current_theme_name') else 'default'
-        cached_style = _cache_manager.get_cached_style(
-            theme_key, 'status_toolbar')
-
-        if not cached_style:
-            cached_style = f"""
-                FluentStatusToolbar {{
-                    background: {theme_manager.get_color("surface")};
-                    border-top: 1px solid {theme_manager.get_color("border")};
-                    border-radius: 0px;
-                }}
-            """
-            _cache_manager._cache[f"{theme_key}_status_toolbar"] = cached_style
+        cached_style = _cache_manager.get_style('status_toolbar', lambda: f"""
+            FluentStatusToolbar {{
+                background: {theme_manager.get_color("surface")};
+                border-top: 1px solid {theme_manager.get_color("border")};
+                border-radius: 0px;
+            }}
+        """)
 
         self.setStyleSheet(cached_style)
 
@@ -1264,7 +1223,6 @@ class FluentStatusToolbar(FluentToolbar):
 
     def _on_theme_changed(self, theme_name: str = "") -> None:
         """Handle theme changes with comprehensive updates"""
-        _cache_manager.clear_cache()
         self._setup_enhanced_styling()
         self._apply_status_label_styling()
 
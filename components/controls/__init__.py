@@ -6,8 +6,18 @@ Interactive control elements including:
 - Picker controls (date/time, selection)
 """
 
-from .media import *
-from .picker import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .media import *
+    from .picker import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["media", "picker"],
+)
 
 __all__ = [
     # Export all control-related classes and functions
@@ -4,7 +4,29 @@ Media Control Components
 Media players, viewers, and media-related controls
 """
 
-from .players import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .players import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["players"],
+    exports={
+        "players": [
+            "FluentImageLoader", "FluentTiledImageCanvas", "FluentImageViewer",
+            "FluentMediaPlayer", "FluentRichContentViewer", "FluentThumbnailModel",
+            "FluentThumbnailDelegate", "FluentThumbnailGallery",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentAnimation": ("players", "FluentAnimation"),
+        "theme_manager": ("players", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all media control classes and functions
@@ -6,31 +6,604 @@ Media players, image viewers, and rich content display components
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                                QSlider, QProgressBar, QFrame, QScrollArea, QTextEdit,
                                QGraphicsView, QGraphicsScene, QGraphicsPixmapItem,
-                               QSizePolicy, QFileDialog, QApplication, QMenu, QGridLayout)
+                               QSizePolicy, QFileDialog, QApplication, QMenu, QGridLayout,
+                               QListView, QAbstractItemView, QStyledItemDelegate,
+                               QStyleOptionViewItem, QStyle)
 from PySide6.QtCore import (Qt, Signal, QTimer, QUrl, QSize, QRect, QPoint,
-                           QPropertyAnimation, QEasingCurve, QThread)
+                           QPropertyAnimation, QEasingCurve, QThread, QObject,
+                           QAbstractListModel, QModelIndex, QRunnable, QThreadPool,
+                           QFile, QIODevice, QPersistentModelIndex)
 from PySide6.QtGui import (QPainter, QColor, QFont, QPen, QBrush, QPixmap, QIcon,
                           QMovie, QFontMetrics, QPainterPath, QTransform, 
-                          QWheelEvent, QMouseEvent, QPaintEvent)
+                          QWheelEvent, QMouseEvent, QPaintEvent, QImage, QImageReader,
+                          QImageIOHandler)
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtMultimediaWidgets import QVideoWidget
 from core.theme import theme_manager
 from core.animation import FluentAnimation
-from typing import Optional, List, Dict, Any, Tuple
+from core.memory import PRIORITY_EXPENSIVE, get_memory_registry, pixmap_bytes, register_cache
+from core.performance_profile import get_performance_profile
+from typing import Optional, List, Dict, Any, Set, Tuple
+from collections import OrderedDict
 import os
+import math
+import itertools
+import threading
 import mimetypes
 import time
 
 
+class _ImageDecodeSignals(QObject):
+    """Signals emitted by _ImageDecodeJob from the thread pool"""
+
+    preview_ready = Signal(int, str, QImage, QSize)  # ticket, path, preview, full size
+    finished = Signal(int, str, QImage, float)  # ticket, path, image, decode ms
+    failed = Signal(int, str, str)  # ticket, path, error
+
+
+class _ImageDecodeJob(QRunnable):
+    """Decodes one image file with QImageReader off the GUI thread
+
+    The file is opened once. Formats whose handler can decode at a reduced
+    size (JPEG, for example) first produce a low-resolution preview, then
+    the same device is rewound for the full decode. With a scaled size the
+    image is decoded straight to that size instead, without a preview.
+    """
+
+    def __init__(self, ticket: int, file_path: str, preview_size: int,
+                 scaled_size: QSize = QSize()):
+        super().__init__()
+        self.signals = _ImageDecodeSignals()
+        self._ticket = ticket
+        self._file_path = file_path
+        self._preview_size = preview_size
+        self._scaled_size = QSize(scaled_size)
+        self._cancelled = False
+        # The pool deletes the job once run() returns, so it may only be
+        # taken back from the queue while run() has not begun
+        self._start_lock = threading.Lock()
+        self._started = False
+
+    def cancel(self):
+        """Drop the result; a decode already inside QImageReader.read still completes"""
+        self._cancelled = True
+
+    def isCancelled(self) -> bool:
+        return self._cancelled
+
+    def takeFrom(self, pool: QThreadPool) -> bool:
+        """Remove the job from pool's queue if it has not started running"""
+        with self._start_lock:
+            return not self._started and pool.tryTake(self)
+
+    def run(self):
+        with self._start_lock:
+            self._started = True
+        started = time.perf_counter()
+
+        device = QFile(self._file_path)
+        if not device.open(QIODevice.OpenModeFlag.ReadOnly):
+            self.signals.failed.emit(self._ticket, self._file_path, device.errorString())
+            return
+
+        try:
+            reader = QImageReader(device)
+            reader.setAutoTransform(True)
+            full_size = reader.size()
+
+            if self._scaled_size.isValid():
+                if full_size.isValid():
+                    reader.setScaledSize(full_size.scaled(
+                        self._scaled_size, Qt.AspectRatioMode.KeepAspectRatio))
+            elif (self._preview_size > 0 and full_size.isValid()
+                    and max(full_size.width(), full_size.height()) > self._preview_size * 2
+                    and reader.supportsOption(QImageIOHandler.ImageOption.ScaledSize)):
+                reader.setScaledSize(full_size.scaled(
+                    self._preview_size, self._preview_size, Qt.AspectRatioMode.KeepAspectRatio))
+                preview = reader.read()
+                if self._cancelled:
+                    return
+                if not preview.isNull():
+                    self.signals.preview_ready.emit(self._ticket, self._file_path, preview, full_size)
+
+                device.seek(0)
+                reader = QImageReader(device)
+                reader.setAutoTransform(True)
+
+            if self._cancelled:
+                return
+            image = reader.read()
+            if self._cancelled:
+                return
+            if image.isNull():
+                self.signals.failed.emit(self._ticket, self._file_path, reader.errorString())
+            else:
+                elapsed = (time.perf_counter() - started) * 1000
+                self.signals.finished.emit(self._ticket, self._file_path, image, elapsed)
+        finally:
+            device.close()
+
+
+class FluentImageLoader(QObject):
+    """Asynchronous image loader with cancellation and neighbour prefetch
+
+    ``load`` supersedes any previous load: its decode is cancelled unless
+    the file is also being prefetched. ``prefetch`` decodes images at low
+    priority into a byte-bounded LRU cache so browsing to them is immediate.
+    """
+
+    preview_ready = Signal(str, QImage, QSize)  # file_path, preview, full size
+    image_ready = Signal(str, QImage)  # file_path, image
+    load_failed = Signal(str, str)  # file_path, error
+    decode_finished = Signal(str, float)  # file_path, decode ms
+    thumbnail_ready = Signal(str, QSize, QImage)  # file_path, requested size, thumbnail
+    thumbnail_failed = Signal(str, QSize)  # file_path, requested size
+
+    PREVIEW_SIZE = 1024
+
+    def __init__(self, parent: Optional[QObject] = None,
+                 cache_bytes: int = 256 * 1024 * 1024):
+        super().__init__(parent)
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, min(2, QThreadPool.globalInstance().maxThreadCount())))
+        self._tickets = itertools.count(1)
+        self._current_ticket = 0
+        self._current_path = ""
+        self._jobs: Dict[str, Tuple[int, _ImageDecodeJob]] = {}
+        self._prefetch_paths: Set[str] = set()
+        self._thumbnail_jobs: Dict[int, Tuple[str, QSize, _ImageDecodeJob]] = {}
+        self._cache: "OrderedDict[str, QImage]" = OrderedDict()
+        self._cache_used = 0
+        self._cache_bytes = cache_bytes
+        register_cache("image_loader.images", FluentImageLoader._cache_count,
+                       FluentImageLoader._cache_size, FluentImageLoader._trim_cache,
+                       owner=self, priority=PRIORITY_EXPENSIVE)
+
+    def load(self, file_path: str):
+        """Load an image, cancelling the previous load"""
+        previous = self._current_path
+        if previous and previous != file_path and previous not in self._prefetch_paths:
+            # Nobody waits for the superseded decode any more
+            entry = self._jobs.pop(previous, None)
+            if entry is not None:
+                self._cancel_job(entry[1])
+        self._current_path = file_path
+
+        cached = self._cache.get(file_path)
+        if cached is not None:
+            self._cache.move_to_end(file_path)
+            self._current_ticket = 0
+            self.image_ready.emit(file_path, cached)
+            return
+
+        in_flight = self._jobs.get(file_path)
+        if in_flight is not None:
+            # A prefetch for this file is already running; adopt it
+            self._current_ticket = in_flight[0]
+            return
+
+        self._current_ticket = self._start(file_path, QThread.Priority.HighPriority.value)
+
+    def prefetch(self, file_paths: List[str]):
+        """Decode images in the background ahead of use
+
+        Prefetches that are not in ``file_paths`` and not the current load
+        are cancelled.
+        """
+        wanted = set(file_paths)
+        self._prefetch_paths = wanted
+        for path, (ticket, job) in list(self._jobs.items()):
+            if path not in wanted and path != self._current_path:
+                self._cancel_job(job)
+                del self._jobs[path]
+
+        for path in file_paths:
+            if path and path not in self._cache and path not in self._jobs:
+                self._start(path, QThread.Priority.LowPriority.value)
+
+    def cancel(self):
+        """Cancel the current load"""
+        entry = self._jobs.pop(self._current_path, None)
+        if entry is not None:
+            self._cancel_job(entry[1])
+        self._current_ticket = 0
+        self._current_path = ""
+
+    def loadThumbnail(self, file_path: str, size: QSize):
+        """Decode an image to fit size in the background
+
+        Thumbnails bypass the image cache; callers keep the results.
+        """
+        ticket = next(self._tickets)
+        job = _ImageDecodeJob(ticket, file_path, 0, size)
+        job.signals.finished.connect(self._on_thumbnail_finished)
+        job.signals.failed.connect(self._on_thumbnail_failed)
+        self._thumbnail_jobs[ticket] = (file_path, QSize(size), job)
+        self._pool.start(job, QThread.Priority.NormalPriority.value)
+
+    def cancelThumbnail(self, file_path: str, size: QSize):
+        """Cancel the pending decodes of one thumbnail"""
+        for ticket, (path, requested, job) in list(self._thumbnail_jobs.items()):
+            if path == file_path and requested == size:
+                self._cancel_job(job)
+                del self._thumbnail_jobs[ticket]
+
+    def cancelThumbnails(self):
+        """Cancel all pending thumbnail decodes"""
+        for _, _, job in self._thumbnail_jobs.values():
+            self._cancel_job(job)
+        self._thumbnail_jobs.clear()
+
+    def cachedImage(self, file_path: str) -> Optional[QImage]:
+        return self._cache.get(file_path)
+
+    def clearCache(self):
+        self._cache.clear()
+        self._cache_used = 0
+
+    def _cache_count(self) -> int:
+        return len(self._cache)
+
+    def _cache_size(self) -> int:
+        return self._cache_used
+
+    def _trim_cache(self, target_bytes: int):
+        """Drop the least recently used images until at most target_bytes remain"""
+        while self._cache and self._cache_used > target_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_used -= evicted.sizeInBytes()
+
+    def _start(self, file_path: str, priority: int) -> int:
+        ticket = next(self._tickets)
+        job = _ImageDecodeJob(ticket, file_path, self.PREVIEW_SIZE)
+        job.signals.preview_ready.connect(self._on_preview_ready)
+        job.signals.finished.connect(self._on_finished)
+        job.signals.failed.connect(self._on_failed)
+        self._jobs[file_path] = (ticket, job)
+        self._pool.start(job, priority)
+        return ticket
+
+    def _cancel_job(self, job: _ImageDecodeJob):
+        """Cancel a job, removing it from the queue if it has not started"""
+        job.cancel()
+        job.takeFrom(self._pool)
+
+    def _release_job(self, ticket: int, file_path: str) -> bool:
+        """Forget a finished job; returns False if its result is stale"""
+        entry = self._jobs.get(file_path)
+        if entry is None or entry[0] != ticket:
+            return False
+        del self._jobs[file_path]
+        return True
+
+    def _on_preview_ready(self, ticket: int, file_path: str, preview: QImage, full_size: QSize):
+        if ticket == self._current_ticket:
+            self.preview_ready.emit(file_path, preview, full_size)
+
+    def _on_finished(self, ticket: int, file_path: str, image: QImage, elapsed: float):
+        if not self._release_job(ticket, file_path):
+            return
+
+        self._store(file_path, image)
+        self.decode_finished.emit(file_path, elapsed)
+        if ticket == self._current_ticket:
+            self.image_ready.emit(file_path, image)
+
+    def _on_failed(self, ticket: int, file_path: str, error: str):
+        if self._release_job(ticket, file_path) and ticket == self._current_ticket:
+            self.load_failed.emit(file_path, error)
+
+    def _on_thumbnail_finished(self, ticket: int, file_path: str, image: QImage, _elapsed: float):
+        entry = self._thumbnail_jobs.pop(ticket, None)
+        if entry is not None:
+            self.thumbnail_ready.emit(file_path, entry[1], image)
+
+    def _on_thumbnail_failed(self, ticket: int, file_path: str, _error: str):
+        entry = self._thumbnail_jobs.pop(ticket, None)
+        if entry is not None:
+            self.thumbnail_failed.emit(file_path, entry[1])
+
+    def _store(self, file_path: str, image: QImage):
+        size = image.sizeInBytes()
+        if size > self._cache_bytes:
+            return
+        self._cache[file_path] = image
+        self._cache_used += size
+        self._trim_cache(self._cache_bytes)
+        get_memory_registry().cache_grew()
+
+
+class _PyramidSignals(QObject):
+    """Signals emitted by _PyramidBuilder from the thread pool"""
+
+    level_ready = Signal(int, int, QImage)  # generation, level, image
+
+
+class _PyramidBuilder(QRunnable):
+    """Builds successive half-resolution mip levels of an image off the GUI thread"""
+
+    def __init__(self, generation: int, image: QImage, min_size: int):
+        super().__init__()
+        self.signals = _PyramidSignals()
+        self._generation = generation
+        self._image = image
+        self._min_size = min_size
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        image = self._image
+        level = 0
+        while not self._cancelled and max(image.width(), image.height()) > self._min_size:
+            image = image.scaled(max(1, image.width() // 2), max(1, image.height() // 2),
+                                 Qt.AspectRatioMode.IgnoreAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+            level += 1
+            if not self._cancelled:
+                self.signals.level_ready.emit(self._generation, level, image)
+
+
+class FluentTiledImageCanvas(QWidget):
+    """Draws an image from a tile pyramid, touching only visible tiles
+
+    Level 0 is the source image; each further level halves the resolution
+    and is generated in the background. Painting picks the coarsest level
+    that still has enough resolution for the current zoom, converts the
+    visible tiles of that level to pixmaps and keeps them in a byte-bounded
+    LRU cache. While zooming, tiles are drawn with fast transformation and
+    refined with smooth transformation once zooming goes idle.
+    """
+
+    TILE_SIZE = 256
+    REFINE_DELAY = 150  # ms of zoom inactivity before smooth rendering
+    MIN_LEVEL_SIZE = 256
+
+    def __init__(self, parent: Optional[QWidget] = None,
+                 cache_bytes: int = 96 * 1024 * 1024):
+        super().__init__(parent)
+
+        self._levels: Dict[int, QImage] = {}
+        self._source_size = QSize()
+        self._generation = 0
+        self._builder: Optional[_PyramidBuilder] = None
+        self._zoom = 1.0
+        self._text = ""
+
+        self._tiles: "OrderedDict[Tuple[int, int, int, int], QPixmap]" = OrderedDict()
+        self._tile_bytes = 0
+        self._cache_bytes = cache_bytes
+        register_cache("tiled_canvas.tiles", FluentTiledImageCanvas._tile_count,
+                       FluentTiledImageCanvas.cacheUsage, FluentTiledImageCanvas._trim_tiles,
+                       owner=self, priority=PRIORITY_EXPENSIVE)
+        register_cache("tiled_canvas.levels", FluentTiledImageCanvas._level_count,
+                       FluentTiledImageCanvas._level_bytes, FluentTiledImageCanvas._trim_levels,
+                       owner=self, priority=PRIORITY_EXPENSIVE)
+
+        self._fast_render = False
+        self._refine_timer = QTimer(self)
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.setInterval(self.REFINE_DELAY)
+        self._refine_timer.timeout.connect(self._refine)
+
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
+
+    def setImage(self, image: Optional[QImage]):
+        """Set the source image and start building its pyramid"""
+        self._reset()
+
+        if image is not None and not image.isNull():
+            self._source_size = image.size()
+            self._levels[0] = image
+            self._builder = _PyramidBuilder(self._generation, image, self.MIN_LEVEL_SIZE)
+            self._builder.signals.level_ready.connect(self._on_level_ready)
+            QThreadPool.globalInstance().start(self._builder)
+
+        self._update_geometry()
+        self.update()
+
+    def setPreview(self, preview: QImage, source_size: QSize):
+        """Show a low-resolution preview standing in for an image of source_size"""
+        self._reset()
+
+        if not preview.isNull() and source_size.isValid():
+            self._source_size = QSize(source_size)
+            level = max(1, round(math.log2(max(1.0, source_size.width() / preview.width()))))
+            self._levels[level] = preview
+
+        self._update_geometry()
+        self.update()
+
+    def _reset(self):
+        if self._builder is not None:
+            self._builder.cancel()
+            self._builder = None
+
+        self._generation += 1
+        self._levels.clear()
+        self._source_size = QSize()
+        self._text = ""
+        self._clear_tiles()
+
+    def imageSize(self) -> QSize:
+        return QSize(self._source_size)
+
+    def setZoom(self, zoom: float, fast: bool = True):
+        """Set zoom factor; fast zooms are refined after an idle period"""
+        self._zoom = zoom
+        if fast:
+            self._fast_render = True
+            self._refine_timer.start()
+        self._update_geometry()
+        self.update()
+
+    def zoom(self) -> float:
+        return self._zoom
+
+    def setText(self, text: str):
+        """Show placeholder text instead of an image"""
+        self.setImage(None)
+        self._text = text
+        self.update()
+
+    def hasImage(self) -> bool:
+        return 0 in self._levels
+
+    def setCacheLimit(self, cache_bytes: int):
+        """Set the byte budget for cached tile pixmaps"""
+        self._cache_bytes = max(0, cache_bytes)
+        self._trim_tiles()
+
+    def cacheUsage(self) -> int:
+        """Get bytes currently held by cached tile pixmaps"""
+        return self._tile_bytes
+
+    def _update_geometry(self):
+        size = self.imageSize()
+        if size.isValid():
+            self.setMinimumSize(max(1, round(size.width() * self._zoom)),
+                                max(1, round(size.height() * self._zoom)))
+        else:
+            self.setMinimumSize(400, 300)
+
+    def _on_level_ready(self, generation: int, level: int, image: QImage):
+        if generation == self._generation:
+            self._levels[level] = image
+            get_memory_registry().cache_grew()
+            self.update()
+
+    def _refine(self):
+        self._fast_render = False
+        self.update()
+
+    def _level_for_zoom(self) -> int:
+        """Coarsest available level whose resolution still covers the zoom"""
+        needed_width = self._source_size.width() * self._zoom
+        levels = sorted(self._levels)
+        level = levels[0]
+        for candidate in levels[1:]:
+            if self._levels[candidate].width() >= needed_width:
+                level = candidate
+        return level
+
+    def _tile(self, level: int, tx: int, ty: int) -> QPixmap:
+        key = (self._generation, level, tx, ty)
+        pixmap = self._tiles.get(key)
+        if pixmap is not None:
+            self._tiles.move_to_end(key)
+            return pixmap
+
+        image = self._levels[level]
+        tile_rect = QRect(tx * self.TILE_SIZE, ty * self.TILE_SIZE,
+                          self.TILE_SIZE, self.TILE_SIZE).intersected(image.rect())
+        pixmap = QPixmap.fromImage(image.copy(tile_rect))
+        self._tiles[key] = pixmap
+        self._tile_bytes += pixmap.width() * pixmap.height() * 4
+        self._trim_tiles()
+        get_memory_registry().cache_grew()
+        return pixmap
+
+    def _trim_tiles(self, target_bytes: Optional[int] = None):
+        """Drop the least recently used tiles until at most target_bytes remain
+
+        Trimming to the cache limit always keeps the most recent tile so a
+        frame never thrashes itself; the memory registry may empty the cache.
+        """
+        keep = 1 if target_bytes is None else 0
+        limit = self._cache_bytes if target_bytes is None else target_bytes
+        while self._tile_bytes > limit and len(self._tiles) > keep:
+            _, pixmap = self._tiles.popitem(last=False)
+            self._tile_bytes -= pixmap.width() * pixmap.height() * 4
+
+    def _tile_count(self) -> int:
+        return len(self._tiles)
+
+    def _level_count(self) -> int:
+        return len(self._levels)
+
+    def _level_bytes(self) -> int:
+        # Level 0 is the caller's image; only the generated levels are ours
+        return sum(image.sizeInBytes() for level, image in self._levels.items() if level)
+
+    def _trim_levels(self, target_bytes: int):
+        """Drop generated pyramid levels, coarsest first; painting falls back to finer ones"""
+        used = self._level_bytes()
+        for level in sorted(self._levels, reverse=True):
+            if used <= target_bytes or len(self._levels) == 1:
+                break
+            if level:
+                used -= self._levels.pop(level).sizeInBytes()
+
+    def _clear_tiles(self):
+        self._tiles.clear()
+        self._tile_bytes = 0
+
+    def paintEvent(self, event: QPaintEvent):
+        painter = QPainter(self)
+
+        source_size = self.imageSize()
+        if not source_size.isValid():
+            if self._text:
+                painter.setPen(QPen(QColor("#cccccc"), 2, Qt.PenStyle.DashLine))
+                painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
+                painter.setPen(QColor("#888888"))
+                painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self._text)
+            return
+
+        level = self._level_for_zoom()
+        level_image = self._levels[level]
+        # Widget pixels per level pixel
+        scale_x = self._zoom * source_size.width() / level_image.width()
+        scale_y = self._zoom * source_size.height() / level_image.height()
+        origin_x = max(0, (self.width() - round(source_size.width() * self._zoom)) // 2)
+        origin_y = max(0, (self.height() - round(source_size.height() * self._zoom)) // 2)
+
+        if not self._fast_render:
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, get_performance_profile().antialiasing())
+
+        # Visible area in level coordinates, expanded to whole tiles
+        dirty = event.rect().intersected(self.visibleRegion().boundingRect())
+        if dirty.isEmpty():
+            return
+        span_x = self.TILE_SIZE * scale_x
+        span_y = self.TILE_SIZE * scale_y
+        first_tx = max(0, int((dirty.left() - origin_x) // span_x))
+        first_ty = max(0, int((dirty.top() - origin_y) // span_y))
+        last_tx = min((level_image.width() - 1) // self.TILE_SIZE,
+                      int((dirty.right() - origin_x) // span_x))
+        last_ty = min((level_image.height() - 1) // self.TILE_SIZE,
+                      int((dirty.bottom() - origin_y) // span_y))
+
+        for ty in range(first_ty, last_ty + 1):
+            for tx in range(first_tx, last_tx + 1):
+                pixmap = self._tile(level, tx, ty)
+                # Round shared edges identically so neighbouring tiles never gap
+                x0 = origin_x + round(tx * self.TILE_SIZE * scale_x)
+                y0 = origin_y + round(ty * self.TILE_SIZE * scale_y)
+                x1 = origin_x + round((tx * self.TILE_SIZE + pixmap.width()) * scale_x)
+                y1 = origin_y + round((ty * self.TILE_SIZE + pixmap.height()) * scale_y)
+                painter.drawPixmap(QRect(x0, y0, x1 - x0, y1 - y0), pixmap)
+
+
 class FluentImageViewer(QWidget):
-    """Fluent Design style image viewer with zoom and pan"""
+    """Fluent Design style image viewer with zoom and pan
+
+    Images are rendered through FluentTiledImageCanvas, so zooming never
+    allocates a full-size scaled copy of the image.
+    """
     
     image_changed = Signal(str)  # file_path
+    image_decoded = Signal(str, float)  # file_path, decode time in ms
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
-        self._current_image = None
+        self._current_image: Optional[QImage] = None
+        self._current_path = ""
+        self._image_sequence: List[str] = []
+        self._sequence_index = -1
         self._zoom_factor = 1.0
         self._min_zoom = 0.1
         self._max_zoom = 5.0
@@ -39,6 +612,7 @@ class FluentImageViewer(QWidget):
         self._is_panning = False
         
         self._setup_ui()
+        self._setup_loader()
         self._setup_style()
         
         theme_manager.theme_changed.connect(self._on_theme_changed)
@@ -85,30 +659,85 @@ class FluentImageViewer(QWidget):
         toolbar_layout.addWidget(self.fit_btn)
         
         # Image display area
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setMinimumSize(400, 300)
-        self.image_label.setText("No image loaded")
-        self.image_label.setStyleSheet("border: 2px dashed #cccccc; color: #888888;")
+        self.image_canvas = FluentTiledImageCanvas()
+        self.image_canvas.setText("No image loaded")
         
-        # Scroll area for panning
+        # Scroll area for panning; the canvas grows past the viewport when zoomed
         self.scroll_area = QScrollArea()
-        self.scroll_area.setWidget(self.image_label)
+        self.scroll_area.setWidget(self.image_canvas)
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         layout.addWidget(self.toolbar)
         layout.addWidget(self.scroll_area, 1)
     
+    def _setup_loader(self):
+        """Setup the background image loader"""
+        self.loader = FluentImageLoader(self)
+        self.loader.preview_ready.connect(self._on_preview_ready)
+        self.loader.image_ready.connect(self._on_image_ready)
+        self.loader.load_failed.connect(self._on_load_failed)
+        self.loader.decode_finished.connect(self.image_decoded.emit)
+
     def loadImage(self, file_path: str):
-        """Load image from file"""
-        if os.path.exists(file_path):
-            self._current_image = QPixmap(file_path)
-            if not self._current_image.isNull():
-                self._display_image()
-                self.image_changed.emit(file_path)
-            else:
-                self.image_label.setText("Failed to load image")
+        """Load image from file
+
+        Decoding happens on a worker thread; image_changed is emitted once the
+        full image is shown. Loading another image cancels this one.
+        """
+        self._current_path = file_path
+        self.loader.load(file_path)
+
+    def setImageSequence(self, file_paths: List[str], current: int = 0):
+        """Set the sequence browsed with showNext/showPrevious and show one item"""
+        self._image_sequence = list(file_paths)
+        self._sequence_index = -1
+        if self._image_sequence:
+            self.showImageAt(current)
+
+    def showImageAt(self, index: int):
+        """Show an image of the browsing sequence and prefetch its neighbours"""
+        if not 0 <= index < len(self._image_sequence):
+            return
+
+        self._sequence_index = index
+        self.loadImage(self._image_sequence[index])
+        self.loader.prefetch([self._image_sequence[i] for i in (index + 1, index - 1)
+                              if 0 <= i < len(self._image_sequence)])
+
+    def showNext(self):
+        """Show the next image of the browsing sequence"""
+        self.showImageAt(self._sequence_index + 1)
+
+    def showPrevious(self):
+        """Show the previous image of the browsing sequence"""
+        self.showImageAt(self._sequence_index - 1)
+
+    def currentIndex(self) -> int:
+        """Get index of the shown image in the browsing sequence"""
+        return self._sequence_index
+
+    def _on_preview_ready(self, file_path: str, preview: QImage, full_size: QSize):
+        """Show a low-resolution preview while the full decode runs"""
+        if file_path == self._current_path:
+            self.image_canvas.setPreview(preview, full_size)
+            self._display_image(fast=False)
+
+    def _on_image_ready(self, file_path: str, image: QImage):
+        """Show the fully decoded image"""
+        if file_path != self._current_path:
+            return
+
+        self._current_image = image
+        self.image_canvas.setImage(image)
+        self._display_image(fast=False)
+        self.image_changed.emit(file_path)
+
+    def _on_load_failed(self, file_path: str, _error: str):
+        """Handle decode failure"""
+        if file_path == self._current_path:
+            self._current_image = None
+            self.image_canvas.setText("Failed to load image")
     
     def _open_image(self):
         """Open image file dialog"""
@@ -119,17 +748,24 @@ class FluentImageViewer(QWidget):
         if file_path:
             self.loadImage(file_path)
     
-    def _display_image(self):
-        """Display current image with zoom"""
-        if self._current_image:
-            scaled_pixmap = self._current_image.scaled(
-                self._current_image.size() * self._zoom_factor,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled_pixmap)
-            self.image_label.resize(scaled_pixmap.size())
-            self._update_zoom_label()
+    def _display_image(self, fast: bool = True):
+        """Display current image with zoom, keeping the viewport center fixed"""
+        if not self.image_canvas.imageSize().isValid():
+            return
+
+        h_bar = self.scroll_area.horizontalScrollBar()
+        v_bar = self.scroll_area.verticalScrollBar()
+        viewport = self.scroll_area.viewport().size()
+        previous_zoom = self.image_canvas.zoom()
+        center_x = (h_bar.value() + viewport.width() / 2) / previous_zoom
+        center_y = (v_bar.value() + viewport.height() / 2) / previous_zoom
+
+        self.image_canvas.setZoom(self._zoom_factor, fast)
+        self.scroll_area.widget().adjustSize()
+
+        h_bar.setValue(round(center_x * self._zoom_factor - viewport.width() / 2))
+        v_bar.setValue(round(center_y * self._zoom_factor - viewport.height() / 2))
+        self._update_zoom_label()
     
     def _zoom_in(self):
         """Zoom in"""
@@ -150,9 +786,9 @@ class FluentImageViewer(QWidget):
     
     def _fit_to_window(self):
         """Fit image to window"""
-        if self._current_image:
+        image_size = self.image_canvas.imageSize()
+        if image_size.isValid():
             available_size = self.scroll_area.size()
-            image_size = self._current_image.size()
             
             scale_x = available_size.width() / image_size.width()
             scale_y = available_size.height() / image_size.height()
@@ -655,19 +1291,292 @@ class FluentRichContentViewer(QWidget):
         self._setup_style()
 
 
+class FluentThumbnailModel(QAbstractListModel):
+    """List model backing FluentThumbnailGallery
+
+    Each row is a lightweight record (title, file path and optional source
+    pixmap). Scaled thumbnails are never stored per row; they are produced on
+    demand by the delegate and kept in its byte-bounded LRU cache.
+    """
+
+    SourcePixmapRole = Qt.ItemDataRole.UserRole + 1
+    FilePathRole = Qt.ItemDataRole.UserRole + 2
+    ThumbnailKeyRole = Qt.ItemDataRole.UserRole + 3
+
+    # Shared across models so thumbnail cache keys never collide
+    _key_counter = itertools.count()
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return os.path.basename(row['title'])
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return row['title']
+        if role == self.SourcePixmapRole:
+            return row['pixmap']
+        if role == self.FilePathRole:
+            return row['path']
+        if role == self.ThumbnailKeyRole:
+            return row['key']
+        return None
+
+    def appendRows(self, rows: List[Tuple[str, str, Optional[QPixmap]]]):
+        """Append (title, path, pixmap) records in a single insert"""
+        if not rows:
+            return
+
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for title, path, pixmap in rows:
+            self._rows.append({
+                'title': title,
+                'path': path,
+                'pixmap': pixmap,
+                'key': next(self._key_counter),
+            })
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+    def title(self, row: int) -> str:
+        return self._rows[row]['title']
+
+
+class FluentThumbnailDelegate(QStyledItemDelegate):
+    """Paints gallery cells directly from model rows
+
+    Only visible rows are ever painted, so decoding and scaling work is
+    bounded by the viewport rather than by the number of items. Files are
+    decoded at thumbnail size by a FluentImageLoader off the GUI thread;
+    cells show a placeholder until their thumbnail arrives.
+
+    Thumbnails are kept in the delegate's own LRU cache, which the gallery
+    sizes to hold at least a few viewports of them, so visible thumbnails
+    never evict each other and get decoded again.
+    """
+
+    PADDING = 8
+    TITLE_HEIGHT = 32
+    CACHE_BYTES = 64 * 1024 * 1024
+
+    thumbnail_loaded = Signal()  # a requested thumbnail arrived or failed
+
+    def __init__(self, parent: Optional[QObject] = None,
+                 loader: Optional[FluentImageLoader] = None):
+        super().__init__(parent)
+        self._thumbnail_size = QSize(150, 150)
+        self._failed_keys: Set[int] = set()
+        # (path, width, height) being decoded -> rows waiting for it, by row key
+        self._pending: Dict[Tuple[str, int, int], Dict[int, QPersistentModelIndex]] = {}
+        self._cache: "OrderedDict[Tuple[int, int, int], QPixmap]" = OrderedDict()
+        self._cache_used = 0
+        self._cache_bytes = self.CACHE_BYTES
+
+        self._loader = loader or FluentImageLoader(self, cache_bytes=0)
+        self._loader.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self._loader.thumbnail_failed.connect(self._on_thumbnail_failed)
+        register_cache("thumbnail_delegate.pixmaps", FluentThumbnailDelegate._cache_count,
+                       FluentThumbnailDelegate._cache_size, FluentThumbnailDelegate._trim_cache,
+                       owner=self, priority=PRIORITY_EXPENSIVE)
+
+    def setThumbnailSize(self, size: QSize):
+        if size != self._thumbnail_size:
+            self._thumbnail_size = QSize(size)
+            # Decodes and thumbnails for the old size would never be shown
+            self._cancel_pending()
+            self._trim_cache(0)
+
+    def thumbnailSize(self) -> QSize:
+        return QSize(self._thumbnail_size)
+
+    def setMinimumCacheBytes(self, minimum: int):
+        """Let the thumbnail cache grow to at least minimum bytes"""
+        self._cache_bytes = max(self.CACHE_BYTES, minimum)
+        self._trim_cache(self._cache_bytes)
+
+    def cacheBytes(self) -> int:
+        return self._cache_bytes
+
+    def cancelHidden(self, view: QAbstractItemView):
+        """Cancel decodes whose rows have all scrolled out of view"""
+        viewport = view.viewport().rect()
+        for request, rows in list(self._pending.items()):
+            if not any(index.isValid()
+                       and view.visualRect(QModelIndex(index)).intersects(viewport)
+                       for index in rows.values()):
+                del self._pending[request]
+                path, width, height = request
+                self._loader.cancelThumbnail(path, QSize(width, height))
+
+    def reset(self):
+        """Forget pending, cached and failed thumbnails, for when the model is cleared"""
+        self._cancel_pending()
+        self._trim_cache(0)
+        self._failed_keys.clear()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(self._thumbnail_size.width() + self.PADDING * 2,
+                     self._thumbnail_size.height() + self.TITLE_HEIGHT + self.PADDING * 2)
+
+    @staticmethod
+    def _cache_key(row_key: int, size: QSize) -> Tuple[int, int, int]:
+        return row_key, size.width(), size.height()
+
+    def _cache_count(self) -> int:
+        return len(self._cache)
+
+    def _cache_size(self) -> int:
+        return self._cache_used
+
+    def _trim_cache(self, target_bytes: int):
+        """Drop the least recently used thumbnails until at most target_bytes remain"""
+        while self._cache and self._cache_used > target_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_used -= pixmap_bytes(evicted)
+
+    def _store(self, cache_key: Tuple[int, int, int], pixmap: QPixmap):
+        previous = self._cache.pop(cache_key, None)
+        if previous is not None:
+            self._cache_used -= pixmap_bytes(previous)
+        self._cache[cache_key] = pixmap
+        self._cache_used += pixmap_bytes(pixmap)
+        self._trim_cache(self._cache_bytes)
+        get_memory_registry().cache_grew()
+
+    def _thumbnail(self, index: QModelIndex) -> Optional[QPixmap]:
+        """Get the scaled thumbnail for a row, queueing its decode on a miss"""
+        size = self._thumbnail_size
+        row_key = index.data(FluentThumbnailModel.ThumbnailKeyRole)
+        if row_key in self._failed_keys:
+            return None
+
+        cache_key = self._cache_key(row_key, size)
+        pixmap = self._cache.get(cache_key)
+        if pixmap is not None:
+            self._cache.move_to_end(cache_key)
+            return pixmap
+
+        source = index.data(FluentThumbnailModel.SourcePixmapRole)
+        if source is not None and not source.isNull():
+            pixmap = source.scaled(size, Qt.AspectRatioMode.KeepAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
+            self._store(cache_key, pixmap)
+            return pixmap
+
+        path = index.data(FluentThumbnailModel.FilePathRole)
+        if not path:
+            self._failed_keys.add(row_key)
+            return None
+
+        request = (path, size.width(), size.height())
+        waiting = self._pending.get(request)
+        if waiting is None:
+            self._pending[request] = {row_key: QPersistentModelIndex(index)}
+            self._loader.loadThumbnail(path, size)
+        else:
+            waiting[row_key] = QPersistentModelIndex(index)
+        return None
+
+    def _on_thumbnail_ready(self, file_path: str, size: QSize, image: QImage):
+        row_keys = self._pending.pop((file_path, size.width(), size.height()), None)
+        if row_keys:
+            pixmap = QPixmap.fromImage(image)
+            for row_key in row_keys:
+                self._store(self._cache_key(row_key, size), pixmap)
+            self.thumbnail_loaded.emit()
+
+    def _on_thumbnail_failed(self, file_path: str, size: QSize):
+        row_keys = self._pending.pop((file_path, size.width(), size.height()), None)
+        if row_keys:
+            self._failed_keys.update(row_keys)
+            self.thumbnail_loaded.emit()
+
+    def _cancel_pending(self):
+        if self._pending:
+            self._loader.cancelThumbnails()
+            self._pending.clear()
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        theme = theme_manager
+        rect = option.rect.adjusted(1, 1, -1, -1)
+        is_selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        is_hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
+
+        # Card background and border
+        if is_selected or is_hovered:
+            background = theme.get_color('accent_light')
+        else:
+            background = theme.get_color('surface')
+        border = theme.get_color('primary') if (is_selected or is_hovered) else theme.get_color('border')
+        painter.setBrush(QBrush(background))
+        painter.setPen(QPen(border, 2 if is_selected else 1))
+        painter.drawRoundedRect(rect, 4, 4)
+
+        # Thumbnail, centered in its slot
+        image_rect = QRect(rect.left() + self.PADDING - 1, rect.top() + self.PADDING - 1,
+                           self._thumbnail_size.width(), self._thumbnail_size.height())
+        pixmap = self._thumbnail(index)
+        if pixmap is not None:
+            target = QRect(QPoint(0, 0), pixmap.size())
+            target.moveCenter(image_rect.center())
+            painter.drawPixmap(target, pixmap)
+        elif index.data(FluentThumbnailModel.ThumbnailKeyRole) not in self._failed_keys:
+            # Placeholder while the thumbnail decodes
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QBrush(theme.get_color('border')))
+            painter.drawRoundedRect(image_rect, 4, 4)
+
+        # Title
+        title_rect = QRect(rect.left() + self.PADDING, image_rect.bottom() + 4,
+                           rect.width() - self.PADDING * 2, self.TITLE_HEIGHT - 4)
+        font = QFont(option.font)
+        font.setPixelSize(11)
+        painter.setFont(font)
+        painter.setPen(theme.get_color('text_primary'))
+        title = QFontMetrics(font).elidedText(
+            str(index.data(Qt.ItemDataRole.DisplayRole) or ""),
+            Qt.TextElideMode.ElideMiddle, title_rect.width())
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, title)
+
+        painter.restore()
+
+
 class FluentThumbnailGallery(QWidget):
-    """Fluent Design style thumbnail gallery"""
+    """Fluent Design style thumbnail gallery
+
+    Items are rows in a FluentThumbnailModel shown by an icon-mode QListView,
+    so only visible thumbnails are painted and resizing never rebuilds widgets.
+    """
     
     item_selected = Signal(int)  # Selected index
     item_double_clicked = Signal(int)  # Double-clicked index
+
+    MIN_THUMBNAIL_SIZE = 48
+    MAX_THUMBNAIL_SIZE = 320
+    CACHED_VIEWPORTS = 3  # thumbnail cache holds at least this many screens of cells
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
-        self._items = []
         self._selected_index = -1
         self._thumbnail_size = QSize(150, 150)
-        self._columns = 4
         
         self._setup_ui()
         self._setup_style()
@@ -690,8 +1599,8 @@ class FluentThumbnailGallery(QWidget):
         toolbar_layout.addWidget(QLabel("Size:"))
         
         self.size_slider = QSlider(Qt.Orientation.Horizontal)
-        self.size_slider.setMinimum(100)
-        self.size_slider.setMaximum(250)
+        self.size_slider.setMinimum(self.MIN_THUMBNAIL_SIZE)
+        self.size_slider.setMaximum(self.MAX_THUMBNAIL_SIZE)
         self.size_slider.setValue(150)
         self.size_slider.setMaximumWidth(100)
         self.size_slider.valueChanged.connect(self._update_thumbnail_size)
@@ -704,139 +1613,134 @@ class FluentThumbnailGallery(QWidget):
         self.add_folder_btn.clicked.connect(self._add_folder)
         toolbar_layout.addWidget(self.add_folder_btn)
         
-        # Gallery area
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        
-        self.gallery_widget = QWidget()
-        self.gallery_layout = QGridLayout(self.gallery_widget)
-        self.gallery_layout.setSpacing(8)
-        
-        self.scroll_area.setWidget(self.gallery_widget)
+        # Gallery view: icon mode with uniform cells keeps layout O(1) per row
+        self.model = FluentThumbnailModel(self)
+        self.delegate = FluentThumbnailDelegate(self)
+        self.delegate.setThumbnailSize(self._thumbnail_size)
+
+        self.list_view = QListView()
+        self.list_view.setViewMode(QListView.ViewMode.IconMode)
+        self.list_view.setMovement(QListView.Movement.Static)
+        self.list_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.list_view.setBatchSize(256)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSpacing(4)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.list_view.setMouseTracking(True)
+        self.list_view.setItemDelegate(self.delegate)
+        self.list_view.setModel(self.model)
+        self.list_view.setGridSize(self._grid_size())
+        self.delegate.thumbnail_loaded.connect(self.list_view.viewport().update)
+
+        # Decodes for rows scrolled past are cancelled once scrolling pauses
+        self._cancel_hidden_timer = QTimer(self)
+        self._cancel_hidden_timer.setSingleShot(True)
+        self._cancel_hidden_timer.setInterval(100)
+        self._cancel_hidden_timer.timeout.connect(
+            lambda: self.delegate.cancelHidden(self.list_view))
+        self.list_view.verticalScrollBar().valueChanged.connect(self._cancel_hidden_timer.start)
+
+        self.list_view.selectionModel().currentChanged.connect(self._on_current_changed)
+        self.list_view.doubleClicked.connect(
+            lambda index: self.item_double_clicked.emit(index.row()))
         
         layout.addWidget(toolbar)
-        layout.addWidget(self.scroll_area, 1)
+        layout.addWidget(self.list_view, 1)
     
     def addImagePath(self, file_path: str):
-        """Add image by file path"""
-        if os.path.exists(file_path):
-            pixmap = QPixmap(file_path)
-            if not pixmap.isNull():
-                self.addItem(file_path, pixmap)
+        """Add image by file path
+
+        The file is not decoded here; its thumbnail is decoded in the
+        background at thumbnail size the first time the row becomes visible.
+        """
+        self.addImagePaths([file_path])
+
+    def addImagePaths(self, file_paths: List[str]):
+        """Add several images by file path in a single model insert"""
+        rows = [(path, path, None) for path in file_paths if os.path.exists(path)]
+        self.model.appendRows(rows)
     
     def addItem(self, title: str, pixmap: QPixmap):
         """Add thumbnail item"""
-        index = len(self._items)
-        
-        # Create thumbnail item
-        item_widget = self._create_thumbnail_item(title, pixmap, index)
-        
-        # Calculate grid position
-        row = index // self._columns
-        col = index % self._columns
-        
-        self.gallery_layout.addWidget(item_widget, row, col)
-        
-        # Store item info
-        self._items.append({
-            'title': title,
-            'pixmap': pixmap,
-            'widget': item_widget
-        })
-    
-    def _create_thumbnail_item(self, title: str, pixmap: QPixmap, index: int):
-        """Create thumbnail item widget"""
-        item_widget = QFrame()
-        item_widget.setFrameStyle(QFrame.Shape.Box)
-        item_widget.setCursor(Qt.CursorShape.PointingHandCursor)
-        
-        # Store index as a custom attribute (instead of trying to assign to non-existent property)
-        item_widget._item_index = index
-        
-        layout = QVBoxLayout(item_widget)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(4)
-        
-        # Thumbnail image
-        image_label = QLabel()
-        image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        image_label.setFixedSize(self._thumbnail_size)
-        
-        # Scale pixmap to fit thumbnail size
-        scaled_pixmap = pixmap.scaled(
-            self._thumbnail_size, 
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        image_label.setPixmap(scaled_pixmap)
-        
-        # Title label
-        title_label = QLabel(os.path.basename(title))
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setWordWrap(True)
-        title_label.setMaximumHeight(40)
-        
-        layout.addWidget(image_label)
-        layout.addWidget(title_label)
-        
-        # Event handling
-        item_widget.mousePressEvent = lambda event: self._on_item_clicked(index, event)
-        
-        return item_widget
+        self.model.appendRows([(title, "", pixmap)])
+
+    def itemCount(self) -> int:
+        """Get number of items in the gallery"""
+        return self.model.rowCount()
+
+    def selectedIndex(self) -> int:
+        """Get selected item index, or -1 if nothing is selected"""
+        return self._selected_index
+
+    def setSelectedIndex(self, index: int):
+        """Select item by index"""
+        self._select_item(index)
+
+    def setThumbnailSize(self, width: int, height: int):
+        """Set thumbnail size in pixels, within MIN/MAX_THUMBNAIL_SIZE"""
+        low, high = self.MIN_THUMBNAIL_SIZE, self.MAX_THUMBNAIL_SIZE
+        self._apply_thumbnail_size(QSize(min(max(width, low), high),
+                                         min(max(height, low), high)))
+
+    def getThumbnailSize(self) -> QSize:
+        """Get thumbnail size"""
+        return QSize(self._thumbnail_size)
+
+    def _grid_size(self) -> QSize:
+        """Cell size including delegate padding and view spacing"""
+        return self.delegate.sizeHint(QStyleOptionViewItem(), QModelIndex()) + QSize(8, 8)
+
+    def _update_cache_budget(self):
+        """Size the thumbnail cache to hold several viewports of thumbnails"""
+        grid = self._grid_size()
+        viewport = self.list_view.viewport().size()
+        cells = ((viewport.width() // grid.width() + 1)
+                 * (viewport.height() // grid.height() + 2))
+        # Thumbnails are decoded at their logical size, 32 bits per pixel
+        thumbnail = self._thumbnail_size.width() * self._thumbnail_size.height() * 4
+        self.delegate.setMinimumCacheBytes(cells * thumbnail * self.CACHED_VIEWPORTS)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_cache_budget()
     
-    def _on_item_clicked(self, index: int, event: QMouseEvent):
-        """Handle item click"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self._select_item(index)
-            
-            # Check for double click
-            if hasattr(self, '_last_click_time'):
-                if time.time() - self._last_click_time < 0.5:
-                    self.item_double_clicked.emit(index)
-            
-            self._last_click_time = time.time()
+    def _on_current_changed(self, current: QModelIndex, _previous: QModelIndex):
+        """Track the current row as the selected item"""
+        index = current.row() if current.isValid() else -1
+        if index != self._selected_index:
+            self._selected_index = index
+            if index >= 0:
+                self.item_selected.emit(index)
     
     def _select_item(self, index: int):
         """Select item"""
-        if self._selected_index != index:
-            # Deselect previous item
-            if 0 <= self._selected_index < len(self._items):
-                prev_widget = self._items[self._selected_index]['widget']
-                prev_widget.setStyleSheet("")
-            
-            # Select new item
-            self._selected_index = index
-            if 0 <= index < len(self._items):
-                item_widget = self._items[index]['widget']
-                theme = theme_manager
-                item_widget.setStyleSheet(f"""
-                    QFrame {{
-                        border: 2px solid {theme.get_color('primary').name()};
-                        background-color: {theme.get_color('accent_light').name()};
-                    }}
-                """)
-            
-            self.item_selected.emit(index)
+        if 0 <= index < self.model.rowCount():
+            model_index = self.model.index(index, 0)
+            self.list_view.setCurrentIndex(model_index)
+            self.list_view.scrollTo(model_index)
     
     def _update_thumbnail_size(self, size: int):
         """Update thumbnail size"""
-        self._thumbnail_size = QSize(size, size)
-        
-        # Update all existing thumbnails
-        for item in self._items:
-            widget = item['widget']
-            image_label = widget.findChild(QLabel)
-            if image_label and hasattr(image_label, 'setFixedSize'):
-                image_label.setFixedSize(self._thumbnail_size)
-                
-                # Rescale pixmap
-                scaled_pixmap = item['pixmap'].scaled(
-                    self._thumbnail_size,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                image_label.setPixmap(scaled_pixmap)
+        self._apply_thumbnail_size(QSize(size, size))
+
+    def _apply_thumbnail_size(self, size: QSize):
+        """Resize cells in place; rows are re-laid out, never rebuilt"""
+        if size == self._thumbnail_size:
+            return
+
+        self._thumbnail_size = QSize(size)
+        self.delegate.setThumbnailSize(size)
+
+        self.size_slider.blockSignals(True)
+        self.size_slider.setValue(size.width())
+        self.size_slider.blockSignals(False)
+
+        self.list_view.setGridSize(self._grid_size())
+        self.list_view.scheduleDelayedItemsLayout()
+        self._update_cache_budget()
     
     def _add_folder(self):
         """Add images from folder"""
@@ -845,17 +1749,16 @@ class FluentThumbnailGallery(QWidget):
             # Supported image extensions
             image_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff', '.ico']
             
-            for filename in os.listdir(folder):
-                if any(filename.lower().endswith(ext) for ext in image_extensions):
-                    file_path = os.path.join(folder, filename)
-                    self.addImagePath(file_path)
+            self.addImagePaths([
+                os.path.join(folder, filename)
+                for filename in sorted(os.listdir(folder))
+                if any(filename.lower().endswith(ext) for ext in image_extensions)
+            ])
     
     def clearItems(self):
         """Clear all items"""
-        for item in self._items:
-            item['widget'].deleteLater()
-        
-        self._items.clear()
+        self.model.clear()
+        self.delegate.reset()
         self._selected_index = -1
     
     def _setup_style(self):
@@ -868,10 +1771,6 @@ class FluentThumbnailGallery(QWidget):
                 border: 1px solid {theme.get_color('border').name()};
                 border-radius: 4px;
             }}
-            QFrame:hover {{
-                border-color: {theme.get_color('primary').name()};
-                background-color: {theme.get_color('accent_light').name()};
-            }}
             QLabel {{
                 color: {theme.get_color('text_primary').name()};
                 background-color: transparent;
@@ -890,7 +1789,7 @@ class FluentThumbnailGallery(QWidget):
                 background-color: {theme.get_color('accent_light').name()};
                 border-color: {theme.get_color('primary').name()};
             }}
-            QScrollArea {{
+            QListView {{
                 background-color: {theme.get_color('background').name()};
                 border: 1px solid {theme.get_color('border').name()};
                 border-radius: 4px;
@@ -902,3 +1801,4 @@ class FluentThumbnailGallery(QWidget):
     def _on_theme_changed(self, _):
         """Handle theme change"""
         self._setup_style()
+        self.list_view.viewport().update()
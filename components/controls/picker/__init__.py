@@ -4,7 +4,33 @@ Picker Control Components
 Date/time pickers, selection pickers, and picker utilities
 """
 
-from .datetime import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .datetime import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["datetime"],
+    exports={
+        "datetime": [
+            "FluentButton", "FluentCalendar", "FluentTimePicker",
+            "FluentDateTimePicker", "FluentDatePicker",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentAnimation": ("datetime", "FluentAnimation"),
+        "FluentMicroInteraction": ("datetime", "FluentMicroInteraction"),
+        "FluentRevealEffect": ("datetime", "FluentRevealEffect"),
+        "FluentSequence": ("datetime", "FluentSequence"),
+        "FluentStateTransition": ("datetime", "FluentStateTransition"),
+        "FluentTransition": ("datetime", "FluentTransition"),
+        "theme_manager": ("datetime", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all picker control classes and functions
@@ -11,21 +11,48 @@ This module provides a comprehensive suite of data components organized by funct
 - feedback: User feedback and status components
 """
 
-# Import from organized submodules
-from .charts import *
-from .input import *
-from .display import *
-from .processing import *
-from .content import *
-from .feedback import *
-
-# Legacy imports for backward compatibility (only import what exists)
-from .content.rich_text import FluentRichTextEditor, FluentLinkDialog
-from .input.colorpicker import FluentColorPicker, FluentColorWheel, FluentColorButton
-from .charts.charts import FluentSimpleBarChart, FluentSimpleLineChart, FluentSimplePieChart, FluentGaugeChart
-from .charts.advanced_charts import FluentAreaChart, FluentScatterChart, FluentHeatMap
-from .display.property_grid import FluentPropertyGrid, FluentPropertyItem, PropertyType
-from .content.json_viewer import OptimizedJsonTreeWidget
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    # Import from organized submodules
+    from .charts import *
+    from .input import *
+    from .display import *
+    from .processing import *
+    from .content import *
+    from .feedback import *
+
+    # Legacy imports for backward compatibility (only import what exists)
+    from .content.rich_text import FluentRichTextEditor, FluentLinkDialog
+    from .input.colorpicker import FluentColorPicker, FluentColorWheel, FluentColorButton
+    from .charts.charts import FluentSimpleBarChart, FluentSimpleLineChart, FluentSimplePieChart, FluentGaugeChart
+    from .charts.advanced_charts import FluentAreaChart, FluentScatterChart, FluentHeatMap
+    from .display.property_grid import FluentPropertyGrid, FluentPropertyItem, PropertyType
+    from .content.json_viewer import OptimizedJsonTreeWidget
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["charts", "input", "display", "processing", "content", "feedback"],
+    exports={
+        "content.rich_text": ["FluentRichTextEditor", "FluentLinkDialog"],
+        "input.colorpicker": [
+            "FluentColorPicker", "FluentColorWheel", "FluentColorButton",
+        ],
+        "charts.charts": [
+            "FluentSimpleBarChart", "FluentSimpleLineChart", "FluentSimplePieChart",
+            "FluentGaugeChart",
+        ],
+        "charts.advanced_charts": [
+            "FluentAreaChart", "FluentScatterChart", "FluentHeatMap",
+        ],
+        "display.property_grid": [
+            "FluentPropertyGrid", "FluentPropertyItem", "PropertyType",
+        ],
+        "content.json_viewer": ["OptimizedJsonTreeWidget"],
+    },
+)
 
 __all__ = [
     # Legacy exports for backward compatibility
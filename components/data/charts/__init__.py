@@ -7,9 +7,34 @@ This module contains all data visualization components including:
 - Visualization utilities (visualization.py)
 """
 
-from .charts import *
-from .advanced_charts import *
-from .visualization import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .charts import *
+    from .advanced_charts import *
+    from .visualization import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["charts", "advanced_charts", "visualization"],
+    exports={
+        "charts": [
+            "FluentSimpleBarChart", "FluentSimpleLineChart", "FluentSimplePieChart",
+            "FluentGaugeChart",
+        ],
+        "advanced_charts": [
+            "ChartType", "FluentAreaChart", "FluentScatterChart", "FluentHeatMap",
+        ],
+        "visualization": [
+            "TreeMapConfig", "NetworkConfig", "TreeMapLayout", "NetworkLayout",
+            "FluentTreeMapItem", "FluentTreeMap", "FluentNetworkNode",
+            "FluentNetworkEdge", "FluentNetworkGraph", "ColorLike", "NodeID",
+            "PositionTuple",
+        ],
+    },
+)
 
 __all__ = [
     # Export all chart-related classes and functions
@@ -15,6 +15,7 @@ from PySide6.QtGui import (
     QPaintEvent, QMouseEvent
 )
 from core.theme import theme_manager
+from core.performance_profile import get_performance_profile
 from typing import Optional, List, Dict, Any, Tuple, Union
 import math
 from enum import Enum
@@ -90,7 +91,7 @@ class FluentAreaChart(QWidget):
     def paintEvent(self, _event: QPaintEvent):
         """Paint the area chart"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Calculate chart area
         margin = 60
@@ -393,7 +394,7 @@ class FluentScatterChart(QWidget):
     def paintEvent(self, _event: QPaintEvent):
         """Paint the scatter chart"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Calculate chart area
         margin = 60
@@ -748,7 +749,7 @@ class FluentHeatMap(QWidget):
     def paintEvent(self, _event: QPaintEvent):
         """Paint the heat map"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         if not self.data_matrix or not self.data_matrix[0]:
             painter.drawText(
@@ -765,7 +766,11 @@ class FluentHeatMap(QWidget):
         # Draw column labels
         font = QFont("Segoe UI", 9)
         painter.setFont(font)
-        painter.setPen(QPen(theme_manager.get_color('text_primary')))
+        tokens = theme_manager.tokens()
+        border_pen = tokens.pen('border')
+        light_text_pen = QPen(QColor("white"))
+        dark_text_pen = QPen(QColor("black"))
+        painter.setPen(tokens.pen('text_primary'))
 
         for col in range(cols):
             if col < len(self.col_labels):  # Check if label exists
@@ -798,14 +803,13 @@ class FluentHeatMap(QWidget):
 
                     # Draw cell
                     painter.fillRect(cell_rect, QBrush(color))
-                    painter.setPen(QPen(theme_manager.get_color('border')))
+                    painter.setPen(border_pen)
                     painter.drawRect(cell_rect)
 
                     # Draw value text
                     if self.show_values:
-                        text_color = QColor(
-                            "white") if color.lightness() < 128 else QColor("black")
-                        painter.setPen(QPen(text_color))
+                        painter.setPen(light_text_pen if color.lightness() < 128
+                                       else dark_text_pen)
                         painter.drawText(
                             cell_rect, Qt.AlignmentFlag.AlignCenter, f"{value:.1f}")
 
@@ -838,14 +842,15 @@ class FluentHeatMap(QWidget):
 
         painter.fillRect(QRectF(legend_x, legend_y, legend_width,
                          legend_height), QBrush(gradient))
-        painter.setPen(QPen(theme_manager.get_color('border')))
+        tokens = theme_manager.tokens()
+        painter.setPen(tokens.pen('border'))
         painter.drawRect(
             QRectF(legend_x, legend_y, legend_width, legend_height))
 
         # Draw value labels
         font = QFont("Segoe UI", 8)
         painter.setFont(font)
-        painter.setPen(QPen(theme_manager.get_color('text_secondary')))
+        painter.setPen(tokens.pen('text_secondary'))
 
         # Max value (top of legend)
         painter.drawText(QRectF(legend_x + legend_width + 5, legend_y - 10, 45, 20),
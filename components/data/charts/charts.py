@@ -8,6 +8,7 @@ from PySide6.QtCore import Qt, Signal, QRect, QPointF, QTimer
 from PySide6.QtGui import (QPainter, QColor, QBrush, QPen, QFont, QLinearGradient, 
                           QRadialGradient, QPainterPath, QConicalGradient)
 from core.theme import theme_manager
+from core.performance_profile import get_performance_profile
 from typing import Optional, List, Dict, Any, Tuple
 import math
 
@@ -57,7 +58,7 @@ class FluentSimpleBarChart(QWidget):
             return
             
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
         
         theme = theme_manager
         rect = self.rect()
@@ -225,7 +226,7 @@ class FluentSimpleLineChart(QWidget):
             return
             
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
         
         theme = theme_manager
         rect = self.rect()
@@ -385,7 +386,7 @@ class FluentSimplePieChart(QWidget):
             return
             
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
         
         theme = theme_manager
         rect = self.rect()
@@ -555,7 +556,7 @@ class FluentGaugeChart(QWidget):
     def paintEvent(self, event):
         """Paint gauge chart"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
         
         theme = theme_manager
         rect = self.rect()
@@ -27,6 +27,7 @@ from PySide6.QtGui import (QPainter, QColor, QBrush, QPen, QTransform, QPaintEve
                            QLinearGradient, QFontMetrics)
 from core.theme import theme_manager
 from core.enhanced_base import FluentLayoutBuilder
+from core.performance_profile import get_performance_profile
 
 # Modern type aliases for better readability
 ColorLike: TypeAlias = QColor | str
@@ -411,7 +412,7 @@ class FluentTreeMap(QWidget):
             return
 
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Use cached paint operations when possible
         self._draw_item_optimized(painter, self._current_view)
@@ -447,7 +448,7 @@ class FluentTreeMap(QWidget):
             painter.setBrush(QBrush(color))
 
         # Modern border styling
-        painter.setPen(QPen(theme_manager.get_color('border'), 1))
+        painter.setPen(theme_manager.token('border').pen)
         painter.drawRect(item.rect)
 
         # Draw label if enabled and enough space
@@ -849,7 +850,7 @@ class FluentNetworkGraph(QWidget):
             return
 
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Apply transform
         transform = QTransform()
@@ -867,13 +868,14 @@ class FluentNetworkGraph(QWidget):
 
     def _draw_edges_optimized(self, painter: QPainter):
         """Draw all edges with optimization"""
+        border = theme_manager.token('border').color
         for edge in self._edges:
             if edge.source in self._nodes and edge.target in self._nodes:
                 source = self._nodes[edge.source]
                 target = self._nodes[edge.target]
 
                 # Set edge color
-                color = edge.color or theme_manager.get_color('border')
+                color = edge.color or border
 
                 # Set pen based on weight with modern styling
                 pen_width = max(1, int(1 + edge.weight * 2))
@@ -923,13 +925,16 @@ class FluentNetworkGraph(QWidget):
 
     def _draw_nodes_optimized(self, painter: QPainter):
         """Draw all nodes with modern styling"""
+        tokens = theme_manager.tokens()
+        primary = tokens.color('primary')
+        border_pen = QPen(tokens.color('border'), 2)
         for node_id, node in self._nodes.items():
             # Set node color
-            color = node.color or theme_manager.get_color('primary')
+            color = node.color or primary
 
             # Draw selection indicator if selected
             if node_id == self._selected_node:
-                painter.setPen(QPen(theme_manager.get_color('accent'), 3))
+                painter.setPen(QPen(tokens.color('accent'), 3))
                 painter.setBrush(QBrush(Qt.BrushStyle.NoBrush))
                 selection_radius = node.size * 0.7
                 painter.drawEllipse(QRectF(node.x - selection_radius, node.y - selection_radius,
@@ -945,7 +950,7 @@ class FluentNetworkGraph(QWidget):
             else:
                 painter.setBrush(QBrush(color))
 
-            painter.setPen(QPen(theme_manager.get_color('border'), 2))
+            painter.setPen(border_pen)
             painter.drawEllipse(QRectF(node.x - node.size / 2, node.y - node.size / 2,
                                       node.size, node.size))
 
@@ -955,7 +960,7 @@ class FluentNetworkGraph(QWidget):
 
     def _draw_node_label(self, painter: QPainter, node: FluentNetworkNode):
         """Draw node label with modern styling"""
-        painter.setPen(QPen(theme_manager.get_color('text_primary')))
+        painter.setPen(theme_manager.token('text_primary').pen)
         font = painter.font()
         font.setBold(True)
         font.setPixelSize(11)
@@ -6,8 +6,40 @@ This module contains all specialized content display components including:
 - JSON viewers (json_viewer.py)
 """
 
-from .rich_text import *
-from .json_viewer import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .rich_text import *
+    from .json_viewer import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["rich_text", "json_viewer"],
+    exports={
+        "rich_text": [
+            "TextFormat", "FormatAction", "MaskType", "FormattingAction",
+            "MaskCharacter", "EditorConfig", "MaskInputTheme", "TextEditorTheme",
+            "OptimizedFluentMaskedInput", "FluentMaskedInput",
+            "OptimizedFluentRichTextEditor", "FluentRichTextEditor",
+            "OptimizedFluentLinkDialog", "FluentLinkDialog",
+        ],
+        "json_viewer": [
+            "JsonData", "JsonPath", "JsonHighlightRule", "JsonSyntaxConfig",
+            "JsonTreeConfig", "ValidationState", "JsonViewerTheme",
+            "OptimizedJsonSyntaxHighlighter", "JsonSyntaxHighlighter",
+            "OptimizedJsonTreeWidget",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentLayoutBuilder": ("rich_text", "FluentLayoutBuilder"),
+        "FluentStandardButton": ("rich_text", "FluentStandardButton"),
+        "get_theme_aware_animation": ("rich_text", "get_theme_aware_animation"),
+        "theme_manager": ("json_viewer", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all content-related classes and functions
@@ -8,10 +8,56 @@ This module contains all data display components including:
 - File explorers (fileexplorer.py)
 """
 
-from .table import *
-from .tree import *
-from .property_grid import *
-from .fileexplorer import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .table import *
+    from .tree import *
+    from .property_grid import *
+    from .fileexplorer import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["table", "tree", "property_grid", "fileexplorer"],
+    exports={
+        "table": [
+            "FluentButton", "FluentLineEdit", "FLUENT_COMPONENTS_AVAILABLE",
+            "TableData", "HeaderData", "ItemData", "TableCallback", "FilterFunction",
+            "TableStyle", "SelectionMode", "SortOrder", "TableConfig", "ListConfig",
+            "TreeConfig", "DataGridConfig", "TableState", "ListState", "DataGridState",
+            "TableTheme", "TableStyleCache", "ListUpdateContext", "TreeUpdateContext",
+            "batch_table_updates", "get_theme_color", "FluentTableWidget",
+            "FluentListWidget", "FluentDataGrid",
+        ],
+        "tree": [
+            "TreeItemData", "NodeData", "TreeState", "AnimationProtocol",
+            "TreeConfiguration", "FluentTreeWidget", "FluentHierarchicalView",
+            "FluentOrgChart",
+        ],
+        "property_grid": [
+            "THEME_AVAILABLE", "ANIMATIONS_AVAILABLE", "PropertyValue", "PropertyDict",
+            "CategoryDict", "T", "P", "PropertyValidationProtocol",
+            "PropertyConstraints", "PropertyType", "FluentPropertyItem",
+            "FluentPropertyGrid",
+        ],
+        "fileexplorer": [
+            "FluentViewMode", "FluentSortBy", "FluentFileExplorer", "FluentPathBar",
+            "FluentFileView", "FluentFileDetailsView", "FluentFileListView",
+            "FluentFileTreeView", "FluentFileGridView", "FluentFolderTree",
+            "FileFilterProxyModel", "FileViewState",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentMicroInteraction": ("property_grid", "FluentMicroInteraction"),
+        "FluentRevealEffect": ("property_grid", "FluentRevealEffect"),
+        "FluentStateTransition": ("table", "FluentStateTransition"),
+        "FluentTransition": ("table", "FluentTransition"),
+        "theme_manager": ("fileexplorer", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all display-related classes and functions
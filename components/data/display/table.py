@@ -17,10 +17,10 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from functools import lru_cache, cached_property
+from functools import cached_property
 from contextlib import contextmanager
 from typing import (Optional, Callable, Protocol,
-                    TypeAlias, Any, final)
+                    TypeAlias, Any, Final, final)
 
 from PySide6.QtWidgets import (QTableWidget, QTableWidgetItem, QListWidget, QListWidgetItem,
                                QTreeWidget, QTreeWidgetItem, QWidget, QVBoxLayout,
@@ -31,9 +31,11 @@ from PySide6.QtGui import QIcon, QColor
 # Attempt to import theme manager; provide fallback if not available.
 try:
     from core.theme import theme_manager
+    from core.style_cache import get_style_cache
     THEME_AVAILABLE = True
 except ImportError:
     theme_manager = None
+    get_style_cache = None
     THEME_AVAILABLE = False
 
 # Attempt to import enhanced animations; provide fallback if not available.
@@ -208,26 +210,22 @@ class TableTheme(Protocol):
 
 # Performance optimization utilities.
 class TableStyleCache:
-    """Cache manager for computed table styles."""
+    """Table view onto the shared theme-versioned style cache."""
 
-    _cache: dict[str, str] = {}
+    NAMESPACE: Final[str] = "table:"
 
     @classmethod
-    @lru_cache(maxsize=32)
-    def get_table_style(cls, component_type: str, theme_name: str) -> str:
-        """Get cached table style with LRU caching."""
-        cache_key = f"{component_type}_{theme_name}"
-        return cls._cache.get(cache_key, "")
-
-    @classmethod
-    def set_style(cls, cache_key: str, style: str) -> None:
-        """Set cached style."""
-        cls._cache[cache_key] = style
+    def get_style(cls, key: str, generator: Callable[[], str]) -> str:
+        """Get cached style or generate it (uncached without the theme system)."""
+        if get_style_cache is None:
+            return generator()
+        return get_style_cache().get_style(cls.NAMESPACE + key, generator)
 
     @classmethod
     def clear_cache(cls) -> None:
-        """Clear all cached styles."""
-        cls._cache.clear()
+        """Clear all cached table styles."""
+        if get_style_cache is not None:
+            get_style_cache().invalidate(cls.NAMESPACE)
 
 
 # Context managers for enhanced operations.
@@ -336,7 +334,7 @@ class FluentTableWidget(QTableWidget):
     def _setup_style(self) -> None:
         """Setup style with safe theme access and caching."""
         # Construct the stylesheet using theme colors or fallbacks.
-        style_sheet = f"""
+        style_sheet = TableStyleCache.get_style("table", lambda: f"""
             QTableWidget {{
                 background-color: {get_theme_color('surface', '#FFFFFF')};
                 border: 1px solid {get_theme_color('border', '#D1D1D1')};
@@ -384,16 +382,10 @@ class FluentTableWidget(QTableWidget):
             QScrollBar::handle:vertical:hover {{
                 background: {get_theme_color('text_secondary', '#666666')};
             }}
-        """
+        """)
 
         self.setStyleSheet(style_sheet)
 
-        # Cache the generated style for performance on theme changes.
-        TableStyleCache.set_style(
-            f"FluentTableWidget_{get_theme_color('primary')}",
-            style_sheet
-        )
-
     def _setup_behavior(self) -> None:
         """Setup behavior with configuration."""
         self.setAlternatingRowColors(self._config.alternating_rows)
@@ -544,9 +536,7 @@ class FluentTableWidget(QTableWidget):
     @Slot()
     def _on_theme_changed(self, theme_name: str = "") -> None:
         """Handle theme change signal."""
-        # Clear the style cache to force regeneration with new theme colors.
-        TableStyleCache.clear_cache()
-        # Reapply the style.
+        # Reapply the style; cached styles are versioned by theme.
         self._setup_style()
 
 
@@ -601,7 +591,9 @@ class FluentListWidget(QListWidget):
     def _setup_style(self) -> None:
         """Setup style with safe theme access and caching."""
         # Construct the stylesheet using theme colors or fallbacks and config values.
-        style_sheet = f"""
+        cache_key = (f"list:{self._config.border_radius}:"
+                     f"{self._config.item_padding}:{self._config.item_margin}")
+        style_sheet = TableStyleCache.get_style(cache_key, lambda: f"""
             QListWidget {{
                 background-color: {get_theme_color('surface', '#FFFFFF')};
                 border: 1px solid {get_theme_color('border', '#D1D1D1')};
@@ -628,7 +620,7 @@ class FluentListWidget(QListWidget):
             QListWidget::item:selected:hover {{
                 background-color: {get_theme_color('primary_dark', '#106EBE')};
             }}
-        """
+        """)
         self.setStyleSheet(style_sheet)
 
     @final
@@ -710,9 +702,7 @@ class FluentListWidget(QListWidget):
         """Handle theme change signal."""
         # Suppress unused parameter warning as theme_name might not be used directly here.
         _ = theme_name
-        # Clear the style cache to force regeneration with new theme colors.
-        TableStyleCache.clear_cache()
-        # Reapply the style.
+        # Reapply the style; cached styles are versioned by theme.
         self._setup_style()
 
 
@@ -762,7 +752,9 @@ class FluentTreeWidget(QTreeWidget):
     def _setup_style(self) -> None:
         """Setup style with safe theme access and configuration."""
         # Construct the stylesheet using theme colors or fallbacks and config values.
-        style_sheet = f"""
+        cache_key = (f"tree:{self._config.border_radius}:"
+                     f"{self._config.item_padding}:{self._config.item_margin}")
+        style_sheet = TableStyleCache.get_style(cache_key, lambda: f"""
             QTreeWidget {{
                 background-color: {get_theme_color('surface', '#FFFFFF')};
                 border: 1px solid {get_theme_color('border', '#D1D1D1')};
@@ -800,7 +792,7 @@ class FluentTreeWidget(QTreeWidget):
                 image: url(:/icons/chevron_down.svg); /* Custom icon for open branch */
                 background-color: transparent;
             }}
-        """
+        """)
         self.setStyleSheet(style_sheet)
 
     @final
@@ -909,9 +901,7 @@ class FluentTreeWidget(QTreeWidget):
         """Handle theme change signal."""
         # Suppress unused parameter warning.
         _ = theme_name
-        # Clear the style cache to force regeneration with new theme colors.
-        TableStyleCache.clear_cache()
-        # Reapply the style.
+        # Reapply the style; cached styles are versioned by theme.
         self._setup_style()
 
 
@@ -1029,7 +1019,7 @@ class FluentDataGrid(QWidget):
     def _setup_style(self) -> None:
         """Setup style with safe theme access and modern styling."""
         # Construct the stylesheet using theme colors or fallbacks.
-        style_sheet = f"""
+        style_sheet = TableStyleCache.get_style("data_grid", lambda: f"""
             FluentDataGrid {{
                 background-color: {get_theme_color('background', '#F5F5F5')};
                 border-radius: 8px;
@@ -1044,7 +1034,7 @@ class FluentDataGrid(QWidget):
             QWidget:hover {{
                 border-color: {get_theme_color('primary_light', '#40E0D0')};
             }}
-        """
+        """)
         self.setStyleSheet(style_sheet)
 
     # Data management methods with type safety.
@@ -1167,9 +1157,7 @@ class FluentDataGrid(QWidget):
         """Handle theme change signal."""
         # Suppress unused parameter warning.
         _ = theme_name
-        # Clear the style cache to force regeneration with new theme colors.
-        TableStyleCache.clear_cache()
-        # Reapply the style.
+        # Reapply the style; cached styles are versioned by theme.
         self._setup_style()
 
     # Signal handlers for UI interactions.
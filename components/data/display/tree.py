@@ -25,7 +25,10 @@ from PySide6.QtGui import (
     QPainter, QColor, QBrush, QPen, QFont, QLinearGradient, QPixmap,
     QFontMetrics
 )
+from core.memory import (PRIORITY_EXPENSIVE, estimate_bytes, get_memory_registry,
+                         pixmap_bytes, register_cache)
 from core.theme import theme_manager
+from core.performance_profile import get_performance_profile
 
 
 # Modern type definitions using TypedDict for better type safety
@@ -122,6 +125,15 @@ class FluentTreeWidget(QTreeWidget):
         self._setup_animations()
 
         theme_manager.theme_changed.connect(self._on_theme_changed)
+        # Item data is needed for search, so it is reported but not trimmed
+        register_cache("tree.item_data", FluentTreeWidget._item_cache_count,
+                       FluentTreeWidget._item_cache_bytes, owner=self)
+
+    def _item_cache_count(self) -> int:
+        return len(self._item_cache)
+
+    def _item_cache_bytes(self) -> int:
+        return sum(estimate_bytes(data) for data in list(self._item_cache.values()))
 
     @property
     def current_state(self) -> TreeState:
@@ -767,6 +779,15 @@ class FluentOrgChart(QWidget):
     node_context_menu = Signal(str, QPoint)  # node_id, position
     layout_changed = Signal()
 
+    STATUS_COLORS: Dict[str, QColor] = {
+        'active': QColor("#28a745"),
+        'inactive': QColor("#dc3545"),
+        'pending': QColor("#ffc107"),
+        'success': QColor("#28a745"),
+        'warning': QColor("#ffc107"),
+        'error': QColor("#dc3545"),
+    }
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
@@ -783,6 +804,9 @@ class FluentOrgChart(QWidget):
         self._layout_cache: Dict[str, Any] = {}
         self._paint_cache: Dict[str, QPixmap] = {}
         self._dirty_layout = True
+        register_cache("orgchart.node_pixmaps", FluentOrgChart._paint_cache_count,
+                       FluentOrgChart._paint_cache_bytes, FluentOrgChart._trim_paint_cache,
+                       owner=self, priority=PRIORITY_EXPENSIVE)
 
         # Animation support
         self._animation_group = QParallelAnimationGroup()
@@ -880,6 +904,20 @@ class FluentOrgChart(QWidget):
         else:
             self._paint_cache.clear()
 
+    def _paint_cache_count(self) -> int:
+        return len(self._paint_cache)
+
+    def _paint_cache_bytes(self) -> int:
+        return sum(pixmap_bytes(pixmap) for pixmap in self._paint_cache.values())
+
+    def _trim_paint_cache(self, target_bytes: int) -> None:
+        """Drop the oldest node pixmaps until at most target_bytes remain"""
+        used = self._paint_cache_bytes()
+        for key in list(self._paint_cache):
+            if used <= target_bytes:
+                break
+            used -= pixmap_bytes(self._paint_cache.pop(key))
+
     def _calculate_layout_async(self) -> None:
         """Calculate layout asynchronously for better performance"""
         if not self._dirty_layout:
@@ -960,16 +998,16 @@ class FluentOrgChart(QWidget):
     def paintEvent(self, event):
         """Enhanced paint with caching and zoom support"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Apply zoom and pan transformations
         painter.scale(self._zoom_factor, self._zoom_factor)
         painter.translate(self._pan_offset)
 
-        theme = theme_manager
+        tokens = theme_manager.tokens()
 
         # Draw connections with enhanced styling
-        painter.setPen(QPen(theme.get_color('border'), 2))
+        painter.setPen(QPen(tokens.color('border'), 2))
         for parent_id, child_id in self._connections:
             if parent_id in self._node_positions and child_id in self._node_positions:
                 self._draw_connection(painter, parent_id, child_id)
@@ -1012,12 +1050,13 @@ class FluentOrgChart(QWidget):
             pixmap = QPixmap(self._node_size[0], self._node_size[1])
             pixmap.fill(Qt.GlobalColor.transparent)
             pixmap_painter = QPainter(pixmap)
-            pixmap_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            pixmap_painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
             self._draw_node_content(pixmap_painter, (0, 0), node_data)
             pixmap_painter.end()
 
             self._paint_cache[cache_key] = pixmap
+            get_memory_registry().cache_grew()
 
         # Draw cached pixmap
         painter.drawPixmap(int(position[0]), int(
@@ -1026,23 +1065,24 @@ class FluentOrgChart(QWidget):
     def _draw_node_content(self, painter: QPainter, position: tuple[float, float],
                            node_data: NodeData) -> None:
         """Draw node content with enhanced styling"""
-        theme = theme_manager
+        tokens = theme_manager.tokens()
         x, y = position
 
         # Node background with gradient
         node_rect = QRect(int(x), int(
             y), self._node_size[0], self._node_size[1])
 
+        surface = tokens.color('surface')
         gradient = QLinearGradient(x, y, x, y + self._node_size[1])
-        gradient.setColorAt(0, theme.get_color('surface'))
-        gradient.setColorAt(1, theme.get_color('surface').darker(108))
+        gradient.setColorAt(0, surface)
+        gradient.setColorAt(1, surface.darker(108))
 
         painter.setBrush(QBrush(gradient))
-        painter.setPen(QPen(theme.get_color('border'), 2))
+        painter.setPen(QPen(tokens.color('border'), 2))
         painter.drawRoundedRect(node_rect, 12, 12)
 
         # Enhanced text rendering
-        painter.setPen(QPen(theme.get_color('text_primary')))
+        painter.setPen(tokens.pen('text_primary'))
 
         # Title with better typography
         title = node_data.get('title', 'Node')
@@ -1055,7 +1095,7 @@ class FluentOrgChart(QWidget):
         subtitle = node_data.get('subtitle', '')
         if subtitle:
             painter.setFont(QFont("Segoe UI", 9))
-            painter.setPen(QPen(theme.get_color('text_secondary')))
+            painter.setPen(tokens.pen('text_secondary'))
             subtitle_rect = QRect(int(x) + 12, int(y) + 38,
                                   self._node_size[0] - 24, 18)
             painter.drawText(
@@ -1069,23 +1109,13 @@ class FluentOrgChart(QWidget):
         if not status:
             return
 
-        status_colors = {
-            'active': QColor("#28a745"),
-            'inactive': QColor("#dc3545"),
-            'pending': QColor("#ffc107"),
-            'success': QColor("#28a745"),
-            'warning': QColor("#ffc107"),
-            'error': QColor("#dc3545")
-        }
-
-        color = status_colors.get(
-            status.lower(), theme_manager.get_color('text_secondary'))
+        color = self.STATUS_COLORS.get(status.lower())
+        if color is None:
+            color = theme_manager.token('text_secondary').color
 
         # Draw status circle with glow effect
         painter.setBrush(QBrush(color))
-        lighter_color = QColor(color)
-        lighter_color = lighter_color.lighter(150)
-        painter.setPen(QPen(lighter_color, 2))
+        painter.setPen(QPen(color.lighter(150), 2))
         painter.drawEllipse(
             int(x) + self._node_size[0] - 24, int(y) + 12, 12, 12)
 
@@ -6,8 +6,36 @@ This module contains all user feedback and status components including:
 - Status indicators (status.py)
 """
 
-from .notification import *
-from .status import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .notification import *
+    from .status import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["notification", "status"],
+    exports={
+        "notification": [
+            "THEME_AVAILABLE", "ENHANCED_ANIMATION_AVAILABLE", "NotificationCallback",
+            "get_safe_color", "animation_context", "ToastType", "ToastConfig",
+            "ToastTheme", "FluentToast", "FluentNotificationCenter",
+            "FluentStatusBadge",
+        ],
+        "status": [
+            "NotificationLevel", "FluentStatusIndicator", "FluentProgressTracker",
+            "FluentNotification", "FluentNotificationManager", "FluentBadge",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentMicroInteraction": ("notification", "FluentMicroInteraction"),
+        "FluentTransition": ("notification", "FluentTransition"),
+        "theme_manager": ("status", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all feedback-related classes and functions
@@ -11,6 +11,7 @@ from PySide6.QtCore import (Qt, Signal, QTimer, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import (QPainter, QColor, QBrush, QPen, QFont, QIcon,
                           QPaintEvent)
 from core.theme import theme_manager
+from core.performance_profile import get_performance_profile
 from typing import Optional, List, Tuple
 from enum import Enum
 
@@ -90,7 +91,7 @@ class FluentStatusIndicator(QWidget):
     def paintEvent(self, event: QPaintEvent):
         """Paint status indicator"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
         
         theme = theme_manager
         rect = self.rect()
@@ -232,7 +233,7 @@ class FluentProgressTracker(QWidget):
             return
             
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
         
         theme = theme_manager
         rect = self.rect()
@@ -7,9 +7,51 @@ This module contains all data input components including:
 - Calendar/date picker (calendar.py)
 """
 
-from .entry import *
-from .colorpicker import *
-from .calendar import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .entry import *
+    from .colorpicker import *
+    from .calendar import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["entry", "colorpicker", "calendar"],
+    exports={
+        "entry": [
+            "BASIC_ANIMATION_AVAILABLE", "ENHANCED_ANIMATION_AVAILABLE", "WidgetValue",
+            "ValidatorResult", "InputState", "MaskCharacter", "ValidationResult",
+            "AnimationSettings", "get_safe_color", "animation_context",
+            "FluentMaskedLineEdit", "FluentAutoCompleteEdit", "FluentRichTextEditor",
+            "FluentSlider", "FluentFileSelector",
+        ],
+        "colorpicker": [
+            "THEME_AVAILABLE", "ANIMATIONS_AVAILABLE", "ColorValue", "AnimationGroup",
+            "T", "C", "ColorValidationProtocol", "ColorFormat", "ColorConstraints",
+            "ColorState", "FluentColorButton", "FluentColorWheel", "FluentColorPicker",
+        ],
+        "calendar": [
+            "OptimizedFluentCalendar", "OptimizedFluentDatePicker",
+            "OptimizedFluentTimePicker", "OptimizedFluentDateTimePicker",
+            "FluentCalendar", "FluentDatePicker", "FluentTimePicker",
+            "FluentDateTimePicker", "CalendarDayButton", "CalendarPopup",
+            "CalendarConfig", "CalendarTheme", "CalendarStateType", "DateLike",
+            "TimeLike", "DateTimeLike", "ColorLike",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentAnimation": ("colorpicker", "FluentAnimation"),
+        "FluentMicroInteraction": ("calendar", "FluentMicroInteraction"),
+        "FluentRevealEffect": ("calendar", "FluentRevealEffect"),
+        "FluentSequence": ("calendar", "FluentSequence"),
+        "FluentStateTransition": ("calendar", "FluentStateTransition"),
+        "FluentTransition": ("calendar", "FluentTransition"),
+        "theme_manager": ("calendar", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all input-related classes and functions
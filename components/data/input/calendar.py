@@ -55,6 +55,11 @@ except ImportError:
     theme_manager = None
     THEME_AVAILABLE = False
 
+try:
+    from core.memory import QOBJECT_BYTES, register_cache
+except ImportError:
+    register_cache = None
+
 try:
     from core.enhanced_animations import (
         FluentRevealEffect, FluentMicroInteraction, FluentTransition,
@@ -191,6 +196,30 @@ class WidgetPoolManager:
                 getattr(widget, 'reset')()
             pool.append(widget)
 
+    @classmethod
+    def count(cls) -> int:
+        """Get the number of pooled widgets"""
+        return sum(len(pool) for pool in cls._pools.values())
+
+    @classmethod
+    def bytes_used(cls) -> int:
+        """Get the estimated bytes of the pooled widgets"""
+        return cls.count() * QOBJECT_BYTES
+
+    @classmethod
+    def trim(cls, target_bytes: int) -> None:
+        """Delete pooled widgets until at most target_bytes remain"""
+        excess = cls.count() - max(0, target_bytes) // QOBJECT_BYTES
+        for pool in cls._pools.values():
+            while pool and excess > 0:
+                pool.pop().deleteLater()
+                excess -= 1
+
+
+if register_cache is not None:
+    register_cache("calendar.widget_pool", WidgetPoolManager.count,
+                   WidgetPoolManager.bytes_used, WidgetPoolManager.trim)
+
 
 # Performance helper functions
 def batch_widget_updates(widgets: Sequence[QWidget]):
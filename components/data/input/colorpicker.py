@@ -38,6 +38,8 @@ from PySide6.QtGui import (
     QRegularExpressionValidator
 )
 
+from core.performance_profile import get_performance_profile
+
 # Enhanced imports with better error handling
 try:
     from core.theme import theme_manager
@@ -280,7 +282,7 @@ class FluentColorButton(QPushButton):
     def paintEvent(self, event) -> None:
         """Enhanced paint with modern effects"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         rect = self.rect()
         
@@ -364,8 +366,8 @@ class FluentColorWheel(QWidget):
     def paintEvent(self, event) -> None:
         """Enhanced paint with better anti-aliasing"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, get_performance_profile().antialiasing())
 
         center = self.rect().center()
         self._draw_color_wheel(painter, center)
@@ -40,6 +40,9 @@ except ImportError:
     theme_manager = None
     THEME_AVAILABLE = False
 
+from core.animation_clock import FluentClockAnimation
+from core.performance_profile import get_performance_profile
+
 try:
     from core.enhanced_animations import FluentTransition, FluentMicroInteraction
     ENHANCED_ANIMATION_AVAILABLE = True
@@ -683,17 +686,14 @@ class FluentStatusBadge(QWidget):
 
     def _setup_animation(self):
         """Setup enhanced pulse animation with spring effect"""
-        self._animation = QPropertyAnimation(self, QByteArray(b"pulseValue"))
-        self._animation.setDuration(2000)
-        self._animation.setStartValue(0.0)
-        self._animation.setEndValue(1.0)
-        self._animation.setLoopCount(-1)
-        
+        # Driven by the shared animation clock, which repaints after each frame
+        self._animation = FluentClockAnimation(
+            self, self._on_pulse_frame, duration=2000, loop_count=-1)
+
         # Use standard easing curve if enhanced animations not available
         if ENHANCED_ANIMATION_AVAILABLE and FluentTransition.EASE_SPRING is not None:
             self._animation.setEasingCurve(FluentTransition.EASE_SPRING)
         else:
-            from PySide6.QtCore import QEasingCurve
             self._animation.setEasingCurve(QEasingCurve.Type.OutBack)
 
         # Start animation for animated statuses
@@ -703,7 +703,7 @@ class FluentStatusBadge(QWidget):
     def paintEvent(self, event: QPaintEvent):
         """Paint the status badge"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Get colors based on status
         if self._status == self.Status.CUSTOM and self._custom_color:
@@ -800,3 +800,6 @@ class FluentStatusBadge(QWidget):
         self.update()
 
     pulseValue = Property(float, _get_pulse_value, _set_pulse_value, "", "")
+
+    def _on_pulse_frame(self, progress: float):
+        self._pulse_value = progress
@@ -6,8 +6,32 @@ This module contains all data processing utilities including:
 - Data formatters (formatters.py)
 """
 
-from .filter_sort import *
-from .formatters import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .filter_sort import *
+    from .formatters import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["filter_sort", "formatters"],
+    exports={
+        "filter_sort": [
+            "FluentFilterBar", "FluentSortingMenu", "FluentFilterSortHeader",
+            "FluentFilterProxyModel", "FilterConfig", "SortConfig", "FilterSortState",
+            "FilterStyle", "SortDirection", "FilterState", "FilterSortTheme",
+            "FilterFunction", "StyleCache", "batch_ui_updates", "get_theme_color",
+            "FilterCallback", "SortCallback", "CustomFilterFunction", "CategoryList",
+            "SortFieldDict",
+        ],
+        "formatters": [
+            "DateLike", "TimeLike", "DateTimeLike", "NumericValue",
+            "FluentDateTimeFormat", "FluentNumberFormat", "FluentFormatter",
+        ],
+    },
+)
 
 __all__ = [
     # Export all processing-related classes and functions
@@ -15,10 +15,9 @@ Optimized for Python 3.11+ with:
 from __future__ import annotations
 
 import time
-import weakref
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from functools import lru_cache, cached_property
+from functools import cached_property
 from contextlib import contextmanager
 from typing import (Optional, List, Dict, Callable, Union, Protocol, 
                     TypeAlias, Final, Any, final)
@@ -32,9 +31,11 @@ from PySide6.QtGui import QAction, QStandardItem
 # Enhanced error handling for dependencies
 try:
     from core.theme import theme_manager
+    from core.style_cache import get_style_cache
     THEME_AVAILABLE = True
 except ImportError:
     theme_manager = None
+    get_style_cache = None
     THEME_AVAILABLE = False
 
 try:
@@ -135,27 +136,22 @@ class FilterFunction(Protocol):
 
 # Performance optimization utilities
 class StyleCache:
-    """Cache manager for computed styles"""
-    
-    _cache: dict[str, str] = {}
-    _cache_keys: weakref.WeakSet = weakref.WeakSet()
-    
-    @classmethod
-    @lru_cache(maxsize=64)
-    def get_style(cls, component_type: str, theme_name: str, **kwargs) -> str:
-        """Get cached style with LRU caching"""
-        cache_key = f"{component_type}_{theme_name}_{hash(frozenset(kwargs.items()))}"
-        return cls._cache.get(cache_key, "")
-    
+    """Filter/sort view onto the shared theme-versioned style cache"""
+
+    NAMESPACE: Final[str] = "filter_sort:"
+
     @classmethod
-    def set_style(cls, cache_key: str, style: str) -> None:
-        """Set cached style"""
-        cls._cache[cache_key] = style
-    
+    def get_style(cls, key: str, generator: Callable[[], str]) -> str:
+        """Get cached style or generate it (uncached without the theme system)"""
+        if get_style_cache is None:
+            return generator()
+        return get_style_cache().get_style(cls.NAMESPACE + key, generator)
+
     @classmethod
     def clear_cache(cls) -> None:
-        """Clear all cached styles"""
-        cls._cache.clear()
+        """Clear all cached filter/sort styles"""
+        if get_style_cache is not None:
+            get_style_cache().invalidate(cls.NAMESPACE)
 
 
 @contextmanager
@@ -294,7 +290,7 @@ class FluentFilterBar(QWidget):
 
     def _setup_combobox_style(self, combobox: QComboBox) -> None:
         """Setup ComboBox styling with safe theme access"""
-        style_sheet = f"""
+        style_sheet = StyleCache.get_style("filter_combobox", lambda: f"""
             QComboBox {{
                 background-color: {get_theme_color('surface', '#FFFFFF')};
                 color: {get_theme_color('text_primary', '#000000')};
@@ -329,7 +325,7 @@ class FluentFilterBar(QWidget):
                 selection-color: {get_theme_color('text_primary', '#000000')};
                 outline: none;
             }}
-        """
+        """)
         combobox.setStyleSheet(style_sheet)
 
     def _apply_style(self) -> None:
@@ -338,8 +334,7 @@ class FluentFilterBar(QWidget):
             self._setup_combobox_style(self._category_selector)
 
     def _on_theme_changed(self) -> None:
-        """Handle theme changes with cache clearing"""
-        StyleCache.clear_cache()
+        """Handle theme changes (cached styles are versioned by theme)"""
         self._apply_style()
 
     def _on_text_changed(self, text: str) -> None:
@@ -492,7 +487,7 @@ class FluentSortingMenu(QMenu):
 
     def _apply_style(self) -> None:
         """Apply menu styling with safe theme access"""
-        style_sheet = f"""
+        style_sheet = StyleCache.get_style("sort_menu", lambda: f"""
             QMenu {{
                 background-color: {get_theme_color('surface', '#FFFFFF')};
                 border: 1px solid {get_theme_color('border', '#D1D1D1')};
@@ -521,12 +516,11 @@ class FluentSortingMenu(QMenu):
                 background-color: {get_theme_color('border', '#D1D1D1')};
                 margin: 4px 0px;
             }}
-        """
+        """)
         self.setStyleSheet(style_sheet)
 
     def _on_theme_changed(self) -> None:
-        """Handle theme changes with cache clearing"""
-        StyleCache.clear_cache()
+        """Handle theme changes (cached styles are versioned by theme)"""
         self._apply_style()
 
     def _on_direction_changed(self, ascending: bool) -> None:
@@ -651,7 +645,7 @@ class FluentFilterSortHeader(QWidget):
     def _apply_style(self) -> None:
         """Apply styling to the header with safe theme access"""
         # Style the sort button
-        sort_button_style = f"""
+        sort_button_style = StyleCache.get_style("sort_button", lambda: f"""
             QToolButton {{
                 background-color: {get_theme_color('surface', '#FFFFFF')};
                 color: {get_theme_color('text_primary', '#000000')};
@@ -674,12 +668,11 @@ class FluentFilterSortHeader(QWidget):
                 subcontrol-position: right center;
                 subcontrol-origin: padding;
             }}
-        """
+        """)
         self._sort_button.setStyleSheet(sort_button_style)
 
     def _on_theme_changed(self) -> None:
-        """Handle theme changes with cache clearing"""
-        StyleCache.clear_cache()
+        """Handle theme changes (cached styles are versioned by theme)"""
         self._apply_style()
 
     def _on_filter_changed(self, text: str, category: str) -> None:
@@ -11,33 +11,71 @@ This module provides comprehensive Fluent Design dialog components including:
 - FluentTeachingTip: Contextual help tooltips and guidance
 """
 
-# Base dialog infrastructure
-from .base_dialog import (
-    FluentBaseDialog, FluentDialogBuilder,
-    DialogSize, DialogType, ButtonRole
-)
+from typing import TYPE_CHECKING
 
-# Specific dialog types
-from .content_dialog import FluentContentDialog, show_content_dialog
-from .message_dialog import (
-    FluentMessageDialog, MessageType, MessageResult,
-    show_information_dialog, show_warning_dialog, show_error_dialog,
-    show_question_dialog, show_success_dialog
-)
-from .input_dialog import (
-    FluentInputDialog, InputType,
-    get_text_input, get_password_input, get_number_input,
-    get_choice_input, get_file_path, get_folder_path
-)
-from .progress_dialog import (
-    FluentProgressDialog, ProgressMode, ProgressContext,
-    show_progress_dialog
-)
-from .form_dialog import (
-    FluentFormDialog, FieldType, FieldConfig,
-    create_contact_form, create_settings_form
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    # Base dialog infrastructure
+    from .base_dialog import (
+        FluentBaseDialog, FluentDialogBuilder,
+        DialogSize, DialogType, ButtonRole
+    )
+
+    # Specific dialog types
+    from .content_dialog import FluentContentDialog, show_content_dialog
+    from .message_dialog import (
+        FluentMessageDialog, MessageType, MessageResult,
+        show_information_dialog, show_warning_dialog, show_error_dialog,
+        show_question_dialog, show_success_dialog
+    )
+    from .input_dialog import (
+        FluentInputDialog, InputType,
+        get_text_input, get_password_input, get_number_input,
+        get_choice_input, get_file_path, get_folder_path
+    )
+    from .progress_dialog import (
+        FluentProgressDialog, ProgressMode, ProgressContext,
+        show_progress_dialog
+    )
+    from .form_dialog import (
+        FluentFormDialog, FieldType, FieldConfig,
+        create_contact_form, create_settings_form
+    )
+    from .teaching_tip import FluentTeachingTip
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=[
+        "base_dialog", "content_dialog", "message_dialog", "input_dialog",
+        "progress_dialog", "form_dialog", "teaching_tip",
+    ],
+    exports={
+        "base_dialog": [
+            "FluentBaseDialog", "FluentDialogBuilder", "DialogSize", "DialogType",
+            "ButtonRole",
+        ],
+        "content_dialog": ["FluentContentDialog", "show_content_dialog"],
+        "message_dialog": [
+            "FluentMessageDialog", "MessageType", "MessageResult",
+            "show_information_dialog", "show_warning_dialog", "show_error_dialog",
+            "show_question_dialog", "show_success_dialog",
+        ],
+        "input_dialog": [
+            "FluentInputDialog", "InputType", "get_text_input", "get_password_input",
+            "get_number_input", "get_choice_input", "get_file_path", "get_folder_path",
+        ],
+        "progress_dialog": [
+            "FluentProgressDialog", "ProgressMode", "ProgressContext",
+            "show_progress_dialog",
+        ],
+        "form_dialog": [
+            "FluentFormDialog", "FieldType", "FieldConfig", "create_contact_form",
+            "create_settings_form",
+        ],
+        "teaching_tip": ["FluentTeachingTip"],
+    },
 )
-from .teaching_tip import FluentTeachingTip
 
 __all__ = [
     # Base infrastructure
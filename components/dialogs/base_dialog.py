@@ -22,6 +22,7 @@ from PySide6.QtGui import QPainter, QColor, QPaintEvent, QKeyEvent
 
 from ..base.fluent_control_base import FluentControlBase, FluentThemeAware
 from core.theme import theme_manager
+from core.performance_profile import get_performance_profile, profile_effect
 
 
 class DialogSize(Enum):
@@ -107,17 +108,10 @@ class FluentBaseDialog(QDialog, FluentControlBase, FluentThemeAware):
         self._setup_animations()
         self._setup_keyboard_handling()
 
-        # Apply initial theme
+        # Apply initial theme; FluentControlBase has the theme manager
+        # call _on_theme_changed for later changes
         self.apply_theme()
 
-        # Connect to theme changes
-        try:
-            if hasattr(theme_manager, 'theme_changed'):
-                theme_manager.theme_changed.connect(self.apply_theme)
-        except Exception:
-            # Handle cases where theme manager might not be fully initialized
-            pass
-
     def _setup_dialog_properties(self):
         """Configure basic dialog properties"""
         # Window flags based on dialog type
@@ -158,7 +152,7 @@ class FluentBaseDialog(QDialog, FluentControlBase, FluentThemeAware):
         self.shadow_effect.setBlurRadius(20)
         self.shadow_effect.setColor(QColor(0, 0, 0, 60))
         self.shadow_effect.setOffset(0, 8)
-        self.content_container.setGraphicsEffect(self.shadow_effect)
+        self.content_container.setGraphicsEffect(profile_effect(self.shadow_effect))
 
         main_layout.addWidget(self.content_container)
 
@@ -478,7 +472,7 @@ class FluentBaseDialog(QDialog, FluentControlBase, FluentThemeAware):
     def paintEvent(self, event: QPaintEvent):
         """Custom paint event for backdrop"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Draw backdrop for modal dialogs
         if self._dialog_type in (DialogType.MODAL, DialogType.OVERLAY):
@@ -488,6 +482,11 @@ class FluentBaseDialog(QDialog, FluentControlBase, FluentThemeAware):
 
         super().paintEvent(event)
 
+    def _on_theme_changed(self):
+        """Re-theme the dialog; the theme manager calls this once per theme change"""
+        super()._on_theme_changed()
+        self.apply_theme()
+
     def apply_theme(self):
         """Apply current theme to dialog"""
         theme = self.get_current_theme()
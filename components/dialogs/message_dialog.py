@@ -17,6 +17,7 @@ from PySide6.QtCore import Signal
 from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor
 
 from .base_dialog import FluentBaseDialog, DialogType, DialogSize, ButtonRole
+from core.performance_profile import get_performance_profile
 
 
 class MessageType(Enum):
@@ -120,7 +121,7 @@ class FluentMessageDialog(FluentBaseDialog):
         pixmap.fill(QColor(0, 0, 0, 0))  # Transparent
 
         painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         color_map = {
             MessageType.INFORMATION: QColor("#0078d4"),
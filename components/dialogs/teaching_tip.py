@@ -14,6 +14,7 @@ from PySide6.QtCore import (Qt, Signal, QTimer, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import QFont, QIcon, QColor
 
 from ..base.fluent_control_base import FluentControlBase, FluentThemeAware
+from core.performance_profile import profile_effect
 
 
 class TeachingTipPlacement(Enum):
@@ -139,7 +140,7 @@ class FluentTeachingTip(QFrame, FluentControlBase, FluentThemeAware):
         shadow.setBlurRadius(12)
         shadow.setColor(QColor(0, 0, 0, 60))
         shadow.setOffset(0, 4)
-        self._container.setGraphicsEffect(shadow)
+        self._container.setGraphicsEffect(profile_effect(shadow))
 
         main_layout.addWidget(self._container)
 
@@ -6,8 +6,29 @@ User interface control elements including:
 - Navigation elements (breadcrumbs, menus)
 """
 
-from .command import *
-from .navigation import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .command import *
+    from .navigation import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["command", "navigation"],
+    exports={
+        "command": [
+            "FluentCommandBar", "FluentCommandBarAction", "FluentCommandBarBuilder",
+            "CommandBarPlacement",
+        ],
+        "navigation": [
+            "FluentAppBar", "FluentAppBarAction", "FluentAppBarBuilder",
+            "FluentNavigationView", "NavigationItem", "NavigationViewDisplayMode",
+            "FluentNavigationItemWidget",
+        ],
+    },
+)
 
 __all__ = [
     # Export all interface-related classes and functions
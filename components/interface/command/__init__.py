@@ -4,9 +4,35 @@ Command Interface Components
 Command bars, toolbars, and menu systems
 """
 
-from .bars import *
-from .menus import *
-from .commandbar import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .bars import *
+    from .menus import *
+    from .commandbar import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["bars", "menus", "commandbar"],
+    exports={
+        "bars": ["FluentToolbar", "FluentRibbonGroup", "FluentQuickAccessToolbar"],
+        "menus": [
+            "MenuItemType", "FluentMenuItem", "FluentMenu", "FluentContextMenu",
+            "FluentCommandPalette", "RibbonGroupFrame", "FluentRibbonTab",
+            "FluentRibbon",
+        ],
+        "commandbar": [
+            "FluentCommandBar", "FluentCommandBarAction", "FluentCommandBarBuilder",
+            "CommandBarPlacement",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "theme_manager": ("commandbar", "theme_manager"),
+    },
+)
 
 __all__ = [
     'FluentCommandBar',
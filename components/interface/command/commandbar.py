@@ -198,7 +198,11 @@ class FluentCommandBar(FluentBaseWidget):
             self._overflow_menu.aboutToHide.connect(lambda: self.overflow_toggled.emit(False))
             
         # Theme changes
-        theme_manager.theme_changed.connect(self._setup_style)
+        self._register_theme_updates()
+
+    def _on_theme_changed(self):
+        """Handle theme change"""
+        self._setup_style()
         
     def _create_command_button(self, action: FluentCommandBarAction) -> QPushButton:
         """Create a styled command button"""
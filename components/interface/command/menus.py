@@ -24,6 +24,7 @@ from PySide6.QtGui import (
 from core.theme import theme_manager
 from core.enhanced_base import FluentLayoutBuilder
 from core.enhanced_animations import FluentMicroInteraction, FluentTransition
+from core.performance_profile import profile_effect
 
 # Try to import enhanced components, fallback to basic ones
 try:
@@ -126,7 +127,7 @@ class FluentMenu(QMenu):
             self._shadow_effect.setBlurRadius(20)
             self._shadow_effect.setColor(QColor(0, 0, 0, 60))
             self._shadow_effect.setOffset(0, 5)
-            self.setGraphicsEffect(self._shadow_effect)
+            self.setGraphicsEffect(profile_effect(self._shadow_effect))
 
     def _setup_animations(self):
         """Setup enhanced menu animations"""
@@ -531,7 +532,7 @@ class FluentCommandPalette(QWidget):
         shadow.setBlurRadius(30)
         shadow.setColor(QColor(0, 0, 0, 80))
         shadow.setOffset(0, 10)
-        self.container.setGraphicsEffect(shadow)
+        self.container.setGraphicsEffect(profile_effect(shadow))
 
     def setup_animations(self):
         """Setup animations"""
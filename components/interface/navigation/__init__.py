@@ -4,10 +4,38 @@ Navigation Interface Components
 Breadcrumbs, navigation menus, app bars, and navigation helpers
 """
 
-from .breadcrumb import *
-from .menu import *
-from .appbar import *
-from .navigationview import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .breadcrumb import *
+    from .menu import *
+    from .appbar import *
+    from .navigationview import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["breadcrumb", "menu", "appbar", "navigationview"],
+    exports={
+        "breadcrumb": ["FluentBreadcrumbItem", "FluentBreadcrumbSeparator"],
+        "menu": ["FluentMenuBar", "FluentMenu", "FluentBreadcrumb", "FluentTabView"],
+        "appbar": ["FluentAppBar", "FluentAppBarAction", "FluentAppBarBuilder"],
+        "navigationview": [
+            "FluentNavigationView", "NavigationItem", "NavigationViewDisplayMode",
+            "FluentNavigationItemWidget",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentAnimation": ("menu", "FluentAnimation"),
+        "FluentMicroInteraction": ("navigationview", "FluentMicroInteraction"),
+        "FluentParallel": ("breadcrumb", "FluentParallel"),
+        "FluentSequence": ("breadcrumb", "FluentSequence"),
+        "FluentTransition": ("breadcrumb", "FluentTransition"),
+        "theme_manager": ("navigationview", "theme_manager"),
+    },
+)
 
 __all__ = [
     # App Bar Components
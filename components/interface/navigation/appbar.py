@@ -249,7 +249,7 @@ class FluentAppBar(FluentBaseWidget):
 
     def _connect_signals(self):
         """Connect theme and other signals"""
-        theme_manager.theme_changed.connect(self._on_theme_changed)
+        self._register_theme_updates()
 
     def _on_theme_changed(self):
         """Handle theme changes"""
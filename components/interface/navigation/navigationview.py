@@ -312,7 +312,7 @@ class FluentNavigationView(FluentBaseWidget):
         
     def _connect_signals(self):
         """Connect signals"""
-        theme_manager.theme_changed.connect(self._on_theme_changed)
+        self._register_theme_updates()
         
     def _on_theme_changed(self):
         """Handle theme changes"""
@@ -8,33 +8,70 @@ stack panels, flex layouts, dock panels, uniform grids, masonry layouts, adaptiv
 Features modern layout patterns with consistent theming, responsive behavior, and smooth animations.
 """
 
-# Import base classes
-from .layout_base import FluentLayoutBase, FluentContainerBase, FluentAdaptiveLayoutBase
+from typing import TYPE_CHECKING
 
-# Import layout components
-from .flex_layout import (
-    FluentFlexLayout, FlexDirection, FlexWrap, JustifyContent,
-    AlignItems, AlignContent, FlexItem
-)
-from .dock_panel import FluentDockPanel, DockPosition, DockItem
-from .additional_layouts import (
-    FluentUniformGrid, FluentMasonryLayout, FluentAdaptiveLayout,
-    FluentCanvas, MasonryItem, LayoutStrategy
-)
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    # Import base classes
+    from .layout_base import FluentLayoutBase, FluentContainerBase, FluentAdaptiveLayoutBase
+
+    # Import layout components
+    from .flex_layout import (
+        FluentFlexLayout, FlexDirection, FlexWrap, JustifyContent,
+        AlignItems, AlignContent, FlexItem
+    )
+    from .dock_panel import FluentDockPanel, DockPosition, DockItem
+    from .additional_layouts import (
+        FluentUniformGrid, FluentMasonryLayout, FluentAdaptiveLayout,
+        FluentCanvas, MasonryItem, LayoutStrategy
+    )
+
+    # Import existing components (keeping for compatibility)
+    from .grid import FluentGrid, FluentGridItem, FluentGridBuilder, GridSpacing, GridItemAlignment
+    from .scroll_viewer import FluentScrollViewer, FluentScrollBar
+    from .stack_panel import FluentStackPanel, FluentWrapPanel, StackOrientation
 
-# Import existing components (keeping for compatibility)
-from .grid import FluentGrid, FluentGridItem, FluentGridBuilder, GridSpacing, GridItemAlignment
-from .scroll_viewer import FluentScrollViewer, FluentScrollBar
-from .stack_panel import FluentStackPanel, FluentWrapPanel, StackOrientation
+    # Import refactored containers
+    from .containers import (
+        FluentCard,
+        FluentExpander,
+        FluentSplitter,
+        FluentTabWidget,
+        FluentInfoBar,
+        FluentPivot
+    )
 
-# Import refactored containers
-from .containers import (
-    FluentCard,
-    FluentExpander,
-    FluentSplitter,
-    FluentTabWidget,
-    FluentInfoBar,
-    FluentPivot
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=[
+        "layout_base", "flex_layout", "dock_panel", "additional_layouts", "grid",
+        "scroll_viewer", "stack_panel", "containers",
+    ],
+    exports={
+        "layout_base": [
+            "FluentLayoutBase", "FluentContainerBase", "FluentAdaptiveLayoutBase",
+        ],
+        "flex_layout": [
+            "FluentFlexLayout", "FlexDirection", "FlexWrap", "JustifyContent",
+            "AlignItems", "AlignContent", "FlexItem",
+        ],
+        "dock_panel": ["FluentDockPanel", "DockPosition", "DockItem"],
+        "additional_layouts": [
+            "FluentUniformGrid", "FluentMasonryLayout", "FluentAdaptiveLayout",
+            "FluentCanvas", "MasonryItem", "LayoutStrategy",
+        ],
+        "grid": [
+            "FluentGrid", "FluentGridItem", "FluentGridBuilder", "GridSpacing",
+            "GridItemAlignment",
+        ],
+        "scroll_viewer": ["FluentScrollViewer", "FluentScrollBar"],
+        "stack_panel": ["FluentStackPanel", "FluentWrapPanel", "StackOrientation"],
+        "containers": [
+            "FluentCard", "FluentExpander", "FluentSplitter", "FluentTabWidget",
+            "FluentInfoBar", "FluentPivot",
+        ],
+    },
 )
 
 __all__ = [
@@ -4,7 +4,30 @@ Dialog Components
 Dialog boxes, modals, and dialog-related utilities
 """
 
-from .dialogs import *
+from typing import TYPE_CHECKING
+
+from components.lazy_import import attach as _attach
+
+if TYPE_CHECKING:
+    from .dialogs import *
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=["dialogs"],
+    exports={
+        "dialogs": [
+            "FluentButton", "FluentDialog", "FluentMessageBox", "FluentInputDialog",
+            "FluentProgressDialog", "FluentToast",
+        ],
+    },
+    # Library names the package re-exported through its modules' star imports
+    aliases={
+        "FluentAnimation": ("dialogs", "FluentAnimation"),
+        "FluentMicroInteraction": ("dialogs", "FluentMicroInteraction"),
+        "FluentTransition": ("dialogs", "FluentTransition"),
+        "theme_manager": ("dialogs", "theme_manager"),
+    },
+)
 
 __all__ = [
     # Export all dialog classes and functions
@@ -160,7 +160,11 @@ class FluentGrid(FluentBaseWidget):
     def _connect_signals(self):
         """Connect signals and slots"""
         # Theme changes
-        theme_manager.theme_changed.connect(self._setup_style)
+        self._register_theme_updates()
+
+    def _on_theme_changed(self):
+        """Handle theme change"""
+        self._setup_style()
         
     def resizeEvent(self, event: QResizeEvent):
         """Handle resize events to trigger responsive layout"""
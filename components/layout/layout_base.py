@@ -71,14 +71,14 @@ class FluentLayoutBase(FluentBaseWidget):
         """Setup base layout functionality"""
         # Apply theme
         self._apply_layout_theme()
-        
-        # Connect theme changes
-        if theme_manager:
-            theme_manager.theme_changed.connect(self._apply_layout_theme)
             
         # Setup responsive behavior
         self._update_current_breakpoint()
         
+    def _on_theme_changed(self):
+        """Re-theme the layout; the theme manager calls this once per theme change"""
+        self._apply_layout_theme()
+
     def _apply_layout_theme(self):
         """Apply theme specific to layout components"""
         if not theme_manager:
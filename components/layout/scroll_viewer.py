@@ -17,6 +17,7 @@ from PySide6.QtCore import Qt, QTimer, QEasingCurve, QPropertyAnimation, Signal,
 from PySide6.QtGui import QPainter, QColor, QPen, QBrush
 
 from ..base.fluent_control_base import FluentControlBase, FluentThemeAware
+from core.performance_profile import get_performance_profile
 
 
 class FluentScrollBar(QScrollBar):
@@ -44,7 +45,7 @@ class FluentScrollBar(QScrollBar):
     def paintEvent(self, event):
         """Custom paint event for Fluent Design styling."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Background
         bg_color = QColor(self._theme.get('scrollbar_background', '#f3f2f1'))
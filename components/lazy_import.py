@@ -0,0 +1,63 @@
+"""
+Lazy Package Imports
+PEP 562 module ``__getattr__`` for the component packages: importing a package
+no longer imports every module in it, a module is imported the first time one
+of its names is used
+"""
+
+import os
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Set to 1 to import everything up front, e.g. for freezing tools that only
+# follow static imports
+EAGER_IMPORT_ENV = "FLUENT_EAGER_IMPORT"
+
+
+def _import(name: str):
+    # Unlike importlib.import_module, __import__ takes the interpreter's import
+    # path, so -X importtime still reports lazily imported modules
+    __import__(name)
+    return sys.modules[name]
+
+
+def attach(package_name: str, submodules: Iterable[str] = (),
+           exports: Optional[Dict[str, Iterable[str]]] = None,
+           aliases: Optional[Dict[str, Tuple[str, str]]] = None
+           ) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for a lazily imported package
+
+    ``submodules`` are imported when accessed as attributes. ``exports`` maps
+    a module, relative to the package, to the names the package takes from
+    it, in the order the package used to import them, so a later module wins
+    a name both define. ``aliases`` maps a name to the (module, attribute)
+    it was imported as. Resolved names are stored on the package, so each
+    lookup goes through ``__getattr__`` once.
+    """
+    package = sys.modules[package_name]
+    submodules = tuple(submodules)
+    origins: Dict[str, Tuple[str, str]] = {}
+    for module, names in (exports or {}).items():
+        for name in names:
+            origins[name] = (module, name)
+    origins.update(aliases or {})
+
+    def __getattr__(name: str) -> Any:
+        if name in origins:
+            module, attribute = origins[name]
+            value = getattr(_import(f"{package_name}.{module}"), attribute)
+        elif name in submodules:
+            value = _import(f"{package_name}.{name}")
+        else:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(package)) | set(origins) | set(submodules))
+
+    if os.environ.get(EAGER_IMPORT_ENV) == "1":
+        for name in (*submodules, *origins):
+            __getattr__(name)
+
+    return __getattr__, __dir__
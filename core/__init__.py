@@ -1,5 +1,10 @@
 """Core module exports"""
 
+from .startup_profile import install_from_env as _install_startup_profiler
+
+# Profile startup from the first import on when FLUENT_STARTUP_PROFILE is set
+_install_startup_profiler()
+
 from .enhanced_animations import (
     FluentTransition,
     FluentSequence,
@@ -4,11 +4,15 @@
 """
 
 from PySide6.QtCore import (QPropertyAnimation, QEasingCurve, QParallelAnimationGroup,
-                            QSequentialAnimationGroup, QByteArray, QTimer, QRect, QPoint)
+                            QSequentialAnimationGroup, QByteArray, QTimer, QRect, QPoint,
+                            QAbstractAnimation)
 from PySide6.QtWidgets import QWidget, QGraphicsOpacityEffect, QGraphicsColorizeEffect, QPushButton
 from PySide6.QtGui import QColor
 from typing import Optional, Callable, List
 
+from .animation_registry import get_animation_registry
+from .performance_profile import get_performance_profile
+
 
 class FluentAnimation:
     """**增强的Fluent Design动画管理器**"""
@@ -34,6 +38,11 @@ class FluentAnimation:
     SPRING_BOUNCY = QEasingCurve.Type.OutBack
     SPRING_WOBBLY = QEasingCurve.Type.OutElastic
 
+    @staticmethod
+    def scaled(duration: int) -> int:
+        """**按性能档位缩放动画时长**"""
+        return get_performance_profile().scale_duration(duration)
+
     @staticmethod
     def fade_in(widget: QWidget, duration: int = DURATION_MEDIUM,
                 callback: Optional[Callable] = None) -> QPropertyAnimation:
@@ -42,7 +51,7 @@ class FluentAnimation:
         widget.setGraphicsEffect(effect)
 
         animation = QPropertyAnimation(effect, QByteArray(b"opacity"))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setStartValue(0.0)
         animation.setEndValue(1.0)
         animation.setEasingCurve(FluentAnimation.EASE_OUT)
@@ -65,7 +74,7 @@ class FluentAnimation:
             raise RuntimeError("Failed to get graphics effect")
 
         animation = QPropertyAnimation(effect, QByteArray(b"opacity"))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setStartValue(1.0)
         animation.setEndValue(0.0)
         animation.setEasingCurve(FluentAnimation.EASE_IN)
@@ -95,7 +104,7 @@ class FluentAnimation:
             widget.move(start_pos.x(), start_pos.y() + widget.height())
 
         animation = QPropertyAnimation(widget, QByteArray(b"pos"))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setEndValue(start_pos)
         animation.setEasingCurve(FluentAnimation.EASE_OUT)
 
@@ -125,12 +134,12 @@ class FluentAnimation:
         """
         # 悬停进入动画
         enter_anim = QPropertyAnimation(widget, QByteArray(b"geometry"))
-        enter_anim.setDuration(FluentAnimation.DURATION_FAST)
+        enter_anim.setDuration(FluentAnimation.scaled(FluentAnimation.DURATION_FAST))
         enter_anim.setEasingCurve(FluentAnimation.EASE_OUT)
 
         # 悬停离开动画
         leave_anim = QPropertyAnimation(widget, QByteArray(b"geometry"))
-        leave_anim.setDuration(FluentAnimation.DURATION_FAST)
+        leave_anim.setDuration(FluentAnimation.scaled(FluentAnimation.DURATION_FAST))
         leave_anim.setEasingCurve(FluentAnimation.EASE_IN)
 
         return enter_anim, leave_anim
@@ -143,7 +152,7 @@ class FluentAnimation:
         """**Spring弹性动画**"""
         animation = QPropertyAnimation(
             widget, QByteArray(property_name.encode()))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setStartValue(start_value)
         animation.setEndValue(end_value)
         animation.setEasingCurve(spring_type)
@@ -154,7 +163,7 @@ class FluentAnimation:
                         duration: int = DURATION_MEDIUM) -> QPropertyAnimation:
         """**形状变换动画**"""
         animation = QPropertyAnimation(widget, QByteArray(b"geometry"))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setStartValue(start_rect)
         animation.setEndValue(end_rect)
         animation.setEasingCurve(FluentAnimation.EASE_OUT_BACK)
@@ -168,7 +177,7 @@ class FluentAnimation:
         widget.setGraphicsEffect(effect)
 
         animation = QPropertyAnimation(effect, QByteArray(b"color"))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setStartValue(start_color)
         animation.setEndValue(end_color)
         animation.setEasingCurve(FluentAnimation.EASE_OUT)
@@ -185,14 +194,14 @@ class FluentAnimation:
 
         # 上升
         up_anim = QPropertyAnimation(widget, QByteArray(b"pos"))
-        up_anim.setDuration(duration // 2)
+        up_anim.setDuration(FluentAnimation.scaled(duration // 2))
         up_anim.setStartValue(original_pos)
         up_anim.setEndValue(up_pos)
         up_anim.setEasingCurve(FluentAnimation.EASE_OUT)
 
         # 下降
         down_anim = QPropertyAnimation(widget, QByteArray(b"pos"))
-        down_anim.setDuration(duration // 2)
+        down_anim.setDuration(FluentAnimation.scaled(duration // 2))
         down_anim.setStartValue(up_pos)
         down_anim.setEndValue(original_pos)
         down_anim.setEasingCurve(FluentAnimation.EASE_IN)
@@ -239,7 +248,7 @@ class FluentAnimation:
             end_pos = start_pos
 
         animation = QPropertyAnimation(widget, QByteArray(b"pos"))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setStartValue(start_pos)
         animation.setEndValue(end_pos)
         animation.setEasingCurve(easing)
@@ -258,7 +267,7 @@ class FluentAnimation:
                                intensity, original_pos.y())
 
             shake_anim = QPropertyAnimation(widget, QByteArray(b"pos"))
-            shake_anim.setDuration(duration // 4)
+            shake_anim.setDuration(FluentAnimation.scaled(duration // 4))
             shake_anim.setStartValue(widget.pos())
             shake_anim.setEndValue(shake_pos)
             shake_anim.setEasingCurve(FluentAnimation.EASE_IN_OUT)
@@ -267,7 +276,7 @@ class FluentAnimation:
 
         # 回到原位
         reset_anim = QPropertyAnimation(widget, QByteArray(b"pos"))
-        reset_anim.setDuration(duration // 4)
+        reset_anim.setDuration(FluentAnimation.scaled(duration // 4))
         reset_anim.setEndValue(original_pos)
         sequence.addAnimation(reset_anim)
 
@@ -298,11 +307,15 @@ class FluentAnimation:
 
         # 淡出
         fade_out = FluentAnimation.fade_out(widget, duration // 2)
+        fade_out.setDuration(duration // 2)  # 循环动画保持原有节奏，不随性能档位缩放
         fade_out.setEndValue(min_opacity)
 
-        # 淡入
-        fade_in = FluentAnimation.fade_in(widget, duration // 2)
+        # 淡入（与淡出共用同一个透明度效果，fade_in()会替换掉它）
+        fade_in = QPropertyAnimation(fade_out.targetObject(), QByteArray(b"opacity"))
+        fade_in.setDuration(duration // 2)
         fade_in.setStartValue(min_opacity)
+        fade_in.setEndValue(1.0)
+        fade_in.setEasingCurve(FluentAnimation.EASE_OUT)
 
         sequence.addAnimation(fade_out)
         sequence.addAnimation(fade_in)
@@ -330,32 +343,47 @@ class FluentAnimation:
 
 
 class AnimationHelper:
-    """**动画辅助类**"""
+    """**动画辅助类**
+
+    动画由全局动画注册表按 (控件, 用途) 复用，重复悬停或点击不会创建新动画
+    """
 
     def __init__(self, widget: QWidget):
         self.widget = widget
-        self._animations = []
         self._original_show_event = None
+        self._rest_geometry: Optional[QRect] = None
+        self._watching_hide = False
+
+    def _registry(self):
+        """**获取动画注册表，并在控件隐藏时停止其动画**"""
+        if not self._watching_hide:
+            self._watching_hide = True
+            original_hide_event = self.widget.hideEvent
+
+            def new_hide_event(event):
+                original_hide_event(event)
+                get_animation_registry().owner_hidden(self.widget)
+
+            self.widget.hideEvent = new_hide_event
+        return get_animation_registry()
 
     def add_hover_effect(self):
         """**添加悬停效果**"""
+        registry = self._registry()
+
         def on_enter():
-            enter_anim, _ = FluentAnimation.hover_effect(self.widget)
-            current_rect = self.widget.geometry()
-            scaled_rect = current_rect.adjusted(-2, -2, 2, 2)
-            enter_anim.setStartValue(current_rect)
-            enter_anim.setEndValue(scaled_rect)
-            enter_anim.start()
-            self._animations.append(enter_anim)
+            if self._rest_geometry is None:
+                self._rest_geometry = self.widget.geometry()
+            registry.animate(self.widget, "geometry",
+                             self._rest_geometry.adjusted(-2, -2, 2, 2),
+                             FluentAnimation.DURATION_FAST, FluentAnimation.EASE_OUT)
 
         def on_leave():
-            _, leave_anim = FluentAnimation.hover_effect(self.widget)
-            current_rect = self.widget.geometry()
-            normal_rect = current_rect.adjusted(2, 2, -2, -2)
-            leave_anim.setStartValue(current_rect)
-            leave_anim.setEndValue(normal_rect)
-            leave_anim.start()
-            self._animations.append(leave_anim)
+            if self._rest_geometry is None:
+                return
+            rest_geometry, self._rest_geometry = self._rest_geometry, None
+            registry.animate(self.widget, "geometry", rest_geometry,
+                             FluentAnimation.DURATION_FAST, FluentAnimation.EASE_IN)
 
         # 重写事件处理方法
         original_enter_event = self.widget.enterEvent
@@ -378,9 +406,9 @@ class AnimationHelper:
         """**添加点击涟漪效果**"""
         def on_click():
             center = self.widget.rect().center()
-            ripple = FluentAnimation.ripple_effect(self.widget, center)
-            ripple.start()
-            self._animations.append(ripple)
+            self._registry().animation(
+                self.widget, "ripple",
+                lambda: FluentAnimation.ripple_effect(self.widget, center)).start()
 
         # 只有按钮类控件才有clicked信号
         if isinstance(self.widget, QPushButton):
@@ -389,9 +417,12 @@ class AnimationHelper:
     def add_bounce_on_show(self):
         """**显示时添加弹跳效果**"""
         def on_show():
-            bounce = FluentAnimation.bounce_animation(self.widget)
-            bounce.start()
-            self._animations.append(bounce)
+            # 弹跳从当前位置开始，每次显示重新创建并替换上一个
+            registry = self._registry()
+            registry.release_key(self.widget, "bounce")
+            registry.animation(
+                self.widget, "bounce",
+                lambda: FluentAnimation.bounce_animation(self.widget)).start()
 
         # 保存原始的showEvent方法
         self._original_show_event = self.widget.showEvent
@@ -407,16 +438,18 @@ class AnimationHelper:
 
     def add_breathing_effect(self):
         """**添加呼吸效果**"""
-        breathing = FluentAnimation.breathing_animation(self.widget)
-        breathing.start()
-        self._animations.append(breathing)
+        if not get_performance_profile().animations_enabled():
+            return
+        breathing = self._registry().animation(
+            self.widget, "breathing",
+            lambda: FluentAnimation.breathing_animation(self.widget))
+        if breathing.state() != QAbstractAnimation.State.Running:
+            breathing.start()
 
     def cleanup(self):
         """**清理动画资源**"""
-        for anim in self._animations:
-            if anim.state() == QPropertyAnimation.State.Running:
-                anim.stop()
-        self._animations.clear()
+        get_animation_registry().release(self.widget)
+        self._rest_geometry = None
 
 
 class FluentTransition:
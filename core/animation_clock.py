@@ -0,0 +1,328 @@
+"""
+Fluent Animation Clock
+One frame timer that advances every running clock animation and repaints the
+widgets they changed once per frame, skipping animations nobody can see
+"""
+
+import time
+from typing import Any, Callable, Dict, Optional, Union
+
+from PySide6.QtCore import QAbstractAnimation, QEasingCurve, QElapsedTimer, QObject, Qt, QTimer
+from PySide6.QtWidgets import QWidget
+
+
+def is_effectively_visible(widget: QWidget) -> bool:
+    """Check whether any part of widget can be seen on screen
+
+    False for widgets that are hidden or in a hidden tab, in minimized or
+    unexposed windows, and for widgets scrolled out of a scroll area viewport.
+    """
+    if not widget.isVisible():
+        return False
+    window = widget.window()
+    if window.isMinimized():
+        return False
+    handle = window.windowHandle()
+    if handle is not None and not handle.isExposed():
+        return False
+    return not widget.visibleRegion().isEmpty()
+
+
+class FluentAnimationClock(QObject):
+    """Shared frame clock for looping and frame-based animations
+
+    Running ``FluentClockAnimation``s are advanced together on each frame, and
+    the widgets they touched are repainted with one ``update()`` each after
+    all of them ran. The frame timer only runs while something is animating
+    or a repaint is pending, so an idle application gets no wakeups.
+
+    With ``PAUSE_WHEN_INVISIBLE`` animations whose target cannot be seen are
+    suspended: a slow visibility check moves them out of the frame loop and
+    back once the target is visible again. They keep their time base, so a
+    resumed loop continues where it would have been.
+    """
+
+    FRAME_INTERVAL = 16  # ms, about 60 frames per second
+    VISIBILITY_INTERVAL = 250  # ms between visibility checks
+    PAUSE_WHEN_INVISIBLE = True
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._animations: Dict[int, "FluentClockAnimation"] = {}
+        self._suspended: Dict[int, "FluentClockAnimation"] = {}
+        self._pending: Dict[int, QWidget] = {}
+
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(self.FRAME_INTERVAL)
+        self._timer.timeout.connect(self._tick)
+
+        self._visibility_timer = QTimer(self)
+        self._visibility_timer.setInterval(self.VISIBILITY_INTERVAL)
+        self._visibility_timer.timeout.connect(self.check_visibility)
+        self._recheck_pending = False
+
+        self.reset_stats()
+
+    def now(self) -> int:
+        """Get the clock time in milliseconds"""
+        return self._elapsed.elapsed()
+
+    def request_update(self, widget: QWidget):
+        """Repaint widget on the next frame, at most once per frame"""
+        self._pending[id(widget)] = widget
+        self._ensure_running()
+
+    def active_count(self) -> int:
+        """Get the number of running animations, suspended ones included"""
+        return len(self._animations) + len(self._suspended)
+
+    def suspended_count(self) -> int:
+        """Get the number of animations suspended while invisible"""
+        return len(self._suspended)
+
+    def check_visibility(self):
+        """Suspend animations of invisible targets and resume visible ones"""
+        if not self.PAUSE_WHEN_INVISIBLE:
+            self._animations.update(self._suspended)
+            self._suspended.clear()
+        else:
+            self._move_by_visibility(self._animations, self._suspended, False)
+            self._move_by_visibility(self._suspended, self._animations, True)
+        if self._animations:
+            self._ensure_running()
+        if not self._animations and not self._suspended:
+            self._visibility_timer.stop()
+
+    def is_ticking(self) -> bool:
+        """Check whether the frame timer is running"""
+        return self._timer.isActive()
+
+    def set_frame_interval(self, interval: int):
+        """Set the frame interval in milliseconds"""
+        self._timer.setInterval(max(1, interval))
+
+    def frame_interval(self) -> int:
+        """Get the frame interval in milliseconds"""
+        return self._timer.interval()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get frame counters and timings"""
+        frames = self.frames
+        return {
+            "active_animations": len(self._animations) + len(self._suspended),
+            "suspended_animations": len(self._suspended),
+            "peak_animations": self.peak_animations,
+            "ticking": self._timer.isActive(),
+            "frames": frames,
+            "updates": self.updates,
+            "last_frame_ms": self.last_frame_time * 1000,
+            "average_frame_ms": self.total_frame_time / frames * 1000 if frames else 0.0,
+            "max_frame_ms": self.max_frame_time * 1000,
+        }
+
+    def reset_stats(self):
+        """Reset frame counters and timings"""
+        self.frames = 0
+        self.updates = 0
+        self.peak_animations = len(self._animations) + len(self._suspended)
+        self.last_frame_time = 0.0
+        self.total_frame_time = 0.0
+        self.max_frame_time = 0.0
+
+    def _add(self, animation: "FluentClockAnimation"):
+        if self.PAUSE_WHEN_INVISIBLE and not is_effectively_visible(animation._target):
+            self._suspended[id(animation)] = animation
+            # A window shown just before is exposed a moment later
+            if not self._recheck_pending:
+                self._recheck_pending = True
+                QTimer.singleShot(self.FRAME_INTERVAL, self._recheck_visibility)
+        else:
+            self._animations[id(animation)] = animation
+            self._ensure_running()
+        active = len(self._animations) + len(self._suspended)
+        if active > self.peak_animations:
+            self.peak_animations = active
+        if not self._visibility_timer.isActive():
+            self._visibility_timer.start()
+
+    def _remove(self, animation: "FluentClockAnimation"):
+        if self._animations.pop(id(animation), None) is None:
+            self._suspended.pop(id(animation), None)
+
+    def _recheck_visibility(self):
+        self._recheck_pending = False
+        self.check_visibility()
+
+    def _move_by_visibility(self, source: Dict[int, "FluentClockAnimation"],
+                            destination: Dict[int, "FluentClockAnimation"], visible: bool):
+        for key, animation in list(source.items()):
+            try:
+                if is_effectively_visible(animation._target) != visible:
+                    continue
+            except RuntimeError:
+                # The target widget was deleted
+                animation._state = QAbstractAnimation.State.Stopped
+                del source[key]
+                continue
+            destination[key] = source.pop(key)
+
+    def _ensure_running(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _tick(self):
+        start = time.perf_counter()
+        now = self._elapsed.elapsed()
+
+        for animation in list(self._animations.values()):
+            try:
+                animation._advance(now)
+            except RuntimeError:
+                # The target widget was deleted
+                animation._state = QAbstractAnimation.State.Stopped
+                self._remove(animation)
+
+        pending = self._pending
+        self._pending = {}
+        for widget in pending.values():
+            try:
+                widget.update()
+            except RuntimeError:
+                pass
+
+        if not self._animations and not self._pending:
+            self._timer.stop()
+
+        elapsed = time.perf_counter() - start
+        self.frames += 1
+        self.updates += len(pending)
+        self.last_frame_time = elapsed
+        self.total_frame_time += elapsed
+        if elapsed > self.max_frame_time:
+            self.max_frame_time = elapsed
+
+
+class FluentClockAnimation:
+    """Animation advanced by the shared animation clock
+
+    Calls ``callback`` with the eased progress (0.0-1.0) on every frame and
+    repaints ``target`` afterwards. Offers the start/stop/pause/resume/state
+    subset of QAbstractAnimation, so it can replace a looping property
+    animation without changing its callers.
+    """
+
+    def __init__(self, target: QWidget, callback: Callable[[float], None],
+                 duration: int = 250, loop_count: int = 1,
+                 easing: Union[QEasingCurve, QEasingCurve.Type] = QEasingCurve.Type.Linear,
+                 finished: Optional[Callable[[], None]] = None,
+                 clock: Optional[FluentAnimationClock] = None):
+        self._target = target
+        self._callback = callback
+        self._finished = finished
+        self._clock = clock
+        self._duration = max(1, duration)
+        self._loop_count = loop_count
+        self._state = QAbstractAnimation.State.Stopped
+        self._start_time = 0
+        self._paused_time = 0
+        self.setEasingCurve(easing)
+
+    def clock(self) -> FluentAnimationClock:
+        if self._clock is None:
+            self._clock = get_animation_clock()
+        return self._clock
+
+    def setDuration(self, duration: int):
+        self._duration = max(1, duration)
+
+    def duration(self) -> int:
+        return self._duration
+
+    def setLoopCount(self, loop_count: int):
+        """Set the number of loops, -1 to loop until stopped"""
+        self._loop_count = loop_count
+
+    def loopCount(self) -> int:
+        return self._loop_count
+
+    def setEasingCurve(self, easing: Union[QEasingCurve, QEasingCurve.Type]):
+        self._easing = QEasingCurve(easing)
+        self._linear = self._easing.type() == QEasingCurve.Type.Linear
+
+    def easingCurve(self) -> QEasingCurve:
+        return QEasingCurve(self._easing)
+
+    def state(self) -> QAbstractAnimation.State:
+        return self._state
+
+    def currentTime(self) -> int:
+        """Get the time into the current loop in milliseconds"""
+        if self._state == QAbstractAnimation.State.Running:
+            return (self.clock().now() - self._start_time) % self._duration
+        if self._state == QAbstractAnimation.State.Paused:
+            return self._paused_time % self._duration
+        return 0
+
+    def start(self):
+        """Start from the beginning, restarting if already running"""
+        clock = self.clock()
+        was_running = self._state == QAbstractAnimation.State.Running
+        self._state = QAbstractAnimation.State.Running
+        self._start_time = clock.now()
+        self._apply(0.0)
+        if not was_running:
+            clock._add(self)
+
+    def stop(self):
+        if self._state != QAbstractAnimation.State.Stopped:
+            if self._state == QAbstractAnimation.State.Running:
+                self.clock()._remove(self)
+            self._state = QAbstractAnimation.State.Stopped
+
+    def pause(self):
+        if self._state == QAbstractAnimation.State.Running:
+            clock = self.clock()
+            self._paused_time = clock.now() - self._start_time
+            clock._remove(self)
+            self._state = QAbstractAnimation.State.Paused
+
+    def resume(self):
+        if self._state == QAbstractAnimation.State.Paused:
+            clock = self.clock()
+            self._start_time = clock.now() - self._paused_time
+            clock._add(self)
+            self._state = QAbstractAnimation.State.Running
+
+    def _advance(self, now: int):
+        elapsed = now - self._start_time
+        if 0 < self._loop_count <= elapsed // self._duration:
+            self._apply(1.0)
+            self.stop()
+            if self._finished:
+                self._finished()
+            return
+        self._apply((elapsed % self._duration) / self._duration)
+
+    def _apply(self, progress: float):
+        if not self._linear:
+            progress = self._easing.valueForProgress(progress)
+        self._callback(progress)
+        # The clock is ticking while this animation runs
+        target = self._target
+        self._clock._pending[id(target)] = target
+
+
+# Global animation clock instance with lazy loading
+_animation_clock = None
+
+
+def get_animation_clock() -> FluentAnimationClock:
+    """Get animation clock instance (lazy loading)"""
+    global _animation_clock
+    if _animation_clock is None:
+        _animation_clock = FluentAnimationClock()
+    return _animation_clock
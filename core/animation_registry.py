@@ -0,0 +1,207 @@
+"""
+Fluent Animation Registry
+Keeps one reusable animation per widget and key, retargets it instead of
+building a new one, stops it when the widget hides and bounds the total count
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from PySide6.QtCore import QAbstractAnimation, QByteArray, QEasingCurve, QObject, QPropertyAnimation
+from PySide6.QtWidgets import QWidget
+
+from .memory import QOBJECT_BYTES, register_cache
+from .performance_profile import get_performance_profile
+
+
+class FluentAnimationRegistry(QObject):
+    """Registry of reusable per-widget animations
+
+    Animations are stored by (owner widget, key). Property animations use the
+    property name as key and are retargeted by ``animate()``; other animations
+    (groups, sequences) are built once by a factory passed to ``animation()``.
+    Animations are parented to their owner and dropped when it is destroyed;
+    owners report hiding through ``owner_hidden()`` to stop theirs. Past
+    ``MAX_ANIMATIONS`` the least recently used entries are stopped and
+    deleted, idle ones first.
+    """
+
+    MAX_ANIMATIONS = 512
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._entries: "OrderedDict[Tuple[int, str], QAbstractAnimation]" = OrderedDict()
+        self._owners: Dict[int, Dict[str, QAbstractAnimation]] = {}
+        self._max_animations = self.MAX_ANIMATIONS
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+        self.stopped_on_hide = 0
+
+    def animation(self, owner: QWidget, key: str,
+                  factory: Callable[[], QAbstractAnimation]) -> QAbstractAnimation:
+        """Get the owner's animation for key, building it with factory once"""
+        entry_key = (id(owner), key)
+        animation = self._entries.get(entry_key)
+        if animation is not None:
+            self.reused += 1
+            self._entries.move_to_end(entry_key)
+            return animation
+
+        animation = factory()
+        if animation.parent() is None:
+            animation.setParent(owner)
+        self._add(owner, entry_key, animation)
+        return animation
+
+    def property_animation(self, owner: QWidget, property_name: str,
+                           target: Optional[QObject] = None) -> QPropertyAnimation:
+        """Get the reusable animation of a property of owner, or of target"""
+        target = owner if target is None else target
+        key = property_name if target is owner else f"{property_name}@{id(target):x}"
+        return self.animation(
+            owner, key,
+            lambda: QPropertyAnimation(target, QByteArray(property_name.encode()), owner))
+
+    def animate(self, owner: QWidget, property_name: str, end_value: Any,
+                duration: int = 250,
+                easing: QEasingCurve.Type = QEasingCurve.Type.OutCubic,
+                start_value: Any = None,
+                target: Optional[QObject] = None) -> QPropertyAnimation:
+        """Animate a property to end_value, retargeting a running animation
+
+        Without start_value the animation continues from the property's
+        current value, so interrupting it does not jump.
+        """
+        animation = self.property_animation(owner, property_name, target)
+        animation.stop()
+        animation.setDuration(get_performance_profile().scale_duration(duration))
+        animation.setEasingCurve(easing)
+        if start_value is None:
+            start_value = animation.targetObject().property(property_name)
+        animation.setStartValue(start_value)
+        animation.setEndValue(end_value)
+        animation.start()
+        return animation
+
+    def stop(self, owner: QWidget) -> int:
+        """Stop all animations of owner; returns how many were running"""
+        stopped = 0
+        for animation in self._owners.get(id(owner), {}).values():
+            if animation.state() != QAbstractAnimation.State.Stopped:
+                animation.stop()
+                stopped += 1
+        return stopped
+
+    def release(self, owner: QWidget):
+        """Stop and delete all animations of owner"""
+        owner_id = id(owner)
+        for key in list(self._owners.get(owner_id, ())):
+            self._delete((owner_id, key))
+
+    def release_key(self, owner: QWidget, key: str):
+        """Stop and delete one animation of owner, if registered"""
+        if (id(owner), key) in self._entries:
+            self._delete((id(owner), key))
+
+    def set_max_animations(self, max_animations: int):
+        """Set the animation limit, evicting least recently used entries"""
+        self._max_animations = max(1, max_animations)
+        self._evict()
+
+    def max_animations(self) -> int:
+        return self._max_animations
+
+    def count(self) -> int:
+        """Get the number of registered animations"""
+        return len(self._entries)
+
+    def running_count(self) -> int:
+        """Get the number of registered animations that are running"""
+        return sum(1 for animation in self._entries.values()
+                   if animation.state() == QAbstractAnimation.State.Running)
+
+    def bytes_used(self) -> int:
+        """Get the estimated bytes of the registered animations"""
+        return len(self._entries) * QOBJECT_BYTES
+
+    def trim(self, target_bytes: int):
+        """Delete idle animations, least recently used first, to fit target_bytes"""
+        excess = len(self._entries) - max(0, target_bytes) // QOBJECT_BYTES
+        idle = [key for key, animation in self._entries.items()
+                if animation.state() == QAbstractAnimation.State.Stopped]
+        for entry_key in idle[:max(0, excess)]:
+            self._delete(entry_key)
+            self.evicted += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Get registry counters"""
+        return {
+            "animations": len(self._entries),
+            "running": self.running_count(),
+            "owners": len(self._owners),
+            "max_animations": self._max_animations,
+            "created": self.created,
+            "reused": self.reused,
+            "evicted": self.evicted,
+            "stopped_on_hide": self.stopped_on_hide,
+        }
+
+    def owner_hidden(self, owner: QWidget):
+        """Stop the animations of an owner that was hidden"""
+        if id(owner) in self._owners:
+            self.stopped_on_hide += self.stop(owner)
+
+    def _add(self, owner: QWidget, entry_key: Tuple[int, str], animation: QAbstractAnimation):
+        owner_id, key = entry_key
+        if owner_id not in self._owners:
+            self._owners[owner_id] = {}
+            owner.destroyed.connect(lambda _=None, owner_id=owner_id: self._forget(owner_id))
+        self._owners[owner_id][key] = animation
+        self._entries[entry_key] = animation
+        self.created += 1
+        self._evict()
+
+    def _evict(self):
+        excess = len(self._entries) - self._max_animations
+        if excess <= 0:
+            return
+        idle = [key for key, animation in self._entries.items()
+                if animation.state() == QAbstractAnimation.State.Stopped]
+        victims = idle[:excess]
+        if len(victims) < excess:
+            idle_keys = set(idle)
+            busy = [key for key in self._entries if key not in idle_keys]
+            victims += busy[:excess - len(victims)]
+        for entry_key in victims:
+            self._delete(entry_key)
+            self.evicted += 1
+
+    def _delete(self, entry_key: Tuple[int, str]):
+        animation = self._entries.pop(entry_key)
+        owner_id, key = entry_key
+        self._owners.get(owner_id, {}).pop(key, None)
+        try:
+            animation.stop()
+            animation.deleteLater()
+        except RuntimeError:
+            pass
+
+    def _forget(self, owner_id: int):
+        # The owner and the animations parented to it are being deleted
+        for key in self._owners.pop(owner_id, ()):
+            self._entries.pop((owner_id, key), None)
+
+
+# Global animation registry instance with lazy loading
+_animation_registry = None
+
+
+def get_animation_registry() -> FluentAnimationRegistry:
+    """Get animation registry instance (lazy loading)"""
+    global _animation_registry
+    if _animation_registry is None:
+        _animation_registry = FluentAnimationRegistry()
+        register_cache("animations", _animation_registry.count,
+                       _animation_registry.bytes_used, _animation_registry.trim)
+    return _animation_registry
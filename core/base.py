@@ -10,11 +10,18 @@ from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Signal, QByteAr
 from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QMouseEvent
 
 from .animation import FluentAnimation, AnimationHelper
+from .performance_profile import get_performance_profile
 
 
 class FluentBaseWidget(QWidget):
     """Base widget class with common Fluent Design features"""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Time handlers of classes defined while instrumentation is on
+        from .instrumentation import instrument_subclass
+        instrument_subclass(cls)
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
@@ -34,11 +41,18 @@ class FluentBaseWidget(QWidget):
 
     def _connect_signals(self):
         """Connect theme manager signals"""
+        self._register_theme_updates()
+
+    def _register_theme_updates(self):
+        """Have the theme manager call _on_theme_changed once per theme change
+
+        Updates are deferred while the widget is hidden and caught up on in
+        showEvent, so hidden pages do not re-theme in the switch itself.
+        """
         # Delay theme manager connection until it's needed
         try:
             from .theme import get_theme_manager
-            theme_manager = get_theme_manager()
-            theme_manager.theme_changed.connect(self._on_theme_changed)
+            get_theme_manager().register_component(self, scheduled=True)
         except:
             # If theme manager can't be accessed yet, skip connection
             pass
@@ -47,13 +61,27 @@ class FluentBaseWidget(QWidget):
         """Handle theme change"""
         self.update()
 
+    def showEvent(self, event):
+        """Catch up on theme changes missed while hidden"""
+        from .theme import get_theme_manager
+        theme_manager = get_theme_manager()
+        theme_manager.set_component_visible(self, True)
+        theme_manager.catch_up_component(self)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """Let the theme manager defer theme updates while hidden"""
+        from .theme import get_theme_manager
+        get_theme_manager().set_component_visible(self, False)
+        super().hideEvent(event)
+
     def _create_animation(self, name: str, target_property: str,
                           duration: int = FluentAnimation.DURATION_MEDIUM,
                           easing: QEasingCurve.Type = FluentAnimation.EASE_OUT) -> QPropertyAnimation:
         """Create and store an animation"""
         animation = QPropertyAnimation(
             self, QByteArray(target_property.encode()))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setEasingCurve(easing)
         self._animations[name] = animation
         return animation
@@ -301,7 +329,7 @@ class FluentBaseContainer(FluentBaseWidget):
         if background_color is None:
             background_color = self._get_theme_color('surface')
 
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
 
         # Apply hover effect
         self._apply_hover_effect(painter, rect, background_color)
@@ -0,0 +1,183 @@
+"""
+Fluent Deferred Widgets
+Placeholders that keep a widget's constructor arguments and build the widget
+when the placeholder is first shown, or earlier while the application is idle
+"""
+
+import time
+import weakref
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional
+
+from PySide6.QtCore import QObject, QSize, QTimer, Signal
+from PySide6.QtWidgets import QVBoxLayout, QWidget
+import shiboken6
+
+
+class FluentDeferredWidget(QWidget):
+    """Stands in for a widget until it is needed
+
+    ``FluentDeferredWidget(FluentSettingsPanel, "Display", parent=page)``
+    takes the place of ``FluentSettingsPanel("Display")`` in a layout, but
+    only builds the panel (its children, effects and animations) in the
+    placeholder's first ``showEvent``. A placeholder on a hidden tab or stack
+    page, or in a collapsed section, costs one empty widget until the user
+    opens it. ``materialize()`` builds it at once, ``prebuild=True`` queues
+    it on the idle-time builder.
+
+    Attributes the placeholder does not have are looked up on the built
+    widget, building it first. To configure it without building it, use
+    ``whenMaterialized(callback)``.
+    """
+
+    materialized = Signal(QWidget)
+
+    def __init__(self, factory: Callable[..., QWidget], *args: Any,
+                 parent: Optional[QWidget] = None, prebuild: bool = False,
+                 placeholder_size: Optional[QSize] = None, **kwargs: Any):
+        super().__init__(parent)
+        self._factory = factory
+        self._args = args
+        self._kwargs = kwargs
+        self._widget: Optional[QWidget] = None
+        self._callbacks: List[Callable[[QWidget], None]] = []
+        self._building = False
+        self._placeholder_size = placeholder_size
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(0)
+
+        if prebuild:
+            get_deferred_builder().schedule(self)
+
+    def isMaterialized(self) -> bool:
+        return self._widget is not None
+
+    def widget(self) -> Optional[QWidget]:
+        """Get the built widget, None while it is deferred"""
+        return self._widget
+
+    def materialize(self) -> QWidget:
+        """Build the widget if it is not built yet, and return it"""
+        if self._widget is not None:
+            return self._widget
+        if self._building:
+            raise RuntimeError(f"{self._factory!r} used its placeholder while being built")
+
+        self._building = True
+        try:
+            widget = self._factory(*self._args, **self._kwargs)
+        finally:
+            self._building = False
+        self._widget = widget
+        self._args = self._kwargs = None
+        self._layout.addWidget(widget)
+        self.setSizePolicy(widget.sizePolicy())
+        self.updateGeometry()
+        if self.isVisible() and not widget.isVisibleTo(self):
+            widget.show()
+
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(widget)
+        self.materialized.emit(widget)
+        return widget
+
+    def whenMaterialized(self, callback: Callable[[QWidget], None]):
+        """Call callback with the widget once it is built, at once if it is"""
+        if self._widget is not None:
+            callback(self._widget)
+        else:
+            self._callbacks.append(callback)
+
+    def setPlaceholderSize(self, size: Optional[QSize]):
+        """Set the size hint used until the widget is built"""
+        self._placeholder_size = size
+        if self._widget is None:
+            self.updateGeometry()
+
+    def sizeHint(self) -> QSize:
+        if self._widget is None and self._placeholder_size is not None:
+            return self._placeholder_size
+        return super().sizeHint()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._widget is None:
+            self.materialize()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names the placeholder lacks; private names are
+        # looked up during construction and never belong to the widget
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+
+class FluentDeferredBuilder(QObject):
+    """Builds queued placeholders while the application is idle
+
+    Runs in slices of at most ``BUDGET_MS`` from a zero-interval timer, so
+    input and painting are handled between slices. A placeholder that was
+    shown or deleted in the meantime is skipped.
+    """
+
+    BUDGET_MS = 8
+
+    built = Signal(QWidget)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._queue: "Deque[weakref.ref]" = deque()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._build_slice)
+        self.built_count = 0
+
+    def schedule(self, placeholder: FluentDeferredWidget):
+        """Queue a placeholder to be built when the application is idle"""
+        self._queue.append(weakref.ref(placeholder))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def pending_count(self) -> int:
+        """Get the number of queued placeholders that still need building"""
+        return sum(1 for ref in self._queue
+                   if ref() is not None and not ref().isMaterialized())
+
+    def flush(self):
+        """Build every queued placeholder now"""
+        self._timer.stop()
+        while self._queue:
+            self._build(self._queue.popleft())
+
+    def _build_slice(self):
+        deadline = time.perf_counter() + self.BUDGET_MS / 1000
+        while self._queue and time.perf_counter() < deadline:
+            self._build(self._queue.popleft())
+        if self._queue:
+            self._timer.start()
+
+    def _build(self, ref: weakref.ref):
+        placeholder = ref()
+        # The C++ placeholder may be deleted while its wrapper lives on
+        if (placeholder is None or not shiboken6.isValid(placeholder)
+                or placeholder.isMaterialized()):
+            return
+        widget = placeholder.materialize()
+        self.built_count += 1
+        self.built.emit(widget)
+
+
+# Global deferred builder instance with lazy loading
+_deferred_builder = None
+
+
+def get_deferred_builder() -> FluentDeferredBuilder:
+    """Get deferred builder instance (lazy loading)"""
+    global _deferred_builder
+    if _deferred_builder is None:
+        _deferred_builder = FluentDeferredBuilder()
+    return _deferred_builder
@@ -13,6 +13,7 @@ from PySide6.QtGui import QColor
 
 # Import theme manager for theme-aware animations
 from .theme import get_theme_manager, ThemeTransitionType
+from .performance_profile import get_performance_profile
 
 
 class ThemeAwareFluentAnimation:
@@ -65,7 +66,7 @@ class ThemeAwareFluentAnimation:
                                          theme_color_name: str, duration: int = 250) -> QPropertyAnimation:
         """Create animation that uses theme colors"""
         animation = QPropertyAnimation(widget, QByteArray(color_property.encode()))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         
         # Generate unique animation ID
@@ -118,13 +119,18 @@ class FluentAnimation:
     # Default properties
     DEFAULT_EASING = QEasingCurve.Type.OutCubic
 
+    @staticmethod
+    def scaled(duration: int) -> int:
+        """Scales an animation duration by the performance profile"""
+        return get_performance_profile().scale_duration(duration)
+
     @staticmethod
     def create_animation(target: QObject, property_name: str, duration: int = DURATION_MEDIUM,
                          easing: QEasingCurve.Type = DEFAULT_EASING) -> QPropertyAnimation:
         """Creates a basic property animation with standard settings"""
         animation = QPropertyAnimation(
             target, QByteArray(property_name.encode()))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setEasingCurve(easing)
         return animation
 
@@ -195,7 +201,7 @@ class FluentTransition:
             widget.setGraphicsEffect(effect)
 
         animation = QPropertyAnimation(effect, QByteArray(b"opacity"))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setEasingCurve(easing)
         return animation
 
@@ -204,7 +210,7 @@ class FluentTransition:
                                  easing: QEasingCurve.Type) -> QPropertyAnimation:
         """Create scale transition"""
         animation = QPropertyAnimation(widget, QByteArray(b"geometry"))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setEasingCurve(easing)
 
         # We don't set start/end values here as they'll be set when actually using the animation
@@ -216,7 +222,7 @@ class FluentTransition:
                                  easing: QEasingCurve.Type) -> QPropertyAnimation:
         """Create slide transition"""
         animation = QPropertyAnimation(widget, QByteArray(b"pos"))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setEasingCurve(easing)
         return animation
 
@@ -230,7 +236,7 @@ class FluentTransition:
             widget.setGraphicsEffect(effect)
 
         animation = QPropertyAnimation(effect, QByteArray(b"blurRadius"))
-        animation.setDuration(duration)
+        animation.setDuration(FluentAnimation.scaled(duration))
         animation.setEasingCurve(easing)
         return animation
 
@@ -333,7 +339,7 @@ class FluentMicroInteraction:
 
             # Press animation
             press_anim = QPropertyAnimation(button, QByteArray(b"geometry"))
-            press_anim.setDuration(FluentAnimation.DURATION_ULTRA_FAST)
+            press_anim.setDuration(FluentAnimation.scaled(FluentAnimation.DURATION_ULTRA_FAST))
             press_anim.setEasingCurve(FluentTransition.EASE_CRISP)
 
             # Calculate new geometry
@@ -353,7 +359,7 @@ class FluentMicroInteraction:
 
             # Release animation
             release_anim = QPropertyAnimation(button, QByteArray(b"geometry"))
-            release_anim.setDuration(FluentAnimation.DURATION_FAST)
+            release_anim.setDuration(FluentAnimation.scaled(FluentAnimation.DURATION_FAST))
             release_anim.setEasingCurve(FluentTransition.EASE_SPRING)
             release_anim.setStartValue(new_rect)
             release_anim.setEndValue(original_rect)
@@ -384,7 +390,7 @@ class FluentMicroInteraction:
                 widget.setGraphicsEffect(effect)
 
             glow_in = QPropertyAnimation(effect, QByteArray(b"opacity"))
-            glow_in.setDuration(FluentAnimation.DURATION_FAST)
+            glow_in.setDuration(FluentAnimation.scaled(FluentAnimation.DURATION_FAST))
             glow_in.setEasingCurve(FluentTransition.EASE_SMOOTH)
             glow_in.setStartValue(1.0)  # Assuming current opacity is 1.0
             glow_in.setEndValue(min(1.0, 1.0 + intensity if intensity >= 0
@@ -412,7 +418,7 @@ class FluentMicroInteraction:
             new_rect = QRect(x, y, width, height)
 
             anim = QPropertyAnimation(widget, QByteArray(b"geometry"))
-            anim.setDuration(FluentAnimation.DURATION_FAST)
+            anim.setDuration(FluentAnimation.scaled(FluentAnimation.DURATION_FAST))
             anim.setEasingCurve(FluentTransition.EASE_SPRING)
             anim.setStartValue(original_rect)
             anim.setEndValue(new_rect)
@@ -443,7 +449,7 @@ class FluentMicroInteraction:
 
             # Expand animation
             expand_anim = QPropertyAnimation(widget, QByteArray(b"geometry"))
-            expand_anim.setDuration(FluentAnimation.DURATION_FAST)
+            expand_anim.setDuration(FluentAnimation.scaled(FluentAnimation.DURATION_FAST))
             expand_anim.setEasingCurve(FluentTransition.EASE_SMOOTH)
             expand_anim.setStartValue(original_rect)
             expand_anim.setEndValue(expanded_rect)
@@ -451,7 +457,7 @@ class FluentMicroInteraction:
 
             # Contract animation
             contract_anim = QPropertyAnimation(widget, QByteArray(b"geometry"))
-            contract_anim.setDuration(FluentAnimation.DURATION_FAST)
+            contract_anim.setDuration(FluentAnimation.scaled(FluentAnimation.DURATION_FAST))
             contract_anim.setEasingCurve(FluentTransition.EASE_SPRING)
             contract_anim.setStartValue(expanded_rect)
             contract_anim.setEndValue(original_rect)
@@ -479,7 +485,7 @@ class FluentMicroInteraction:
             for i in range(3):
                 # Move right
                 right_anim = QPropertyAnimation(widget, QByteArray(b"pos"))
-                right_anim.setDuration(50)
+                right_anim.setDuration(FluentAnimation.scaled(50))
                 right_anim.setStartValue(original_pos)
                 right_anim.setEndValue(
                     QPoint(original_pos.x() + int(intensity), original_pos.y()))
@@ -488,7 +494,7 @@ class FluentMicroInteraction:
 
                 # Move left
                 left_anim = QPropertyAnimation(widget, QByteArray(b"pos"))
-                left_anim.setDuration(50)
+                left_anim.setDuration(FluentAnimation.scaled(50))
                 left_anim.setStartValue(
                     QPoint(original_pos.x() + int(intensity), original_pos.y()))
                 left_anim.setEndValue(
@@ -498,7 +504,7 @@ class FluentMicroInteraction:
 
                 # Return to center
                 center_anim = QPropertyAnimation(widget, QByteArray(b"pos"))
-                center_anim.setDuration(50)
+                center_anim.setDuration(FluentAnimation.scaled(50))
                 center_anim.setStartValue(
                     QPoint(original_pos.x() - int(intensity), original_pos.y()))
                 center_anim.setEndValue(original_pos)
@@ -522,7 +528,7 @@ class FluentMicroInteraction:
             # This would typically involve creating a temporary widget overlay
             # For now, we'll simulate with a scale animation
             ripple_anim = QPropertyAnimation(widget, QByteArray(b"geometry"))
-            ripple_anim.setDuration(FluentAnimation.DURATION_MEDIUM)
+            ripple_anim.setDuration(FluentAnimation.scaled(FluentAnimation.DURATION_MEDIUM))
             ripple_anim.setEasingCurve(FluentTransition.EASE_ELASTIC)
 
             original_rect = widget.geometry()
@@ -533,7 +539,7 @@ class FluentMicroInteraction:
 
             # Return to normal
             return_anim = QPropertyAnimation(widget, QByteArray(b"geometry"))
-            return_anim.setDuration(FluentAnimation.DURATION_MEDIUM)
+            return_anim.setDuration(FluentAnimation.scaled(FluentAnimation.DURATION_MEDIUM))
             return_anim.setEasingCurve(FluentTransition.EASE_SMOOTH)
             return_anim.setStartValue(expanded_rect)
             return_anim.setEndValue(original_rect)
@@ -576,7 +582,7 @@ class FluentStateTransition:
                 # Create a special animation using the custom setter
                 animation = QPropertyAnimation(
                     self.widget, QByteArray(prop_name.encode()))
-                animation.setDuration(duration)
+                animation.setDuration(FluentAnimation.scaled(duration))
                 animation.setEasingCurve(easing)
                 animation.setEndValue(value)
                 animations.addAnimation(animation)
@@ -587,7 +593,7 @@ class FluentStateTransition:
                 # Use original string for property lookup since indexOfProperty expects a string
                 if hasattr(self.widget, prop_name) or self.widget.metaObject().indexOfProperty(prop_name) != -1:
                     animation = QPropertyAnimation(self.widget, byte_prop_name)
-                    animation.setDuration(duration)
+                    animation.setDuration(FluentAnimation.scaled(duration))
                     animation.setEasingCurve(easing)
                     animation.setEndValue(value)
                     animations.addAnimation(animation)
@@ -636,7 +642,7 @@ class FluentRevealEffect:
             effect.setOpacity(0)
 
             fade_anim = QPropertyAnimation(effect, QByteArray(b"opacity"))
-            fade_anim.setDuration(duration)
+            fade_anim.setDuration(FluentAnimation.scaled(duration))
             fade_anim.setStartValue(0.0)
             fade_anim.setEndValue(1.0)
             fade_anim.setEasingCurve(FluentTransition.EASE_SMOOTH)
@@ -661,7 +667,7 @@ class FluentRevealEffect:
                 widget.setGraphicsEffect(effect)
 
             fade_anim = QPropertyAnimation(effect, QByteArray(b"opacity"))
-            fade_anim.setDuration(duration)
+            fade_anim.setDuration(FluentAnimation.scaled(duration))
             fade_anim.setStartValue(1.0)
             fade_anim.setEndValue(0.0)
             fade_anim.setEasingCurve(FluentTransition.EASE_SMOOTH)
@@ -696,7 +702,7 @@ class FluentRevealEffect:
             widget.move(start_pos)  # Move to start position before animation
 
             slide_anim = QPropertyAnimation(widget, QByteArray(b"pos"))
-            slide_anim.setDuration(duration)
+            slide_anim.setDuration(FluentAnimation.scaled(duration))
             slide_anim.setStartValue(start_pos)
             slide_anim.setEndValue(original_pos)
             slide_anim.setEasingCurve(FluentTransition.EASE_SPRING)
@@ -725,7 +731,7 @@ class FluentRevealEffect:
             widget.setGeometry(start_rect)  # Set initial size
 
             scale_anim = QPropertyAnimation(widget, QByteArray(b"geometry"))
-            scale_anim.setDuration(duration)
+            scale_anim.setDuration(FluentAnimation.scaled(duration))
             scale_anim.setStartValue(start_rect)
             scale_anim.setEndValue(original_rect)
             scale_anim.setEasingCurve(FluentTransition.EASE_SPRING)
@@ -749,7 +755,7 @@ class FluentRevealEffect:
             widget.move(start_pos)  # Set initial position
 
             reveal_anim = QPropertyAnimation(widget, QByteArray(b"pos"))
-            reveal_anim.setDuration(FluentAnimation.DURATION_MEDIUM)
+            reveal_anim.setDuration(FluentAnimation.scaled(FluentAnimation.DURATION_MEDIUM))
             reveal_anim.setEasingCurve(FluentTransition.EASE_SPRING)
             reveal_anim.setStartValue(start_pos)
             reveal_anim.setEndValue(original_pos)
@@ -792,7 +798,7 @@ class FluentRevealEffect:
 
             animation = QPropertyAnimation(
                 opacity_effect, QByteArray(b"opacity"), widget)
-            animation.setDuration(duration)
+            animation.setDuration(FluentAnimation.scaled(duration))
             animation.setStartValue(start_value)
             animation.setEndValue(end_value)
             animation.setEasingCurve(easing_curve_type)
@@ -825,7 +831,7 @@ class FluentRevealEffect:
             widget.setGeometry(start_rect)  # Set initial size
 
             scale_anim = QPropertyAnimation(widget, QByteArray(b"geometry"))
-            scale_anim.setDuration(FluentAnimation.DURATION_MEDIUM)
+            scale_anim.setDuration(FluentAnimation.scaled(FluentAnimation.DURATION_MEDIUM))
             scale_anim.setEasingCurve(FluentTransition.EASE_SPRING)
             scale_anim.setStartValue(start_rect)
             scale_anim.setEndValue(original_rect)
@@ -877,7 +883,7 @@ class FluentRevealEffect:
 
                     fade_anim = QPropertyAnimation(
                         effect, QByteArray(b"opacity"))
-                    fade_anim.setDuration(duration)
+                    fade_anim.setDuration(FluentAnimation.scaled(duration))
                     fade_anim.setStartValue(0.0)
                     fade_anim.setEndValue(1.0)
                     fade_anim.setEasingCurve(FluentTransition.EASE_SMOOTH)
@@ -889,7 +895,7 @@ class FluentRevealEffect:
                     widget.move(start_pos)
 
                     move_anim = QPropertyAnimation(widget, QByteArray(b"pos"))
-                    move_anim.setDuration(duration)
+                    move_anim.setDuration(FluentAnimation.scaled(duration))
                     move_anim.setStartValue(start_pos)
                     move_anim.setEndValue(original_pos)
                     move_anim.setEasingCurve(FluentTransition.EASE_SPRING)
@@ -909,7 +915,7 @@ class FluentRevealEffect:
 
                     scale_anim = QPropertyAnimation(
                         widget, QByteArray(b"geometry"))
-                    scale_anim.setDuration(duration)
+                    scale_anim.setDuration(FluentAnimation.scaled(duration))
                     scale_anim.setStartValue(start_rect)
                     scale_anim.setEndValue(original_rect)
                     scale_anim.setEasingCurve(FluentTransition.EASE_SPRING)
@@ -1006,7 +1012,7 @@ class FluentLayoutTransition:
                             # Create animation to new position
                             anim = QPropertyAnimation(
                                 child, QByteArray(b"geometry"))
-                            anim.setDuration(duration)
+                            anim.setDuration(FluentAnimation.scaled(duration))
                             anim.setEasingCurve(easing_curve)
                             anim.setStartValue(original_rect)
                             anim.setEndValue(target_rect)
@@ -1053,7 +1059,7 @@ class FluentLayoutTransition:
 
                 # Create animation
                 anim = QPropertyAnimation(effect, QByteArray(b"opacity"))
-                anim.setDuration(duration)
+                anim.setDuration(FluentAnimation.scaled(duration))
                 anim.setStartValue(0.0 if should_show else 1.0)
                 anim.setEndValue(1.0 if should_show else 0.0)
                 anim.setEasingCurve(FluentTransition.EASE_SMOOTH)
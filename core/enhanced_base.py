@@ -10,6 +10,7 @@ from .animation import FluentAnimation
 from .theme_integration import get_transition_manager
 from .enhanced_animations import get_theme_aware_animation
 from .theme import get_theme_manager
+from .shadow import FluentShadowWidget
 
 
 class FluentLayoutBuilder:
@@ -326,9 +327,9 @@ class FluentPanel(FluentBaseContainer):
         self._setup_animations()
         self._apply_styling()
 
-        # Connect theme changes
-        theme_manager = get_theme_manager()
-        theme_manager.theme_changed.connect(self._apply_styling)
+    def _on_theme_changed(self):
+        """Restyle the panel; the theme manager calls this once per theme change"""
+        self._apply_styling()
 
     def _setup_ui(self):
         """Setup panel UI structure"""
@@ -989,6 +990,7 @@ class ThemeIntegratedContainer(FluentBaseContainer, ThemeAwareWidget):
         self._theme_manager.transition_finished.connect(self._on_theme_transition_finished)
         
         self._elevation_level = 1
+        self._shadow = FluentShadowWidget(self, self._border_radius)
         self._setup_theme_container()
     
     def _on_theme_transition_started(self):
@@ -997,6 +999,7 @@ class ThemeIntegratedContainer(FluentBaseContainer, ThemeAwareWidget):
     
     def _on_theme_transition_finished(self):
         """Handle theme transition completion"""
+        self._apply_theme_shadow()
         self.update()
     
     def _setup_theme_container(self):
@@ -1021,6 +1024,32 @@ class ThemeIntegratedContainer(FluentBaseContainer, ThemeAwareWidget):
             }}
         """
         self.setStyleSheet(shadow_style)
+        self._apply_theme_shadow()
+
+    def _apply_theme_shadow(self):
+        """Paint the elevation's theme shadow under the container"""
+        blur_radius, offset_y, color = self._theme_manager.get_elevation_shadow(self._elevation_level)
+        self._shadow.setShadowEnabled(self._elevation_level > 0)
+        self._shadow.setCornerRadius(self._border_radius)
+        self._shadow.setBlurRadius(blur_radius)
+        self._shadow.setOffset(0, offset_y)
+        self._shadow.setColor(color)
+
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        self._shadow.sync()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._shadow.sync()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._shadow.sync()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._shadow.sync()
     
     def set_elevation(self, level: int):
         """Set elevation level with smooth transition"""
@@ -0,0 +1,408 @@
+"""
+Fluent Widget Instrumentation
+Opt-in timing of paint, resize and theme handlers of FluentBaseWidget
+subclasses, per class and per instance, and detection of event loop stalls
+with the stack of the handler that caused them
+"""
+
+import functools
+import inspect
+import sys
+import threading
+import time
+import traceback
+import weakref
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from PySide6.QtCore import QEvent, QObject, QRectF, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QFont, QPainter
+from PySide6.QtWidgets import QWidget
+
+# Handlers timed on every FluentBaseWidget subclass, by the kind of work
+INSTRUMENTED_METHODS = {
+    "paintEvent": "paint",
+    "resizeEvent": "resize",
+    "_on_theme_changed": "theme",
+    "_apply_theme": "theme",
+    "_apply_style": "theme",
+    "_apply_styling": "theme",
+    "_apply_themed_styles": "theme",
+}
+# Also put on FluentBaseWidget itself, so classes keeping QWidget's handler
+# are timed too
+BASE_METHODS = ("paintEvent", "resizeEvent")
+
+
+class Stall(NamedTuple):
+    time: float  # time.time() when the event loop stopped responding
+    duration_ms: float
+    handler: Optional[str]  # "Class.kind" of the instrumented handler running, if any
+    stack: str  # main thread stack while stalled, empty if it could not be taken
+
+
+class FluentInstrumentation(QObject):
+    """Times widget handlers and watches the event loop
+
+    Disabled, nothing is installed and there is no overhead. ``enable()``
+    wraps the handlers in ``INSTRUMENTED_METHODS`` on every FluentBaseWidget
+    subclass (including ones defined later) and starts the stall watchdog;
+    ``disable()`` puts the original handlers back. Theme handlers are
+    connected to signals at construction, so they are timed for widgets
+    created while enabled.
+
+    A stall is a gap of more than ``STALL_THRESHOLD_MS`` between heartbeats
+    of a timer in the event loop. A watchdog thread takes the main thread's
+    stack while the gap lasts, so the stall names the handler that blocked.
+    """
+
+    STALL_THRESHOLD_MS = 100
+    HEARTBEAT_MS = 20
+    MAX_STALLS = 100
+
+    stall_detected = Signal(object)  # Stall
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._enabled = False
+        self._threshold_ms = self.STALL_THRESHOLD_MS
+        # (class name, kind) -> [count, total ns, max ns]
+        self._class_stats: Dict[Tuple[str, str], List[int]] = {}
+        self._instance_stats: "weakref.WeakKeyDictionary[QWidget, Dict[str, List[int]]]" = \
+            weakref.WeakKeyDictionary()
+        self._stalls: List[Stall] = []
+        self._patched: Dict[Tuple[type, str], Any] = {}
+        self._active: Set[Tuple[int, str]] = set()
+        self._handlers: List[str] = []
+
+        self._heartbeat_timer = QTimer(self)
+        self._heartbeat_timer.setInterval(self.HEARTBEAT_MS)
+        self._heartbeat_timer.timeout.connect(self._heartbeat)
+        self._last_beat = 0.0
+        self._stall_sample: Optional[Tuple[Optional[str], str]] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._watchdog_stop = threading.Event()
+        self._main_thread = threading.main_thread().ident
+
+    # Switching on and off
+
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self, stall_threshold_ms: Optional[float] = None):
+        """Start timing handlers and watching for stalls"""
+        if stall_threshold_ms is not None:
+            self._threshold_ms = stall_threshold_ms
+        if self._enabled:
+            return
+        self._enabled = True
+
+        from .base import FluentBaseWidget
+        for name in BASE_METHODS:
+            self._patch(FluentBaseWidget, name, getattr(FluentBaseWidget, name), inherited=True)
+        for cls in [FluentBaseWidget] + _subclasses(FluentBaseWidget):
+            self.instrument_class(cls)
+
+        self._last_beat = time.perf_counter()
+        self._heartbeat_timer.start()
+        self._watchdog_stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="fluent-stall-watchdog",
+                                          daemon=True)
+        self._watchdog.start()
+
+    def disable(self):
+        """Stop timing and put the original handlers back, keeping the data"""
+        if not self._enabled:
+            return
+        self._enabled = False
+        for (cls, name), original in self._patched.items():
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        self._patched.clear()
+        self._heartbeat_timer.stop()
+        self._watchdog_stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+
+    def set_stall_threshold(self, threshold_ms: float):
+        self._threshold_ms = threshold_ms
+
+    def instrument_class(self, cls: type):
+        """Wrap the handlers a FluentBaseWidget subclass defines"""
+        if not self._enabled:
+            return
+        for name, kind in INSTRUMENTED_METHODS.items():
+            method = cls.__dict__.get(name)
+            if callable(method) and (cls, name) not in self._patched:
+                self._patch(cls, name, method)
+
+    def _patch(self, cls: type, name: str, method: Callable, inherited: bool = False):
+        # None marks an attribute that only existed on a base class
+        self._patched[(cls, name)] = None if inherited else method
+        setattr(cls, name, self._wrap(method, INSTRUMENTED_METHODS[name]))
+
+    def _wrap(self, method: Callable, kind: str) -> Callable:
+        instrumentation = self
+
+        def timed(widget, *args):
+            # Bound into signal connections, so it outlives disable()
+            if not instrumentation._enabled:
+                return method(widget, *args)
+            key = (id(widget), kind)
+            active = instrumentation._active
+            # Overrides calling super() count once
+            if key in active:
+                return method(widget, *args)
+            active.add(key)
+            handlers = instrumentation._handlers
+            handlers.append(f"{type(widget).__name__}.{kind}")
+            start = time.perf_counter_ns()
+            try:
+                return method(widget, *args)
+            finally:
+                instrumentation._record(widget, kind, time.perf_counter_ns() - start)
+                handlers.pop()
+                active.discard(key)
+
+        return functools.wraps(method)(_with_parameters(method, timed))
+
+    # Recording
+
+    def _record(self, widget: QWidget, kind: str, elapsed: int):
+        key = (type(widget).__name__, kind)
+        stats = self._class_stats.get(key)
+        if stats is None:
+            stats = self._class_stats[key] = [0, 0, 0]
+        stats[0] += 1
+        stats[1] += elapsed
+        if elapsed > stats[2]:
+            stats[2] = elapsed
+
+        try:
+            per_kind = self._instance_stats.get(widget)
+            if per_kind is None:
+                per_kind = self._instance_stats[widget] = {}
+        except TypeError:
+            return
+        stats = per_kind.get(kind)
+        if stats is None:
+            stats = per_kind[kind] = [0, 0, 0]
+        stats[0] += 1
+        stats[1] += elapsed
+        if elapsed > stats[2]:
+            stats[2] = elapsed
+
+    def _heartbeat(self):
+        now = time.perf_counter()
+        gap_ms = (now - self._last_beat) * 1000 - self.HEARTBEAT_MS
+        self._last_beat = now
+        if gap_ms <= self._threshold_ms:
+            self._stall_sample = None
+            return
+        handler, stack = self._stall_sample or (None, "")
+        self._stall_sample = None
+        stall = Stall(time.time() - gap_ms / 1000, gap_ms, handler, stack)
+        self._stalls.append(stall)
+        del self._stalls[:-self.MAX_STALLS]
+        self.stall_detected.emit(stall)
+
+    def _watch(self):
+        # Sample the main thread once per stall, while it is stuck
+        interval = max(0.005, self._threshold_ms / 4000)
+        while not self._watchdog_stop.wait(interval):
+            late_ms = (time.perf_counter() - self._last_beat) * 1000 - self.HEARTBEAT_MS
+            if late_ms <= self._threshold_ms or self._stall_sample is not None:
+                continue
+            frame = sys._current_frames().get(self._main_thread)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+            handlers = list(self._handlers)
+            self._stall_sample = (handlers[-1] if handlers else None, stack)
+
+    # Metrics
+
+    def class_stats(self, kind: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Get {class: {kind: {count, total_ms, mean_ms, max_ms}}}"""
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (class_name, stat_kind), stats in self._class_stats.items():
+            if kind is None or kind == stat_kind:
+                result.setdefault(class_name, {})[stat_kind] = _summary(stats)
+        return result
+
+    def instance_stats(self, widget: QWidget) -> Dict[str, Dict[str, float]]:
+        """Get {kind: {count, total_ms, mean_ms, max_ms}} of one widget"""
+        return {kind: _summary(stats)
+                for kind, stats in self._instance_stats.get(widget, {}).items()}
+
+    def slowest_classes(self, kind: str = "paint", limit: int = 10) -> List[Tuple[str, Dict[str, float]]]:
+        """Get the classes that spent the most time in one kind of handler"""
+        ranked = sorted(((class_name, stats) for (class_name, stat_kind), stats
+                         in self._class_stats.items() if stat_kind == kind),
+                        key=lambda item: -item[1][1])
+        return [(class_name, _summary(stats)) for class_name, stats in ranked[:limit]]
+
+    def slowest_instances(self, kind: str = "paint", limit: int = 10) -> List[Tuple[QWidget, Dict[str, float]]]:
+        """Get the live widgets that spent the most time in one kind of handler"""
+        ranked = sorted(((widget, per_kind[kind]) for widget, per_kind
+                         in list(self._instance_stats.items()) if kind in per_kind),
+                        key=lambda item: -item[1][1])
+        return [(widget, _summary(stats)) for widget, stats in ranked[:limit]]
+
+    def stalls(self) -> List[Stall]:
+        """Get recent event loop stalls, oldest first"""
+        return list(self._stalls)
+
+    def reset(self):
+        """Drop all timings and stalls"""
+        self._class_stats.clear()
+        self._instance_stats.clear()
+        self._stalls.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get totals"""
+        return {
+            "enabled": self._enabled,
+            "classes": len({class_name for class_name, _ in self._class_stats}),
+            "instances": len(self._instance_stats),
+            "events": sum(stats[0] for stats in self._class_stats.values()),
+            "stalls": len(self._stalls),
+            "stall_threshold_ms": self._threshold_ms,
+        }
+
+
+def _summary(stats: List[int]) -> Dict[str, float]:
+    count, total, maximum = stats
+    return {"count": count, "total_ms": total / 1e6,
+            "mean_ms": total / count / 1e6 if count else 0.0, "max_ms": maximum / 1e6}
+
+
+def _with_parameters(method: Callable, call: Callable) -> Callable:
+    """Make a function with method's positional parameters that calls call
+
+    PySide connects a slot with the number of arguments its function takes
+    and calls it by name afterwards, so a wrapper must take exactly what the
+    handler it replaces takes, or the handler breaks once it is restored.
+    """
+    try:
+        parameters = list(inspect.signature(method).parameters.values())
+    except ValueError:
+        # Qt's own handlers, only ever called from C++
+        parameters = [inspect.Parameter("args", inspect.Parameter.VAR_POSITIONAL)]
+    if any(p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD, p.KEYWORD_ONLY) for p in parameters):
+        return lambda *args, **kwargs: call(*args, **kwargs)
+    names = [p.name for p in parameters]
+    defaults = {p.name: p.default for p in parameters if p.default is not p.empty}
+    signature = ", ".join(f"{name}=_defaults[{name!r}]" if name in defaults else name
+                          for name in names)
+    namespace = {"_call": call, "_defaults": defaults}
+    exec(f"def handler({signature}):\n    return _call({', '.join(names)})", namespace)
+    return namespace["handler"]
+
+
+def _subclasses(cls: type) -> List[type]:
+    found = []
+    pending = list(cls.__subclasses__())
+    while pending:
+        subclass = pending.pop()
+        if subclass not in found:
+            found.append(subclass)
+            pending.extend(subclass.__subclasses__())
+    return found
+
+
+class FluentInstrumentationOverlay(QWidget):
+    """In-app panel with the busiest widget classes and the last stall
+
+    Floats in the top right corner of its parent and ignores the mouse.
+    Shows milliseconds per second spent in each kind of handler over the
+    last refresh interval.
+    """
+
+    REFRESH_MS = 500
+    ROWS = 6
+
+    def __init__(self, parent: QWidget, instrumentation: Optional[FluentInstrumentation] = None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        self._instrumentation = instrumentation or get_instrumentation()
+        self._previous: Dict[Tuple[str, str], int] = {}
+        self._previous_time = time.perf_counter()
+        self._lines: List[str] = ["Collecting..."]
+        self._font = QFont("monospace", 8)
+        self._font.setStyleHint(QFont.StyleHint.Monospace)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start()
+
+        self.resize(340, (self.ROWS + 3) * 14 + 12)
+        parent.installEventFilter(self)
+        self._place()
+        self.raise_()
+
+    def lines(self) -> List[str]:
+        return list(self._lines)
+
+    def refresh(self):
+        """Recompute the rows from the timings since the last refresh"""
+        now = time.perf_counter()
+        seconds = max(now - self._previous_time, 1e-3)
+        current = {key: stats[1] for key, stats in self._instrumentation._class_stats.items()}
+        deltas = sorted(((key, total - self._previous.get(key, 0)) for key, total in current.items()),
+                        key=lambda item: -item[1])
+        self._previous, self._previous_time = current, now
+
+        lines = [f"{'class':<24} {'kind':<7} {'ms/s':>6}"]
+        for (class_name, kind), delta in deltas[:self.ROWS]:
+            if delta <= 0:
+                break
+            lines.append(f"{class_name[:24]:<24} {kind:<7} {delta / 1e6 / seconds:>6.1f}")
+        stalls = self._instrumentation.stalls()
+        if stalls:
+            stall = stalls[-1]
+            lines.append(f"{len(stalls)} stalls, last {stall.duration_ms:.0f} ms "
+                         f"in {stall.handler or 'unknown'}")
+        self._lines = lines
+        self.update()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self.parentWidget() and event.type() == QEvent.Type.Resize:
+            self._place()
+        return False
+
+    def _place(self):
+        parent = self.parentWidget()
+        self.move(max(0, parent.width() - self.width() - 8), 8)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 180))
+        painter.drawRoundedRect(QRectF(self.rect()), 6, 6)
+        painter.setFont(self._font)
+        painter.setPen(QColor(255, 255, 255))
+        for row, line in enumerate(self._lines):
+            painter.drawText(8, 18 + row * 14, line)
+        painter.end()
+
+
+# Global instrumentation instance with lazy loading
+_instrumentation = None
+
+
+def get_instrumentation() -> FluentInstrumentation:
+    """Get instrumentation instance (lazy loading)"""
+    global _instrumentation
+    if _instrumentation is None:
+        _instrumentation = FluentInstrumentation()
+    return _instrumentation
+
+
+def instrument_subclass(cls: type):
+    """Instrument a FluentBaseWidget subclass defined while enabled"""
+    if _instrumentation is not None and _instrumentation._enabled:
+        _instrumentation.instrument_class(cls)
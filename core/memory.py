@@ -0,0 +1,240 @@
+"""
+Fluent Memory Registry
+Accounting of component caches in one place: entry counts and estimated bytes,
+a global memory budget enforced by trimming caches, and trim_caches() for
+low-memory situations
+"""
+
+import sys
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
+
+# Rough size of a cached QObject (animation, effect, pooled widget) and its
+# private data; Qt does not report it
+QOBJECT_BYTES = 1024
+
+# Trim order under a budget: caches that are cheap to regenerate go first
+PRIORITY_CHEAP = 0  # stylesheets, animations, pooled widgets
+PRIORITY_EXPENSIVE = 10  # rendered and blurred pixmaps
+
+
+def pixmap_bytes(pixmap) -> int:
+    """Get the pixel memory of a QPixmap or QImage"""
+    if pixmap is None or pixmap.isNull():
+        return 0
+    return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+
+def estimate_bytes(value: Any) -> int:
+    """Estimate the memory held by a cached value, containers included"""
+    if isinstance(value, (QPixmap, QImage)):
+        return sys.getsizeof(value) + pixmap_bytes(value)
+    if isinstance(value, QObject):
+        return QOBJECT_BYTES
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_bytes(key) + estimate_bytes(item)
+                                          for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_bytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class _Registration:
+    __slots__ = ("name", "entries", "size", "trim", "priority", "owner")
+
+    def __init__(self, name, entries, size, trim, priority, owner):
+        self.name = name
+        self.entries = entries
+        self.size = size
+        self.trim = trim
+        self.priority = priority
+        self.owner = owner
+
+    def call(self, function: Callable, *args) -> Any:
+        if self.owner is None:
+            return function(*args)
+        owner = self.owner()
+        if owner is None:
+            return None
+        return function(owner, *args)
+
+    def is_alive(self) -> bool:
+        return self.owner is None or self.owner() is not None
+
+
+class FluentMemoryRegistry(QObject):
+    """Registry of caches for memory accounting and eviction
+
+    A cache registers a name and callbacks: ``entries()`` and ``size()``
+    report its entry count and estimated bytes, ``trim(target_bytes)``
+    shrinks it to at most that many bytes (0 empties it). Caches held by a
+    widget or other object pass it as ``owner``; the callbacks then take the
+    owner as first argument, the registry only keeps a weak reference, and
+    instances of the same cache are reported together under its name.
+
+    With a budget set, caches call ``cache_grew()`` after inserting, and
+    once the event loop is free the registry trims caches until the total
+    fits: lowest ``priority`` first (cheap to regenerate, such as
+    stylesheets), then the largest. Caches without ``trim`` are only
+    reported.
+    """
+
+    trimmed = Signal(int)  # bytes freed
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._registrations: List[_Registration] = []
+        self._budget: Optional[int] = None
+        self._check_timer = QTimer(self)
+        self._check_timer.setSingleShot(True)
+        self._check_timer.setInterval(0)
+        self._check_timer.timeout.connect(self.enforce_budget)
+        self.trims = 0
+        self.bytes_freed = 0
+
+    def register(self, name: str, entries: Callable[..., int], size: Callable[..., int],
+                 trim: Optional[Callable[..., Any]] = None, owner: Optional[object] = None,
+                 priority: int = PRIORITY_CHEAP):
+        """Register a cache under name"""
+        self._registrations.append(_Registration(
+            name, entries, size, trim, priority,
+            weakref.ref(owner) if owner is not None else None))
+        if self._budget is not None:
+            self.cache_grew()
+
+    def unregister(self, name: str, owner: Optional[object] = None):
+        """Remove a cache, or the one instance of it held by owner"""
+        self._registrations = [
+            registration for registration in self._registrations
+            if registration.name != name
+            or (owner is not None and registration.owner is not None
+                and registration.owner() is not owner)]
+
+    def names(self) -> List[str]:
+        """Get the names of registered caches"""
+        return list(dict.fromkeys(registration.name for registration in self._live()))
+
+    def report(self) -> Dict[str, Dict[str, int]]:
+        """Get {name: {entries, bytes, instances, trimmable}}, largest first"""
+        report: Dict[str, Dict[str, int]] = {}
+        for registration in self._live():
+            row = report.setdefault(registration.name, {
+                "entries": 0, "bytes": 0, "instances": 0,
+                "trimmable": registration.trim is not None})
+            row["entries"] += registration.call(registration.entries) or 0
+            row["bytes"] += registration.call(registration.size) or 0
+            row["instances"] += 1
+        return dict(sorted(report.items(), key=lambda item: -item[1]["bytes"]))
+
+    def total_bytes(self) -> int:
+        """Get the estimated bytes held by all registered caches"""
+        return sum(registration.call(registration.size) or 0 for registration in self._live())
+
+    def set_budget(self, max_bytes: Optional[int]):
+        """Set the byte budget of all caches together, None for no budget"""
+        self._budget = None if max_bytes is None else max(0, max_bytes)
+        if self._budget is not None:
+            self.enforce_budget()
+
+    def budget(self) -> Optional[int]:
+        return self._budget
+
+    def cache_grew(self):
+        """Note that a cache grew, to check the budget once the loop is free"""
+        if self._budget is not None and not self._check_timer.isActive():
+            self._check_timer.start()
+
+    def enforce_budget(self) -> int:
+        """Trim caches until the total fits the budget; returns bytes freed"""
+        if self._budget is None:
+            return 0
+        sizes = [(registration, registration.call(registration.size) or 0)
+                 for registration in self._live()]
+        excess = sum(size for _, size in sizes) - self._budget
+        if excess <= 0:
+            return 0
+
+        freed = 0
+        for registration, size in sorted(sizes, key=lambda item: (item[0].priority, -item[1])):
+            if excess <= 0:
+                break
+            if registration.trim is None or size == 0:
+                continue
+            released = self._trim(registration, size, max(0, size - excess))
+            freed += released
+            excess -= released
+        self._trimmed(freed)
+        return freed
+
+    def trim(self, fraction: float = 0.0) -> int:
+        """Shrink every trimmable cache to fraction of its size; returns bytes freed"""
+        freed = 0
+        for registration in self._live():
+            if registration.trim is None:
+                continue
+            size = registration.call(registration.size) or 0
+            if size:
+                freed += self._trim(registration, size, int(size * fraction))
+        if fraction <= 0:
+            QPixmapCache.clear()
+        self._trimmed(freed)
+        return freed
+
+    def stats(self) -> Dict[str, Any]:
+        """Get registry counters"""
+        return {
+            "caches": len(self.names()),
+            "registrations": len(self._live()),
+            "bytes": self.total_bytes(),
+            "budget": self._budget,
+            "trims": self.trims,
+            "bytes_freed": self.bytes_freed,
+        }
+
+    def _trim(self, registration: _Registration, size: int, target: int) -> int:
+        registration.call(registration.trim, target)
+        return max(0, size - (registration.call(registration.size) or 0))
+
+    def _trimmed(self, freed: int):
+        if freed:
+            self.trims += 1
+            self.bytes_freed += freed
+            self.trimmed.emit(freed)
+
+    def _live(self) -> List[_Registration]:
+        # Drop instances whose owner was collected
+        live = [registration for registration in self._registrations if registration.is_alive()]
+        if len(live) != len(self._registrations):
+            self._registrations = live
+        return live
+
+
+# Global memory registry instance with lazy loading
+_memory_registry = None
+
+
+def get_memory_registry() -> FluentMemoryRegistry:
+    """Get memory registry instance (lazy loading)"""
+    global _memory_registry
+    if _memory_registry is None:
+        _memory_registry = FluentMemoryRegistry()
+    return _memory_registry
+
+
+def register_cache(name: str, entries: Callable[..., int], size: Callable[..., int],
+                   trim: Optional[Callable[..., Any]] = None, owner: Optional[object] = None,
+                   priority: int = PRIORITY_CHEAP):
+    """Convenience function to register a cache with the memory registry"""
+    get_memory_registry().register(name, entries, size, trim, owner, priority)
+
+
+def trim_caches(fraction: float = 0.0) -> int:
+    """Free cache memory, for low-memory situations; returns bytes freed
+
+    Empties every trimmable cache (and Qt's QPixmapCache), or with fraction
+    shrinks each to that share of its size.
+    """
+    return get_memory_registry().trim(fraction)
@@ -0,0 +1,25 @@
+"""
+Native Paint Mode
+Helpers for custom-painted widgets that draw from the theme palette and color
+tokens instead of a stylesheet (see FluentTheme.set_native_paint_enabled)
+"""
+
+from PySide6.QtWidgets import QWidget
+
+from .theme import get_theme_manager
+
+
+def is_native_paint_active() -> bool:
+    """Check whether custom-painted widgets should skip their stylesheets"""
+    return get_theme_manager().is_native_paint_enabled()
+
+
+def apply_native_palette(widget: QWidget):
+    """Drop a widget's stylesheet and give it the theme palette
+
+    Without a stylesheet Qt uses the plain widget style for the widget's
+    paints and size hints instead of the stylesheet style.
+    """
+    if widget.styleSheet():
+        widget.setStyleSheet("")
+    widget.setPalette(get_theme_manager().palette())
@@ -0,0 +1,332 @@
+"""
+Fluent Performance Profile
+One runtime switch for the library's animation, shadow, effect and
+anti-aliasing quality, recommended from the machine and changeable at any time
+"""
+
+import os
+import sys
+import time
+from enum import Enum
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from PySide6.QtCore import QObject, QRectF, Signal
+from PySide6.QtGui import (QBrush, QColor, QGuiApplication, QImage, QLinearGradient, QPainter,
+                           QPen)
+from PySide6.QtWidgets import (QApplication, QGraphicsBlurEffect, QGraphicsColorizeEffect,
+                               QGraphicsDropShadowEffect, QGraphicsEffect)
+
+from .startup_profile import startup_phase
+
+PROFILE_ENV = "FLUENT_PERFORMANCE_PROFILE"
+
+# Dynamic properties kept on effects passed through the profile
+PROFILED_PROPERTY = "fluentProfileEffect"
+DISABLED_PROPERTY = "fluentProfileDisabled"
+
+# Effects rendered offscreen on every repaint of their widget; opacity
+# effects carry state (fades) and are left alone
+HEAVY_EFFECTS = (QGraphicsDropShadowEffect, QGraphicsBlurEffect, QGraphicsColorizeEffect)
+
+# Detection thresholds
+LOW_CPU_COUNT = 2
+BALANCED_CPU_COUNT = 4
+BALANCED_PIXELS = 2 * 3840 * 2160  # device pixels over all screens
+BALANCED_PAINT_MS = 15.0
+LOW_PAINT_MS = 40.0
+
+
+class PerformanceProfile(Enum):
+    """Rendering quality profiles, best first"""
+    HIGH = "high"
+    BALANCED = "balanced"
+    LOW = "low"
+    REDUCED_MOTION = "reduced_motion"
+
+
+class ProfileSettings(NamedTuple):
+    animation_scale: float  # share of their duration library animations run
+    animations: bool  # decorative animations: hover, ripple, popup and page effects
+    transitions: bool  # theme cross-fades
+    shadows: bool  # cached nine-patch shadows under cards and surfaces
+    effects: bool  # QGraphicsEffect shadows and blurs
+    antialiasing: bool
+    frame_interval: int  # ms per frame of the shared animation clock
+
+
+PROFILE_SETTINGS: Dict[PerformanceProfile, ProfileSettings] = {
+    PerformanceProfile.HIGH: ProfileSettings(1.0, True, True, True, True, True, 16),
+    PerformanceProfile.BALANCED: ProfileSettings(0.75, True, True, True, False, True, 16),
+    PerformanceProfile.LOW: ProfileSettings(0.0, False, False, False, False, False, 33),
+    PerformanceProfile.REDUCED_MOTION: ProfileSettings(0.0, False, False, True, True, True, 16),
+}
+
+_ORDER = (PerformanceProfile.HIGH, PerformanceProfile.BALANCED, PerformanceProfile.LOW)
+
+
+class ProfileDetection(NamedTuple):
+    profile: PerformanceProfile
+    reasons: List[str]
+    cpu_count: int
+    screens: int
+    pixels: int
+    paint_ms: float
+
+
+def parse_profile(value: Union[PerformanceProfile, str]) -> PerformanceProfile:
+    """Get the profile for an enum member or its name ("low", "reduced-motion")"""
+    if isinstance(value, PerformanceProfile):
+        return value
+    try:
+        return PerformanceProfile(value.strip().lower().replace("-", "_"))
+    except ValueError:
+        raise ValueError(f"Unknown performance profile: {value!r}") from None
+
+
+def remote_session() -> Optional[str]:
+    """Get a description of the remote desktop session the app runs in, if any"""
+    session = os.environ.get("SESSIONNAME", "")
+    if session.upper().startswith(("RDP-", "ICA-")):
+        return f"remote desktop session {session}"
+    if os.environ.get("XRDP_SESSION"):
+        return "xrdp session"
+    if os.environ.get("SSH_CONNECTION") and os.environ.get("DISPLAY", "").startswith("localhost:"):
+        return "X11 forwarded over ssh"
+    if QGuiApplication.instance() is not None and QGuiApplication.platformName() == "vnc":
+        return "vnc platform"
+    return None
+
+
+def paint_benchmark(rects: int = 100) -> float:
+    """Time painting antialiased gradient rounded rects into an image, in ms"""
+    image = QImage(256, 256, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    gradient = QLinearGradient(0, 0, 256, 256)
+    gradient.setColorAt(0, QColor(0, 120, 212))
+    gradient.setColorAt(1, QColor(255, 255, 255, 128))
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setBrush(QBrush(gradient))
+    painter.setPen(QPen(QColor(0, 0, 0, 60), 1.5))
+    start = time.perf_counter()
+    for i in range(rects):
+        painter.drawRoundedRect(QRectF(i % 16 * 14 + 0.5, i // 16 * 18 + 0.5, 40, 28), 6, 6)
+    painter.end()
+    return (time.perf_counter() - start) * 1000
+
+
+def _profile_from_environment() -> Optional[Tuple[PerformanceProfile, str]]:
+    """Get the profile the environment names, with the variable that named it"""
+    override = os.environ.get(PROFILE_ENV)
+    if override:
+        try:
+            return parse_profile(override), f"{PROFILE_ENV}={override}"
+        except ValueError:
+            print(f"Ignoring {PROFILE_ENV}={override!r}", file=sys.stderr)
+    if os.environ.get("LOW_PERFORMANCE_MODE") == "1":
+        return PerformanceProfile.LOW, "LOW_PERFORMANCE_MODE=1"
+    return None
+
+
+def detect_profile(benchmark: bool = True) -> ProfileDetection:
+    """Pick a profile from the environment, CPU count, screens and paint speed
+
+    ``FLUENT_PERFORMANCE_PROFILE`` names a profile outright, and the legacy
+    ``LOW_PERFORMANCE_MODE=1`` selects LOW. Otherwise remote desktop sessions
+    get LOW, and each measurement can only lower the profile.
+    """
+    cpu_count = os.cpu_count() or 1
+    screens = QGuiApplication.screens() if QGuiApplication.instance() is not None else []
+    pixels = sum(int(screen.size().width() * screen.size().height()
+                     * screen.devicePixelRatio() ** 2) for screen in screens)
+
+    def result(profile, reasons, paint_ms=0.0):
+        return ProfileDetection(profile, reasons, cpu_count, len(screens), pixels, paint_ms)
+
+    override = _profile_from_environment()
+    if override:
+        return result(override[0], [override[1]])
+    remote = remote_session()
+    if remote:
+        return result(PerformanceProfile.LOW, [remote])
+
+    rank, reasons = 0, []
+
+    def lower(to: PerformanceProfile, reason: str):
+        nonlocal rank
+        rank = max(rank, _ORDER.index(to))
+        reasons.append(reason)
+
+    if cpu_count <= LOW_CPU_COUNT:
+        lower(PerformanceProfile.LOW, f"{cpu_count} CPUs")
+    elif cpu_count <= BALANCED_CPU_COUNT:
+        lower(PerformanceProfile.BALANCED, f"{cpu_count} CPUs")
+    if pixels > BALANCED_PIXELS:
+        lower(PerformanceProfile.BALANCED, f"{pixels} device pixels on {len(screens)} screens")
+
+    paint_ms = 0.0
+    if benchmark:
+        paint_ms = min(paint_benchmark() for _ in range(3))
+        if paint_ms > LOW_PAINT_MS:
+            lower(PerformanceProfile.LOW, f"paint benchmark {paint_ms:.1f} ms")
+        elif paint_ms > BALANCED_PAINT_MS:
+            lower(PerformanceProfile.BALANCED, f"paint benchmark {paint_ms:.1f} ms")
+    return result(_ORDER[rank], reasons, paint_ms)
+
+
+class FluentPerformanceProfile(QObject):
+    """Rendering quality of the library's components, for slow machines and remote desktops
+
+    The profile is HIGH unless the environment names one, and can be switched
+    at any time with ``set_profile()``. ``detect()`` only recommends a profile
+    for the machine; apps opt in with ``set_profile(profile.detect())``.
+    Applying a profile:
+
+    - turns effects passed through ``apply_to_effect()`` off and back on
+    - shows or hides cached shadows (``FluentShadowWidget``)
+    - sets the frame interval of the shared animation clock
+    - turns theme cross-fades off, without changing the theme setting
+
+    Nothing outside the library is changed. Components ask
+    ``animations_enabled()`` and friends before starting decorative work,
+    scale their durations with ``scale_duration()`` (``FluentAnimation``
+    helpers do this) and pass ``antialiasing()`` to their render hints.
+    """
+
+    profile_changed = Signal(object)  # PerformanceProfile
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._profile: Optional[PerformanceProfile] = None
+        self._settings = PROFILE_SETTINGS[PerformanceProfile.HIGH]
+        self._detection: Optional[ProfileDetection] = None
+        self.switches = 0
+
+    def profile(self) -> PerformanceProfile:
+        """Get the active profile, the environment's or HIGH on first use"""
+        if self._profile is None:
+            self._set_initial_profile()
+        return self._profile
+
+    def settings(self) -> ProfileSettings:
+        """Get the settings of the active profile"""
+        if self._profile is None:
+            self._set_initial_profile()
+        return self._settings
+
+    def detect(self) -> PerformanceProfile:
+        """Detect the profile recommended for this machine, without applying it"""
+        with startup_phase("performance:detect"):
+            self._detection = detect_profile()
+        return self._detection.profile
+
+    def detection(self) -> Optional[ProfileDetection]:
+        """Get the result of the last detection"""
+        return self._detection
+
+    def set_profile(self, profile: Union[PerformanceProfile, str]):
+        """Switch to profile ("high", "balanced", "low", "reduced_motion")"""
+        profile = parse_profile(profile)
+        if profile == self._profile:
+            return
+        self._profile = profile
+        self._settings = PROFILE_SETTINGS[profile]
+        self._apply()
+        self.switches += 1
+        self.profile_changed.emit(profile)
+
+    def animations_enabled(self) -> bool:
+        return self.settings().animations
+
+    def transitions_enabled(self) -> bool:
+        return self.settings().transitions
+
+    def shadows_enabled(self) -> bool:
+        return self.settings().shadows
+
+    def effects_enabled(self) -> bool:
+        return self.settings().effects
+
+    def antialiasing(self) -> bool:
+        return self.settings().antialiasing
+
+    def scale_duration(self, duration: int) -> int:
+        """Scale the duration in ms of a library animation"""
+        scale = self.settings().animation_scale
+        if scale == 1.0 or duration <= 0:
+            return duration
+        # At least 1 ms, so finished is still emitted after start() returns
+        return max(1, int(duration * scale))
+
+    def apply_to_effect(self, effect: QGraphicsEffect) -> QGraphicsEffect:
+        """Turn a new graphics effect off if the profile disallows it, now and on switches"""
+        if isinstance(effect, HEAVY_EFFECTS):
+            effect.setProperty(PROFILED_PROPERTY, True)
+            if not self.settings().effects:
+                if effect.isEnabled():
+                    effect.setEnabled(False)
+                    effect.setProperty(DISABLED_PROPERTY, True)
+            elif effect.property(DISABLED_PROPERTY):
+                effect.setEnabled(True)
+                effect.setProperty(DISABLED_PROPERTY, None)
+        return effect
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the active profile, its settings and the detection result"""
+        detection = self._detection
+        return {
+            "profile": self.profile().value,
+            "settings": self._settings._asdict(),
+            "detected": detection.profile.value if detection else None,
+            "reasons": list(detection.reasons) if detection else [],
+            "cpu_count": detection.cpu_count if detection else None,
+            "screens": detection.screens if detection else None,
+            "paint_ms": detection.paint_ms if detection else None,
+            "switches": self.switches,
+        }
+
+    def _set_initial_profile(self):
+        override = _profile_from_environment()
+        self.set_profile(override[0] if override else PerformanceProfile.HIGH)
+
+    def _apply(self):
+        settings = self._settings
+
+        from .animation_clock import get_animation_clock
+        get_animation_clock().set_frame_interval(settings.frame_interval)
+
+        app = QApplication.instance()
+        if app is None:
+            return
+        from .shadow import FluentShadowWidget
+        for widget in app.allWidgets():
+            effect = widget.graphicsEffect()
+            if effect is not None and effect.property(PROFILED_PROPERTY):
+                self.apply_to_effect(effect)
+            if isinstance(widget, FluentShadowWidget):
+                widget.sync()
+        for window in app.topLevelWidgets():
+            window.update()
+
+
+# Global performance profile instance with lazy loading
+_performance_profile = None
+
+
+def get_performance_profile() -> FluentPerformanceProfile:
+    """Get performance profile instance (lazy loading)"""
+    global _performance_profile
+    if _performance_profile is None:
+        _performance_profile = FluentPerformanceProfile()
+    return _performance_profile
+
+
+def set_performance_profile(profile: Union[PerformanceProfile, str]):
+    """Convenience function to switch the application's performance profile"""
+    get_performance_profile().set_profile(profile)
+
+
+def profile_effect(effect: QGraphicsEffect) -> QGraphicsEffect:
+    """Convenience function to make a new graphics effect follow the profile"""
+    return get_performance_profile().apply_to_effect(effect)
@@ -0,0 +1,345 @@
+"""
+Fluent Shadow Rendering
+Blurred rounded-rect shadows rendered once into cached nine-patch pixmaps and
+painted with plain drawPixmap calls, instead of a QGraphicsDropShadowEffect
+that renders and blurs its widget offscreen on every repaint
+"""
+
+import math
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+
+from PySide6.QtCore import QMargins, QPointF, QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+from PySide6.QtWidgets import (QGraphicsBlurEffect, QGraphicsPixmapItem,
+                               QGraphicsScene, QSplitter, QWidget)
+
+from .memory import PRIORITY_EXPENSIVE, get_memory_registry, pixmap_bytes, register_cache
+from .performance_profile import get_performance_profile
+
+
+# Parents that take in every child widget added to them as an item of their
+# own (a splitter pane), so a shadow placed there would become one
+ADOPTING_PARENTS = (QSplitter,)
+
+
+def shadow_margins(blur: float, offset: QPointF = QPointF()) -> QMargins:
+    """Get how far a shadow reaches outside the rect casting it"""
+    extent = math.ceil(blur)
+    x, y = round(offset.x()), round(offset.y())
+    return QMargins(max(0, extent - x), max(0, extent - y),
+                    max(0, extent + x), max(0, extent + y))
+
+
+class FluentShadowRenderer:
+    """Cache of nine-patch shadow pixmaps
+
+    A shadow is rendered once per (corner radius, blur, color, device pixel
+    ratio) as the smallest image that still holds its corners, then painted
+    at any size by stretching the one-pixel edge and center slices. Blur and
+    radius are rounded to whole pixels so animated elevations share entries.
+    """
+
+    MAX_ENTRIES = 128
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self._pixmaps: "OrderedDict[Tuple[int, int, int, float], Tuple[QPixmap, int]]" = OrderedDict()
+        self._max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def nine_patch(self, radius: float, blur: float, color: QColor,
+                   device_pixel_ratio: float = 1.0) -> Tuple[QPixmap, int]:
+        """Get the shadow pixmap and its corner size in logical pixels"""
+        key = (max(0, round(radius)), max(0, math.ceil(blur)), color.rgba(), device_pixel_ratio)
+        entry = self._pixmaps.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._pixmaps.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        entry = self._render(*key)
+        self._pixmaps[key] = entry
+        while len(self._pixmaps) > self._max_entries:
+            self._pixmaps.popitem(last=False)
+            self.evictions += 1
+        get_memory_registry().cache_grew()
+        return entry
+
+    def patches(self, rect: Union[QRect, QRectF], radius: float, blur: float,
+                color: QColor, offset: QPointF = QPointF(),
+                device_pixel_ratio: float = 1.0) -> Tuple[QPixmap, List[Tuple[QRectF, QRectF]]]:
+        """Get the shadow pixmap and the (target, source) rects that paint it
+
+        Widgets that repaint the same shadow keep the result, so a paint is
+        nothing but the drawPixmap calls.
+        """
+        pixmap, corner = self.nine_patch(radius, blur, color, device_pixel_ratio)
+
+        extent = math.ceil(blur)
+        target = QRectF(rect).translated(offset).adjusted(-extent, -extent, extent, extent)
+        # Small targets squeeze the corners instead of overlapping them
+        tc = min(float(corner), target.width() / 2, target.height() / 2)
+        sc = corner * device_pixel_ratio
+        size = pixmap.width()
+
+        target_x = (target.left(), target.left() + tc, target.right() - tc)
+        target_y = (target.top(), target.top() + tc, target.bottom() - tc)
+        target_w = (tc, target.width() - 2 * tc, tc)
+        target_h = (tc, target.height() - 2 * tc, tc)
+        source = (0.0, sc, size - sc)
+        source_size = (sc, size - 2 * sc, sc)
+
+        patches = []
+        for row in range(3):
+            if target_h[row] <= 0:
+                continue
+            for column in range(3):
+                if target_w[column] <= 0:
+                    continue
+                patches.append((
+                    QRectF(target_x[column], target_y[row], target_w[column], target_h[row]),
+                    QRectF(source[column], source[row], source_size[column], source_size[row])))
+        return pixmap, patches
+
+    def paint(self, painter: QPainter, rect: Union[QRect, QRectF], radius: float,
+              blur: float, color: QColor, offset: QPointF = QPointF()):
+        """Paint the shadow cast by a rounded rect"""
+        if color.alpha() == 0 or rect.isEmpty():
+            return
+        device = painter.device()
+        ratio = device.devicePixelRatioF() if device is not None else 1.0
+        pixmap, patches = self.patches(rect, radius, blur, color, offset, ratio)
+        for target, source in patches:
+            painter.drawPixmap(target, pixmap, source)
+
+    def clear(self):
+        """Drop all cached pixmaps"""
+        self._pixmaps.clear()
+
+    def set_max_entries(self, max_entries: int):
+        """Set the entry limit, evicting least recently used pixmaps"""
+        self._max_entries = max(1, max_entries)
+        while len(self._pixmaps) > self._max_entries:
+            self._pixmaps.popitem(last=False)
+            self.evictions += 1
+
+    def count(self) -> int:
+        """Get the number of cached pixmaps"""
+        return len(self._pixmaps)
+
+    def bytes_used(self) -> int:
+        """Get the pixel memory of the cached pixmaps"""
+        return sum(pixmap_bytes(pixmap) for pixmap, _ in self._pixmaps.values())
+
+    def trim(self, target_bytes: int):
+        """Evict least recently used pixmaps until at most target_bytes remain"""
+        used = self.bytes_used()
+        while used > target_bytes and self._pixmaps:
+            pixmap, _ = self._pixmaps.popitem(last=False)[1]
+            used -= pixmap_bytes(pixmap)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters"""
+        return {
+            "pixmaps": len(self._pixmaps),
+            "max_entries": self._max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bytes": self.bytes_used(),
+        }
+
+    def _render(self, radius: int, blur: int, rgba: int,
+                device_pixel_ratio: float) -> Tuple[QPixmap, int]:
+        # The corner covers the blur outside the shape, the blur inside it
+        # and the rounding; one more pixel is the stretched edge
+        corner = radius + 2 * blur
+        size = 2 * corner + 1
+        pixels = math.ceil(size * device_pixel_ratio)
+
+        image = QImage(pixels, pixels, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, get_performance_profile().antialiasing())
+        painter.scale(device_pixel_ratio, device_pixel_ratio)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor.fromRgba(rgba))
+        painter.drawRoundedRect(QRectF(blur, blur, size - 2 * blur, size - 2 * blur),
+                                radius, radius)
+        painter.end()
+
+        if blur:
+            image = self._blur(image, blur * device_pixel_ratio)
+
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap, corner
+
+    @staticmethod
+    def _blur(image: QImage, radius: float) -> QImage:
+        # Same blur QGraphicsDropShadowEffect applies, done once per entry
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(QPixmap.fromImage(image))
+        effect = QGraphicsBlurEffect()
+        effect.setBlurRadius(radius)
+        effect.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
+        item.setGraphicsEffect(effect)
+        scene.addItem(item)
+
+        result = QImage(image.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        result.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(result)
+        scene.render(painter, QRectF(result.rect()), QRectF(image.rect()))
+        painter.end()
+        return result
+
+
+class FluentShadowWidget(QWidget):
+    """Paints a cached shadow under a target widget
+
+    Lives next to the target in the target's parent, stacked right under it,
+    so the shadow can extend past the target without an offscreen render.
+    Has the setter and getter API of QGraphicsDropShadowEffect; the target
+    calls ``sync()`` from its move, resize, show and hide events. A target
+    without a parent widget (a window) or inside a parent that adopts its
+    children (``ADOPTING_PARENTS``) gets no shadow, and none is shown while
+    the performance profile turns shadows off.
+    """
+
+    def __init__(self, target: QWidget, radius: float = 0,
+                 renderer: Optional[FluentShadowRenderer] = None):
+        super().__init__(None)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+
+        self._target = target
+        self._renderer = renderer
+        self._radius = radius
+        self._blur = 1.0
+        self._offset = QPointF(8, 8)
+        self._color = QColor(63, 63, 63, 180)
+        self._enabled = True
+        self._patches: Optional[Tuple[float, QPixmap, List[Tuple[QRectF, QRectF]]]] = None
+        target.destroyed.connect(self.deleteLater)
+
+    def renderer(self) -> FluentShadowRenderer:
+        if self._renderer is None:
+            self._renderer = get_shadow_renderer()
+        return self._renderer
+
+    def setBlurRadius(self, blur: float):
+        if blur != self._blur:
+            self._blur = max(0.0, blur)
+            self._patches = None
+            self.sync()
+            self.update()
+
+    def blurRadius(self) -> float:
+        return self._blur
+
+    def setOffset(self, x: Union[float, QPointF], y: Optional[float] = None):
+        offset = QPointF(x) if y is None else QPointF(x, y)
+        if offset != self._offset:
+            self._offset = offset
+            self._patches = None
+            self.sync()
+            self.update()
+
+    def offset(self) -> QPointF:
+        return QPointF(self._offset)
+
+    def setXOffset(self, x: float):
+        self.setOffset(x, self._offset.y())
+
+    def xOffset(self) -> float:
+        return self._offset.x()
+
+    def setYOffset(self, y: float):
+        self.setOffset(self._offset.x(), y)
+
+    def yOffset(self) -> float:
+        return self._offset.y()
+
+    def setColor(self, color: QColor):
+        if color != self._color:
+            self._color = QColor(color)
+            self._patches = None
+            self.update()
+
+    def color(self) -> QColor:
+        return QColor(self._color)
+
+    def setCornerRadius(self, radius: float):
+        if radius != self._radius:
+            self._radius = radius
+            self._patches = None
+            self.update()
+
+    def cornerRadius(self) -> float:
+        return self._radius
+
+    def setShadowEnabled(self, enabled: bool):
+        """Turn the shadow on or off"""
+        self._enabled = enabled
+        self.sync()
+
+    def isShadowEnabled(self) -> bool:
+        return self._enabled
+
+    def sync(self):
+        """Follow the target's parent, geometry, stacking and visibility"""
+        target = self._target
+        parent = target.parentWidget()
+        if (parent is None or target.isWindow() or isinstance(parent, ADOPTING_PARENTS)
+                or not self._enabled or not get_performance_profile().shadows_enabled()):
+            if self.isVisible():
+                self.hide()
+            return
+        if self.parentWidget() is not parent:
+            self.setParent(parent)
+
+        geometry = target.geometry().marginsAdded(shadow_margins(self._blur, self._offset))
+        if geometry != self.geometry():
+            if geometry.size() != self.size():
+                self._patches = None
+            self.setGeometry(geometry)
+        if target.isVisibleTo(parent):
+            self.stackUnder(target)
+            if not self.isVisibleTo(parent):
+                self.show()
+        elif self.isVisibleTo(parent):
+            self.hide()
+
+    def paintEvent(self, event):
+        if self._color.alpha() == 0:
+            return
+        ratio = self.devicePixelRatioF()
+        if self._patches is None or self._patches[0] != ratio:
+            rect = self.rect().marginsRemoved(shadow_margins(self._blur, self._offset))
+            self._patches = (ratio, *self.renderer().patches(
+                rect, self._radius, self._blur, self._color, self._offset, ratio))
+
+        _, pixmap, patches = self._patches
+        painter = QPainter(self)
+        for target, source in patches:
+            painter.drawPixmap(target, pixmap, source)
+
+
+# Global shadow renderer instance with lazy loading
+_shadow_renderer = None
+
+
+def get_shadow_renderer() -> FluentShadowRenderer:
+    """Get shadow renderer instance (lazy loading)"""
+    global _shadow_renderer
+    if _shadow_renderer is None:
+        _shadow_renderer = FluentShadowRenderer()
+        register_cache("shadows", _shadow_renderer.count, _shadow_renderer.bytes_used,
+                       _shadow_renderer.trim, priority=PRIORITY_EXPENSIVE)
+    return _shadow_renderer
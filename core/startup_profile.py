@@ -0,0 +1,424 @@
+"""
+Startup Profiling
+Records where an application's cold start goes: module imports, theme
+construction, settings reads, first stylesheet generation and the
+construction of each widget class, and writes a JSON report plus a folded
+stack file for flame graph tools
+
+Set ``FLUENT_STARTUP_PROFILE`` to the report path (or to 1 for
+``fluent_startup.json``) before the first import of the library.
+"""
+
+import atexit
+import functools
+import importlib.abc
+import importlib.machinery
+import json
+import os
+import re
+import sys
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+STARTUP_PROFILE_ENV = "FLUENT_STARTUP_PROFILE"
+DEFAULT_REPORT_PATH = "fluent_startup.json"
+REPORT_FORMAT_VERSION = 1
+
+# Packages whose modules are timed and whose widget classes are instrumented
+PROFILED_PACKAGES = ("components", "core")
+
+# Construction helpers timed as their own frames, by the phase they belong to
+_HELPER_METHOD = re.compile(r"_(setup|apply|init|create)_\w+$")
+_HELPER_PHASES = (
+    ("animation", "animations"),
+    ("style", "styling"),
+    ("theme", "styling"),
+    ("appearance", "styling"),
+    ("effect", "effects"),
+    ("shadow", "effects"),
+)
+
+
+def _helper_phase(method_name: str) -> str:
+    for keyword, phase in _HELPER_PHASES:
+        if keyword in method_name:
+            return phase
+    return "setup"
+
+
+class _NullPhase:
+    """Context manager used while no profiler is running"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ("_profiler", "_name")
+
+    def __init__(self, profiler: "StartupProfiler", name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._profiler.enter(self._name)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._profiler.exit()
+        return False
+
+
+class _TimedLoader:
+    """Loader proxy that records a module's execution as an import frame"""
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        profiler = self._profiler
+        if not profiler.active:
+            self._loader.exec_module(module)
+            return
+        profiler.enter(f"import:{module.__name__}")
+        try:
+            self._loader.exec_module(module)
+        finally:
+            profiler.exit()
+        profiler.instrument_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Finds the profiled packages' modules and times their execution"""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        if not self._profiler.active or fullname.partition(".")[0] not in PROFILED_PACKAGES:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _TimedLoader(spec.loader, self._profiler)
+        return spec
+
+
+class StartupProfiler:
+    """Collects nested startup phases as frames
+
+    A frame is a ``"phase:detail"`` name such as ``"import:core.theme"`` or
+    ``"construct:FluentButton"``. Each frame's self time (its time minus the
+    frames nested in it) is added up per stack, which is what flame graphs
+    draw, and per phase, which adds up to the profiled part of startup.
+    """
+
+    def __init__(self, report_path: Optional[str] = None):
+        self.report_path = report_path
+        self.active = True
+        self._start = time.perf_counter_ns()
+        self._end: Optional[int] = None
+        # [name, start, time of nested frames]
+        self._stack: List[list] = []
+        self._stacks: Dict[str, int] = {}
+        self._frames: Dict[str, List[int]] = {}  # name -> [count, total, self]
+        self._constructions: Dict[str, List[int]] = {}  # class -> [count, total, self, max]
+        self._constructing: set = set()
+        self._instrumented: set = set()
+        self._import_timer: Optional[_ImportTimer] = None
+        self._finish_scheduled = False
+
+    def phase(self, name: str):
+        """Context manager recording a frame"""
+        return _Phase(self, name) if self.active else _NULL_PHASE
+
+    def enter(self, name: str):
+        self._stack.append([name, time.perf_counter_ns(), 0])
+
+    def exit(self):
+        name, start, nested = self._stack.pop()
+        elapsed = time.perf_counter_ns() - start
+        self_time = elapsed - nested
+        stack = self._stack
+        if stack:
+            stack[-1][2] += elapsed
+
+        key = ";".join([frame[0] for frame in stack] + [name])
+        self._stacks[key] = self._stacks.get(key, 0) + self_time
+        frame = self._frames.setdefault(name, [0, 0, 0])
+        frame[0] += 1
+        # Recursive frames only count the outermost one as total time
+        if not any(outer[0] == name for outer in stack):
+            frame[1] += elapsed
+        frame[2] += self_time
+        if name.startswith("construct:"):
+            construction = self._constructions.setdefault(name[10:], [0, 0, 0, 0])
+            construction[0] += 1
+            construction[1] += elapsed
+            construction[2] += self_time
+            construction[3] = max(construction[3], elapsed)
+
+        if not stack and not self._finish_scheduled and self.report_path is not None:
+            self._schedule_finish()
+
+    # Instrumentation
+
+    def install_import_hook(self):
+        """Time imports of the profiled packages from now on"""
+        if self._import_timer is None:
+            self._import_timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._import_timer)
+        for name, module in list(sys.modules.items()):
+            if name.partition(".")[0] in PROFILED_PACKAGES and module is not None:
+                self.instrument_module(module)
+
+    def remove_import_hook(self):
+        if self._import_timer is not None:
+            try:
+                sys.meta_path.remove(self._import_timer)
+            except ValueError:
+                pass
+            self._import_timer = None
+
+    def instrument_module(self, module):
+        """Time construction of the widget classes a module defines"""
+        QWidget = _qwidget_type()
+        if QWidget is None:
+            return
+        for value in list(vars(module).values()):
+            if (isinstance(value, type) and value.__module__ == module.__name__
+                    and issubclass(value, QWidget)):
+                self.instrument_class(value)
+
+    def instrument_class(self, cls: type):
+        """Record a construct frame per instance and a frame per setup helper"""
+        if cls in self._instrumented:
+            return
+        self._instrumented.add(cls)
+        for name, value in list(vars(cls).items()):
+            if name == "__init__" and callable(value):
+                setattr(cls, name, self._timed_init(value))
+            elif _HELPER_METHOD.match(name) and callable(value) and not isinstance(value, type):
+                setattr(cls, name, self._timed_method(
+                    value, f"{_helper_phase(name)}:{cls.__name__}.{name}"))
+
+    def _timed_init(self, init):
+        profiler = self
+
+        @functools.wraps(init)
+        def __init__(self, *args, **kwargs):
+            key = id(self)
+            # super().__init__() chains are part of the outermost construction
+            if not profiler.active or key in profiler._constructing:
+                return init(self, *args, **kwargs)
+            profiler._constructing.add(key)
+            profiler.enter(f"construct:{type(self).__name__}")
+            try:
+                return init(self, *args, **kwargs)
+            finally:
+                profiler.exit()
+                profiler._constructing.discard(key)
+
+        return __init__
+
+    def _timed_method(self, method, frame: str):
+        profiler = self
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if not profiler.active:
+                return method(*args, **kwargs)
+            profiler.enter(frame)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                profiler.exit()
+
+        return wrapper
+
+    # Reporting
+
+    def _schedule_finish(self):
+        # Startup ends when the event loop first gets to run
+        try:
+            from PySide6.QtCore import QCoreApplication, QTimer
+        except ImportError:
+            return
+        if QCoreApplication.instance() is None:
+            return
+        self._finish_scheduled = True
+        QTimer.singleShot(0, self.finish)
+
+    def finish(self) -> Optional[Dict[str, Any]]:
+        """Stop profiling and write the report if a path was given"""
+        if not self.active:
+            return None
+        while self._stack:
+            self.exit()
+        self._end = time.perf_counter_ns()
+        self.active = False
+        self.remove_import_hook()
+        report = self.report()
+        if self.report_path:
+            write_report(report, self.report_path)
+        return report
+
+    def report(self) -> Dict[str, Any]:
+        """Get the recorded frames as a report"""
+        end = self._end if self._end is not None else time.perf_counter_ns()
+        total = end - self._start
+        phases: Dict[str, float] = {}
+        for name, (_, _, self_time) in self._frames.items():
+            phase = name.partition(":")[0]
+            phases[phase] = phases.get(phase, 0.0) + self_time / 1e6
+        accounted = sum(self._stacks.values())
+
+        try:
+            from PySide6 import __version__ as pyside_version
+        except ImportError:
+            pyside_version = None
+
+        return {
+            "format": REPORT_FORMAT_VERSION,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "argv": list(sys.argv),
+            "python": sys.version.split()[0],
+            "pyside": pyside_version,
+            "total_ms": total / 1e6,
+            "accounted_ms": accounted / 1e6,
+            "phases": dict(sorted(phases.items(), key=lambda item: -item[1])),
+            "classes": {
+                name: {"count": count, "total_ms": total_ns / 1e6,
+                       "self_ms": self_ns / 1e6, "mean_ms": total_ns / count / 1e6,
+                       "max_ms": max_ns / 1e6}
+                for name, (count, total_ns, self_ns, max_ns) in sorted(
+                    self._constructions.items(), key=lambda item: -item[1][1])
+            },
+            "frames": {
+                name: {"count": count, "total_ms": total_ns / 1e6, "self_ms": self_ns / 1e6}
+                for name, (count, total_ns, self_ns) in sorted(
+                    self._frames.items(), key=lambda item: -item[1][1])
+            },
+            # Self time in microseconds per folded stack
+            "stacks": {stack: round(self_ns / 1e3) for stack, self_ns in self._stacks.items()},
+        }
+
+
+def _qwidget_type():
+    module = sys.modules.get("PySide6.QtWidgets")
+    return getattr(module, "QWidget", None)
+
+
+def folded_stacks(report: Dict[str, Any]) -> str:
+    """Format a report as folded stacks (``frame;frame count`` lines)"""
+    lines = [f"{stack} {micros}" for stack, micros in report["stacks"].items() if micros > 0]
+    unaccounted = round((report["total_ms"] - report["accounted_ms"]) * 1e3)
+    if unaccounted > 0:
+        lines.append(f"unprofiled {unaccounted}")
+    return "\n".join(lines) + "\n"
+
+
+def write_report(report: Dict[str, Any], path: str):
+    """Write a report as JSON and its folded stacks next to it"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    with open(os.path.splitext(path)[0] + ".folded", "w", encoding="utf-8") as file:
+        file.write(folded_stacks(report))
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as file:
+        report = json.load(file)
+    if report.get("format") != REPORT_FORMAT_VERSION:
+        raise ValueError(f"{path} is not a startup report of format {REPORT_FORMAT_VERSION}")
+    return report
+
+
+class ReportDelta(NamedTuple):
+    section: str  # "total", "phases" or "classes"
+    name: str
+    old_ms: Optional[float]
+    new_ms: Optional[float]
+    regression: bool
+
+
+def compare_reports(old: Dict[str, Any], new: Dict[str, Any],
+                    threshold: float = 0.10, min_ms: float = 1.0) -> List[ReportDelta]:
+    """Compare two reports
+
+    Compares total startup, each phase and the mean construction time of each
+    widget class. A change is a regression when it is slower by more than
+    ``threshold`` (a fraction of the old time) and by more than ``min_ms``;
+    a phase or class that only exists in the new report counts from zero.
+    """
+    def delta(section: str, name: str, old_ms: Optional[float], new_ms: Optional[float]):
+        growth = (new_ms or 0.0) - (old_ms or 0.0)
+        regression = growth > min_ms and growth > (old_ms or 0.0) * threshold
+        return ReportDelta(section, name, old_ms, new_ms, regression)
+
+    deltas = [delta("total", "startup", old["total_ms"], new["total_ms"])]
+    for name in dict.fromkeys([*old["phases"], *new["phases"]]):
+        deltas.append(delta("phases", name, old["phases"].get(name), new["phases"].get(name)))
+    for name in dict.fromkeys([*old["classes"], *new["classes"]]):
+        old_class, new_class = old["classes"].get(name), new["classes"].get(name)
+        deltas.append(delta("classes", name,
+                            old_class["mean_ms"] if old_class else None,
+                            new_class["mean_ms"] if new_class else None))
+    return deltas
+
+
+# Global startup profiler instance, set while profiling
+_startup_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> Optional[StartupProfiler]:
+    """Get the running startup profiler, if any"""
+    return _startup_profiler
+
+
+def startup_phase(name: str):
+    """Context manager recording a startup frame; does nothing when not profiling"""
+    profiler = _startup_profiler
+    if profiler is None or not profiler.active:
+        return _NULL_PHASE
+    return _Phase(profiler, name)
+
+
+def install_startup_profiler(report_path: Optional[str] = None) -> StartupProfiler:
+    """Start profiling startup
+
+    With a report path the report is written when the event loop first runs,
+    or at exit if it never does.
+    """
+    global _startup_profiler
+    if _startup_profiler is None or not _startup_profiler.active:
+        _startup_profiler = StartupProfiler(report_path)
+        _startup_profiler.install_import_hook()
+        if report_path is not None:
+            atexit.register(_startup_profiler.finish)
+    return _startup_profiler
+
+
+def install_from_env() -> Optional[StartupProfiler]:
+    """Start profiling if ``FLUENT_STARTUP_PROFILE`` is set"""
+    value = os.environ.get(STARTUP_PROFILE_ENV)
+    if not value or value == "0":
+        return None
+    if _startup_profiler is not None:
+        return _startup_profiler
+    return install_startup_profiler(DEFAULT_REPORT_PATH if value == "1" else value)
@@ -0,0 +1,148 @@
+"""
+Theme-Versioned Style Cache
+Shared, bounded cache for generated stylesheets and other theme-derived values
+"""
+
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from .memory import estimate_bytes, register_cache
+from .theme import get_theme_manager
+
+
+class FluentStyleCache:
+    """LRU cache for values derived from the current theme
+
+    Every entry belongs to the theme version it was generated for. When the
+    theme version changes (mode switch, custom color) the whole cache is
+    dropped at once, so callers never have to clear it on theme changes.
+    Keys are plain strings, conventionally prefixed with a namespace such as
+    ``"combobox:"``, and are interned on insertion.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._max_entries = max(1, max_entries)
+        self._version: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: str, generator: Callable[[], Any]) -> Any:
+        """Get cached value for key, generating it on a miss"""
+        self._sync_version()
+
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+
+        self.misses += 1
+        value = generator()
+        entries[sys.intern(key)] = value
+        while len(entries) > self._max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def get_style(self, key: str, generator: Callable[[], str]) -> str:
+        """Get a stylesheet for key, generating it on a miss
+
+        Unlike ``get``, a miss first looks in the theme's on-disk style cache
+        (``FluentTheme.cached_style``), so a cold start reads the stylesheet
+        back instead of generating it. Keys must identify everything besides
+        the theme variant that the stylesheet depends on.
+        """
+        return self.get(key, lambda: get_theme_manager().cached_style(key, generator))
+
+    def invalidate(self, prefix: Optional[str] = None):
+        """Drop all entries, or only those whose key starts with prefix"""
+        if prefix is None:
+            self._entries.clear()
+        else:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+        self.invalidations += 1
+
+    def _sync_version(self):
+        version = get_theme_manager().get_theme_version()
+        if version != self._version:
+            if self._entries:
+                self._entries.clear()
+                self.invalidations += 1
+            self._version = version
+
+    def set_max_entries(self, max_entries: int):
+        """Set the entry limit, evicting least recently used entries"""
+        self._max_entries = max(1, max_entries)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def max_entries(self) -> int:
+        """Get the entry limit"""
+        return self._max_entries
+
+    def count(self) -> int:
+        """Get the number of cached entries"""
+        return len(self._entries)
+
+    def bytes_used(self) -> int:
+        """Get the estimated bytes of the cached keys and values"""
+        return sum(estimate_bytes(key) + estimate_bytes(value)
+                   for key, value in self._entries.items())
+
+    def trim(self, target_bytes: int):
+        """Evict least recently used entries until at most target_bytes remain"""
+        if target_bytes <= 0:
+            self.evictions += len(self._entries)
+            self._entries.clear()
+            return
+        used = self.bytes_used()
+        while used > target_bytes and self._entries:
+            key, value = self._entries.popitem(last=False)
+            used -= estimate_bytes(key) + estimate_bytes(value)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "theme_version": self._version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def reset_stats(self):
+        """Reset hit/miss/eviction counters"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+
+# Global style cache instance with lazy loading
+_style_cache = None
+
+
+def get_style_cache() -> FluentStyleCache:
+    """Get style cache instance (lazy loading)"""
+    global _style_cache
+    if _style_cache is None:
+        _style_cache = FluentStyleCache()
+        register_cache("style_cache", _style_cache.count, _style_cache.bytes_used,
+                       _style_cache.trim)
+    return _style_cache
+
+
+def cached_style(key: str, generator: Callable[[], Any]) -> Any:
+    """Convenience function to get a theme-versioned cached value"""
+    return get_style_cache().get(key, generator)
@@ -3,11 +3,25 @@ Enhanced Fluent Design Theme Management System
 Supports light/dark theme switching, custom theme colors, and animation coordination
 """
 
-from typing import Dict, Any, Optional, Set, Callable, List, Tuple
+import sys
+import time
+import weakref
+from collections import deque
+from collections.abc import Mapping
+from typing import Dict, Any, Optional, Set, Callable, List, Tuple, Iterator, Deque, NamedTuple
 from enum import Enum
+from contextlib import contextmanager
+from string import Template
 from PySide6.QtCore import QObject, Signal, QSettings, QTimer, QPropertyAnimation, QByteArray
-from PySide6.QtGui import QColor, QPalette
+from PySide6.QtGui import QBrush, QColor, QPalette, QPen, QPixmap
 from PySide6.QtWidgets import QWidget
+import shiboken6
+
+from .memory import register_cache
+from .performance_profile import get_performance_profile
+from .startup_profile import startup_phase
+from .theme_precompile import ThemeStyleCache, default_cache_path, source_hash, variant_key
+from .theme_transition import cross_fade_window, transition_windows
 
 
 class ThemeMode(Enum):
@@ -26,14 +40,24 @@ class ThemeTransitionType(Enum):
 
 
 class ComponentThemeState:
-    """Manages theme state for individual components"""
+    """Manages theme state for individual components
+
+    The component is held weakly so that registry entries never keep a
+    widget alive.
+    """
     
     def __init__(self, component: QWidget):
-        self.component = component
+        self._component_ref = weakref.ref(component)
         self.animations: Dict[str, QPropertyAnimation] = {}
         self.cached_styles: Dict[str, str] = {}
         self.transition_in_progress = False
+        self.theme_version = -1  # theme version the component was last re-themed for
     
+    @property
+    def component(self) -> Optional[QWidget]:
+        """The component, or None once its Python wrapper is gone"""
+        return self._component_ref()
+
     def clear_cache(self):
         """Clear cached styles"""
         self.cached_styles.clear()
@@ -41,13 +65,242 @@ class ComponentThemeState:
     def stop_animations(self):
         """Stop all running animations"""
         for animation in self.animations.values():
-            if animation.state() == QPropertyAnimation.State.Running:
+            if (shiboken6.isValid(animation)
+                    and animation.state() == QPropertyAnimation.State.Running):
                 animation.stop()
 
 
+class ColorToken(NamedTuple):
+    """Shared paint objects and strings for one theme color
+
+    The QColor, QBrush and QPen are shared by every caller for the current
+    theme version and must be treated as read-only; copy before modifying.
+    """
+    name: str
+    color: QColor
+    brush: QBrush
+    pen: QPen  # solid, 1px
+    hex: str  # "#rrggbb"
+    qss: str  # hex, or "rgba(r, g, b, a)" for translucent colors
+
+    @classmethod
+    def from_color(cls, name: str, color: QColor) -> "ColorToken":
+        color = QColor(color)
+        return cls(name, color, QBrush(color), QPen(color, 1), color.name(),
+                   color_to_qss(color))
+
+
+def color_to_qss(color: QColor) -> str:
+    """Format a color as a QSS value, with rgba() for translucent colors"""
+    if color.alpha() == 255:
+        return color.name()
+    return f"rgba({color.red()}, {color.green()}, {color.blue()}, {color.alpha()})"
+
+
+# Returned for names the theme does not define, like get_color() does
+_DEFAULT_TOKEN = ColorToken.from_color("", QColor("#000000"))
+
+
+class ThemeTokens(Mapping):
+    """Read-only snapshot of all theme color tokens
+
+    Taken with ``FluentTheme.tokens()`` once per paint, so that paint code
+    looks colors up without allocating. Unknown names fall back to black.
+    """
+
+    __slots__ = ("version", "_tokens")
+
+    def __init__(self, version: int, tokens: Dict[str, ColorToken]):
+        self.version = version
+        self._tokens = tokens
+
+    def __getitem__(self, name: str) -> ColorToken:
+        return self._tokens[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tokens)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def token(self, name: str) -> ColorToken:
+        """Get the token for name"""
+        return self._tokens.get(name, _DEFAULT_TOKEN)
+
+    def color(self, name: str) -> QColor:
+        """Get the shared, read-only color for name"""
+        return self._tokens.get(name, _DEFAULT_TOKEN).color
+
+    def brush(self, name: str) -> QBrush:
+        """Get the shared, read-only solid brush for name"""
+        return self._tokens.get(name, _DEFAULT_TOKEN).brush
+
+    def pen(self, name: str) -> QPen:
+        """Get the shared, read-only 1px pen for name"""
+        return self._tokens.get(name, _DEFAULT_TOKEN).pen
+
+    def hex(self, name: str) -> str:
+        """Get the "#rrggbb" string for name"""
+        return self._tokens.get(name, _DEFAULT_TOKEN).hex
+
+
+# Component style templates: (widget selector, QSS template). Templates use
+# string.Template placeholders: $selector for the rule target and theme token
+# names such as $primary for colors.
+COMPONENT_STYLE_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    "button": ("QPushButton", """
+        $selector {
+            background-color: $primary;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 8px 16px;
+            font-size: 14px;
+            font-weight: 400;
+            min-height: 32px;
+        }
+        $selector:hover {
+            background-color: $secondary;
+        }
+        $selector:pressed {
+            background-color: $pressed;
+        }
+        $selector:focus {
+            border: 2px solid $focus;
+        }
+        $selector:disabled {
+            background-color: $border;
+            color: $text_disabled;
+        }
+    """),
+
+    "secondary_button": ("QPushButton", """
+        $selector {
+            background-color: $surface;
+            color: $text_primary;
+            border: 1px solid $border;
+            border-radius: 4px;
+            padding: 8px 16px;
+            font-size: 14px;
+            font-weight: 400;
+            min-height: 32px;
+        }
+        $selector:hover {
+            background-color: $hover;
+            border-color: $primary;
+        }
+        $selector:pressed {
+            background-color: $pressed;
+        }
+        $selector:focus {
+            border: 2px solid $focus;
+        }
+        $selector:disabled {
+            background-color: $background;
+            color: $text_disabled;
+            border-color: $border;
+        }
+    """),
+
+    "textbox": ("QLineEdit", """
+        $selector {
+            background-color: $surface;
+            border: 1px solid $border;
+            border-radius: 4px;
+            padding: 8px 12px;
+            font-size: 14px;
+            color: $text_primary;
+            min-height: 20px;
+        }
+        $selector:focus {
+            border-color: $focus;
+            border-width: 2px;
+        }
+        $selector:hover {
+            border-color: $secondary;
+        }
+        $selector:disabled {
+            background-color: $background;
+            color: $text_disabled;
+            border-color: $border;
+        }
+    """),
+
+    "card": ("QFrame", """
+        $selector {
+            background-color: $card;
+            border: 1px solid $border;
+            border-radius: 8px;
+            padding: 16px;
+        }
+        $selector:hover {
+            border-color: $primary;
+        }
+    """),
+
+    "panel": ("QFrame", """
+        $selector {
+            background-color: $surface;
+            border: 1px solid $border;
+            border-radius: 6px;
+        }
+    """),
+
+    "label": ("QLabel", """
+        $selector {
+            color: $text_primary;
+            font-size: 14px;
+            background-color: transparent;
+        }
+    """),
+
+    "combobox": ("QComboBox", """
+        $selector {
+            background-color: $surface;
+            border: 1px solid $border;
+            border-radius: 4px;
+            padding: 8px 12px;
+            font-size: 14px;
+            color: $text_primary;
+            min-height: 20px;
+        }
+        $selector:focus {
+            border-color: $focus;
+            border-width: 2px;
+        }
+        $selector:hover {
+            border-color: $secondary;
+        }
+        $selector::drop-down {
+            border: none;
+            padding-right: 8px;
+        }
+        $selector::down-arrow {
+            border: none;
+        }
+    """),
+}
+
+
+# Theme colors available to component style templates
+COMPONENT_STYLE_COLORS = (
+    "primary", "secondary", "surface", "background", "card", "border",
+    "text_primary", "text_secondary", "text_disabled", "hover",
+    "pressed", "focus", "success", "warning", "error", "info")
+
+
 class FluentTheme(QObject):
     """**Enhanced Fluent Design Theme Manager**"""
 
+    # Per-tick time budget for re-theming hidden components after a change
+    SLICE_BUDGET_MS = 8
+    # Interval for dropping registry entries of already deleted widgets
+    REGISTRY_COMPACTION_INTERVAL_MS = 30000
+    # Persist generated tokens and stylesheets across runs (see style_cache())
+    STYLE_CACHE_ENABLED = True
+    # Delay before newly generated styles are written to the cache file
+    STYLE_CACHE_SAVE_DELAY_MS = 2000
+
     # Enhanced theme change signals
     theme_changed = Signal(str)  # theme_name
     mode_changed = Signal(ThemeMode)  # theme_mode
@@ -63,15 +316,53 @@ class FluentTheme(QObject):
         self._current_mode = ThemeMode.LIGHT
         self._current_theme = "default"
         self._custom_colors = {}
-        self._registered_components: Dict[QWidget, ComponentThemeState] = {}
+        # Weakly keyed: an entry disappears with the widget's Python wrapper.
+        # Entries whose C++ widget is gone while the wrapper lives on are
+        # "leaked" and dropped by compact_registry()
+        self._registered_components: "weakref.WeakKeyDictionary[QWidget, ComponentThemeState]" = \
+            weakref.WeakKeyDictionary()
+        self._compaction_timer = QTimer(self)
+        self._compaction_timer.setInterval(self.REGISTRY_COMPACTION_INTERVAL_MS)
+        self._compaction_timer.timeout.connect(self.compact_registry)
+        self._registry_compactions = 0
+        self._registry_compacted = 0
         self._transition_callbacks: List[Callable] = []
         self._style_cache: Dict[str, str] = {}
         self._color_cache: Dict[str, QColor] = {}
+        self._token_cache: Dict[str, ColorToken] = {}
+        self._tokens_snapshot: Optional[ThemeTokens] = None
+        self._palette: Optional[QPalette] = None
+        self._native_paint = False
+        self._style_disk_cache: Optional[ThemeStyleCache] = None
+        self._style_cache_path: Optional[str] = None
+        self._variant_key: Optional[str] = None
+        self._style_cache_save_timer = QTimer(self)
+        self._style_cache_save_timer.setSingleShot(True)
+        self._style_cache_save_timer.setInterval(self.STYLE_CACHE_SAVE_DELAY_MS)
+        self._style_cache_save_timer.timeout.connect(self.save_style_cache)
+        self._version = 0  # bumped on every change that affects styles
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._batch_start_mode = self._current_mode
+        self._notify_pending = False
+        # Scheduled components in registration order, the visible subset
+        # (tracked through set_component_visible) and the re-theme queue
+        self._scheduled_components: "weakref.WeakKeyDictionary[QWidget, None]" = \
+            weakref.WeakKeyDictionary()
+        self._visible_components: "weakref.WeakSet[QWidget]" = weakref.WeakSet()
+        self._stale_components: "Deque[weakref.ref]" = deque()
+        self._slice_timer = QTimer(self)
+        self._slice_timer.setSingleShot(True)
+        self._slice_timer.setInterval(0)
+        self._slice_timer.timeout.connect(self._process_stale_components)
         self._animation_enabled = True
         self._transition_duration = 250
         self._transition_type = ThemeTransitionType.FADE
+        # (window ref, pixmap) of the appearance before the pending change
+        self._transition_snapshots: List[Tuple[weakref.ref, QPixmap]] = []
         
-        self.settings = QSettings("FluentUI", "Theme")
+        with startup_phase("settings:QSettings"):
+            self.settings = QSettings("FluentUI", "Theme")
 
         # **Enhanced Fluent Design Color Palette**
         self._light_palette = {
@@ -140,19 +431,56 @@ class FluentTheme(QObject):
             "elevation_12": QColor("#464647"),
         }
 
-        self.load_settings()
+        with startup_phase("settings:load"):
+            self.load_settings()
         self._cache_colors()
 
-    def register_component(self, component: QWidget):
-        """Register component for theme updates"""
-        if component not in self._registered_components:
-            state = ComponentThemeState(component)
-            self._registered_components[component] = state
-            self.component_registered.emit(component)
-            
-            # Connect to component destroyed signal for cleanup
-            component.destroyed.connect(
-                lambda: self._unregister_component_internal(component))
+    def register_component(self, component: QWidget, scheduled: bool = False):
+        """Register component for theme updates
+
+        Scheduled components are re-themed by the theme manager calling their
+        ``_on_theme_changed()`` once per theme version: at once while visible,
+        otherwise in time-sliced batches after the switch (see
+        ``SLICE_BUDGET_MS``) or from ``catch_up_component`` when shown. They
+        report their visibility through ``set_component_visible``.
+        """
+        with startup_phase("theme:register"):
+            if component not in self._registered_components:
+                state = ComponentThemeState(component)
+                state.theme_version = self._version
+                self._registered_components[component] = state
+                self.component_registered.emit(component)
+
+                # No destroyed connection: the entry goes away with the widget's
+                # Python wrapper, and per-widget connections to one receiver make
+                # tearing down large widget trees quadratic
+                if not self._compaction_timer.isActive():
+                    self._compaction_timer.start()
+            if scheduled:
+                self._scheduled_components[component] = None
+                if component.isVisible():
+                    self._visible_components.add(component)
+
+    def set_component_visible(self, component: QWidget, visible: bool):
+        """Record a scheduled component's visibility (from show/hide events)"""
+        if component not in self._scheduled_components:
+            return
+        if visible:
+            self._visible_components.add(component)
+        else:
+            self._visible_components.discard(component)
+
+    def catch_up_component(self, component: QWidget):
+        """Re-theme a scheduled component now if it missed theme changes"""
+        if component in self._scheduled_components:
+            self._retheme_component(component)
+
+    def _retheme_component(self, component: QWidget):
+        state = self._registered_components.get(component)
+        if (state is not None and state.theme_version != self._version
+                and shiboken6.isValid(component)):
+            state.theme_version = self._version
+            component._on_theme_changed()
 
     def unregister_component(self, component: QWidget):
         """Unregister component from theme updates"""
@@ -160,11 +488,51 @@ class FluentTheme(QObject):
 
     def _unregister_component_internal(self, component: QWidget):
         """Internal method to unregister component"""
-        if component in self._registered_components:
-            state = self._registered_components[component]
+        state = self._registered_components.pop(component, None)
+        if state is not None:
             state.stop_animations()
-            del self._registered_components[component]
-            self.component_unregistered.emit(component)
+            self._scheduled_components.pop(component, None)
+            self._visible_components.discard(component)
+            if shiboken6.isValid(component):
+                self.component_unregistered.emit(component)
+
+    def compact_registry(self) -> int:
+        """Drop entries for components whose C++ object no longer exists
+
+        Such entries are left behind when a Python reference keeps a widget's
+        wrapper alive after the widget itself was deleted. Runs periodically
+        while components are registered.
+        """
+        leaked = [component for component in list(self._registered_components.keys())
+                  if not shiboken6.isValid(component)]
+        for component in leaked:
+            self._unregister_component_internal(component)
+
+        self._registry_compactions += 1
+        self._registry_compacted += len(leaked)
+        if not self._registered_components:
+            self._compaction_timer.stop()
+        return len(leaked)
+
+    def get_registry_stats(self) -> Dict[str, int]:
+        """Get component registry counters
+
+        ``registered`` counts registry entries, ``live`` those whose widget
+        still exists and ``leaked`` those whose widget was deleted without
+        being unregistered (removed by the next compaction).
+        """
+        registered = list(self._registered_components.keys())
+        live = sum(1 for component in registered if shiboken6.isValid(component))
+        return {
+            "registered": len(registered),
+            "live": live,
+            "leaked": len(registered) - live,
+            "scheduled": len(self._scheduled_components),
+            "visible": len(self._visible_components),
+            "queued": len(self._stale_components),
+            "compactions": self._registry_compactions,
+            "compacted": self._registry_compacted,
+        }
 
     def add_transition_callback(self, callback: Callable):
         """Add callback to be called during theme transitions"""
@@ -180,6 +548,10 @@ class FluentTheme(QObject):
         """Enable or disable theme transition animations"""
         self._animation_enabled = enabled
 
+    def transitions_enabled(self) -> bool:
+        """Check if theme changes animate: enabled and allowed by the performance profile"""
+        return self._animation_enabled and get_performance_profile().transitions_enabled()
+
     def set_transition_duration(self, duration: int):
         """Set theme transition duration in milliseconds"""
         self._transition_duration = max(0, duration)
@@ -191,6 +563,7 @@ class FluentTheme(QObject):
     def _cache_colors(self):
         """Cache colors for improved performance"""
         self._color_cache.clear()
+        self._reset_tokens()
         palette = (self._light_palette if self._current_mode == ThemeMode.LIGHT
                    else self._dark_palette)
         
@@ -201,20 +574,32 @@ class FluentTheme(QObject):
         for color_name, color in self._custom_colors.items():
             self._color_cache[color_name] = QColor(color)
 
+    def _reset_tokens(self):
+        """Drop color tokens after any color change"""
+        self._token_cache = {}
+        self._tokens_snapshot = None
+        self._palette = None
+        self._variant_key = None
+
     def _invalidate_caches(self):
         """Invalidate all caches when theme changes"""
+        self._version += 1
         self._style_cache.clear()
         self._color_cache.clear()
         
         # Invalidate component caches
         for state in self._registered_components.values():
-            state.clear_cache()
+            if state.cached_styles:
+                state.clear_cache()
         
         self._cache_colors()
 
     def _notify_registered_components(self):
         """Notify all registered components of theme change"""
-        if self._animation_enabled:
+        if self.transitions_enabled():
+            if self._notify_pending:
+                return  # the pending notification will carry the latest state
+            self._notify_pending = True
             self.transition_started.emit(self._transition_type.value)
             
             # Mark all components as transitioning
@@ -228,21 +613,77 @@ class FluentTheme(QObject):
                 except Exception as e:
                     print(f"Error in theme transition callback: {e}")
             
-            # Delay the actual theme change signal for smooth transitions
-            QTimer.singleShot(50, self._emit_theme_changed)
+            # Delay the actual theme change signal for smooth transitions;
+            # changes made meanwhile fold into this one notification
+            QTimer.singleShot(50, self._emit_pending_theme_changed)
         else:
             self._emit_theme_changed()
 
+    def _emit_pending_theme_changed(self):
+        """Emit a deferred notification unless it was already delivered"""
+        if self._notify_pending:
+            self._emit_theme_changed()
+
     def _emit_theme_changed(self):
         """Emit theme changed signals"""
+        self._notify_pending = False
         self.theme_changed.emit(self._current_theme)
+        self._update_registered_components()
+
+        # Restyled underneath the snapshots taken before the first change;
+        # cross-fade them into the new appearance
+        if self._transition_snapshots:
+            if self.transitions_enabled():
+                self._start_window_transitions()
+            else:
+                self._transition_snapshots = []
         
-        if self._animation_enabled:
+        if self.transitions_enabled():
             # End transition after duration
             QTimer.singleShot(self._transition_duration, self._finish_transition)
         else:
             self._finish_transition()
 
+    def _update_registered_components(self):
+        """Re-theme visible scheduled components now and queue the rest"""
+        for component in list(self._visible_components):
+            self._retheme_component(component)
+
+        # Components shown before their turn catch up in showEvent; the
+        # queued call is then a no-op
+        self._stale_components = deque(self._scheduled_components.keyrefs())
+        if self._stale_components:
+            self._slice_timer.start()
+
+    def _process_stale_components(self):
+        """Re-theme queued components until the slice budget is spent"""
+        deadline = time.perf_counter() + self.SLICE_BUDGET_MS / 1000.0
+        queue = self._stale_components
+        scheduled = self._scheduled_components
+        while queue:
+            component = queue.popleft()()
+            if component is not None and component in scheduled:
+                self._retheme_component(component)
+            if time.perf_counter() >= deadline:
+                break
+
+        if queue:
+            self._slice_timer.start()
+
+    def flush_theme_updates(self):
+        """Re-theme all queued components immediately"""
+        self._slice_timer.stop()
+        queue = self._stale_components
+        scheduled = self._scheduled_components
+        while queue:
+            component = queue.popleft()()
+            if component is not None and component in scheduled:
+                self._retheme_component(component)
+
+    def pending_theme_updates(self) -> int:
+        """Get the number of components still queued for re-theming"""
+        return len(self._stale_components)
+
     def _finish_transition(self):
         """Finish theme transition"""
         # Mark all components as transition complete
@@ -277,6 +718,69 @@ class FluentTheme(QObject):
         self._color_cache[color_name] = default_color
         return default_color
 
+    def token(self, color_name: str) -> ColorToken:
+        """Get shared, read-only paint objects for a theme color
+
+        Unlike ``get_color`` this does not allocate; the token stays the
+        same object until the theme colors change.
+        """
+        token = self._token_cache.get(color_name)
+        if token is None:
+            token = ColorToken.from_color(color_name, self.get_color(color_name))
+            self._token_cache[color_name] = token
+        return token
+
+    def tokens(self) -> ThemeTokens:
+        """Get a read-only snapshot of all theme color tokens"""
+        snapshot = self._tokens_snapshot
+        if snapshot is None:
+            palette = (self._light_palette if self._current_mode == ThemeMode.LIGHT
+                       else self._dark_palette)
+            snapshot = ThemeTokens(self._version, {
+                color_name: self.token(color_name)
+                for color_name in list(palette) + list(self._custom_colors)})
+            self._tokens_snapshot = snapshot
+        return snapshot
+
+    def palette(self) -> QPalette:
+        """Get a QPalette filled from the current theme tokens
+
+        Shared until the theme colors change; copy before modifying.
+        """
+        if self._palette is None:
+            self._palette = self._build_palette(self.tokens())
+        return self._palette
+
+    def _build_palette(self, tokens: ThemeTokens) -> QPalette:
+        palette = QPalette()
+        roles = {
+            QPalette.ColorRole.Window: "background",
+            QPalette.ColorRole.WindowText: "text_primary",
+            QPalette.ColorRole.Base: "surface",
+            QPalette.ColorRole.AlternateBase: "hover",
+            QPalette.ColorRole.Text: "text_primary",
+            QPalette.ColorRole.PlaceholderText: "text_secondary",
+            QPalette.ColorRole.Button: "surface",
+            QPalette.ColorRole.ButtonText: "text_primary",
+            QPalette.ColorRole.Light: "card",
+            QPalette.ColorRole.Midlight: "hover",
+            QPalette.ColorRole.Mid: "border",
+            QPalette.ColorRole.Dark: "border",
+            QPalette.ColorRole.Highlight: "primary",
+            QPalette.ColorRole.Link: "primary",
+            QPalette.ColorRole.LinkVisited: "secondary",
+            QPalette.ColorRole.ToolTipBase: "surface",
+            QPalette.ColorRole.ToolTipText: "text_primary",
+        }
+        for role, color_name in roles.items():
+            palette.setColor(role, tokens.color(color_name))
+        palette.setColor(QPalette.ColorRole.HighlightedText, QColor("#ffffff"))
+        disabled = tokens.color("text_disabled")
+        for role in (QPalette.ColorRole.WindowText, QPalette.ColorRole.Text,
+                     QPalette.ColorRole.ButtonText):
+            palette.setColor(QPalette.ColorGroup.Disabled, role, disabled)
+        return palette
+
     def get_color_with_alpha(self, color_name: str, alpha: int) -> QColor:
         """Get color with specific alpha value"""
         color = self.get_color(color_name)
@@ -292,6 +796,16 @@ class FluentTheme(QObject):
         elevation_key = f"elevation_{min(level, 12)}"
         return self.get_color(elevation_key)
 
+    def get_elevation_shadow(self, level: float) -> Tuple[float, int, QColor]:
+        """Get the (blur radius, y offset, color) of the shadow for an elevation"""
+        blur_radius = max(1.0, level * 2.0)
+        offset_y = max(0, int(level * 0.7))
+        if self._current_mode == ThemeMode.LIGHT:
+            alpha = min(80, int(30 + level * 6))
+        else:
+            alpha = min(120, int(50 + level * 8))
+        return blur_radius, offset_y, QColor(0, 0, 0, alpha)
+
     def get_theme_mode(self) -> ThemeMode:
         """**Get current theme mode**"""
         return self._current_mode
@@ -300,19 +814,104 @@ class FluentTheme(QObject):
         """**Get current theme name**"""
         return self._current_theme
 
+    def get_theme_version(self) -> int:
+        """Get the theme version, which increases whenever styles may change"""
+        return self._version
+
     def set_theme_mode(self, mode: ThemeMode):
         """**Set theme mode with enhanced transition**"""
         if self._current_mode != mode:
-            self._current_mode = mode
-            self._invalidate_caches()
-            self.save_settings()
-            self.mode_changed.emit(mode)
-            self._notify_registered_components()
+            with self.batch():
+                self._begin_change()
+                self._current_mode = mode
+                self._cache_colors()
+                self._batch_dirty = True
 
     def set_custom_color(self, color_name: str, color: QColor):
         """**Set custom color**"""
-        self._custom_colors[color_name] = color
-        self._color_cache[color_name] = QColor(color)
+        if self._custom_colors.get(color_name) == color:
+            return
+        with self.batch():
+            self._begin_change()
+            self._custom_colors[color_name] = QColor(color)
+            self._color_cache[color_name] = QColor(color)
+            self._reset_tokens()
+            self._batch_dirty = True
+
+    def set_native_paint_enabled(self, enabled: bool):
+        """Let custom-painted widgets paint from the theme palette
+
+        In native paint mode such widgets drop their stylesheets and draw
+        from ``palette()`` and ``tokens()``, which keeps Qt's stylesheet
+        style out of their paints and size hints. Switching re-themes
+        components like any other theme change.
+        """
+        if enabled != self._native_paint:
+            with self.batch():
+                self._begin_change()
+                self._native_paint = enabled
+                self._batch_dirty = True
+
+    def is_native_paint_enabled(self) -> bool:
+        """Check whether native paint mode is on"""
+        return self._native_paint
+
+    @contextmanager
+    def batch(self) -> Iterator["FluentTheme"]:
+        """Collapse any number of theme changes into one notification
+
+        Inside ``with theme.batch():`` mode and color changes take effect
+        immediately for color lookups, but the theme version, cache
+        invalidation, ``mode_changed`` and ``theme_changed`` are deferred
+        until the outermost batch exits, and then happen exactly once.
+        """
+        if self._batch_depth == 0:
+            self._batch_start_mode = self._current_mode
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self._commit_changes()
+
+    def _begin_change(self):
+        """Prepare for the first change of a batch"""
+        if not self._batch_dirty:
+            self._capture_transition_snapshots()
+
+    def _capture_transition_snapshots(self):
+        """Grab the visible windows before the theme changes under them
+
+        FADE transitions cross-fade these snapshots into the new appearance
+        with one overlay per window (see ``theme_transition``).
+        """
+        if (not self.transitions_enabled() or self._notify_pending
+                or self._transition_type != ThemeTransitionType.FADE
+                or self._transition_duration <= 0):
+            return
+        self._transition_snapshots = [(weakref.ref(window), window.grab())
+                                      for window in transition_windows()]
+
+    def _start_window_transitions(self):
+        """Cross-fade each snapshotted window into its new appearance"""
+        snapshots, self._transition_snapshots = self._transition_snapshots, []
+        for window_ref, snapshot in snapshots:
+            window = window_ref()
+            if window is not None and shiboken6.isValid(window) and window.isVisible():
+                cross_fade_window(window, snapshot, self._transition_duration)
+
+    def is_batching(self) -> bool:
+        """Check whether a batch() transaction is open"""
+        return self._batch_depth > 0
+
+    def _commit_changes(self):
+        """Publish accumulated changes as a single new theme version"""
+        self._invalidate_caches()
+        if self._current_mode != self._batch_start_mode:
+            self.save_settings()
+            self.mode_changed.emit(self._current_mode)
         self._notify_registered_components()
 
     def get_style_sheet(self, component_type: str) -> str:
@@ -322,170 +921,151 @@ class FluentTheme(QObject):
         if cache_key in self._style_cache:
             return self._style_cache[cache_key]
         
-        style = self._generate_component_style(component_type)
+        with startup_phase(f"stylesheet:{component_type}"):
+            style = self.cached_style(
+                f"component:{component_type}",
+                lambda: self._generate_component_style(component_type))
         self._style_cache[cache_key] = style
         return style
 
+    def stylesheet_count(self) -> int:
+        """Get the number of stylesheets held in memory, all variants"""
+        cache = self._style_disk_cache
+        return cache.count() if cache is not None else len(self._style_cache)
+
+    def stylesheet_bytes(self) -> int:
+        """Get the estimated bytes of stylesheets held in memory"""
+        # The lookup table shares its stylesheets with the style cache
+        size = sys.getsizeof(self._style_cache) + sum(
+            sys.getsizeof(key) for key in self._style_cache)
+        cache = self._style_disk_cache
+        return size + (cache.bytes_used() if cache is not None else 0)
+
+    def trim_stylesheets(self, target_bytes: int = 0):
+        """Drop stylesheets of other variants, and the lookup table
+
+        Stylesheets of the current variant stay, they are in use.
+        """
+        self._style_cache.clear()
+        cache = self._style_disk_cache
+        if cache is not None:
+            cache.trim(target_bytes, keep=self._get_variant_key())
+
     def _generate_component_style(self, component_type: str) -> str:
         """Generate component style with comprehensive theme support"""
-        colors = {
-            "primary": self.get_color("primary").name(),
-            "secondary": self.get_color("secondary").name(),
-            "surface": self.get_color("surface").name(),
-            "background": self.get_color("background").name(),
-            "card": self.get_color("card").name(),
-            "border": self.get_color("border").name(),
-            "text_primary": self.get_color("text_primary").name(),
-            "text_secondary": self.get_color("text_secondary").name(),
-            "text_disabled": self.get_color("text_disabled").name(),
-            "hover": self.get_color("hover").name(),
-            "pressed": self.get_color("pressed").name(),
-            "focus": self.get_color("focus").name(),
-            "success": self.get_color("success").name(),
-            "warning": self.get_color("warning").name(),
-            "error": self.get_color("error").name(),
-            "info": self.get_color("info").name(),
-        }
+        tokens = self.tokens()
+        colors = {color_name: tokens.hex(color_name)
+                  for color_name in COMPONENT_STYLE_COLORS}
 
         return self._get_component_css(component_type, colors)
 
     def _get_component_css(self, component_type: str, colors: Dict[str, str]) -> str:
         """Get comprehensive component CSS styles"""
-        styles = {
-            "button": f"""
-                QPushButton {{
-                    background-color: {colors['primary']};
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 8px 16px;
-                    font-size: 14px;
-                    font-weight: 400;
-                    min-height: 32px;
-                }}
-                QPushButton:hover {{
-                    background-color: {colors['secondary']};
-                }}
-                QPushButton:pressed {{
-                    background-color: {colors['pressed']};
-                }}
-                QPushButton:focus {{
-                    border: 2px solid {colors['focus']};
-                }}
-                QPushButton:disabled {{
-                    background-color: {colors['border']};
-                    color: {colors['text_disabled']};
-                }}
-            """,
-            
-            "secondary_button": f"""
-                QPushButton {{
-                    background-color: {colors['surface']};
-                    color: {colors['text_primary']};
-                    border: 1px solid {colors['border']};
-                    border-radius: 4px;
-                    padding: 8px 16px;
-                    font-size: 14px;
-                    font-weight: 400;
-                    min-height: 32px;
-                }}
-                QPushButton:hover {{
-                    background-color: {colors['hover']};
-                    border-color: {colors['primary']};
-                }}
-                QPushButton:pressed {{
-                    background-color: {colors['pressed']};
-                }}
-                QPushButton:focus {{
-                    border: 2px solid {colors['focus']};
-                }}
-                QPushButton:disabled {{
-                    background-color: {colors['background']};
-                    color: {colors['text_disabled']};
-                    border-color: {colors['border']};
-                }}
-            """,
-            
-            "textbox": f"""
-                QLineEdit {{
-                    background-color: {colors['surface']};
-                    border: 1px solid {colors['border']};
-                    border-radius: 4px;
-                    padding: 8px 12px;
-                    font-size: 14px;
-                    color: {colors['text_primary']};
-                    min-height: 20px;
-                }}
-                QLineEdit:focus {{
-                    border-color: {colors['focus']};
-                    border-width: 2px;
-                }}
-                QLineEdit:hover {{
-                    border-color: {colors['secondary']};
-                }}
-                QLineEdit:disabled {{
-                    background-color: {colors['background']};
-                    color: {colors['text_disabled']};
-                    border-color: {colors['border']};
-                }}
-            """,
-            
-            "card": f"""
-                QFrame {{
-                    background-color: {colors['card']};
-                    border: 1px solid {colors['border']};
-                    border-radius: 8px;
-                    padding: 16px;
-                }}
-                QFrame:hover {{
-                    border-color: {colors['primary']};
-                }}
-            """,
-            
-            "panel": f"""
-                QFrame {{
-                    background-color: {colors['surface']};
-                    border: 1px solid {colors['border']};
-                    border-radius: 6px;
-                }}
-            """,
-            
-            "label": f"""
-                QLabel {{
-                    color: {colors['text_primary']};
-                    font-size: 14px;
-                    background-color: transparent;
-                }}
-            """,
-            
-            "combobox": f"""
-                QComboBox {{
-                    background-color: {colors['surface']};
-                    border: 1px solid {colors['border']};
-                    border-radius: 4px;
-                    padding: 8px 12px;
-                    font-size: 14px;
-                    color: {colors['text_primary']};
-                    min-height: 20px;
-                }}
-                QComboBox:focus {{
-                    border-color: {colors['focus']};
-                    border-width: 2px;
-                }}
-                QComboBox:hover {{
-                    border-color: {colors['secondary']};
-                }}
-                QComboBox::drop-down {{
-                    border: none;
-                    padding-right: 8px;
-                }}
-                QComboBox::down-arrow {{
-                    border: none;
-                }}
-            """,
-        }
-        
-        return styles.get(component_type, "")
+        if component_type not in COMPONENT_STYLE_TEMPLATES:
+            return ""
+        selector, template = COMPONENT_STYLE_TEMPLATES[component_type]
+        return Template(template).safe_substitute(colors, selector=selector)
+
+    def get_style_tokens(self) -> Dict[str, str]:
+        """Get all current theme colors (including custom ones) as QSS values"""
+        cache = self.style_cache()
+        if cache is not None:
+            tokens = cache.get_tokens(self._get_variant_key())
+            if tokens is not None:
+                return dict(tokens)
+        tokens = {color_name: token.qss for color_name, token in self.tokens().items()}
+        if cache is not None:
+            cache.set_tokens(self._get_variant_key(), tokens)
+            self._schedule_style_cache_save()
+        return tokens
+
+    def style_cache(self) -> Optional[ThemeStyleCache]:
+        """Get the on-disk cache of compiled tokens and stylesheets
+
+        Entries are stored per (theme, mode, custom colors) variant, and the
+        whole file is invalidated by a hash of the palettes and templates.
+        Returns None when ``STYLE_CACHE_ENABLED`` is off.
+        """
+        if not self.STYLE_CACHE_ENABLED:
+            return None
+        if self._style_disk_cache is None:
+            self._style_disk_cache = ThemeStyleCache(
+                self._style_cache_path or default_cache_path(),
+                source_hash({ThemeMode.LIGHT.value: self._light_palette,
+                             ThemeMode.DARK.value: self._dark_palette},
+                            COMPONENT_STYLE_TEMPLATES))
+        return self._style_disk_cache
+
+    def set_style_cache_path(self, path: Optional[str]):
+        """Use another cache file; None restores the default location"""
+        self.save_style_cache()
+        self._style_cache_path = path
+        self._style_disk_cache = None
+
+    def _get_variant_key(self, mode: Optional[ThemeMode] = None) -> str:
+        if mode is not None and mode != self._current_mode:
+            return variant_key(self._current_theme, mode.value, self._custom_colors)
+        if self._variant_key is None:
+            self._variant_key = variant_key(
+                self._current_theme, self._current_mode.value, self._custom_colors)
+        return self._variant_key
+
+    def cached_style(self, name: str, generate: Callable[[], str]) -> str:
+        """Get a stylesheet for the current theme variant from the style cache
+
+        ``generate`` runs only when the cache has no stylesheet under name
+        for this variant; its result is written to the cache file shortly
+        after. Names must identify everything else the stylesheet depends on.
+        """
+        cache = self.style_cache()
+        if cache is None:
+            return generate()
+        key = self._get_variant_key()
+        style = cache.get_style(key, name)
+        if style is None:
+            style = generate()
+            cache.set_style(key, name, style)
+            self._schedule_style_cache_save()
+        return style
+
+    def _schedule_style_cache_save(self):
+        if not self._style_cache_save_timer.isActive():
+            self._style_cache_save_timer.start()
+
+    def save_style_cache(self) -> bool:
+        """Write pending style cache entries to disk now"""
+        self._style_cache_save_timer.stop()
+        cache = self._style_disk_cache
+        if cache is None or not cache.is_dirty():
+            return False
+        return cache.save()
+
+    def precompile_styles(self, modes: Optional[List[ThemeMode]] = None) -> int:
+        """Compile tokens and component styles ahead of time and save them
+
+        Covers every theme mode by default, with the current theme name and
+        custom colors, so the next start loads them instead of generating
+        them. Returns the number of stylesheets written.
+        """
+        cache = self.style_cache()
+        if cache is None:
+            return 0
+        compiled = 0
+        for mode in modes or list(ThemeMode):
+            palette = (self._light_palette if mode == ThemeMode.LIGHT
+                       else self._dark_palette)
+            colors = {**palette, **self._custom_colors}
+            key = self._get_variant_key(mode)
+            cache.set_tokens(key, {color_name: color_to_qss(color)
+                                   for color_name, color in colors.items()})
+            hex_colors = {color_name: colors.get(color_name, _DEFAULT_TOKEN.color).name()
+                          for color_name in COMPONENT_STYLE_COLORS}
+            for component_type in COMPONENT_STYLE_TEMPLATES:
+                cache.set_style(key, f"component:{component_type}",
+                                self._get_component_css(component_type, hex_colors))
+                compiled += 1
+        self.save_style_cache()
+        return compiled
 
     def create_component_transition(self, component: QWidget,
                                   transition_type: Optional[ThemeTransitionType] = None) -> Optional[QPropertyAnimation]:
@@ -498,46 +1078,21 @@ class FluentTheme(QObject):
         
         state = self._registered_components[component]
         
-        if transition_type == ThemeTransitionType.FADE:
-            return self._create_fade_transition(component, state)
-        elif transition_type == ThemeTransitionType.SLIDE:
+        # FADE is a window-level cross-fade, so components restyle instantly
+        if transition_type == ThemeTransitionType.SLIDE:
             return self._create_slide_transition(component, state)
         elif transition_type == ThemeTransitionType.MORPH:
             return self._create_morph_transition(component, state)
         
         return None
 
-    def _create_fade_transition(self, component: QWidget, 
-                              state: ComponentThemeState) -> QPropertyAnimation:
-        """Create fade transition animation"""
-        if "fade" in state.animations:
-            state.animations["fade"].stop()
-        
-        # Create opacity animation
-        animation = QPropertyAnimation(component, QByteArray(b"windowOpacity"))
-        animation.setDuration(self._transition_duration)
-        animation.setStartValue(1.0)
-        animation.setEndValue(0.3)
-        
-        def on_fade_out_finished():
-            # Apply new theme styles here
-            component.update()
-            # Fade back in
-            animation.setStartValue(0.3)
-            animation.setEndValue(1.0)
-            animation.start()
-        
-        animation.finished.connect(on_fade_out_finished)
-        state.animations["fade"] = animation
-        return animation
-
     def _create_slide_transition(self, component: QWidget,
                                state: ComponentThemeState) -> QPropertyAnimation:
         """Create slide transition animation"""
         if "slide" in state.animations:
             state.animations["slide"].stop()
         
-        animation = QPropertyAnimation(component, QByteArray(b"geometry"))
+        animation = QPropertyAnimation(component, QByteArray(b"geometry"), component)
         animation.setDuration(self._transition_duration)
         
         # Store original geometry and create slide effect
@@ -565,7 +1120,7 @@ class FluentTheme(QObject):
         if "morph" in state.animations:
             state.animations["morph"].stop()
         
-        animation = QPropertyAnimation(component, QByteArray(b"geometry"))
+        animation = QPropertyAnimation(component, QByteArray(b"geometry"), component)
         animation.setDuration(self._transition_duration)
         
         original_rect = component.geometry()
@@ -622,7 +1177,10 @@ def get_theme_manager():
     """Get theme manager instance (lazy loading)"""
     global _theme_manager
     if _theme_manager is None:
-        _theme_manager = FluentTheme()
+        with startup_phase("theme:FluentTheme()"):
+            _theme_manager = FluentTheme()
+        register_cache("theme.stylesheets", _theme_manager.stylesheet_count,
+                       _theme_manager.stylesheet_bytes, _theme_manager.trim_stylesheets)
     return _theme_manager
 
 # Backward compatibility proxy
@@ -638,9 +1196,9 @@ theme_manager = ThemeManagerProxy()
 
 
 # Utility functions for easier theme integration
-def register_component_for_theme(component: QWidget):
+def register_component_for_theme(component: QWidget, scheduled: bool = False):
     """Convenience function to register component for theme updates"""
-    get_theme_manager().register_component(component)
+    get_theme_manager().register_component(component, scheduled)
 
 def get_themed_style(component_type: str) -> str:
     """Convenience function to get themed style for component"""
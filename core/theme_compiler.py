@@ -0,0 +1,204 @@
+"""
+Application Stylesheet Compiler
+Compiles FluentTheme tokens into one application-level stylesheet, so a theme
+switch re-polishes the application once instead of every widget separately
+"""
+
+import hashlib
+import sys
+from string import Template
+from typing import Dict, Optional, Tuple
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QApplication, QWidget
+
+from .memory import estimate_bytes, register_cache
+from .theme import get_theme_manager, COMPONENT_STYLE_TEMPLATES
+
+
+# Dynamic property that opts a widget into a compiled style class
+STYLE_CLASS_PROPERTY = "fluentStyle"
+
+
+class FluentStyleSheetCompiler(QObject):
+    """Builds and installs the application stylesheet from theme tokens
+
+    Rules are QSS templates written against ``$selector`` and theme tokens
+    (``$primary``, ``$border``, ...). Style-class rules target widgets whose
+    ``fluentStyle`` dynamic property matches; object rules target an object
+    name. Widgets opt in with ``apply_style_class`` instead of calling
+    ``setStyleSheet`` on every theme change.
+    """
+
+    stylesheet_installed = Signal(str)  # compiled stylesheet
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._theme = get_theme_manager()
+        self._rules: Dict[str, str] = {}
+        self._base_style_sheet = ""
+        self._compiled_cache: Dict[Tuple, str] = {}
+        self._rules_version = 0
+        self._rules_hash: Optional[str] = None
+        self._installed = False
+        self._installed_sheet: Optional[str] = None
+        self._previous_sheet: Optional[str] = None
+
+        for style_class, (widget_type, template) in COMPONENT_STYLE_TEMPLATES.items():
+            self.register_style(style_class, template, widget_type)
+
+    def register_style(self, style_class: str, template: str,
+                       widget_type: str = "*"):
+        """Register rules for widgets with ``fluentStyle`` set to style_class"""
+        selector = f'{widget_type}[{STYLE_CLASS_PROPERTY}="{style_class}"]'
+        self._set_rule(f"class:{style_class}", selector, template)
+
+    def register_object_style(self, object_name: str, template: str,
+                              widget_type: str = ""):
+        """Register rules for widgets with the given object name"""
+        self._set_rule(f"object:{object_name}", f"{widget_type}#{object_name}", template)
+
+    def unregister_style(self, style_class: str):
+        """Remove a style class's rules"""
+        if self._rules.pop(f"class:{style_class}", None) is not None:
+            self._rules_changed()
+
+    def has_style(self, style_class: str) -> bool:
+        """Check whether a style class has registered rules"""
+        return f"class:{style_class}" in self._rules
+
+    def set_base_style_sheet(self, style_sheet: str):
+        """Set application QSS that is prepended to the compiled rules"""
+        if style_sheet != self._base_style_sheet:
+            self._base_style_sheet = style_sheet
+            self._rules_changed()
+
+    def _set_rule(self, key: str, selector: str, template: str):
+        self._rules[key] = Template(template).safe_substitute(selector=selector)
+        self._rules_changed()
+
+    def _rules_changed(self):
+        self._rules_version += 1
+        self._rules_hash = None
+        self._compiled_cache.clear()
+        if self._installed:
+            self._install_current()
+
+    def compile(self) -> str:
+        """Compile the stylesheet for the current theme tokens"""
+        tokens = self._theme.get_style_tokens()
+        cache_key = (self._rules_version, tuple(sorted(tokens.items())))
+        compiled = self._compiled_cache.get(cache_key)
+        if compiled is None:
+            compiled = self._theme.cached_style(
+                f"application:{self._get_rules_hash()}",
+                lambda: self._substitute(tokens))
+            self._compiled_cache[cache_key] = compiled
+        return compiled
+
+    def compiled_count(self) -> int:
+        """Get the number of compiled stylesheets kept"""
+        return len(self._compiled_cache)
+
+    def compiled_bytes(self) -> int:
+        """Get the estimated bytes of the compiled stylesheet table
+
+        The stylesheets are shared with the style cache and counted there.
+        """
+        return sys.getsizeof(self._compiled_cache) + sum(
+            estimate_bytes(key) for key in self._compiled_cache)
+
+    def trim_compiled(self, target_bytes: int = 0):
+        """Drop compiled stylesheets, recompiled from the style cache"""
+        if target_bytes < self.compiled_bytes():
+            self._compiled_cache.clear()
+
+    def _substitute(self, tokens: Dict[str, str]) -> str:
+        parts = [self._base_style_sheet] if self._base_style_sheet else []
+        parts.extend(Template(rule).safe_substitute(tokens)
+                     for rule in self._rules.values())
+        return "\n".join(parts)
+
+    def _get_rules_hash(self) -> str:
+        """Content hash of the rules, naming the stylesheet in the style cache"""
+        if self._rules_hash is None:
+            digest = hashlib.sha1(self._base_style_sheet.encode())
+            for key, rule in self._rules.items():
+                digest.update(f"\0{key}\0{rule}".encode())
+            self._rules_hash = digest.hexdigest()[:16]
+        return self._rules_hash
+
+    def install(self):
+        """Install the compiled stylesheet and keep it in sync with the theme"""
+        if not self._installed:
+            self._installed = True
+            app = QApplication.instance()
+            self._previous_sheet = app.styleSheet() if app is not None else None
+            self._theme.theme_changed.connect(self._install_current)
+        self._install_current()
+
+    def uninstall(self):
+        """Stop managing the application stylesheet and restore the one it replaced"""
+        if self._installed:
+            self._installed = False
+            self._theme.theme_changed.disconnect(self._install_current)
+            app = QApplication.instance()
+            if app is not None and self._installed_sheet is not None:
+                app.setStyleSheet(self._previous_sheet or "")
+            self._installed_sheet = None
+            self._previous_sheet = None
+
+    def is_installed(self) -> bool:
+        """Check whether the compiled stylesheet manages the application"""
+        return self._installed
+
+    def _install_current(self, *args):
+        app = QApplication.instance()
+        if app is None:
+            return
+        compiled = self.compile()
+        if compiled == self._installed_sheet:
+            return
+        self._installed_sheet = compiled
+        app.setStyleSheet(compiled)
+        self.stylesheet_installed.emit(compiled)
+
+
+# Global compiler instance with lazy loading
+_stylesheet_compiler = None
+
+
+def get_stylesheet_compiler() -> FluentStyleSheetCompiler:
+    """Get stylesheet compiler instance (lazy loading)"""
+    global _stylesheet_compiler
+    if _stylesheet_compiler is None:
+        _stylesheet_compiler = FluentStyleSheetCompiler()
+        register_cache("stylesheet_compiler", _stylesheet_compiler.compiled_count,
+                       _stylesheet_compiler.compiled_bytes, _stylesheet_compiler.trim_compiled)
+    return _stylesheet_compiler
+
+
+def install_application_stylesheet() -> FluentStyleSheetCompiler:
+    """Convenience function to install the compiled application stylesheet"""
+    compiler = get_stylesheet_compiler()
+    compiler.install()
+    return compiler
+
+
+def is_compiled_style_active() -> bool:
+    """Check whether components should rely on the compiled stylesheet"""
+    return _stylesheet_compiler is not None and _stylesheet_compiler.is_installed()
+
+
+def apply_style_class(widget: QWidget, style_class: str):
+    """Style a widget through the compiled stylesheet instead of its own QSS
+
+    Clears the widget's per-instance stylesheet and re-polishes it only when
+    its style class actually changes.
+    """
+    if widget.styleSheet():
+        widget.setStyleSheet("")
+    if widget.property(STYLE_CLASS_PROPERTY) != style_class:
+        widget.setProperty(STYLE_CLASS_PROPERTY, style_class)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
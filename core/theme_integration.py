@@ -10,6 +10,7 @@ from PySide6.QtGui import QFont, QIcon, QColor, QPainter, QPaintEvent, QMouseEve
 
 from .base import FluentBaseWidget, FluentBaseContainer
 from .theme import get_theme_manager, register_component_for_theme, ThemeTransitionType
+from .theme_compiler import get_stylesheet_compiler, is_compiled_style_active, apply_style_class
 from .enhanced_animations import FluentAnimation, FluentTransition
 
 
@@ -31,10 +32,13 @@ class ThemeAwareWidget(FluentBaseWidget):
         self._theme_animation: Optional[QPropertyAnimation] = None
         self._theme_properties: Dict[str, Any] = {}
         self._cached_styles: Dict[str, str] = {}
+        self._applied_theme_version = -1
+        self._auto_register = auto_register
 
-        # Auto-register for theme updates
+        # Auto-register for theme updates; the theme manager then re-themes
+        # this widget directly, deferring the work while it is hidden
         if auto_register:
-            self._theme_manager.register_component(self)
+            self._theme_manager.register_component(self, scheduled=True)
 
         # Connect theme signals
         self._connect_theme_signals()
@@ -42,17 +46,37 @@ class ThemeAwareWidget(FluentBaseWidget):
         # Setup initial theme
         self._apply_initial_theme()
 
+    def _connect_signals(self):
+        """Theme signals are connected by _connect_theme_signals"""
+
     def _connect_theme_signals(self):
         """Connect to theme manager signals"""
-        self._theme_manager.theme_changed.connect(self._on_theme_changed)
-        self._theme_manager.mode_changed.connect(self._on_mode_changed)
-        self._theme_manager.transition_started.connect(
-            self._on_transition_started)
-        self._theme_manager.transition_finished.connect(
-            self._on_transition_finished)
+        # theme_changed follows every mode change, so mode_changed is not
+        # connected; listening to both would re-theme twice per switch.
+        # Registered widgets are driven by the theme manager instead.
+        if not self._auto_register:
+            self._theme_manager.theme_changed.connect(self._on_theme_changed)
+
+    def connectNotify(self, signal):
+        """Forward global transition signals once something listens for them"""
+        # Forwarding for every widget would cost one slot call per widget on
+        # each theme switch, whether or not anyone is listening
+        if bytes(signal.name()) in (b"transition_started", b"transition_finished"):
+            self._connect_transition_forwarding()
+        super().connectNotify(signal)
+
+    def _connect_transition_forwarding(self):
+        """Connect the global transition signals to this widget's signals"""
+        if getattr(self, "_forwarding_transitions", False):
+            return
+        self._forwarding_transitions = True
+        theme_manager = get_theme_manager()
+        theme_manager.transition_started.connect(self._on_transition_started)
+        theme_manager.transition_finished.connect(self._on_transition_finished)
 
     def _apply_initial_theme(self):
         """Apply initial theme without animation"""
+        self._applied_theme_version = self._theme_manager.get_theme_version()
         self._update_theme_properties()
         self._apply_theme_styles()
 
@@ -77,7 +101,13 @@ class ThemeAwareWidget(FluentBaseWidget):
 
     def _on_theme_changed(self):
         """Handle theme change with optional animation"""
-        if self._theme_manager._animation_enabled:
+        # Re-theme at most once per theme version
+        version = self._theme_manager.get_theme_version()
+        if version == self._applied_theme_version:
+            return
+        self._applied_theme_version = version
+
+        if self._theme_manager.transitions_enabled() and self.isVisible():
             self._animate_theme_transition()
         else:
             self._update_theme_properties()
@@ -139,6 +169,17 @@ class ThemeAwareWidget(FluentBaseWidget):
         self._cached_styles[cache_key] = style
         return style
 
+    def apply_themed_style(self, component_type: str):
+        """Apply themed style for component type
+
+        Uses the compiled application stylesheet when it is installed and
+        knows the component type; otherwise sets a per-instance stylesheet.
+        """
+        if is_compiled_style_active() and get_stylesheet_compiler().has_style(component_type):
+            apply_style_class(self, component_type)
+        else:
+            self.setStyleSheet(self.get_themed_style(component_type))
+
     def set_transition_type(self, transition_type: ThemeTransitionType):
         """Set transition animation type"""
         self._transition_type = transition_type
@@ -149,6 +190,18 @@ class ThemeAwareWidget(FluentBaseWidget):
         self._theme_properties.clear()
         self._update_theme_properties()
 
+    def showEvent(self, event):
+        """Catch up on theme changes missed while hidden before painting"""
+        if self._auto_register:
+            # closeEvent unregisters; a reopened widget registers again
+            self._theme_manager.register_component(self, scheduled=True)
+        if self._applied_theme_version != self._theme_manager.get_theme_version():
+            self._applied_theme_version = self._theme_manager.get_theme_version()
+            self._update_theme_properties()
+            self._apply_theme_styles()
+            self.theme_applied.emit()
+        super().showEvent(event)
+
     def closeEvent(self, event):
         """Handle close event with cleanup"""
         if self._theme_animation:
@@ -187,8 +240,7 @@ class ThemeAwareButton(ThemeAwareWidget, QPushButton):
 
     def _apply_theme_styles(self):
         """Apply themed button styles"""
-        style = self.get_themed_style(self._button_type)
-        self.setStyleSheet(style)
+        self.apply_themed_style(self._button_type)
 
     def enterEvent(self, event):
         """Handle mouse enter with animation"""
@@ -261,8 +313,7 @@ class ThemeAwarePanel(ThemeAwareWidget, QFrame):
 
     def _apply_theme_styles(self):
         """Apply themed panel styles"""
-        style = self.get_themed_style("panel")
-        self.setStyleSheet(style)
+        self.apply_themed_style("panel")
 
     def add_widget(self, widget: QWidget, stretch: int = 0):
         """Add widget to panel layout"""
@@ -0,0 +1,217 @@
+"""
+Precompiled Theme Styles
+Persists compiled theme tokens and stylesheets per theme variant in one cache
+file, so a cold start reads them back instead of regenerating them
+
+Cached are the ``get_style_sheet`` component templates, the compiled
+application stylesheet, and component stylesheets generated through
+``FluentTheme.cached_style`` or ``FluentStyleCache.get_style`` (combo box,
+table, filter/sort, panel, toolbar and accordion styles). Only the templates
+can be precompiled (``FluentTheme.precompile_styles``); the others are cached
+the first time they are generated. Stylesheets that components build
+inline with f-strings outside these helpers are not cached and are still
+generated on every start.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, Mapping, Optional
+from PySide6.QtCore import QStandardPaths
+from PySide6.QtGui import QColor
+
+from .memory import estimate_bytes
+
+
+# Bump when the file layout or the way styles are generated changes,
+# component style generators included
+CACHE_FORMAT_VERSION = 2
+CACHE_FILE_NAME = "fluent_theme_cache.json"
+# Environment variable naming another cache file than the default one
+CACHE_PATH_ENV = "FLUENT_STYLE_CACHE"
+
+
+def default_cache_path() -> str:
+    """Get the default cache file path
+
+    ``FLUENT_STYLE_CACHE`` overrides it; otherwise the file is kept in the
+    user cache directory.
+    """
+    path = os.environ.get(CACHE_PATH_ENV)
+    if path:
+        return path
+    directory = QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.CacheLocation)
+    return os.path.join(directory or os.path.expanduser("~/.cache/fluentui"),
+                        CACHE_FILE_NAME)
+
+
+def _color_key(color: QColor) -> str:
+    return color.name(QColor.NameFormat.HexArgb)
+
+
+def colors_hash(colors: Mapping[str, QColor]) -> str:
+    """Short content hash of named colors, independent of insertion order"""
+    digest = hashlib.sha1()
+    for name in sorted(colors):
+        digest.update(f"{name}={_color_key(colors[name])};".encode())
+    return digest.hexdigest()[:16]
+
+
+def source_hash(palettes: Mapping[str, Mapping[str, QColor]],
+                templates: Mapping[str, Any]) -> str:
+    """Content hash of everything precompiled styles are generated from
+
+    A cache file written for a different hash is ignored, so editing a
+    palette or a style template invalidates it.
+    """
+    digest = hashlib.sha1(f"format={CACHE_FORMAT_VERSION};".encode())
+    for mode in sorted(palettes):
+        digest.update(f"palette:{mode}:{colors_hash(palettes[mode])};".encode())
+    digest.update(json.dumps(templates, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def variant_key(theme_name: str, mode: str, custom_colors: Mapping[str, QColor]) -> str:
+    """Cache key of one theme variant: theme, mode and custom colors"""
+    return f"{theme_name}:{mode}:{colors_hash(custom_colors)}"
+
+
+class ThemeStyleCache:
+    """Compiled tokens and stylesheets of theme variants, stored in one file
+
+    Each variant holds its QSS color tokens and the stylesheets generated for
+    it by key. The file is read once, on the first lookup, and rewritten as a
+    whole by ``save()`` when entries were added.
+    """
+
+    def __init__(self, path: str, content_hash: str):
+        self._path = path
+        self._content_hash = content_hash
+        self._variants: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+        self._trimmed = False
+        self.hits = 0
+        self.misses = 0
+
+    def path(self) -> str:
+        """Get the cache file path"""
+        return self._path
+
+    def load(self) -> bool:
+        """Read the cache file; returns whether usable entries were loaded"""
+        self._loaded = True
+        variants = self._read_variants()
+        if variants is None:
+            return False
+        # Entries added before loading win over the file
+        for key, variant in variants.items():
+            self._variants.setdefault(key, variant)
+        return True
+
+    def _read_variants(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path, "rb") as file:
+                data = json.loads(file.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("hash") != self._content_hash:
+            return None
+        variants = data.get("variants")
+        return variants if isinstance(variants, dict) else None
+
+    def _variant(self, key: str) -> Dict[str, Any]:
+        if not self._loaded:
+            self.load()
+        variant = self._variants.get(key)
+        if variant is None:
+            variant = self._variants[key] = {"tokens": {}, "styles": {}}
+        return variant
+
+    def get_tokens(self, key: str) -> Optional[Dict[str, str]]:
+        """Get the QSS color tokens stored for a variant"""
+        return self._variant(key)["tokens"] or None
+
+    def set_tokens(self, key: str, tokens: Dict[str, str]):
+        variant = self._variant(key)
+        if variant["tokens"] != tokens:
+            variant["tokens"] = dict(tokens)
+            self._dirty = True
+
+    def get_style(self, key: str, name: str) -> Optional[str]:
+        """Get a stylesheet stored for a variant"""
+        style = self._variant(key)["styles"].get(name)
+        if style is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return style
+
+    def set_style(self, key: str, name: str, style: str):
+        styles = self._variant(key)["styles"]
+        if styles.get(name) != style:
+            styles[name] = style
+            self._dirty = True
+
+    def variants(self) -> Iterable[str]:
+        """Get the keys of the known variants"""
+        if not self._loaded:
+            self.load()
+        return list(self._variants)
+
+    def count(self) -> int:
+        """Get the number of stylesheets held in memory"""
+        return sum(len(variant["styles"]) for variant in self._variants.values())
+
+    def bytes_used(self) -> int:
+        """Get the estimated bytes of the tokens and stylesheets in memory"""
+        return estimate_bytes(self._variants)
+
+    def trim(self, target_bytes: int, keep: Optional[str] = None):
+        """Drop variants other than keep from memory until at most target_bytes remain
+
+        The file still has them and ``save()`` writes them back.
+        """
+        for key in [key for key in self._variants if key != keep]:
+            if self.bytes_used() <= target_bytes:
+                break
+            del self._variants[key]
+            self._trimmed = True
+
+    def is_dirty(self) -> bool:
+        """Check whether there are entries the file does not have yet"""
+        return self._dirty
+
+    def save(self) -> bool:
+        """Write all entries to the cache file, replacing it atomically"""
+        variants = self._variants
+        if self._trimmed:
+            variants = {**(self._read_variants() or {}), **variants}
+        data = {"hash": self._content_hash, "variants": variants}
+        temporary = f"{self._path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            with open(temporary, "w", encoding="utf-8") as file:
+                json.dump(data, file, separators=(",", ":"))
+            os.replace(temporary, self._path)
+        except OSError:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            return False
+        self._dirty = False
+        return True
+
+    def clear(self):
+        """Drop all entries and delete the cache file"""
+        self._variants.clear()
+        self._loaded = True
+        self._dirty = False
+        self._trimmed = False
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
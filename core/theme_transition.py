@@ -0,0 +1,93 @@
+"""
+Window-Level Theme Transition
+Cross-fades a snapshot of a window's old appearance into its new one, so a
+theme switch animates one overlay per window instead of every component
+"""
+
+from typing import List, Optional
+from PySide6.QtCore import Qt, QEasingCurve, QVariantAnimation
+from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtWidgets import QApplication, QWidget
+
+
+class ThemeCrossFadeOverlay(QWidget):
+    """Child overlay that blends two snapshots of its window
+
+    The overlay paints the new appearance and the old one on top with
+    decreasing opacity. Opaque windows get an opaque overlay, so each frame
+    costs two pixmap blits no matter how many widgets the window holds.
+    """
+
+    def __init__(self, window: QWidget, old_snapshot: QPixmap,
+                 new_snapshot: QPixmap, duration: int):
+        super().__init__(window)
+        self._old_snapshot = old_snapshot
+        self._new_snapshot = new_snapshot
+        self._opacity = 1.0
+
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        if not window.testAttribute(Qt.WidgetAttribute.WA_TranslucentBackground):
+            # Lets Qt skip repainting the widgets underneath every frame
+            self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setGeometry(window.rect())
+
+        self._animation = QVariantAnimation(self)
+        self._animation.setStartValue(1.0)
+        self._animation.setEndValue(0.0)
+        self._animation.setDuration(duration)
+        self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._animation.valueChanged.connect(self._set_opacity)
+        self._animation.finished.connect(self.deleteLater)
+
+    def _set_opacity(self, opacity: float):
+        self._opacity = opacity
+        self.update()
+
+    def start(self):
+        """Show the overlay and start fading out the old snapshot"""
+        self.raise_()
+        self.show()
+        self._animation.start()
+
+    def finish(self):
+        """Remove the overlay immediately"""
+        self._animation.stop()
+        self.hide()
+        self.deleteLater()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._new_snapshot)
+        painter.setOpacity(self._opacity)
+        painter.drawPixmap(0, 0, self._old_snapshot)
+
+    @classmethod
+    def overlays(cls, window: QWidget) -> List["ThemeCrossFadeOverlay"]:
+        """Get the overlays currently running on a window"""
+        return [child for child in window.findChildren(
+            cls, options=Qt.FindChildOption.FindDirectChildrenOnly)
+            if not child.isHidden()]
+
+
+def transition_windows() -> List[QWidget]:
+    """Get the windows that take part in a theme transition"""
+    app = QApplication.instance()
+    if app is None:
+        return []
+    return [window for window in app.topLevelWidgets()
+            if window.isVisible() and not window.isMinimized()
+            and window.windowType() in (Qt.WindowType.Window, Qt.WindowType.Dialog)
+            and not window.size().isEmpty()]
+
+
+def cross_fade_window(window: QWidget, old_snapshot: QPixmap,
+                      duration: int) -> Optional[ThemeCrossFadeOverlay]:
+    """Cross-fade a window from its old snapshot to its current appearance"""
+    for overlay in ThemeCrossFadeOverlay.overlays(window):
+        overlay.finish()
+    if duration <= 0:
+        return None
+
+    overlay = ThemeCrossFadeOverlay(window, old_snapshot, window.grab(), duration)
+    overlay.start()
+    return overlay
@@ -0,0 +1,7 @@
+import os
+import tempfile
+
+# Keep the style cache written by benchmark runs out of the user cache
+# directory (see core.theme_precompile.default_cache_path)
+os.environ.setdefault("FLUENT_STYLE_CACHE",
+                      os.path.join(tempfile.gettempdir(), "fluent_bench_theme_cache.json"))
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Animation Clock Benchmark
+
+Runs a dashboard of spinners for a few seconds, each driven by its own QTimer,
+by its own QPropertyAnimation, or by the shared animation clock, and compares
+timer wakeups, CPU time and the clock's frame time. Run from the project root:
+
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.bench_animation_clock
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+from PySide6.QtCore import (QByteArray, QElapsedTimer, QEvent, QEventLoop,
+                            QPropertyAnimation, QTimer)
+from PySide6.QtWidgets import QApplication, QGridLayout, QWidget
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from core.animation_clock import get_animation_clock
+from components.basic.display.loading import FluentSpinner
+
+MODES = ("timer", "property", "clock")
+
+
+class CountingSpinner(FluentSpinner):
+    """Spinner on the shared animation clock that counts its paints"""
+
+    paints = 0
+
+    def paintEvent(self, event):
+        CountingSpinner.paints += 1
+        super().paintEvent(event)
+
+
+class TimerSpinner(CountingSpinner):
+    """Spinner stepped by a private 16 ms timer"""
+
+    wakeups = 0
+    _elapsed = QElapsedTimer()
+
+    def _setup_animation(self):
+        self._timer = QTimer(self)
+        self._timer.setInterval(16)
+        self._timer.timeout.connect(self._step)
+
+    def _step(self):
+        TimerSpinner.wakeups += 1
+        self.setAngle(int(self._elapsed.elapsed() % 1200 * 360 / 1200))
+
+    def start(self):
+        if not self._elapsed.isValid():
+            self._elapsed.start()
+        self._running = True
+        self._timer.start()
+
+    def stop(self):
+        self._running = False
+        self._timer.stop()
+
+
+class PropertySpinner(CountingSpinner):
+    """Spinner driven by its own looping QPropertyAnimation"""
+
+    def _setup_animation(self):
+        self._rotation_animation = QPropertyAnimation(self, QByteArray(b"angle"))
+        self._rotation_animation.setDuration(1200)
+        self._rotation_animation.setStartValue(0)
+        self._rotation_animation.setEndValue(360)
+        self._rotation_animation.setLoopCount(-1)
+
+
+SPINNERS = {"timer": TimerSpinner, "property": PropertySpinner, "clock": CountingSpinner}
+
+
+def build_dashboard(count: int, mode: str) -> QWidget:
+    window = QWidget()
+    layout = QGridLayout(window)
+    layout.setSpacing(4)
+    columns = max(1, int(count ** 0.5))
+    spinner_type = SPINNERS[mode]
+    for i in range(count):
+        layout.addWidget(spinner_type(24), i // columns, i % columns)
+    window.resize(1200, 900)
+    window.show()
+    app.processEvents()
+    return window
+
+
+def spinners(window: QWidget) -> List[FluentSpinner]:
+    layout = window.layout()
+    return [layout.itemAt(i).widget() for i in range(layout.count())]
+
+
+def wait(seconds: float):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def run_mode(count: int, seconds: float, mode: str) -> Dict[str, float]:
+    clock = get_animation_clock()
+    window = build_dashboard(count, mode)
+    TimerSpinner.wakeups = 0
+    CountingSpinner.paints = 0
+    clock.reset_stats()
+
+    for spinner in spinners(window):
+        spinner.start()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    wait(seconds)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    for spinner in spinners(window):
+        spinner.stop()
+
+    stats = clock.stats()
+    paints = max(1, CountingSpinner.paints)
+    result = {
+        "cpu_per_second": cpu / wall,
+        "paints_per_second": paints / wall,
+        "cpu_per_paint_us": cpu / paints * 1e6,
+        "wakeups_per_second": (TimerSpinner.wakeups if mode == "timer"
+                               else stats["frames"] if mode == "clock" else float("nan")) / wall,
+        "average_frame_ms": stats["average_frame_ms"] if mode == "clock" else float("nan"),
+        "max_frame_ms": stats["max_frame_ms"] if mode == "clock" else float("nan"),
+    }
+
+    window.close()
+    window.deleteLater()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+    return result
+
+
+def run(count: int, seconds: float) -> Dict[str, Dict[str, float]]:
+    results = {mode: run_mode(count, seconds, mode) for mode in MODES}
+
+    print(f"{count} spinners for {seconds:.1f} s")
+    print(f"{'driver':>10} {'CPU s/s':>8} {'paints/s':>9} {'CPU/paint':>10} "
+          f"{'wakeups/s':>10} {'frame avg':>10} {'frame max':>10}")
+    for mode, result in results.items():
+        print(f"{mode:>10} {result['cpu_per_second']:>8.2f} "
+              f"{result['paints_per_second']:>9.0f} {result['cpu_per_paint_us']:>7.1f} us "
+              f"{result['wakeups_per_second']:>10.0f} "
+              f"{result['average_frame_ms']:>7.2f} ms {result['max_frame_ms']:>7.2f} ms")
+    clock = get_animation_clock()
+    wait(0.1)
+    print(f"clock after stop: {clock.active_count()} animations, "
+          f"ticking={clock.is_ticking()}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200, help="number of spinners")
+    parser.add_argument("--seconds", type=float, default=3.0, help="time to animate per driver")
+    args = parser.parse_args()
+    run(args.count, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
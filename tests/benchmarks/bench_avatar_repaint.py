@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Avatar Repaint Benchmark
+
+Repaints a scrolling list of initials avatars with and without the shared
+sprite cache. Run from the project root:
+
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.bench_avatar_repaint
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict
+
+from PySide6.QtWidgets import QApplication, QScrollArea, QVBoxLayout, QWidget
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Some component modules create widgets at import time
+app = QApplication.instance() or QApplication(sys.argv)
+
+from components.basic.visual.avatar import FluentAvatar, get_avatar_pixmap_cache
+
+NAMES = ["Ada Lovelace", "Alan Turing", "Grace Hopper", "Edsger Dijkstra",
+         "Barbara Liskov", "Donald Knuth", "Margaret Hamilton", "Ken Thompson",
+         "Frances Allen", "John McCarthy", "Radia Perlman", "Niklaus Wirth"]
+
+
+def build_list(count: int) -> QScrollArea:
+    """Scroll area holding a single column of initials avatars"""
+    content = QWidget()
+    layout = QVBoxLayout(content)
+    layout.setSpacing(4)
+    for i in range(count):
+        avatar = FluentAvatar(FluentAvatar.Size.MEDIUM)
+        avatar.setName(f"{NAMES[i % len(NAMES)]} {i % 400}")
+        layout.addWidget(avatar)
+
+    scroll = QScrollArea()
+    scroll.setWidget(content)
+    scroll.setWidgetResizable(True)
+    scroll.resize(320, 720)
+    scroll.show()
+    return scroll
+
+
+def scroll_and_repaint(scroll: QScrollArea, passes: int) -> float:
+    """Scroll top to bottom, repainting the viewport at every step"""
+    bar = scroll.verticalScrollBar()
+    step = max(1, scroll.viewport().height() // 2)
+    start = time.perf_counter()
+    for _ in range(passes):
+        for value in range(bar.minimum(), bar.maximum() + step, step):
+            bar.setValue(value)
+            scroll.viewport().repaint()
+    return time.perf_counter() - start
+
+
+def run(count: int, passes: int) -> Dict[str, float]:
+    scroll = build_list(count)
+    app.processEvents()
+
+    results = {}
+    for enabled in (False, True):
+        FluentAvatar.SPRITE_CACHE_ENABLED = enabled
+        get_avatar_pixmap_cache().clear()
+        scroll_and_repaint(scroll, 1)  # warm up
+        results["sprites" if enabled else "direct"] = scroll_and_repaint(scroll, passes)
+
+    cache = get_avatar_pixmap_cache()
+    print(f"{count} avatars, {passes} scroll passes")
+    print(f"  direct painting: {results['direct'] * 1000:8.1f} ms")
+    print(f"  sprite cache:    {results['sprites'] * 1000:8.1f} ms")
+    print(f"  speedup:         {results['direct'] / results['sprites']:8.2f}x")
+    print(f"  sprites cached:  {cache.count()} ({cache.bytesUsed() / 1024:.0f} KiB)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=5000, help="number of avatars")
+    parser.add_argument("--passes", type=int, default=3, help="scroll passes to time")
+    args = parser.parse_args()
+    run(args.count, args.passes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Color Token Benchmark
+
+Compares theme color lookups through get_color(), which copies a QColor on
+every call, with the shared tokens from token() and a tokens() snapshot, and
+times a heat-map style paint loop with each. Run from the project root:
+
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.bench_color_tokens
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Dict
+
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QBrush, QImage, QPainter, QPen
+from PySide6.QtWidgets import QApplication
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from core.theme import get_theme_manager
+
+NAMES = ("primary", "surface", "border", "text_primary", "text_secondary", "hover")
+
+
+def time_calls(function: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return time.perf_counter() - start
+
+
+def time_lookups(iterations: int) -> Dict[str, float]:
+    """Seconds for `iterations` pen lookups of each name"""
+    theme = get_theme_manager()
+    tokens = theme.tokens()
+    return {
+        "get_color": time_calls(
+            lambda: [QPen(theme.get_color(name)) for name in NAMES], iterations),
+        "token": time_calls(
+            lambda: [theme.token(name).pen for name in NAMES], iterations),
+        "tokens": time_calls(
+            lambda: [tokens.pen(name) for name in NAMES], iterations),
+    }
+
+
+def paint_cells(cells: int, use_tokens: bool) -> float:
+    """Paint a grid of bordered cells the way the heat map does"""
+    theme = get_theme_manager()
+    image = QImage(800, 800, QImage.Format.Format_ARGB32_Premultiplied)
+    painter = QPainter(image)
+    side = max(1, int(cells ** 0.5))
+    size = 800 / side
+    start = time.perf_counter()
+    if use_tokens:
+        tokens = theme.tokens()
+        surface_brush = tokens.brush('surface')
+        border_pen = tokens.pen('border')
+        for row in range(side):
+            for col in range(side):
+                rect = QRectF(col * size, row * size, size, size)
+                painter.fillRect(rect, surface_brush)
+                painter.setPen(border_pen)
+                painter.drawRect(rect)
+    else:
+        for row in range(side):
+            for col in range(side):
+                rect = QRectF(col * size, row * size, size, size)
+                painter.fillRect(rect, QBrush(theme.get_color('surface')))
+                painter.setPen(QPen(theme.get_color('border')))
+                painter.drawRect(rect)
+    elapsed = time.perf_counter() - start
+    painter.end()
+    return elapsed
+
+
+def run(iterations: int, cells: int) -> Dict[str, float]:
+    theme = get_theme_manager()
+    theme.tokens()  # warm up the token cache
+    results = time_lookups(iterations)
+    results["paint_get_color"] = paint_cells(cells, False)
+    results["paint_tokens"] = paint_cells(cells, True)
+
+    calls = iterations * len(NAMES)
+    print(f"{calls} pen lookups")
+    for key in ("get_color", "token", "tokens"):
+        print(f"  {key + '():':<12} {results[key] * 1000:8.1f} ms "
+              f"({results[key] / calls * 1e9:6.0f} ns/lookup)")
+    print(f"{cells} heat-map cells")
+    print(f"  get_color(): {results['paint_get_color'] * 1000:8.1f} ms")
+    print(f"  tokens():    {results['paint_tokens'] * 1000:8.1f} ms")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=100000,
+                        help="lookup rounds over the sampled color names")
+    parser.add_argument("--cells", type=int, default=10000,
+                        help="heat-map cells to paint")
+    args = parser.parse_args()
+    run(args.iterations, args.cells)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Deferred Construction Benchmark
+
+Builds a window with heavy composite panels spread over the pages of a stack,
+with only the first page showing, once with every panel built up front and
+once with FluentDeferredWidget placeholders, and compares the time until the
+window is on screen. Run from the project root:
+
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.bench_deferred_construction
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QStackedWidget, QVBoxLayout, QWidget
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from core.deferred import FluentDeferredWidget, get_deferred_builder
+from components.composite.containers.panels import FluentPropertiesEditor, FluentSettingsPanel
+from components.interface.command.menus import FluentCommandPalette
+from components.interface.navigation.navigationview import FluentNavigationView
+
+PANELS = (FluentSettingsPanel, FluentPropertiesEditor, FluentCommandPalette, FluentNavigationView)
+MODES = ("eager", "deferred", "prebuild")
+
+
+def build_window(count: int, per_page: int, mode: str) -> QStackedWidget:
+    window = QStackedWidget()
+    page = None
+    for i in range(count):
+        if i % per_page == 0:
+            page = QWidget()
+            QVBoxLayout(page)
+            window.addWidget(page)
+        panel_type = PANELS[i % len(PANELS)]
+        if mode == "eager":
+            panel = panel_type()
+        else:
+            panel = FluentDeferredWidget(panel_type, prebuild=mode == "prebuild")
+        page.layout().addWidget(panel)
+    window.resize(800, 600)
+    return window
+
+
+def _process_events():
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+
+
+def run_mode(count: int, per_page: int, mode: str) -> Dict[str, float]:
+    start = time.perf_counter()
+    window = build_window(count, per_page, mode)
+    window.show()
+    app.processEvents()
+    startup = time.perf_counter() - start
+
+    # Idle time the prebuild queue takes to build the rest
+    start = time.perf_counter()
+    builder = get_deferred_builder()
+    while builder.pending_count():
+        app.processEvents()
+    idle = time.perf_counter() - start
+
+    # Visit every page, as a user going through all of them would
+    start = time.perf_counter()
+    for index in range(window.count()):
+        window.setCurrentIndex(index)
+        app.processEvents()
+    visit = time.perf_counter() - start
+
+    window.close()
+    window.deleteLater()
+    _process_events()
+    return {"startup_ms": startup * 1000, "idle_ms": idle * 1000, "visit_ms": visit * 1000}
+
+
+def run(count: int, per_page: int) -> Dict[str, Dict[str, float]]:
+    # Warm up imports, stylesheets and caches
+    run_mode(len(PANELS), len(PANELS), "eager")
+    results = {mode: run_mode(count, per_page, mode) for mode in MODES}
+
+    print(f"{count} composite panels, {per_page} per page, first page shown")
+    print(f"{'mode':>9} {'startup':>10} {'idle build':>11} {'all pages':>10}")
+    for mode, result in results.items():
+        print(f"{mode:>9} {result['startup_ms']:>7.1f} ms {result['idle_ms']:>8.1f} ms "
+              f"{result['visit_ms']:>7.1f} ms")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=40, help="number of panels")
+    parser.add_argument("--per-page", type=int, default=4, help="panels per stack page")
+    args = parser.parse_args()
+    run(args.count, args.per_page)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Hidden Animations Benchmark
+
+Starts loaders on a background tab and on a scrolled-off page of a scroll
+area, then measures the CPU time and clock frames they cost while nobody can
+see them, with the clock's pause-when-invisible on and off. Run from the
+project root:
+
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.bench_hidden_animations
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+from PySide6.QtCore import QEvent, QEventLoop, QTimer
+from PySide6.QtWidgets import (QApplication, QGridLayout, QLabel, QScrollArea,
+                               QTabWidget, QVBoxLayout, QWidget)
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from core.animation_clock import FluentAnimationClock, get_animation_clock
+from components.basic.display.loading import FluentDotLoader, FluentSpinner
+
+
+def loader_grid(count: int) -> QWidget:
+    page = QWidget()
+    layout = QGridLayout(page)
+    columns = max(1, int(count ** 0.5))
+    for i in range(count):
+        loader = FluentSpinner(24) if i % 2 else FluentDotLoader()
+        layout.addWidget(loader, i // columns, i % columns)
+    return page
+
+
+def build_window(count: int) -> QWidget:
+    """Window whose loaders sit on a hidden tab and below a scroll fold"""
+    tabs = QTabWidget()
+    tabs.addTab(QLabel("Overview"), "Overview")
+    tabs.addTab(loader_grid(count // 2), "Jobs")
+
+    area = QScrollArea()
+    content = QWidget()
+    layout = QVBoxLayout(content)
+    spacer = QLabel("Summary")
+    spacer.setFixedHeight(2000)
+    layout.addWidget(spacer)
+    layout.addWidget(loader_grid(count - count // 2))
+    area.setWidget(content)
+    tabs.addTab(area, "History")
+    tabs.setCurrentIndex(2)
+
+    tabs.resize(800, 600)
+    tabs.show()
+    app.processEvents()
+    return tabs
+
+
+def loaders(window: QWidget) -> List[QWidget]:
+    return window.findChildren(FluentSpinner) + window.findChildren(FluentDotLoader)
+
+
+def wait(seconds: float):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def run_mode(count: int, seconds: float, pause: bool) -> Dict[str, float]:
+    FluentAnimationClock.PAUSE_WHEN_INVISIBLE = pause
+    clock = get_animation_clock()
+    window = build_window(count)
+    for loader in loaders(window):
+        loader.start()
+    wait(0.3)
+    clock.check_visibility()
+    clock.reset_stats()
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    wait(seconds)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    stats = clock.stats()
+
+    for loader in loaders(window):
+        loader.stop()
+    window.close()
+    window.deleteLater()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+    return {
+        "cpu_per_second": cpu / wall,
+        "frames_per_second": stats["frames"] / wall,
+        "updates_per_second": stats["updates"] / wall,
+        "suspended": stats["suspended_animations"],
+        "active": stats["active_animations"],
+    }
+
+
+def run(count: int, seconds: float) -> Dict[str, Dict[str, float]]:
+    default = FluentAnimationClock.PAUSE_WHEN_INVISIBLE
+    try:
+        results = {"running": run_mode(count, seconds, False),
+                   "paused": run_mode(count, seconds, True)}
+    finally:
+        FluentAnimationClock.PAUSE_WHEN_INVISIBLE = default
+
+    print(f"{count} hidden loaders for {seconds:.1f} s")
+    print(f"{'invisible':>10} {'CPU s/s':>8} {'frames/s':>9} {'updates/s':>10} "
+          f"{'suspended':>10}")
+    for mode, result in results.items():
+        print(f"{mode:>10} {result['cpu_per_second']:>8.3f} "
+              f"{result['frames_per_second']:>9.0f} {result['updates_per_second']:>10.0f} "
+              f"{result['suspended']:>4}/{result['active']:<5}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=500, help="number of loaders")
+    parser.add_argument("--seconds", type=float, default=3.0, help="time to measure per mode")
+    args = parser.parse_args()
+    run(args.count, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
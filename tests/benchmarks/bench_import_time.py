@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Import Time Benchmark
+
+Imports component entry points in fresh interpreters under ``python -X
+importtime``, adds up the self time of the project's own modules and checks it
+against a budget per entry point. Run from the project root:
+
+    python -m tests.benchmarks.bench_import_time --check
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Tuple
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+PROJECT_PACKAGES = ("components", "core")
+
+# Entry point -> (statement, budget for project modules in ms)
+TARGETS: Dict[str, Tuple[str, float]] = {
+    "components": ("import components", 10.0),
+    "button": ("from components.basic.forms.button import FluentButton", 180.0),
+    "basic facade": ("from components.basic import FluentButton", 180.0),
+    "card": ("from components.basic.display.card import FluentCard", 180.0),
+    "layout": ("from components.layout import FluentGrid", 150.0),
+    "charts": ("from components.data.charts import FluentSimpleBarChart", 90.0),
+}
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+class ImportTime(NamedTuple):
+    total_ms: float
+    project_ms: float
+    project_modules: int
+    slowest: List[Tuple[str, float]]
+
+
+def parse_importtime(output: str) -> ImportTime:
+    """Parse ``-X importtime`` output into totals for the project modules"""
+    total = 0
+    project = 0
+    modules = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, _, _, name = match.groups()
+        total += int(self_us)
+        if name.split(".")[0] in PROJECT_PACKAGES:
+            project += int(self_us)
+            modules.append((name, int(self_us) / 1000))
+    modules.sort(key=lambda module: module[1], reverse=True)
+    return ImportTime(total / 1000, project / 1000, len(modules), modules[:5])
+
+
+def measure(statement: str) -> ImportTime:
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def run(repeat: int) -> Dict[str, ImportTime]:
+    # Best of several runs; the first one also warms the bytecode cache
+    results = {}
+    for name, (statement, _) in TARGETS.items():
+        results[name] = min((measure(statement) for _ in range(repeat + 1)),
+                            key=lambda result: result.project_ms)
+
+    print(f"import time, best of {repeat} runs")
+    print(f"{'entry point':>14} {'total':>10} {'project':>10} {'budget':>10} {'modules':>8}")
+    for name, result in results.items():
+        budget = TARGETS[name][1]
+        flag = "" if result.project_ms <= budget else "  OVER BUDGET"
+        print(f"{name:>14} {result.total_ms:>7.1f} ms {result.project_ms:>7.1f} ms "
+              f"{budget:>7.1f} ms {result.project_modules:>8}{flag}")
+    for name, result in results.items():
+        slowest = ", ".join(f"{module} {ms:.1f}" for module, ms in result.slowest[:3])
+        print(f"  {name}: {slowest}")
+    return results
+
+
+def over_budget(results: Dict[str, ImportTime]) -> List[str]:
+    return [name for name, result in results.items() if result.project_ms > TARGETS[name][1]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per entry point")
+    parser.add_argument("--check", action="store_true",
+                        help="exit with status 1 when an entry point is over budget")
+    args = parser.parse_args()
+    results = run(args.repeat)
+    failed = over_budget(results)
+    if args.check and failed:
+        print(f"over budget: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Instrumentation Overhead Benchmark
+
+Repaints a grid of Fluent widgets with instrumentation never enabled, enabled,
+and enabled then disabled again, and compares the time per repaint. Run from
+the project root:
+
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.bench_instrumentation
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict
+
+from PySide6.QtWidgets import QApplication, QGridLayout, QWidget
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from core.instrumentation import get_instrumentation
+from components.basic.visual.avatar import FluentAvatar
+from components.interface.navigation.appbar import FluentAppBar
+from components.layout.grid import FluentGrid
+
+# FluentBaseWidget subclasses, the ones instrumentation times
+WIDGETS = (FluentAvatar, FluentAppBar, FluentGrid)
+MODES = ("off", "on", "disabled")
+
+
+def build_window(count: int) -> QWidget:
+    window = QWidget()
+    layout = QGridLayout(window)
+    for i in range(count):
+        layout.addWidget(WIDGETS[i % len(WIDGETS)](), i // 10, i % 10)
+    window.resize(1000, 600)
+    window.show()
+    app.processEvents()
+    return window
+
+
+def time_repaints(window: QWidget, repeat: int, rounds: int = 5) -> float:
+    # Best of several rounds, per repaint
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            window.repaint()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best
+
+
+def run(count: int, repeat: int) -> Dict[str, float]:
+    window = build_window(count)
+    instrumentation = get_instrumentation()
+    time_repaints(window, repeat)
+
+    results = {"off": time_repaints(window, repeat)}
+    instrumentation.enable()
+    results["on"] = time_repaints(window, repeat)
+    events = instrumentation.stats()["events"]
+    instrumentation.disable()
+    results["disabled"] = time_repaints(window, repeat)
+    window.close()
+
+    print(f"{count} widgets, best of 5 x {repeat} repaints, {events} handlers timed while on")
+    print(f"{'mode':>9} {'repaint':>10} {'overhead':>9}")
+    for mode in MODES:
+        overhead = results[mode] / results["off"] - 1
+        print(f"{mode:>9} {results[mode] * 1000:>7.3f} ms {overhead:>8.1%}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=60, help="number of widgets")
+    parser.add_argument("--repeat", type=int, default=100, help="repaints per round")
+    args = parser.parse_args()
+    run(args.count, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
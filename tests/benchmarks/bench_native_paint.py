@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Native Paint Benchmark
+
+Compares custom-painted widgets styled through per-widget stylesheets with
+native paint mode, where they draw from the theme palette and tokens with no
+stylesheet attached: time to build and show them, paint throughput, and the
+cost of restyling them all (a theme or state change). Run from the project root:
+
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.bench_native_paint
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Dict, Tuple
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QGridLayout, QWidget
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Some component modules create widgets at import time
+app = QApplication.instance() or QApplication(sys.argv)
+
+from core.theme import get_theme_manager
+from components.basic.display.progress import FluentProgressBar
+
+
+def make_progress_bar(i: int) -> QWidget:
+    bar = FluentProgressBar()
+    bar.setValue(i % 100)
+    return bar
+
+
+def restyle_progress_bar(bar: FluentProgressBar):
+    # What a theme change does
+    bar._setup_fluent_style()
+
+
+WIDGETS: Dict[str, Tuple[Callable[[int], QWidget], Callable[[QWidget], None]]] = {
+    "progress bars": (make_progress_bar, restyle_progress_bar),
+}
+
+
+def build_window(count: int, factory: Callable[[int], QWidget]) -> QWidget:
+    window = QWidget()
+    layout = QGridLayout(window)
+    layout.setSpacing(2)
+    columns = max(1, int(count ** 0.5))
+    for i in range(count):
+        layout.addWidget(factory(i), i // columns, i % columns)
+    window.resize(1600, 1200)
+    window.show()
+    app.processEvents()
+    return window
+
+
+def paints_per_second(window: QWidget, count: int, passes: int) -> float:
+    """Widget paints per second over full-window repaints"""
+    window.repaint()  # warm up
+    start = time.perf_counter()
+    for _ in range(passes):
+        window.repaint()
+    return count * passes / (time.perf_counter() - start)
+
+
+def time_restyle(window: QWidget, restyle: Callable[[QWidget], None]) -> float:
+    """Seconds to restyle every widget and repaint the window"""
+    widgets = [window.layout().itemAt(i).widget() for i in range(window.layout().count())]
+    start = time.perf_counter()
+    for widget in widgets:
+        restyle(widget)
+    app.processEvents()
+    window.repaint()
+    return time.perf_counter() - start
+
+
+def run(count: int, passes: int) -> Dict[Tuple[str, bool], Dict[str, float]]:
+    theme = get_theme_manager()
+    original = theme.is_native_paint_enabled()
+
+    results: Dict[Tuple[str, bool], Dict[str, float]] = {}
+    try:
+        for name, (factory, restyle) in WIDGETS.items():
+            for native in (False, True):
+                theme.set_native_paint_enabled(native)
+                theme.flush_theme_updates()
+                start = time.perf_counter()
+                window = build_window(count, factory)
+                window.repaint()
+                results[(name, native)] = {
+                    "build": time.perf_counter() - start,
+                    "paints": paints_per_second(window, count, passes),
+                    "restyle": time_restyle(window, restyle),
+                }
+                window.close()
+                window.deleteLater()
+                app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+                app.processEvents()
+    finally:
+        theme.set_native_paint_enabled(original)
+        theme.flush_theme_updates()
+
+    print(f"{count} widgets, {passes} full repaints")
+    print(f"{'':>14} {'':>10} {'build + show':>13} {'paints/s':>10} {'restyle':>10}")
+    for (name, native), timings in results.items():
+        print(f"{name:>14} {'native' if native else 'stylesheet':>10} "
+              f"{timings['build'] * 1000:>10.1f} ms {timings['paints']:>10,.0f} "
+              f"{timings['restyle'] * 1000:>7.1f} ms")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1000, help="number of widgets")
+    parser.add_argument("--passes", type=int, default=20, help="full repaints to time")
+    args = parser.parse_args()
+    run(args.count, args.passes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Performance Profile Benchmark
+
+Repaints a window of shadowed, antialiased Fluent widgets under each
+performance profile and compares the time per repaint, after printing the
+profile recommended for this machine. Run from the project root:
+
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.bench_performance_profile
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict
+
+from PySide6.QtWidgets import QApplication, QGraphicsDropShadowEffect, QGridLayout, QWidget
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from core.performance_profile import (PerformanceProfile, detect_profile,
+                                      get_performance_profile, profile_effect)
+from components.basic.visual.avatar import FluentAvatar
+
+
+def shadowed_tile() -> QWidget:
+    # A surface with a drop shadow effect, as menus, dialogs and combo boxes use
+    tile = QWidget()
+    tile.setAutoFillBackground(True)
+    shadow = QGraphicsDropShadowEffect(tile)
+    shadow.setBlurRadius(16)
+    shadow.setOffset(0, 2)
+    tile.setGraphicsEffect(profile_effect(shadow))
+    return tile
+
+
+def build_window(count: int) -> QWidget:
+    window = QWidget()
+    layout = QGridLayout(window)
+    for i in range(count):
+        widget = FluentAvatar() if i % 2 else shadowed_tile()
+        layout.addWidget(widget, i // 10, i % 10)
+    window.resize(1000, 600)
+    window.show()
+    app.processEvents()
+    return window
+
+
+def time_repaints(window: QWidget, repeat: int, rounds: int = 5) -> float:
+    # Best of several rounds, per repaint
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            window.repaint()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best
+
+
+def run(count: int, repeat: int) -> Dict[str, float]:
+    detection = detect_profile()
+    print(f"recommended {detection.profile.value}: {', '.join(detection.reasons) or 'no limits'}"
+          f" ({detection.cpu_count} CPUs, {detection.screens} screens,"
+          f" paint {detection.paint_ms:.1f} ms)")
+
+    profile = get_performance_profile()
+    profile.set_profile(PerformanceProfile.HIGH)
+    window = build_window(count)
+    time_repaints(window, repeat)
+
+    results = {}
+    for option in PerformanceProfile:
+        profile.set_profile(option)
+        app.processEvents()
+        results[option.value] = time_repaints(window, repeat)
+    profile.set_profile(detection.profile)
+    window.close()
+
+    high = results[PerformanceProfile.HIGH.value]
+    print(f"{count} widgets, best of 5 x {repeat} repaints")
+    print(f"{'profile':>15} {'repaint':>10} {'vs high':>8}")
+    for name, seconds in results.items():
+        print(f"{name:>15} {seconds * 1000:>7.3f} ms {seconds / high:>7.2f}x")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=60, help="number of widgets")
+    parser.add_argument("--repeat", type=int, default=50, help="repaints per round")
+    args = parser.parse_args()
+    run(args.count, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Shadow Rendering Benchmark
+
+Paints a grid of elevated cards with no shadow, with a QGraphicsDropShadowEffect
+per card and with the cached nine-patch shadow, and compares the time of a
+full window repaint. Run from the project root:
+
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.bench_shadow
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import (QApplication, QFrame, QGraphicsDropShadowEffect,
+                               QGridLayout, QLabel, QVBoxLayout, QWidget)
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from core.shadow import FluentShadowWidget, get_shadow_renderer
+from core.theme import theme_manager
+
+MODES = ("none", "effect", "cached")
+ELEVATIONS = (1, 2, 4, 8)
+
+
+class Card(QFrame):
+    """Plain stylesheet card without a shadow"""
+
+    def __init__(self, elevation: int):
+        super().__init__()
+        self.setStyleSheet("Card { background: #ffffff; border: 1px solid #e0e0e0;"
+                           " border-radius: 8px; }")
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"Elevation {elevation}"))
+        self.setFixedSize(120, 64)
+
+
+class EffectCard(Card):
+    """Card with a QGraphicsDropShadowEffect"""
+
+    def __init__(self, elevation: int):
+        super().__init__(elevation)
+        blur, offset_y, color = theme_manager.get_elevation_shadow(elevation)
+        shadow = QGraphicsDropShadowEffect(self)
+        shadow.setBlurRadius(blur)
+        shadow.setOffset(0, offset_y)
+        shadow.setColor(color)
+        self.setGraphicsEffect(shadow)
+
+
+class CachedCard(Card):
+    """Card with a cached nine-patch shadow"""
+
+    def __init__(self, elevation: int):
+        super().__init__(elevation)
+        blur, offset_y, color = theme_manager.get_elevation_shadow(elevation)
+        self._shadow = FluentShadowWidget(self, 8)
+        self._shadow.setBlurRadius(blur)
+        self._shadow.setOffset(0, offset_y)
+        self._shadow.setColor(color)
+
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        self._shadow.sync()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._shadow.sync()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._shadow.sync()
+
+
+CARDS = {"none": Card, "effect": EffectCard, "cached": CachedCard}
+
+
+def build_window(count: int, mode: str) -> QWidget:
+    window = QWidget()
+    layout = QGridLayout(window)
+    layout.setSpacing(16)
+    columns = max(1, int(count ** 0.5))
+    card_type = CARDS[mode]
+    for i in range(count):
+        layout.addWidget(card_type(ELEVATIONS[i % len(ELEVATIONS)]), i // columns, i % columns)
+    window.resize(columns * 136 + 32, (count // columns + 1) * 80 + 32)
+    window.show()
+    app.processEvents()
+    return window
+
+
+def run_mode(count: int, frames: int, mode: str) -> Dict[str, float]:
+    window = build_window(count, mode)
+    window.repaint()
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        window.repaint()
+    elapsed = time.perf_counter() - start
+
+    window.close()
+    window.deleteLater()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+    frame_ms = elapsed / frames * 1000
+    return {"frame_ms": frame_ms, "card_us": frame_ms * 1000 / count}
+
+
+def run(count: int, frames: int) -> Dict[str, Dict[str, float]]:
+    renderer = get_shadow_renderer()
+    renderer.clear()
+    results = {mode: run_mode(count, frames, mode) for mode in MODES}
+
+    print(f"{count} elevated cards, {frames} full repaints")
+    print(f"{'shadow':>8} {'repaint':>10} {'per card':>10}")
+    for mode, result in results.items():
+        print(f"{mode:>8} {result['frame_ms']:>7.1f} ms {result['card_us']:>7.1f} us")
+    stats = renderer.stats()
+    print(f"shadow cache: {stats['pixmaps']} pixmaps, {stats['bytes'] / 1024:.1f} KiB, "
+          f"{stats['hits']} hits, {stats['misses']} misses")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=500, help="number of cards")
+    parser.add_argument("--frames", type=int, default=20, help="number of full repaints")
+    args = parser.parse_args()
+    run(args.count, args.frames)
+
+
+if __name__ == "__main__":
+    main()
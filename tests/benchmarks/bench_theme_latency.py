@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Theme Switch Latency Benchmark
+
+Measures the time to the first visible frame after a theme switch when most
+themed widgets live on hidden pages, and how long the hidden pages take to
+catch up in the background. Run from the project root:
+
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.bench_theme_latency
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QGridLayout, QStackedWidget, QWidget
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from core.theme import ThemeMode, get_theme_manager
+from core.theme_integration import ThemeAwareWidget
+
+
+class ThemedPanel(ThemeAwareWidget):
+    """Registered widget that restyles itself like a themed panel"""
+
+    def _apply_theme_styles(self):
+        self.apply_themed_style("panel")
+
+
+def build_window(visible: int, total: int) -> QStackedWidget:
+    """Stacked window whose current page holds `visible` of `total` panels"""
+    window = QStackedWidget()
+    remaining = total
+    while remaining > 0:
+        page = QWidget()
+        layout = QGridLayout(page)
+        count = min(visible, remaining)
+        columns = max(1, int(count ** 0.5))
+        for i in range(count):
+            layout.addWidget(ThemedPanel(), i // columns, i % columns)
+        window.addWidget(page)
+        remaining -= count
+    window.resize(800, 600)
+    window.show()
+    app.processEvents()
+    return window
+
+
+def time_switch(window: QWidget) -> Dict[str, float]:
+    """Seconds to first visible frame and until every panel is themed"""
+    theme = get_theme_manager()
+    mode = ThemeMode.DARK if theme.get_theme_mode() == ThemeMode.LIGHT else ThemeMode.LIGHT
+
+    start = time.perf_counter()
+    theme.set_theme_mode(mode)
+    window.repaint()
+    first_frame = time.perf_counter() - start
+    while theme.pending_theme_updates():
+        app.processEvents()
+    complete = time.perf_counter() - start
+
+    # Reference: what a fully synchronous switch costs for the same tree
+    mode = ThemeMode.DARK if mode == ThemeMode.LIGHT else ThemeMode.LIGHT
+    start = time.perf_counter()
+    theme.set_theme_mode(mode)
+    theme.flush_theme_updates()
+    window.repaint()
+    synchronous = time.perf_counter() - start
+
+    return {"first_frame": first_frame, "complete": complete, "synchronous": synchronous}
+
+
+def run(visible: int, totals: List[int]) -> Dict[int, Dict[str, float]]:
+    theme = get_theme_manager()
+    original_mode = theme.get_theme_mode()
+    original_animation = theme._animation_enabled
+    theme.set_animation_enabled(False)
+
+    results = {}
+    try:
+        for total in totals:
+            window = build_window(visible, total)
+            results[total] = time_switch(window)
+            window.close()
+            window.deleteLater()
+            app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+            app.processEvents()
+    finally:
+        theme.set_animation_enabled(original_animation)
+        theme.set_theme_mode(original_mode)
+        theme.flush_theme_updates()
+
+    print(f"{visible} visible panels, {theme.SLICE_BUDGET_MS} ms slices")
+    print(f"{'panels':>8} {'first frame':>13} {'all themed':>12} {'synchronous':>13}")
+    for total, timings in results.items():
+        print(f"{total:>8} {timings['first_frame'] * 1000:>10.1f} ms "
+              f"{timings['complete'] * 1000:>9.1f} ms "
+              f"{timings['synchronous'] * 1000:>10.1f} ms")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--visible", type=int, default=100,
+                        help="panels on the visible page")
+    parser.add_argument("--totals", type=int, nargs="+", default=[1000, 5000, 10000],
+                        help="total panel counts to measure")
+    args = parser.parse_args()
+    run(args.visible, args.totals)
+
+
+if __name__ == "__main__":
+    main()
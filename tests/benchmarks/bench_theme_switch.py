@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Theme Switch Benchmark
+
+Measures theme-switch latency against widget count for per-widget
+setStyleSheet calls versus the compiled application stylesheet. Run from the
+project root:
+
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.bench_theme_switch
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import (QApplication, QFrame, QGridLayout, QLabel, QPushButton,
+                               QVBoxLayout, QWidget)
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.theme import ThemeMode, get_theme_manager
+from core.theme_compiler import apply_style_class, get_stylesheet_compiler
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def build_window(count: int, compiled: bool) -> Tuple[QWidget, List[Callable]]:
+    """Window holding themed cards (frame, label, button), plus its theme slots"""
+    theme = get_theme_manager()
+    slots = []
+
+    def themed(widget: QWidget, style_class: str) -> QWidget:
+        if compiled:
+            apply_style_class(widget, style_class)
+        else:
+            # What components do today: regenerate and set their own QSS
+            def restyle(_name=None):
+                widget.setStyleSheet(theme._generate_component_style(style_class))
+            restyle()
+            theme.theme_changed.connect(restyle)
+            slots.append(restyle)
+        return widget
+
+    window = QWidget()
+    layout = QGridLayout(window)
+    cards = max(1, count // 3)
+    columns = max(1, int(cards ** 0.5))
+    for i in range(cards):
+        card = themed(QFrame(), "card")
+        card_layout = QVBoxLayout(card)
+        card_layout.addWidget(themed(QLabel(f"Card {i}"), "label"))
+        card_layout.addWidget(themed(QPushButton("Open"), "button"))
+        layout.addWidget(card, i // columns, i % columns)
+    window.show()
+    app.processEvents()
+    return window, slots
+
+
+def time_switches(switches: int) -> float:
+    """Average seconds per theme switch, including event processing"""
+    theme = get_theme_manager()
+    total = 0.0
+    for _ in range(switches):
+        mode = ThemeMode.DARK if theme.get_theme_mode() == ThemeMode.LIGHT else ThemeMode.LIGHT
+        start = time.perf_counter()
+        theme.set_theme_mode(mode)
+        app.processEvents()
+        total += time.perf_counter() - start
+    return total / switches
+
+
+def run(counts: List[int], switches: int) -> Dict[int, Dict[str, float]]:
+    theme = get_theme_manager()
+    original_mode = theme.get_theme_mode()
+    original_animation = theme._animation_enabled
+    theme.set_animation_enabled(False)
+    compiler = get_stylesheet_compiler()
+
+    results = {}
+    try:
+        for count in counts:
+            results[count] = {}
+            for compiled in (False, True):
+                if compiled:
+                    compiler.install()
+                window, slots = build_window(count, compiled)
+                results[count]["compiled" if compiled else "per_widget"] = time_switches(switches)
+                for slot in slots:
+                    theme.theme_changed.disconnect(slot)
+                window.close()
+                window.deleteLater()
+                app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+                if compiled:
+                    compiler.uninstall()
+                app.processEvents()
+    finally:
+        theme.set_animation_enabled(original_animation)
+        theme.set_theme_mode(original_mode)
+
+    print(f"{'widgets':>8} {'per-widget QSS':>16} {'compiled QSS':>14} {'speedup':>8}")
+    for count, timings in results.items():
+        print(f"{count:>8} {timings['per_widget'] * 1000:>13.1f} ms "
+              f"{timings['compiled'] * 1000:>11.1f} ms "
+              f"{timings['per_widget'] / timings['compiled']:>7.1f}x")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--counts", type=int, nargs="+", default=[250, 1000, 3000],
+                        help="widget counts to measure")
+    parser.add_argument("--switches", type=int, default=4, help="theme switches per count")
+    args = parser.parse_args()
+    run(args.counts, args.switches)
+
+
+if __name__ == "__main__":
+    main()
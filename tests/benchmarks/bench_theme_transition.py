@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Theme Transition Benchmark
+
+Measures the main-thread time an animated theme switch costs, from the
+switch until the transition finishes, for the window-level cross-fade (FADE)
+versus per-component geometry animations (SLIDE). Run from the project root:
+
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.bench_theme_transition
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QGridLayout, QWidget
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from core.theme import ThemeMode, ThemeTransitionType, get_theme_manager
+from core.theme_integration import ThemeAwareWidget
+
+
+class ThemedPanel(ThemeAwareWidget):
+    """Registered widget that restyles itself like a themed panel"""
+
+    def _apply_theme_styles(self):
+        self.apply_themed_style("panel")
+
+
+def build_window(count: int) -> QWidget:
+    window = QWidget()
+    layout = QGridLayout(window)
+    columns = max(1, int(count ** 0.5))
+    for i in range(count):
+        layout.addWidget(ThemedPanel(), i // columns, i % columns)
+    window.resize(1000, 800)
+    window.show()
+    app.processEvents()
+    return window
+
+
+def time_transition(window: QWidget, transition_type: ThemeTransitionType) -> Dict[str, float]:
+    """Busy seconds in the switch itself and in the frames until it finishes"""
+    theme = get_theme_manager()
+    theme.set_transition_type(transition_type)
+    for panel in window.findChildren(ThemedPanel):
+        panel.set_transition_type(transition_type)
+    finished = []
+    theme.transition_finished.connect(lambda: finished.append(True))
+    mode = ThemeMode.DARK if theme.get_theme_mode() == ThemeMode.LIGHT else ThemeMode.LIGHT
+
+    start = time.perf_counter()
+    theme.set_theme_mode(mode)
+    switch = time.perf_counter() - start
+    frames = 0.0
+    while not finished:
+        start = time.perf_counter()
+        app.processEvents()
+        frames += time.perf_counter() - start
+        time.sleep(0.001)
+    theme.transition_finished.disconnect()
+    return {"switch": switch, "frames": frames}
+
+
+def run(counts: List[int], duration: int) -> Dict[int, Dict[str, Dict[str, float]]]:
+    theme = get_theme_manager()
+    original_mode = theme.get_theme_mode()
+    original_animation = theme._animation_enabled
+    original_type = theme._transition_type
+    original_duration = theme._transition_duration
+    theme.set_animation_enabled(True)
+    theme.set_transition_duration(duration)
+
+    results = {}
+    try:
+        for count in counts:
+            window = build_window(count)
+            results[count] = {
+                "fade": time_transition(window, ThemeTransitionType.FADE),
+                "slide": time_transition(window, ThemeTransitionType.SLIDE),
+            }
+            window.close()
+            window.deleteLater()
+            app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+            app.processEvents()
+    finally:
+        theme.set_transition_type(original_type)
+        theme.set_transition_duration(original_duration)
+        theme.set_animation_enabled(False)
+        theme.set_theme_mode(original_mode)
+        theme.flush_theme_updates()
+        theme.set_animation_enabled(original_animation)
+        theme.save_settings()
+
+    print(f"{duration} ms transitions, main-thread busy time (switch + frames)")
+    print(f"{'widgets':>8} {'cross-fade':>22} {'per-component':>22}")
+    for count, timings in results.items():
+        fade, slide = timings["fade"], timings["slide"]
+        print(f"{count:>8} {fade['switch'] * 1000:>9.1f} + {fade['frames'] * 1000:>6.1f} ms "
+              f"{slide['switch'] * 1000:>9.1f} + {slide['frames'] * 1000:>6.1f} ms")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 500, 2000],
+                        help="widget counts to measure")
+    parser.add_argument("--duration", type=int, default=250,
+                        help="transition duration in milliseconds")
+    args = parser.parse_args()
+    run(args.counts, args.duration)
+
+
+if __name__ == "__main__":
+    main()
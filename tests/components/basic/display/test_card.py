@@ -4,6 +4,7 @@ from PySide6.QtWidgets import QApplication, QLabel, QWidget
 from PySide6.QtTest import QTest
 
 from components.basic.display.card import FluentCard, ExpandableFluentCard, FluentCardMetrics
+from core.shadow import FluentShadowWidget
 
 # Fixture for QApplication instance
 
@@ -23,7 +24,8 @@ class TestFluentCard:
         assert not card.isClickable()
         assert card.getElevation() == FluentCardMetrics.ELEVATION_MEDIUM
         assert card.getCornerRadius() == FluentCardMetrics.RADIUS_MEDIUM
-        assert card.graphicsEffect() is not None
+        assert isinstance(card._shadow, FluentShadowWidget)
+        assert card.graphicsEffect() is None
 
     def test_set_clickable(self, qtbot):
         card = FluentCard()
@@ -0,0 +1,138 @@
+import pytest
+from PySide6.QtCore import SIGNAL, QSize
+from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtWidgets import QApplication
+
+from components.basic.visual.avatar import (
+    AvatarPixmapCache,
+    FluentAvatar,
+    FluentAvatarGroup,
+    get_avatar_pixmap_cache
+)
+from core.theme import theme_manager
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _solid_pixmap(size: int, color: str) -> QPixmap:
+    pixmap = QPixmap(size, size)
+    pixmap.fill(QColor(color))
+    return pixmap
+
+
+class TestAvatarPixmapCache:
+    def test_renders_once_per_key(self, app_instance):
+        cache = AvatarPixmapCache()
+        calls = []
+
+        def render():
+            calls.append(1)
+            return _solid_pixmap(32, "red")
+
+        first = cache.pixmap(("a", 32), render)
+        second = cache.pixmap(("a", 32), render)
+        assert len(calls) == 1
+        assert first.cacheKey() == second.cacheKey()
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used_by_bytes(self, app_instance):
+        entry_bytes = 32 * 32 * 4
+        cache = AvatarPixmapCache(max_bytes=entry_bytes * 2)
+
+        cache.pixmap(("a",), lambda: _solid_pixmap(32, "red"))
+        cache.pixmap(("b",), lambda: _solid_pixmap(32, "green"))
+        cache.pixmap(("a",), lambda: _solid_pixmap(32, "red"))
+        cache.pixmap(("c",), lambda: _solid_pixmap(32, "blue"))
+
+        assert cache.count() == 2
+        assert cache.bytesUsed() <= cache.maxBytes()
+        misses = cache.misses
+        cache.pixmap(("a",), lambda: _solid_pixmap(32, "red"))
+        assert cache.misses == misses
+
+        cache.clear()
+        assert cache.count() == 0
+        assert cache.bytesUsed() == 0
+
+
+class TestFluentAvatarPhotoCache:
+    def test_avatars_share_photo_pixmap(self, qtbot, app_instance):
+        get_avatar_pixmap_cache().clear()
+        photo = _solid_pixmap(128, "purple")
+
+        avatars = []
+        for _ in range(3):
+            avatar = FluentAvatar()
+            qtbot.addWidget(avatar)
+            avatar.setPixmap(photo)
+            avatar.grab()
+            avatars.append(avatar)
+
+        assert get_avatar_pixmap_cache().count() == 1
+
+    def test_image_key_shares_separate_pixmaps(self, qtbot, app_instance):
+        get_avatar_pixmap_cache().clear()
+
+        for color in ("red", "blue"):
+            avatar = FluentAvatar()
+            qtbot.addWidget(avatar)
+            avatar.setPixmap(_solid_pixmap(64, color), image_key="user-42")
+            avatar.grab()
+
+        assert get_avatar_pixmap_cache().count() == 1
+
+
+class TestFluentAvatarSprites:
+    def test_initials_avatars_share_sprite(self, qtbot, app_instance):
+        get_avatar_pixmap_cache().clear()
+        misses = get_avatar_pixmap_cache().misses
+
+        for _ in range(3):
+            avatar = FluentAvatar()
+            qtbot.addWidget(avatar)
+            avatar.setName("Ada Lovelace")
+            avatar.grab()
+
+        assert get_avatar_pixmap_cache().count() == 1
+        assert get_avatar_pixmap_cache().misses == misses + 1
+
+    def test_sprite_cache_can_be_disabled(self, qtbot, app_instance, monkeypatch):
+        get_avatar_pixmap_cache().clear()
+        monkeypatch.setattr(FluentAvatar, "SPRITE_CACHE_ENABLED", False)
+
+        avatar = FluentAvatar()
+        qtbot.addWidget(avatar)
+        avatar.setName("Ada Lovelace")
+        avatar.grab()
+
+        assert get_avatar_pixmap_cache().count() == 0
+
+    def test_sprite_key_follows_theme_colors(self, qtbot, app_instance):
+        avatar = FluentAvatar()
+        qtbot.addWidget(avatar)
+        avatar._style = FluentAvatar.Style.GRADIENT
+        key = avatar._sprite_key(avatar.rect())
+
+        # A custom primary color re-themes the avatar without a mode change
+        avatar._cached_colors = dict(avatar._cached_colors, accent=QColor("#ff0000"))
+        assert avatar._sprite_key(avatar.rect()) != key
+
+
+class TestFluentAvatarGroup:
+    def test_dispose_disconnects_theme_changes(self, qtbot, app_instance):
+        theme_changed = SIGNAL("theme_changed(QString)")
+        receivers = theme_manager.receivers(theme_changed)
+        group = FluentAvatarGroup()
+        qtbot.addWidget(group)
+        assert theme_manager.receivers(theme_changed) == receivers + 1
+
+        group._dispose_resources()
+        assert theme_manager.receivers(theme_changed) == receivers
+
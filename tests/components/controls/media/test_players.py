@@ -0,0 +1,345 @@
+import time
+
+import pytest
+from PySide6.QtCore import QSize, QThreadPool
+from PySide6.QtGui import QColor, QImage, QPixmap
+from PySide6.QtWidgets import QApplication, QScrollArea
+
+from core.memory import get_memory_registry, trim_caches
+from components.controls.media.players import (FluentImageLoader, FluentImageViewer,
+                                               FluentThumbnailDelegate, FluentThumbnailGallery,
+                                               FluentThumbnailModel, FluentTiledImageCanvas)
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _image_files(directory, count, width=200, height=150):
+    paths = []
+    for i in range(count):
+        image = QImage(width, height, QImage.Format.Format_RGB32)
+        image.fill(QColor.fromHsv(i * 40 % 360, 200, 200))
+        path = str(directory / f"image_{i}.png")
+        assert image.save(path)
+        paths.append(path)
+    return paths
+
+
+def _wait_until(app, predicate, timeout=5.0):
+    end = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > end:
+            raise AssertionError("timed out")
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def _drain(app, loader):
+    loader._pool.waitForDone(5000)
+    app.processEvents()
+
+
+def _canvas_with_pyramid(app, width=2048, height=1024):
+    canvas = FluentTiledImageCanvas()
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor("steelblue"))
+    canvas.setImage(image)
+    QThreadPool.globalInstance().waitForDone(5000)
+    app.processEvents()
+    return canvas
+
+
+class TestFluentTiledImageCanvas:
+    def test_pyramid_levels_halve_down_to_min_size(self, app_instance):
+        canvas = _canvas_with_pyramid(app_instance)
+        assert {level: image.width() for level, image in canvas._levels.items()} == {
+            0: 2048, 1: 1024, 2: 512, 3: 256}
+        assert canvas.hasImage()
+        assert canvas.imageSize() == QSize(2048, 1024)
+
+    def test_level_for_zoom_is_coarsest_sufficient(self, app_instance):
+        canvas = _canvas_with_pyramid(app_instance)
+        for zoom, level in ((2.0, 0), (1.0, 0), (0.5, 1), (0.3, 1), (0.25, 2), (0.1, 3)):
+            canvas.setZoom(zoom, fast=False)
+            assert canvas._level_for_zoom() == level, zoom
+
+    def test_paints_only_visible_tiles(self, app_instance):
+        canvas = _canvas_with_pyramid(app_instance)
+        scroll_area = QScrollArea()
+        scroll_area.setWidget(canvas)
+        scroll_area.setWidgetResizable(True)
+        scroll_area.resize(300, 300)
+        scroll_area.show()
+        canvas.setZoom(1.0, fast=False)
+        _wait_until(app_instance, lambda: canvas.cacheUsage() > 0)
+
+        tile_bytes = FluentTiledImageCanvas.TILE_SIZE ** 2 * 4
+        # 2048x1024 has 32 tiles at level 0; a 300 px viewport sees at most 4
+        assert 0 < canvas.cacheUsage() <= 4 * tile_bytes
+        assert {key[1] for key in canvas._tiles} == {0}
+
+        canvas.setCacheLimit(0)
+        assert len(canvas._tiles) == 1
+        scroll_area.close()
+
+    def test_memory_registry_trims_tiles_and_levels(self, app_instance):
+        canvas = _canvas_with_pyramid(app_instance)
+        canvas.resize(300, 300)
+        canvas.show()
+        _wait_until(app_instance, lambda: canvas.cacheUsage() > 0)
+        assert {"tiled_canvas.tiles", "tiled_canvas.levels"} <= set(get_memory_registry().names())
+
+        trim_caches()
+        assert canvas.cacheUsage() == 0
+        assert list(canvas._levels) == [0]
+        canvas.setZoom(0.1, fast=False)
+        assert canvas._level_for_zoom() == 0
+        canvas.close()
+
+    def test_preview_stands_in_at_matching_level(self, app_instance):
+        canvas = FluentTiledImageCanvas()
+        preview = QImage(512, 256, QImage.Format.Format_RGB32)
+        canvas.setPreview(preview, QSize(4096, 2048))
+        assert canvas.imageSize() == QSize(4096, 2048)
+        assert list(canvas._levels) == [3]
+        assert not canvas.hasImage()
+
+        canvas.setText("No image")
+        assert not canvas.imageSize().isValid()
+
+
+class TestFluentImageLoader:
+    def test_load_cancels_superseded_decodes(self, app_instance, tmp_path):
+        paths = _image_files(tmp_path, 4, 1600, 1200)
+        loader = FluentImageLoader()
+        decoded, ready = [], []
+        loader.decode_finished.connect(lambda path, _ms: decoded.append(path))
+        loader.image_ready.connect(lambda path, _image: ready.append(path))
+
+        for path in paths:
+            loader.load(path)
+        _drain(app_instance, loader)
+
+        assert ready == [paths[-1]]
+        assert decoded == [paths[-1]]
+        assert all(loader.cachedImage(path) is None for path in paths[:-1])
+
+    def test_load_keeps_prefetched_decodes(self, app_instance, tmp_path):
+        first, neighbour = _image_files(tmp_path, 2)
+        loader = FluentImageLoader()
+        loader.load(first)
+        loader.prefetch([neighbour])
+        loader.load(neighbour)
+        _drain(app_instance, loader)
+        assert loader.cachedImage(neighbour) is not None
+
+    def test_prefetched_image_loads_from_cache(self, app_instance, tmp_path):
+        paths = _image_files(tmp_path, 2)
+        loader = FluentImageLoader()
+        loader.prefetch(paths)
+        _drain(app_instance, loader)
+
+        ready = []
+        loader.image_ready.connect(lambda path, _image: ready.append(path))
+        loader.load(paths[1])
+        assert ready == [paths[1]]
+
+    def test_cache_evicts_least_recently_used(self, app_instance, tmp_path):
+        paths = _image_files(tmp_path, 3)
+        image_bytes = QImage(paths[0]).sizeInBytes()
+        loader = FluentImageLoader(cache_bytes=image_bytes * 2)
+        for path in paths:
+            loader.load(path)
+            _drain(app_instance, loader)
+
+        assert loader.cachedImage(paths[0]) is None
+        assert loader.cachedImage(paths[1]) is not None
+        assert loader.cachedImage(paths[2]) is not None
+
+    def test_memory_registry_trims_cache(self, app_instance, tmp_path):
+        paths = _image_files(tmp_path, 2)
+        loader = FluentImageLoader()
+        loader.prefetch(paths)
+        _drain(app_instance, loader)
+        assert "image_loader.images" in get_memory_registry().names()
+
+        trim_caches()
+        assert all(loader.cachedImage(path) is None for path in paths)
+        assert loader._cache_used == 0
+
+    def test_cancel_drops_current_load(self, app_instance, tmp_path):
+        path, = _image_files(tmp_path, 1)
+        loader = FluentImageLoader()
+        ready = []
+        loader.image_ready.connect(lambda path, _image: ready.append(path))
+        loader.load(path)
+        # The decode has run, but its result is still queued
+        loader._pool.waitForDone(5000)
+        loader.cancel()
+        app_instance.processEvents()
+        assert ready == []
+
+    def test_superseded_decodes_that_ran(self, app_instance, tmp_path):
+        first, second = _image_files(tmp_path, 2)
+        loader = FluentImageLoader()
+        ready = []
+        loader.image_ready.connect(lambda path, _image: ready.append(path))
+        # The pool has deleted the finished jobs before their results arrive
+        loader.load(first)
+        loader._pool.waitForDone(5000)
+        loader.load(second)
+        loader._pool.waitForDone(5000)
+        loader.prefetch([])
+        loader.loadThumbnail(first, QSize(32, 32))
+        loader._pool.waitForDone(5000)
+        loader.cancelThumbnails()
+        app_instance.processEvents()
+        assert ready == [second]
+
+
+class TestFluentImageViewer:
+    def test_sequence_browsing_prefetches_neighbours(self, app_instance, tmp_path):
+        paths = _image_files(tmp_path, 3)
+        viewer = FluentImageViewer()
+        shown = []
+        viewer.image_changed.connect(shown.append)
+
+        viewer.setImageSequence(paths)
+        _wait_until(app_instance, lambda: shown == paths[:1])
+        viewer.showNext()
+        _wait_until(app_instance, lambda: shown == paths[:2])
+        assert viewer.currentIndex() == 1
+        _drain(app_instance, viewer.loader)
+        assert viewer.loader.cachedImage(paths[2]) is not None
+
+        viewer.showNext()
+        viewer.showNext()
+        assert viewer.currentIndex() == 2
+        viewer.showPrevious()
+        assert viewer.currentIndex() == 1
+        assert viewer.image_canvas.imageSize() == QImage(paths[0]).size()
+
+
+def _cached_thumbnail(gallery, row):
+    key = gallery.model.index(row, 0).data(FluentThumbnailModel.ThumbnailKeyRole)
+    return gallery.delegate._cache.get(
+        FluentThumbnailDelegate._cache_key(key, gallery.getThumbnailSize()))
+
+
+class TestFluentThumbnailGallery:
+    def test_add_and_select_items(self, app_instance, tmp_path):
+        paths = _image_files(tmp_path, 3)
+        gallery = FluentThumbnailGallery()
+        gallery.addImagePaths(paths + [str(tmp_path / "missing.png")])
+        gallery.addItem("pixmap", QPixmap(20, 20))
+        assert gallery.itemCount() == 4
+
+        selected = []
+        gallery.item_selected.connect(selected.append)
+        gallery.setSelectedIndex(2)
+        gallery.setSelectedIndex(10)
+        assert gallery.selectedIndex() == 2
+        assert selected == [2]
+
+        gallery.clearItems()
+        assert gallery.itemCount() == 0
+        assert gallery.selectedIndex() == -1
+
+    def test_thumbnails_decode_in_background(self, app_instance, tmp_path):
+        paths = _image_files(tmp_path, 3, 600, 400)
+        broken = tmp_path / "broken.png"
+        broken.write_bytes(b"not an image")
+        gallery = FluentThumbnailGallery()
+        gallery.addImagePaths(paths + [str(broken)])
+        decoded = []
+        gallery.delegate._loader.thumbnail_ready.connect(
+            lambda path, _size, image: decoded.append((path, image.size())))
+
+        gallery.resize(800, 600)
+        gallery.show()
+        _wait_until(app_instance, lambda: len(decoded) == 3
+                    and gallery.delegate._failed_keys)
+        app_instance.processEvents()
+
+        assert sorted(path for path, _ in decoded) == paths
+        assert all(size == QSize(150, 100) for _, size in decoded)
+        for row in range(3):
+            assert _cached_thumbnail(gallery, row).size() == QSize(150, 100)
+
+        gallery.clearItems()
+        assert not gallery.delegate._failed_keys
+        gallery.close()
+
+    def test_visible_thumbnails_fit_the_cache(self, app_instance, tmp_path):
+        paths = _image_files(tmp_path, 80, 320, 320)
+        gallery = FluentThumbnailGallery()
+        gallery.addImagePaths(paths)
+        requested = []
+        loader = gallery.delegate._loader
+        loader.thumbnail_ready.connect(lambda path, size, _image: requested.append(path))
+
+        # More visible thumbnails than Qt's 10 MB pixmap cache holds
+        gallery.resize(3840, 2160)
+        gallery.setThumbnailSize(320, 320)
+        gallery.show()
+        _wait_until(app_instance, lambda: len(gallery.delegate._cache) >= 40
+                    and not gallery.delegate._pending)
+        assert gallery.delegate._cache_used > 10 * 1024 * 1024
+        decodes = len(requested)
+        for _ in range(20):
+            gallery.list_view.viewport().repaint()
+            _drain(app_instance, loader)
+        assert len(requested) == decodes
+        gallery.close()
+
+    def test_scrolling_cancels_hidden_decodes(self, app_instance, tmp_path):
+        paths = _image_files(tmp_path, 60)
+        gallery = FluentThumbnailGallery()
+        gallery.addImagePaths(paths)
+        gallery.resize(400, 300)
+        gallery.show()
+        _wait_until(app_instance, lambda: gallery.delegate._pending)
+        first = set(gallery.delegate._pending)
+
+        gallery.list_view.scrollToBottom()
+        gallery.list_view.viewport().repaint()
+        assert first <= set(gallery.delegate._pending)
+        gallery.delegate.cancelHidden(gallery.list_view)
+        assert first.isdisjoint(gallery.delegate._pending)
+        assert all(path != paths[0] for path, _, _ in gallery.delegate._loader._thumbnail_jobs.values())
+        gallery.close()
+
+    def test_memory_registry_trims_thumbnails(self, app_instance):
+        gallery = FluentThumbnailGallery()
+        pixmap = QPixmap(64, 64)
+        pixmap.fill(QColor("teal"))
+        for _ in range(3):
+            gallery.addItem("item", pixmap)
+        gallery.resize(800, 600)
+        gallery.show()
+        _wait_until(app_instance, lambda: gallery.delegate._cache)
+
+        trim_caches()
+        assert not gallery.delegate._cache
+        gallery.close()
+
+    def test_thumbnail_size_is_clamped_to_slider_range(self, app_instance):
+        gallery = FluentThumbnailGallery()
+        gallery.setThumbnailSize(80, 80)
+        assert gallery.getThumbnailSize() == QSize(80, 80)
+        assert gallery.size_slider.value() == 80
+        assert gallery.delegate.thumbnailSize() == QSize(80, 80)
+
+        gallery.setThumbnailSize(1000, 10)
+        expected = QSize(FluentThumbnailGallery.MAX_THUMBNAIL_SIZE,
+                         FluentThumbnailGallery.MIN_THUMBNAIL_SIZE)
+        assert gallery.getThumbnailSize() == expected
+        assert gallery.size_slider.value() == expected.width()
+
+        gallery.size_slider.setValue(200)
+        assert gallery.getThumbnailSize() == QSize(200, 200)
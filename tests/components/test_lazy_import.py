@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+import components.basic as basic
+import components.basic.visual as visual
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _loaded_modules(statement, **env):
+    code = f"{statement}; import sys; print(' '.join(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                            env=dict(os.environ, QT_QPA_PLATFORM="offscreen", **env),
+                            capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestLazyPackages:
+    def test_importing_a_module_skips_its_siblings(self):
+        modules = _loaded_modules("from components.basic.forms.button import FluentButton")
+
+        assert "components.basic.forms.button" in modules
+        assert "components.basic.forms.combobox" not in modules
+        assert "components.basic.display" not in modules
+        assert "components.data" not in modules
+
+    def test_eager_import_env(self):
+        # Eager import loads every package, the media players included
+        multimedia = subprocess.run([sys.executable, "-c", "import PySide6.QtMultimedia"],
+                                    capture_output=True)
+        if multimedia.returncode != 0:
+            pytest.skip("QtMultimedia is not available")
+        modules = _loaded_modules("import components.basic.visual", FLUENT_EAGER_IMPORT="1")
+
+        assert "components.basic.visual.avatar" in modules
+        assert "components.basic.visual.rating" in modules
+
+    def test_names_resolve_on_first_access(self, app_instance):
+        from components.basic.display.card import FluentCard
+        from components.basic.visual.rating import EnhancedFluentRating
+
+        assert basic.FluentCard is FluentCard
+        assert "FluentCard" in vars(basic)
+        assert basic.FluentRating is EnhancedFluentRating
+        assert visual.avatar.FluentAvatar is visual.FluentAvatar
+
+    def test_dir_lists_lazy_names(self):
+        names = dir(visual)
+
+        assert "FluentAvatar" in names
+        assert "EnhancedFluentRating" in names
+        assert "rating" in names
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            basic.FluentDoesNotExist
+        assert not hasattr(basic, "FluentDoesNotExist")
+
+    def test_library_names_still_exported(self, app_instance):
+        import components.composite.containers as containers
+        from core.enhanced_base import FluentPanel
+        from core.theme import theme_manager
+
+        assert containers.FluentPanel is FluentPanel
+        assert visual.theme_manager is theme_manager
+        assert "FluentPanel" in dir(containers)
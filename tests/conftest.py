@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from core.theme import ThemeMode, ThemeTransitionType, get_theme_manager
+from core.theme_precompile import CACHE_FILE_NAME, CACHE_PATH_ENV
+
+# Keep the style cache written by test runs out of the user cache directory
+_style_cache_dir = tempfile.mkdtemp(prefix="fluent-style-cache-")
+os.environ[CACHE_PATH_ENV] = os.path.join(_style_cache_dir, CACHE_FILE_NAME)
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_style_cache_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def instant_theme(app_instance):
+    """Theme manager with transitions off, restored after the test"""
+    theme = get_theme_manager()
+    mode = theme.get_theme_mode()
+    animation_enabled = theme._animation_enabled
+    theme.set_animation_enabled(False)
+    yield theme
+    theme.set_native_paint_enabled(False)
+    theme.set_theme_mode(mode)
+    theme.flush_theme_updates()
+    theme.set_animation_enabled(animation_enabled)
+
+
+@pytest.fixture
+def fading_theme(app_instance):
+    """Theme manager cross-fading windows in 40 ms, restored after the test"""
+    theme = get_theme_manager()
+    mode = theme.get_theme_mode()
+    animation_enabled = theme._animation_enabled
+    duration = theme._transition_duration
+    transition_type = theme._transition_type
+    theme.set_animation_enabled(True)
+    theme.set_transition_duration(40)
+    theme.set_transition_type(ThemeTransitionType.FADE)
+    yield theme
+    theme.set_transition_duration(duration)
+    theme.set_transition_type(transition_type)
+    theme.set_animation_enabled(False)
+    theme.set_theme_mode(mode)
+    theme.flush_theme_updates()
+    theme.set_animation_enabled(animation_enabled)
+    theme.save_settings()
+
+
+@pytest.fixture
+def other_mode():
+    """Get the light/dark mode opposite to a theme manager's current one"""
+    def other(theme):
+        return ThemeMode.DARK if theme.get_theme_mode() == ThemeMode.LIGHT else ThemeMode.LIGHT
+    return other
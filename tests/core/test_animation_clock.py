@@ -0,0 +1,162 @@
+import pytest
+from PySide6.QtCore import QAbstractAnimation
+from PySide6.QtWidgets import QApplication, QScrollArea, QVBoxLayout, QWidget
+
+from core.animation_clock import (FluentAnimationClock, FluentClockAnimation,
+                                  get_animation_clock, is_effectively_visible)
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def clock(app_instance):
+    clock = FluentAnimationClock()
+    clock.set_frame_interval(5)
+    yield clock
+    clock._timer.stop()
+
+
+@pytest.fixture
+def target(qtbot):
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    widget.show()
+    qtbot.waitUntil(lambda: is_effectively_visible(widget), timeout=1000)
+    return widget
+
+
+class TestFluentAnimationClock:
+    def test_idle_clock_does_not_tick(self, clock):
+        assert not clock.is_ticking()
+        assert clock.active_count() == 0
+
+    def test_repaints_each_target_once_per_frame(self, qtbot, clock, target):
+        progress = []
+        first = FluentClockAnimation(target, progress.append, duration=1000,
+                                     loop_count=-1, clock=clock)
+        second = FluentClockAnimation(target, progress.append, duration=1000,
+                                      loop_count=-1, clock=clock)
+        first.start()
+        second.start()
+        assert clock.is_ticking()
+        assert clock.active_count() == 2
+
+        qtbot.waitUntil(lambda: clock.frames >= 3, timeout=1000)
+        assert clock.updates == clock.frames
+        assert len(progress) >= 2 * clock.frames
+
+        first.stop()
+        second.stop()
+        qtbot.waitUntil(lambda: not clock.is_ticking(), timeout=1000)
+        assert clock.stats()["active_animations"] == 0
+
+    def test_finite_animation_finishes(self, qtbot, clock, target):
+        progress = []
+        finished = []
+        animation = FluentClockAnimation(target, progress.append, duration=30,
+                                         finished=lambda: finished.append(True),
+                                         clock=clock)
+        animation.start()
+
+        qtbot.waitUntil(lambda: bool(finished), timeout=1000)
+        assert progress[0] == 0.0
+        assert progress[-1] == 1.0
+        assert animation.state() == QAbstractAnimation.State.Stopped
+        qtbot.waitUntil(lambda: not clock.is_ticking(), timeout=1000)
+
+    def test_pause_and_resume(self, clock, target):
+        animation = FluentClockAnimation(target, lambda progress: None,
+                                         duration=1000, loop_count=-1, clock=clock)
+        animation.start()
+
+        animation.pause()
+        assert animation.state() == QAbstractAnimation.State.Paused
+        assert clock.active_count() == 0
+
+        animation.resume()
+        assert animation.state() == QAbstractAnimation.State.Running
+        assert clock.active_count() == 1
+        animation.stop()
+
+
+class TestPauseWhenInvisible:
+    def test_hidden_target_is_suspended_and_resumed(self, qtbot, clock, target):
+        progress = []
+        animation = FluentClockAnimation(target, progress.append, duration=1000,
+                                         loop_count=-1, clock=clock)
+        animation.start()
+
+        target.hide()
+        clock.check_visibility()
+        assert clock.suspended_count() == 1
+        assert animation.state() == QAbstractAnimation.State.Running
+        qtbot.waitUntil(lambda: not clock.is_ticking(), timeout=1000)
+        frames = len(progress)
+        qtbot.wait(50)
+        assert len(progress) == frames
+
+        target.show()
+        qtbot.waitUntil(lambda: is_effectively_visible(target), timeout=1000)
+        clock.check_visibility()
+        assert clock.suspended_count() == 0
+        qtbot.waitUntil(lambda: len(progress) > frames, timeout=1000)
+        animation.stop()
+        assert clock.active_count() == 0
+
+    def test_scrolled_off_widget_is_not_visible(self, qtbot, app_instance):
+        area = QScrollArea()
+        qtbot.addWidget(area)
+        content = QWidget()
+        layout = QVBoxLayout(content)
+        widgets = [QWidget() for _ in range(20)]
+        for widget in widgets:
+            widget.setFixedSize(100, 100)
+            layout.addWidget(widget)
+        area.setWidget(content)
+        area.resize(200, 150)
+        area.show()
+        qtbot.waitUntil(lambda: is_effectively_visible(area), timeout=1000)
+
+        assert is_effectively_visible(widgets[0])
+        assert not is_effectively_visible(widgets[-1])
+
+        area.verticalScrollBar().setValue(area.verticalScrollBar().maximum())
+        assert not is_effectively_visible(widgets[0])
+        assert is_effectively_visible(widgets[-1])
+
+    def test_animation_started_while_hidden_waits(self, qtbot, clock, app_instance):
+        widget = QWidget()
+        qtbot.addWidget(widget)
+        animation = FluentClockAnimation(widget, lambda progress: None, duration=1000,
+                                         loop_count=-1, clock=clock)
+
+        animation.start()
+
+        assert clock.suspended_count() == 1
+        assert not clock.is_ticking()
+        animation.stop()
+
+
+class TestClockDrivenWidgets:
+    def test_spinner_runs_on_shared_clock(self, qtbot, app_instance):
+        from components.basic.display.loading import FluentSpinner
+
+        clock = get_animation_clock()
+        spinner = FluentSpinner()
+        qtbot.addWidget(spinner)
+        spinner.show()
+        qtbot.waitUntil(lambda: is_effectively_visible(spinner), timeout=1000)
+        active = clock.active_count()
+
+        spinner.start()
+        assert clock.active_count() == active + 1
+        qtbot.waitUntil(lambda: spinner.getAngle() > 0, timeout=1000)
+
+        spinner.stop()
+        assert clock.active_count() == active
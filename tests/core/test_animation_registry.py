@@ -0,0 +1,101 @@
+import pytest
+from PySide6.QtCore import QAbstractAnimation, QEvent, QPointF, QRect
+from PySide6.QtGui import QEnterEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+from core.animation_registry import FluentAnimationRegistry, get_animation_registry
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def registry(app_instance):
+    return FluentAnimationRegistry()
+
+
+@pytest.fixture
+def widget(qtbot):
+    widget = QWidget()
+    widget.setGeometry(0, 0, 100, 40)
+    qtbot.addWidget(widget)
+    widget.show()
+    return widget
+
+
+def _delete(widget):
+    widget.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+class TestFluentAnimationRegistry:
+    def test_animate_retargets_one_animation(self, registry, widget):
+        first = registry.animate(widget, "geometry", QRect(0, 0, 120, 40), duration=1000)
+        second = registry.animate(widget, "geometry", QRect(0, 0, 80, 40), duration=1000)
+
+        assert first is second
+        assert second.endValue() == QRect(0, 0, 80, 40)
+        assert registry.count() == 1
+        assert registry.stats()["reused"] == 1
+        second.stop()
+
+    def test_hidden_owner_stops_animations(self, registry, widget):
+        animation = registry.animate(widget, "geometry", QRect(0, 0, 120, 40), duration=1000)
+
+        widget.hide()
+        registry.owner_hidden(widget)
+
+        assert animation.state() == QAbstractAnimation.State.Stopped
+        assert registry.stats()["stopped_on_hide"] == 1
+
+    def test_destroyed_owner_is_dropped(self, registry, app_instance):
+        widget = QWidget()
+        registry.animate(widget, "geometry", QRect(0, 0, 10, 10), duration=1000)
+        assert registry.count() == 1
+
+        _delete(widget)
+
+        assert registry.count() == 0
+        assert registry.stats()["owners"] == 0
+
+    def test_cap_evicts_idle_animations_first(self, registry, qtbot):
+        widgets = [QWidget() for _ in range(3)]
+        for widget in widgets:
+            qtbot.addWidget(widget)
+        running = registry.animate(widgets[0], "geometry", QRect(0, 0, 10, 10), duration=1000)
+        registry.property_animation(widgets[1], "geometry")
+        registry.set_max_animations(2)
+
+        registry.property_animation(widgets[2], "geometry")
+
+        assert registry.count() == 2
+        assert registry.stats()["evicted"] == 1
+        assert running.state() == QAbstractAnimation.State.Running
+        running.stop()
+
+
+class TestHoverAnimations:
+    def test_repeated_hover_reuses_breathing_animation(self, qtbot, app_instance):
+        from core.base import FluentBaseWidget
+
+        registry = get_animation_registry()
+        widget = FluentBaseWidget()
+        qtbot.addWidget(widget)
+        widget.show()
+        count = registry.count()
+
+        for _ in range(50):
+            widget.enterEvent(QEnterEvent(QPointF(1, 1), QPointF(1, 1), QPointF(1, 1)))
+            widget.leaveEvent(QEvent(QEvent.Type.Leave))
+
+        assert registry.count() == count + 1
+        assert registry.running_count() >= 1
+
+        widget.hide()
+        breathing = registry._owners[id(widget)]["breathing"]
+        assert breathing.state() == QAbstractAnimation.State.Stopped
@@ -0,0 +1,116 @@
+import pytest
+from PySide6.QtCore import QSize
+from PySide6.QtWidgets import QApplication, QLabel, QStackedWidget, QVBoxLayout, QWidget
+
+from core.deferred import FluentDeferredBuilder, FluentDeferredWidget
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class Counter:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text="", suffix=""):
+        self.calls.append((text, suffix))
+        return QLabel(text + suffix)
+
+
+@pytest.fixture
+def stack(app_instance):
+    stack = QStackedWidget()
+    for _ in range(2):
+        page = QWidget()
+        QVBoxLayout(page)
+        stack.addWidget(page)
+    yield stack
+    stack.close()
+    stack.deleteLater()
+
+
+class TestFluentDeferredWidget:
+    def test_built_on_first_show(self, stack):
+        factory = Counter()
+        placeholder = FluentDeferredWidget(factory, "hello", suffix="!")
+        stack.widget(1).layout().addWidget(placeholder)
+        stack.show()
+
+        assert not placeholder.isMaterialized()
+        assert factory.calls == []
+
+        stack.setCurrentIndex(1)
+
+        assert factory.calls == [("hello", "!")]
+        assert placeholder.widget().text() == "hello!"
+        assert placeholder.widget().isVisible()
+
+        stack.setCurrentIndex(0)
+        stack.setCurrentIndex(1)
+        assert len(factory.calls) == 1
+
+    def test_attribute_access_builds(self, app_instance):
+        placeholder = FluentDeferredWidget(Counter(), "text")
+
+        assert placeholder.text() == "text"
+        assert placeholder.isMaterialized()
+
+    def test_when_materialized(self, app_instance):
+        placeholder = FluentDeferredWidget(Counter(), "text")
+        seen = []
+        placeholder.whenMaterialized(seen.append)
+        placeholder.materialized.connect(seen.append)
+
+        assert seen == []
+        widget = placeholder.materialize()
+        placeholder.whenMaterialized(seen.append)
+        assert seen == [widget, widget, widget]
+
+    def test_placeholder_size(self, app_instance):
+        placeholder = FluentDeferredWidget(Counter(), placeholder_size=QSize(200, 120))
+
+        assert placeholder.sizeHint() == QSize(200, 120)
+        placeholder.materialize()
+        assert placeholder.sizeHint() != QSize(200, 120)
+
+    def test_private_names_are_not_forwarded(self, app_instance):
+        placeholder = FluentDeferredWidget(Counter())
+
+        with pytest.raises(AttributeError):
+            placeholder._missing
+        assert not placeholder.isMaterialized()
+
+
+class TestFluentDeferredBuilder:
+    def test_builds_queue_when_idle(self, app_instance):
+        builder = FluentDeferredBuilder()
+        placeholders = [FluentDeferredWidget(Counter(), str(i)) for i in range(3)]
+        for placeholder in placeholders:
+            builder.schedule(placeholder)
+        placeholders[1].materialize()
+
+        assert builder.pending_count() == 2
+        while builder.pending_count():
+            app_instance.processEvents()
+
+        assert all(placeholder.isMaterialized() for placeholder in placeholders)
+        assert builder.built_count == 2
+
+    def test_flush_skips_deleted_placeholders(self, app_instance):
+        builder = FluentDeferredBuilder()
+        parent = QWidget()
+        kept = FluentDeferredWidget(Counter())
+        deleted = FluentDeferredWidget(Counter(), parent=parent)
+        builder.schedule(kept)
+        builder.schedule(deleted)
+        parent.close()
+        del parent
+        builder.flush()
+
+        assert kept.isMaterialized()
+        assert builder.built_count == 1
@@ -0,0 +1,143 @@
+import time
+
+import pytest
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QApplication, QWidget
+
+from core.base import FluentBaseWidget
+from core.instrumentation import FluentInstrumentation, FluentInstrumentationOverlay
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class Emitter(QObject):
+    changed = Signal(str)
+
+
+class PaintingWidget(FluentBaseWidget):
+    delay = 0.0
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        time.sleep(self.delay)
+
+
+@pytest.fixture
+def instrumentation(app_instance):
+    instrumentation = FluentInstrumentation()
+    yield instrumentation
+    instrumentation.disable()
+
+
+def _process_for(app, seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        app.processEvents()
+
+
+class TestFluentInstrumentation:
+    def test_disabled_installs_nothing(self, instrumentation):
+        original = PaintingWidget.__dict__["paintEvent"]
+        instrumentation.enable()
+        assert PaintingWidget.__dict__["paintEvent"] is not original
+        assert "paintEvent" in FluentBaseWidget.__dict__
+
+        instrumentation.disable()
+        assert PaintingWidget.__dict__["paintEvent"] is original
+        assert "paintEvent" not in FluentBaseWidget.__dict__
+        assert "resizeEvent" not in FluentBaseWidget.__dict__
+
+    def test_paint_and_resize_per_class_and_instance(self, app_instance, instrumentation):
+        instrumentation.enable()
+        widget = PaintingWidget()
+        widget.resize(120, 80)
+        widget.show()
+        _process_for(app_instance, 0.05)
+
+        stats = instrumentation.class_stats()["PaintingWidget"]
+        # super().paintEvent() is counted once
+        assert stats["paint"]["count"] == instrumentation.instance_stats(widget)["paint"]["count"]
+        assert stats["paint"]["count"] >= 1
+        assert stats["resize"]["count"] >= 1
+        assert instrumentation.slowest_instances("paint")[0][0] is widget
+        widget.close()
+
+    def test_classes_defined_while_enabled(self, app_instance, instrumentation):
+        instrumentation.enable()
+
+        class LateWidget(FluentBaseWidget):
+            def _on_theme_changed(self):
+                super()._on_theme_changed()
+
+        widget = LateWidget()
+        widget._on_theme_changed()
+
+        assert instrumentation.class_stats("theme")["LateWidget"]["theme"]["count"] == 1
+        instrumentation.disable()
+        widget._on_theme_changed()
+        assert instrumentation.class_stats("theme")["LateWidget"]["theme"]["count"] == 1
+
+    def test_slots_keep_their_arguments(self, app_instance, instrumentation):
+        instrumentation.enable()
+        emitter = Emitter()
+        widget = PaintingWidget()
+        emitter.changed.connect(widget._on_theme_changed)
+        emitter.changed.emit("dark")
+        instrumentation.disable()
+        # Connected to the wrapper, called by name on the restored handler
+        emitter.changed.emit("light")
+
+        assert instrumentation.instance_stats(widget)["theme"]["count"] == 1
+
+    def test_stall_names_handler(self, app_instance, instrumentation):
+        stalls = []
+        instrumentation.stall_detected.connect(stalls.append)
+        instrumentation.enable(stall_threshold_ms=50)
+        widget = PaintingWidget()
+        widget.show()
+        _process_for(app_instance, 0.1)
+
+        widget.delay = 0.25
+        widget.repaint()
+        widget.delay = 0.0
+        _process_for(app_instance, 0.1)
+
+        assert stalls and stalls == instrumentation.stalls()
+        stall = stalls[-1]
+        assert stall.duration_ms > 50
+        assert stall.handler == "PaintingWidget.paint"
+        assert "paintEvent" in stall.stack
+        widget.close()
+
+    def test_reset(self, app_instance, instrumentation):
+        instrumentation.enable()
+        widget = PaintingWidget()
+        widget.show()
+        _process_for(app_instance, 0.05)
+        instrumentation.reset()
+
+        assert instrumentation.class_stats() == {}
+        assert instrumentation.stats()["events"] == 0
+        widget.close()
+
+
+class TestFluentInstrumentationOverlay:
+    def test_lists_busiest_classes(self, app_instance, instrumentation):
+        instrumentation.enable()
+        window = QWidget()
+        window.resize(600, 400)
+        overlay = FluentInstrumentationOverlay(window, instrumentation)
+        widget = PaintingWidget(window)
+        window.show()
+        _process_for(app_instance, 0.05)
+        overlay.refresh()
+
+        assert any(line.startswith("PaintingWidget") for line in overlay.lines())
+        assert overlay.x() + overlay.width() <= window.width()
+        window.close()
@@ -0,0 +1,127 @@
+import gc
+
+import pytest
+from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtWidgets import QApplication
+
+from core.memory import (PRIORITY_EXPENSIVE, FluentMemoryRegistry, estimate_bytes,
+                         pixmap_bytes)
+from core.shadow import FluentShadowRenderer
+from core.theme_precompile import ThemeStyleCache
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class FakeCache:
+    def __init__(self, sizes):
+        self.sizes = list(sizes)
+
+    def count(self):
+        return len(self.sizes)
+
+    def size(self):
+        return sum(self.sizes)
+
+    def trim(self, target_bytes):
+        while self.sizes and self.size() > target_bytes:
+            self.sizes.pop(0)
+
+
+def _register(registry, name, cache, **kwargs):
+    registry.register(name, cache.count, cache.size, cache.trim, **kwargs)
+
+
+class TestFluentMemoryRegistry:
+    def test_report_groups_instances(self, app_instance):
+        registry = FluentMemoryRegistry()
+        first, second = FakeCache([10, 20]), FakeCache([5])
+        registry.register("widget.cache", FakeCache.count, FakeCache.size, owner=first)
+        registry.register("widget.cache", FakeCache.count, FakeCache.size, owner=second)
+        _register(registry, "shared", FakeCache([100]))
+
+        report = registry.report()
+        assert list(report) == ["shared", "widget.cache"]
+        assert report["widget.cache"] == {"entries": 3, "bytes": 35, "instances": 2,
+                                          "trimmable": False}
+        assert registry.total_bytes() == 135
+
+        del first
+        gc.collect()
+        assert registry.report()["widget.cache"]["instances"] == 1
+
+    def test_budget_trims_cheap_caches_first(self, app_instance):
+        registry = FluentMemoryRegistry()
+        pixmaps = FakeCache([400, 400])
+        styles = FakeCache([100, 100, 100])
+        _register(registry, "pixmaps", pixmaps, priority=PRIORITY_EXPENSIVE)
+        _register(registry, "styles", styles)
+        trimmed = []
+        registry.trimmed.connect(trimmed.append)
+
+        registry.set_budget(1000)
+        assert styles.sizes == [100, 100]
+        assert pixmaps.sizes == [400, 400]
+
+        pixmaps.sizes.append(400)
+        registry.cache_grew()
+        assert len(pixmaps.sizes) == 3
+        app_instance.processEvents()
+        # Styles are emptied before the expensive pixmaps are touched
+        assert styles.sizes == []
+        assert pixmaps.sizes == [400, 400]
+        assert trimmed == [100, 600]
+
+    def test_trim_empties_trimmable_caches(self, app_instance):
+        registry = FluentMemoryRegistry()
+        trimmable, reported = FakeCache([10, 20, 30]), FakeCache([50])
+        _register(registry, "trimmable", trimmable)
+        registry.register("reported", reported.count, reported.size)
+
+        assert registry.trim(0.5) == 30
+        assert trimmable.sizes == [30]
+        assert registry.trim() == 30
+        assert registry.total_bytes() == 50
+        assert registry.stats()["bytes_freed"] == 60
+
+    def test_byte_estimates(self, app_instance):
+        pixmap = QPixmap(10, 20)
+        assert pixmap_bytes(pixmap) == 10 * 20 * pixmap.depth() // 8
+        assert pixmap_bytes(QPixmap()) == 0
+        assert estimate_bytes({"key": pixmap}) > pixmap_bytes(pixmap)
+
+
+class TestCacheTrimming:
+    def test_shadow_renderer(self, app_instance):
+        renderer = FluentShadowRenderer()
+        renderer.nine_patch(8, 16, QColor(0, 0, 0, 80))
+        oldest = renderer.bytes_used()
+        for blur in (4, 8):
+            renderer.nine_patch(8, blur, QColor(0, 0, 0, 80))
+
+        # Least recently used first
+        renderer.trim(renderer.bytes_used() - oldest)
+        assert renderer.count() == 2
+        renderer.trim(0)
+        assert renderer.count() == 0
+
+    def test_theme_style_cache_keeps_trimmed_variants_on_disk(self, app_instance, tmp_path):
+        path = str(tmp_path / "styles.json")
+        cache = ThemeStyleCache(path, "hash")
+        cache.set_style("light", "button", "QPushButton {}")
+        cache.set_style("dark", "button", "QPushButton { color: white; }")
+        cache.save()
+
+        cache.trim(0, keep="dark")
+        assert cache.count() == 1
+        cache.set_style("dark", "card", "QFrame {}")
+        cache.save()
+
+        reloaded = ThemeStyleCache(path, "hash")
+        assert reloaded.get_style("light", "button") == "QPushButton {}"
+        assert reloaded.get_style("dark", "card") == "QFrame {}"
@@ -0,0 +1,77 @@
+import pytest
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QApplication, QWidget
+
+from core.native_paint import apply_native_palette, is_native_paint_active
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class TestThemePalette:
+    def test_palette_follows_tokens(self, instant_theme):
+        palette = instant_theme.palette()
+        tokens = instant_theme.tokens()
+
+        assert palette.color(QPalette.ColorRole.Window) == tokens.color("background")
+        assert palette.color(QPalette.ColorRole.Base) == tokens.color("surface")
+        assert palette.color(QPalette.ColorRole.Highlight) == tokens.color("primary")
+        assert palette.color(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text) == \
+            tokens.color("text_disabled")
+        assert instant_theme.palette() is palette
+
+    def test_palette_rebuilt_on_theme_change(self, instant_theme, other_mode):
+        palette = instant_theme.palette()
+
+        instant_theme.set_theme_mode(other_mode(instant_theme))
+
+        assert instant_theme.palette() is not palette
+        assert instant_theme.palette().color(QPalette.ColorRole.Window) == \
+            instant_theme.get_color("background")
+
+
+class TestNativePaintMode:
+    def test_switching_notifies_once(self, instant_theme):
+        changes = []
+        instant_theme.theme_changed.connect(changes.append)
+        version = instant_theme.get_theme_version()
+        try:
+            instant_theme.set_native_paint_enabled(True)
+            instant_theme.set_native_paint_enabled(True)
+        finally:
+            instant_theme.theme_changed.disconnect(changes.append)
+
+        assert is_native_paint_active()
+        assert len(changes) == 1
+        assert instant_theme.get_theme_version() == version + 1
+
+    def test_apply_native_palette(self, qtbot, instant_theme):
+        widget = QWidget()
+        qtbot.addWidget(widget)
+        widget.setStyleSheet("QWidget { background: red; }")
+
+        apply_native_palette(widget)
+
+        assert widget.styleSheet() == ""
+        assert widget.palette().color(QPalette.ColorRole.Window) == \
+            instant_theme.get_color("background")
+
+    def test_progress_bar_drops_stylesheet(self, qtbot, instant_theme):
+        from components.basic.display.progress import FluentProgressBar
+
+        bar = FluentProgressBar()
+        qtbot.addWidget(bar)
+        assert bar.styleSheet()
+
+        instant_theme.set_native_paint_enabled(True)
+        assert bar.styleSheet() == ""
+        assert bar.palette().color(QPalette.ColorRole.Highlight) == \
+            instant_theme.get_color("primary")
+
+        instant_theme.set_native_paint_enabled(False)
+        assert bar.styleSheet()
@@ -0,0 +1,175 @@
+import pytest
+from PySide6.QtCore import QAbstractAnimation, QByteArray, QPoint, QPropertyAnimation
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QApplication, QGraphicsDropShadowEffect, QWidget
+
+from core.animation import FluentAnimation
+from core.animation_registry import get_animation_registry
+from core.performance_profile import (DISABLED_PROPERTY, FluentPerformanceProfile,
+                                      PerformanceProfile, detect_profile,
+                                      get_performance_profile, parse_profile, profile_effect)
+from core.shadow import FluentShadowWidget
+from core.theme import theme_manager
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def profile(app_instance):
+    profile = get_performance_profile()
+    profile.set_profile(PerformanceProfile.HIGH)
+    yield profile
+    profile.set_profile(PerformanceProfile.HIGH)
+
+
+@pytest.fixture
+def local_machine(monkeypatch):
+    for name in ("FLUENT_PERFORMANCE_PROFILE", "LOW_PERFORMANCE_MODE", "SESSIONNAME",
+                 "XRDP_SESSION", "SSH_CONNECTION"):
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+def _animation(parent, duration):
+    animation = QPropertyAnimation(parent, QByteArray(b"pos"), parent)
+    animation.setDuration(duration)
+    animation.setEndValue(QPoint(10, 10))
+    return animation
+
+
+class TestDetection:
+    def test_environment_overrides(self, app_instance, local_machine):
+        local_machine.setenv("FLUENT_PERFORMANCE_PROFILE", "reduced-motion")
+        assert detect_profile(benchmark=False).profile == PerformanceProfile.REDUCED_MOTION
+
+        local_machine.setenv("FLUENT_PERFORMANCE_PROFILE", "fastest")
+        local_machine.setenv("LOW_PERFORMANCE_MODE", "1")
+        assert detect_profile(benchmark=False).profile == PerformanceProfile.LOW
+
+        local_machine.delenv("LOW_PERFORMANCE_MODE")
+        local_machine.setenv("SESSIONNAME", "RDP-Tcp#3")
+        detection = detect_profile(benchmark=False)
+        assert detection.profile == PerformanceProfile.LOW
+        assert "RDP-Tcp#3" in detection.reasons[0]
+
+    def test_cpu_count(self, app_instance, local_machine):
+        for cpus, expected in ((2, PerformanceProfile.LOW), (4, PerformanceProfile.BALANCED),
+                               (16, PerformanceProfile.HIGH)):
+            local_machine.setattr("os.cpu_count", lambda: cpus)
+            assert detect_profile(benchmark=False).profile == expected
+
+    def test_profile_defaults_without_detection(self, app_instance, local_machine):
+        local_machine.setattr("os.cpu_count", lambda: 1)
+        profile = FluentPerformanceProfile()
+        assert profile.profile() == PerformanceProfile.HIGH
+        assert profile.detection() is None
+
+        assert profile.detect() == PerformanceProfile.LOW
+        assert profile.profile() == PerformanceProfile.HIGH
+        assert profile.switches == 1
+
+        local_machine.setenv("LOW_PERFORMANCE_MODE", "1")
+        assert FluentPerformanceProfile().profile() == PerformanceProfile.LOW
+
+    def test_parse_profile(self):
+        assert parse_profile("Balanced") == PerformanceProfile.BALANCED
+        with pytest.raises(ValueError):
+            parse_profile("fastest")
+
+
+class TestFluentPerformanceProfile:
+    def test_switch_emits_once(self, profile):
+        changes = []
+        profile.profile_changed.connect(changes.append)
+        profile.set_profile("low")
+        profile.set_profile(PerformanceProfile.LOW)
+        assert changes == [PerformanceProfile.LOW]
+        assert not profile.animations_enabled() and not profile.antialiasing()
+        assert profile.stats()["profile"] == "low"
+
+    def test_scale_duration(self, profile):
+        assert profile.scale_duration(200) == 200
+        profile.set_profile(PerformanceProfile.BALANCED)
+        assert profile.scale_duration(200) == 150
+        assert profile.scale_duration(0) == 0
+        profile.set_profile(PerformanceProfile.REDUCED_MOTION)
+        # At least 1 ms, so finished is still emitted after start() returns
+        assert profile.scale_duration(200) == 1
+
+    def test_library_animations_scaled(self, profile):
+        widget = QWidget()
+        profile.set_profile(PerformanceProfile.BALANCED)
+        assert FluentAnimation.fade_in(widget, 200).duration() == 150
+        assert get_animation_registry().animate(widget, "pos", QPoint(5, 5), 400).duration() == 300
+        get_animation_registry().release(widget)
+
+        # Qt animations the library did not create keep their durations
+        animation = _animation(widget, 200)
+        animation.start()
+        assert animation.duration() == 200
+        assert animation.state() == QAbstractAnimation.State.Running
+        animation.stop()
+
+    def test_effects_follow_profile(self, profile):
+        widget = QWidget()
+        widget.setGraphicsEffect(profile_effect(QGraphicsDropShadowEffect(widget)))
+        other = QWidget()
+        other.setGraphicsEffect(QGraphicsDropShadowEffect(other))
+        profile.set_profile(PerformanceProfile.BALANCED)
+        assert not widget.graphicsEffect().isEnabled()
+        assert widget.graphicsEffect().property(DISABLED_PROPERTY)
+        assert other.graphicsEffect().isEnabled()
+
+        profile.set_profile(PerformanceProfile.HIGH)
+        assert widget.graphicsEffect().isEnabled()
+
+    def test_render_hints_left_to_components(self, profile):
+        profile.set_profile(PerformanceProfile.LOW)
+        image = QImage(8, 8, QImage.Format.Format_ARGB32_Premultiplied)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        assert painter.testRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, profile.antialiasing())
+        assert not painter.testRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.end()
+
+    def test_effect_disabled_by_its_owner_stays_disabled(self, profile):
+        effect = QGraphicsDropShadowEffect()
+        effect.setEnabled(False)
+        profile.set_profile(PerformanceProfile.LOW)
+        profile_effect(effect)
+        profile.set_profile(PerformanceProfile.HIGH)
+        profile_effect(effect)
+        assert not effect.isEnabled()
+
+    def test_cached_shadows_follow_profile(self, profile):
+        parent = QWidget()
+        target = QWidget(parent)
+        target.setGeometry(20, 20, 60, 40)
+        shadow = FluentShadowWidget(target, 4)
+        parent.show()
+        shadow.sync()
+        assert shadow.isVisible()
+
+        profile.set_profile(PerformanceProfile.LOW)
+        assert not shadow.isVisible()
+        profile.set_profile(PerformanceProfile.HIGH)
+        assert shadow.isVisible()
+        parent.close()
+
+    def test_theme_transitions_follow_profile(self, profile):
+        enabled = theme_manager._animation_enabled
+        theme_manager.set_animation_enabled(True)
+        try:
+            assert theme_manager.transitions_enabled()
+            profile.set_profile(PerformanceProfile.REDUCED_MOTION)
+            assert not theme_manager.transitions_enabled()
+            assert theme_manager._animation_enabled
+        finally:
+            theme_manager.set_animation_enabled(enabled)
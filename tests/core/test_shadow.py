@@ -0,0 +1,120 @@
+import pytest
+from PySide6.QtCore import QPointF, QRect
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtWidgets import QApplication, QLabel, QSplitter, QWidget
+
+from core.shadow import FluentShadowRenderer, FluentShadowWidget, shadow_margins
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def renderer(app_instance):
+    return FluentShadowRenderer()
+
+
+def _paint(renderer, size=200, blur=8):
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    painter = QPainter(image)
+    renderer.paint(painter, QRect(40, 40, size - 80, size - 80), 8, blur,
+                   QColor(0, 0, 0, 80), QPointF(0, 4))
+    painter.end()
+    return image
+
+
+class TestFluentShadowRenderer:
+    def test_pixmap_rendered_once_per_shadow(self, renderer):
+        for size in (120, 200, 300):
+            _paint(renderer, size)
+
+        assert renderer.count() == 1
+        assert renderer.stats()["misses"] == 1
+        assert renderer.stats()["hits"] == 2
+
+        _paint(renderer, blur=12)
+        assert renderer.count() == 2
+
+    def test_shadow_fades_out_past_the_rect(self, renderer):
+        image = _paint(renderer)
+
+        inside = image.pixelColor(100, 100).alpha()
+        edge = image.pixelColor(100, 164).alpha()
+        outside = image.pixelColor(100, 190).alpha()
+        assert inside > edge > outside
+        assert outside == 0
+        assert image.pixelColor(5, 5).alpha() == 0
+
+    def test_cap_evicts_least_recently_used(self, renderer):
+        renderer.set_max_entries(2)
+        for blur in (2, 4, 6):
+            _paint(renderer, blur=blur)
+
+        assert renderer.count() == 2
+        assert renderer.stats()["evictions"] == 1
+
+    def test_margins_follow_offset(self):
+        margins = shadow_margins(6.5, QPointF(0, 3))
+        assert (margins.left(), margins.top(), margins.right(), margins.bottom()) == (7, 4, 7, 10)
+
+
+class TestFluentShadowWidget:
+    def test_follows_target(self, qtbot, app_instance):
+        parent = QWidget()
+        qtbot.addWidget(parent)
+        parent.resize(300, 300)
+        target = QWidget(parent)
+        shadow = FluentShadowWidget(target, 8)
+        shadow.setBlurRadius(6)
+        shadow.setOffset(0, 2)
+        target.setGeometry(50, 50, 100, 60)
+        parent.show()
+        shadow.sync()
+
+        assert shadow.parentWidget() is parent
+        assert shadow.isVisible()
+        assert shadow.geometry() == QRect(44, 46, 112, 72)
+
+        target.hide()
+        shadow.sync()
+        assert not shadow.isVisible()
+
+    def test_card_uses_theme_elevation_shadow(self, qtbot, app_instance):
+        from components.basic.display.card import FluentCard
+        from core.theme import theme_manager
+
+        parent = QWidget()
+        qtbot.addWidget(parent)
+        card = FluentCard(parent)
+        card.setGeometry(20, 20, 200, 120)
+        parent.show()
+
+        blur, offset_y, color = theme_manager.get_elevation_shadow(card._current_elevation)
+        assert card._shadow.isVisible()
+        assert card._shadow.blurRadius() == blur
+        assert card._shadow.yOffset() == offset_y
+        assert card._shadow.color() == color
+        assert card._shadow.parentWidget() is parent
+
+    def test_no_shadow_pane_in_splitter(self, qtbot, app_instance):
+        from components.basic.display.card import FluentCard
+
+        splitter = QSplitter()
+        qtbot.addWidget(splitter)
+        card = FluentCard()
+        splitter.addWidget(card)
+        splitter.addWidget(QLabel("pane"))
+        splitter.resize(400, 200)
+        splitter.show()
+        card._shadow.sync()
+
+        assert splitter.count() == 2
+        assert [type(splitter.widget(i)).__name__ for i in range(2)] == ["FluentCard", "QLabel"]
+        assert card._shadow.parentWidget() is not splitter
+        assert not card._shadow.isVisible()
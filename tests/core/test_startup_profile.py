@@ -0,0 +1,147 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+from PySide6.QtWidgets import QApplication, QWidget
+
+from core.startup_profile import (StartupProfiler, compare_reports, folded_stacks,
+                                  load_report, startup_phase, write_report)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class Panel(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._setup_ui()
+        self._setup_animations()
+
+    def _setup_ui(self):
+        self.child = Badge(self)
+
+    def _setup_animations(self):
+        pass
+
+
+class Badge(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+
+class WidePanel(Panel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+
+class TestStartupProfiler:
+    def test_phase_is_a_no_op_without_profiler(self):
+        with startup_phase("theme:test"):
+            pass
+
+    def test_nested_frames_split_self_time(self):
+        profiler = StartupProfiler()
+        with profiler.phase("import:outer"):
+            time.sleep(0.01)
+            with profiler.phase("theme:inner"):
+                time.sleep(0.01)
+        report = profiler.finish()
+
+        outer = report["frames"]["import:outer"]
+        inner = report["frames"]["theme:inner"]
+        assert outer["total_ms"] >= outer["self_ms"] + inner["total_ms"] - 0.01
+        assert set(report["stacks"]) == {"import:outer", "import:outer;theme:inner"}
+        assert report["phases"]["theme"] == pytest.approx(inner["self_ms"])
+        assert report["accounted_ms"] <= report["total_ms"]
+
+    def test_construction_timed_per_class(self, app_instance):
+        profiler = StartupProfiler()
+        profiler.instrument_class(Panel)
+        profiler.instrument_class(Badge)
+        profiler.instrument_class(WidePanel)
+        Panel()
+        WidePanel()
+        report = profiler.finish()
+
+        # super().__init__() chains count once, under the constructed class
+        assert report["classes"]["Panel"]["count"] == 1
+        assert report["classes"]["WidePanel"]["count"] == 1
+        assert report["classes"]["Badge"]["count"] == 2
+        assert "construct:WidePanel;setup:Panel._setup_ui;construct:Badge" in report["stacks"]
+        assert "animations:Panel._setup_animations" in report["frames"]
+
+    def test_finished_profiler_stops_recording(self, app_instance):
+        profiler = StartupProfiler()
+        profiler.finish()
+
+        with profiler.phase("import:late"):
+            pass
+        assert "import:late" not in profiler.report()["frames"]
+
+    def test_report_files(self, tmp_path):
+        profiler = StartupProfiler()
+        with profiler.phase("import:module"):
+            time.sleep(0.002)
+        report = profiler.finish()
+        path = str(tmp_path / "startup.json")
+        write_report(report, path)
+
+        assert load_report(path)["frames"] == report["frames"]
+        with open(tmp_path / "startup.folded") as file:
+            folded = file.read()
+        assert folded == folded_stacks(report)
+        assert folded.splitlines()[0].startswith("import:module ")
+
+
+class TestCompareReports:
+    @staticmethod
+    def _report(total, phases, classes):
+        return {"total_ms": total, "phases": phases,
+                "classes": {name: {"mean_ms": ms} for name, ms in classes.items()}}
+
+    def test_regressions(self):
+        old = self._report(100.0, {"import": 60.0, "theme": 5.0}, {"FluentButton": 1.0})
+        new = self._report(130.0, {"import": 62.0, "theme": 5.5}, {"FluentButton": 3.0,
+                                                                   "FluentCard": 0.5})
+        deltas = {(delta.section, delta.name): delta for delta in compare_reports(old, new)}
+
+        assert deltas["total", "startup"].regression
+        assert not deltas["phases", "import"].regression  # under 10%
+        assert not deltas["phases", "theme"].regression  # under 1 ms
+        assert deltas["classes", "FluentButton"].regression
+        assert deltas["classes", "FluentCard"].old_ms is None
+        assert not deltas["classes", "FluentCard"].regression
+
+    def test_faster_is_not_a_regression(self):
+        old = self._report(100.0, {"import": 60.0}, {})
+        new = self._report(50.0, {"import": 20.0}, {})
+
+        assert not any(delta.regression for delta in compare_reports(old, new))
+
+
+def test_profile_from_environment(tmp_path):
+    path = tmp_path / "startup.json"
+    code = ("from PySide6.QtWidgets import QApplication\n"
+            "from components.basic.forms.button import FluentButton\n"
+            "app = QApplication([])\n"
+            "buttons = [FluentButton('ok') for _ in range(3)]\n")
+    subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, check=True,
+                   env=dict(os.environ, QT_QPA_PLATFORM="offscreen",
+                            FLUENT_STARTUP_PROFILE=str(path)))
+
+    with open(path) as file:
+        report = json.load(file)
+    assert "import:components.basic.forms.button" in report["frames"]
+    assert "theme:FluentTheme()" in report["frames"]
+    assert report["classes"]["FluentButton"]["count"] == 3
+    assert (tmp_path / "startup.folded").exists()
@@ -0,0 +1,76 @@
+import sys
+
+import pytest
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+from core.style_cache import FluentStyleCache, get_style_cache
+from core.theme import get_theme_manager
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class TestFluentStyleCache:
+    def test_generates_once_and_counts(self, app_instance):
+        cache = FluentStyleCache()
+        calls = []
+
+        def generate():
+            calls.append(1)
+            return "QWidget { color: red; }"
+
+        assert cache.get("test:widget", generate) == "QWidget { color: red; }"
+        assert cache.get("test:widget", generate) == "QWidget { color: red; }"
+        assert len(calls) == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_interns_keys(self, app_instance):
+        cache = FluentStyleCache()
+        key = "".join(["test:", "interned"])
+        cache.get(key, lambda: "")
+        assert any(stored is sys.intern(key) for stored in cache._entries)
+
+    def test_evicts_least_recently_used(self, app_instance):
+        cache = FluentStyleCache(max_entries=2)
+        cache.get("a", lambda: "a")
+        cache.get("b", lambda: "b")
+        cache.get("a", lambda: "a")
+        cache.get("c", lambda: "c")
+
+        assert cache.count() == 2
+        assert cache.evictions == 1
+        misses = cache.misses
+        cache.get("a", lambda: "a")
+        assert cache.misses == misses
+
+    def test_invalidates_prefix(self, app_instance):
+        cache = FluentStyleCache()
+        cache.get("combobox:list", lambda: "")
+        cache.get("table:grid", lambda: "")
+        cache.invalidate("combobox:")
+        assert cache.count() == 1
+
+    def test_drops_entries_when_theme_version_changes(self, app_instance):
+        theme = get_theme_manager()
+        cache = FluentStyleCache()
+        cache.get("test:color", lambda: theme.get_color("primary").name())
+        version = theme.get_theme_version()
+
+        theme.set_custom_color("test_brand", QColor("#123456"))
+
+        assert theme.get_theme_version() > version
+        calls = []
+        cache.get("test:color", lambda: calls.append(1) or "")
+        assert calls == [1]
+        assert cache.count() == 1
+
+    def test_global_instance(self, app_instance):
+        assert get_style_cache() is get_style_cache()
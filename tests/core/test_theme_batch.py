@@ -0,0 +1,106 @@
+import pytest
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+from core.theme_integration import ThemeAwareWidget
+from core.theme_transition import ThemeCrossFadeOverlay
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class CountingWidget(ThemeAwareWidget):
+    def __init__(self, parent=None):
+        self.applied = 0
+        super().__init__(parent)
+
+    def _apply_theme_styles(self):
+        self.applied += 1
+
+
+class TestThemeBatch:
+    def test_batch_emits_one_versioned_notification(self, app_instance, instant_theme):
+        emitted = []
+        instant_theme.theme_changed.connect(emitted.append)
+        version = instant_theme.get_theme_version()
+        try:
+            with instant_theme.batch():
+                for i in range(20):
+                    instant_theme.set_custom_color(f"brand_{i}", QColor(i, 0, 0))
+                    assert instant_theme.get_color(f"brand_{i}") == QColor(i, 0, 0)
+                assert emitted == []
+                assert instant_theme.is_batching()
+        finally:
+            instant_theme.theme_changed.disconnect(emitted.append)
+
+        assert len(emitted) == 1
+        assert instant_theme.get_theme_version() == version + 1
+
+    def test_nested_batches_commit_once(self, app_instance, instant_theme, other_mode):
+        modes = []
+        instant_theme.mode_changed.connect(modes.append)
+        version = instant_theme.get_theme_version()
+        target = other_mode(instant_theme)
+        try:
+            with instant_theme.batch():
+                with instant_theme.batch():
+                    instant_theme.set_theme_mode(target)
+                instant_theme.set_custom_color("brand_nested", QColor("#abcdef"))
+                assert modes == []
+        finally:
+            instant_theme.mode_changed.disconnect(modes.append)
+
+        assert modes == [target]
+        assert instant_theme.get_theme_version() == version + 1
+
+    def test_unchanged_custom_color_does_not_notify(self, app_instance, instant_theme):
+        instant_theme.set_custom_color("brand_same", QColor("#101010"))
+        version = instant_theme.get_theme_version()
+        instant_theme.set_custom_color("brand_same", QColor("#101010"))
+        assert instant_theme.get_theme_version() == version
+
+
+class TestThemeAwareWidgetDeduplication:
+    def test_rethemes_once_per_mode_switch(self, qtbot, app_instance, instant_theme, other_mode):
+        widget = CountingWidget()
+        qtbot.addWidget(widget)
+        widget.show()
+        applied = widget.applied
+
+        instant_theme.set_theme_mode(other_mode(instant_theme))
+
+        assert widget.applied == applied + 1
+
+
+class TestCoalescedTransition:
+    def test_rapid_changes_fade_once_after_one_notification(self, qtbot, fading_theme, other_mode):
+        window = CountingWidget()
+        qtbot.addWidget(window)
+        window.resize(200, 100)
+        window.show()
+        qtbot.waitExposed(window)
+        applied = window.applied
+        emitted = []
+        fading_theme.theme_changed.connect(emitted.append)
+        try:
+            with qtbot.waitSignal(fading_theme.theme_changed):
+                fading_theme.set_theme_mode(other_mode(fading_theme))
+                snapshots = fading_theme._transition_snapshots
+                fading_theme.set_custom_color("brand_fade", QColor("#123456"))
+                # One snapshot of the appearance before the first change
+                assert fading_theme._transition_snapshots is snapshots
+                assert len(snapshots) == 1
+                assert emitted == []
+                assert not ThemeCrossFadeOverlay.overlays(window)
+            assert len(ThemeCrossFadeOverlay.overlays(window)) == 1
+            qtbot.wait(100)
+        finally:
+            fading_theme.theme_changed.disconnect(emitted.append)
+
+        assert len(emitted) == 1
+        assert window.applied == applied + 1
@@ -0,0 +1,73 @@
+import pytest
+from PySide6.QtWidgets import QApplication, QPushButton
+
+from core.theme import get_theme_manager
+from core.theme_compiler import (
+    STYLE_CLASS_PROPERTY,
+    FluentStyleSheetCompiler,
+    apply_style_class
+)
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class TestFluentStyleSheetCompiler:
+    def test_compiles_builtin_styles_from_tokens(self, app_instance):
+        compiler = FluentStyleSheetCompiler()
+        compiled = compiler.compile()
+
+        assert f'QPushButton[{STYLE_CLASS_PROPERTY}="button"]' in compiled
+        assert get_theme_manager().get_color("primary").name() in compiled
+        assert "$" not in compiled
+        assert compiler.compile() is compiled
+
+    def test_registered_and_object_styles(self, app_instance):
+        compiler = FluentStyleSheetCompiler()
+        compiler.register_style("chip", "$selector { color: $text_primary; }")
+        compiler.register_object_style("statusBar", "$selector { border-color: $border; }")
+        compiled = compiler.compile()
+
+        tokens = get_theme_manager().get_style_tokens()
+        assert f'*[{STYLE_CLASS_PROPERTY}="chip"] {{ color: {tokens["text_primary"]}; }}' in compiled
+        assert f'#statusBar {{ border-color: {tokens["border"]}; }}' in compiled
+        assert compiler.has_style("chip")
+
+        compiler.unregister_style("chip")
+        assert not compiler.has_style("chip")
+        assert "chip" not in compiler.compile()
+
+    def test_install_follows_theme_changes(self, app_instance, instant_theme, other_mode):
+        app_instance.setStyleSheet("QLabel { color: red; }")
+        compiler = FluentStyleSheetCompiler()
+        compiler.set_base_style_sheet("QToolTip { border: none; }")
+        compiler.install()
+        try:
+            assert app_instance.styleSheet().startswith("QToolTip { border: none; }")
+
+            instant_theme.set_theme_mode(other_mode(instant_theme))
+            assert app_instance.styleSheet() == compiler.compile()
+            assert instant_theme.get_color("surface").name() in app_instance.styleSheet()
+        finally:
+            compiler.uninstall()
+
+        assert not compiler.is_installed()
+        assert app_instance.styleSheet() == "QLabel { color: red; }"
+        app_instance.setStyleSheet("")
+
+
+class TestApplyStyleClass:
+    def test_replaces_instance_style_sheet(self, qtbot, app_instance):
+        button = QPushButton("Save")
+        qtbot.addWidget(button)
+        button.setStyleSheet("QPushButton { color: red; }")
+
+        apply_style_class(button, "button")
+
+        assert button.styleSheet() == ""
+        assert button.property(STYLE_CLASS_PROPERTY) == "button"
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+from core.theme import COMPONENT_STYLE_TEMPLATES, ThemeMode, get_theme_manager
+from core.theme_precompile import CACHE_PATH_ENV, ThemeStyleCache, default_cache_path
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def cached_theme(tmp_path, app_instance):
+    theme = get_theme_manager()
+    theme.set_style_cache_path(str(tmp_path / "theme_cache.json"))
+    theme._style_cache.clear()
+    yield theme
+    theme.set_style_cache_path(None)
+    theme._style_cache.clear()
+
+
+def _reload(theme):
+    """Start over from the cache file, like a new process would"""
+    theme.set_style_cache_path(theme.style_cache().path())
+    theme._style_cache.clear()
+
+
+class TestThemeStyleCache:
+    def test_precompile_writes_all_modes(self, cached_theme):
+        compiled = cached_theme.precompile_styles()
+
+        assert compiled == len(ThemeMode) * len(COMPONENT_STYLE_TEMPLATES)
+        with open(cached_theme.style_cache().path()) as file:
+            data = json.load(file)
+        assert len(data["variants"]) == len(ThemeMode)
+        current = data["variants"][cached_theme._get_variant_key()]
+        assert current["styles"]["component:button"] == \
+            cached_theme._generate_component_style("button")
+        assert current["tokens"]["overlay"] == cached_theme.token("overlay").qss
+
+    def test_cold_start_skips_generation(self, cached_theme, monkeypatch):
+        expected = cached_theme.get_style_sheet("card")
+        cached_theme.save_style_cache()
+        _reload(cached_theme)
+
+        def fail(component_type):
+            raise AssertionError("style was regenerated")
+
+        monkeypatch.setattr(cached_theme, "_generate_component_style", fail)
+        assert cached_theme.get_style_sheet("card") == expected
+        assert cached_theme.style_cache().hits == 1
+
+    def test_component_styles_survive_cold_start(self, cached_theme):
+        from core.style_cache import FluentStyleCache
+
+        generated = []
+
+        def generate():
+            generated.append(True)
+            return "QFrame { border: none; }"
+
+        assert FluentStyleCache().get_style("panels:test", generate) == generate()
+        cached_theme.save_style_cache()
+        _reload(cached_theme)
+        generated.clear()
+
+        assert FluentStyleCache().get_style("panels:test", generate) == "QFrame { border: none; }"
+        assert generated == []
+
+    def test_changed_sources_invalidate_file(self, cached_theme):
+        cached_theme.precompile_styles()
+        path = cached_theme.style_cache().path()
+
+        cache = ThemeStyleCache(path, "other-hash")
+        assert not cache.load()
+        assert cache.get_style(cached_theme._get_variant_key(), "component:card") is None
+
+    def test_custom_colors_are_a_separate_variant(self, cached_theme):
+        key = cached_theme._get_variant_key()
+        cached_theme.set_custom_color("brand_precompile", QColor("#224466"))
+
+        assert cached_theme._get_variant_key() != key
+        assert cached_theme.get_style_tokens()["brand_precompile"] == "#224466"
+
+    def test_saves_once_after_changes(self, cached_theme):
+        cached_theme.get_style_sheet("panel")
+        assert cached_theme.style_cache().is_dirty()
+
+        assert cached_theme.save_style_cache()
+        assert not cached_theme.save_style_cache()
+
+    def test_environment_names_default_path(self, monkeypatch, tmp_path):
+        path = str(tmp_path / "other_cache.json")
+        monkeypatch.setenv(CACHE_PATH_ENV, path)
+        assert default_cache_path() == path
+
+        monkeypatch.delenv(CACHE_PATH_ENV)
+        assert default_cache_path() != path
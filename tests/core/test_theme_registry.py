@@ -0,0 +1,89 @@
+import gc
+
+import pytest
+import shiboken6
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+from core.theme import get_theme_manager
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class ThemedWidget(QWidget):
+    """Minimal scheduled component"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        get_theme_manager().register_component(self, scheduled=True)
+
+    def _on_theme_changed(self):
+        pass
+
+
+def _delete_now(app, widget):
+    widget.deleteLater()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+class TestComponentRegistry:
+    def test_deleted_widgets_leave_registry(self, app_instance):
+        theme = get_theme_manager()
+        registered = theme.get_registry_stats()["registered"]
+        parent = QWidget()
+        children = [ThemedWidget(parent) for _ in range(10)]
+        assert theme.get_registry_stats()["registered"] == registered + 10
+
+        del children
+        _delete_now(app_instance, parent)
+
+        assert theme.get_registry_stats()["registered"] == registered
+
+    def test_compaction_drops_leaked_entries(self, app_instance):
+        theme = get_theme_manager()
+        widget = ThemedWidget()
+        before = theme.get_registry_stats()
+
+        # The Python reference outlives the C++ widget
+        shiboken6.delete(widget)
+        assert not shiboken6.isValid(widget)
+        stats = theme.get_registry_stats()
+        assert stats["leaked"] == before["leaked"] + 1
+        assert stats["live"] == before["live"] - 1
+
+        assert theme.compact_registry() >= 1
+        stats = theme.get_registry_stats()
+        assert stats["leaked"] == 0
+        assert stats["registered"] == before["registered"] - before["leaked"] - 1
+        assert stats["compacted"] >= 1
+
+    def test_soak_100k_widgets_keeps_memory_flat(self, app_instance):
+        theme = get_theme_manager()
+
+        def cycle():
+            parent = QWidget()
+            for _ in range(1000):
+                ThemedWidget(parent)
+            _delete_now(app_instance, parent)
+
+        for _ in range(5):
+            cycle()
+        gc.collect()
+        registered = theme.get_registry_stats()["registered"]
+        objects = len(gc.get_objects())
+
+        for _ in range(100):
+            cycle()
+        gc.collect()
+
+        stats = theme.get_registry_stats()
+        assert stats["registered"] == registered
+        assert stats["leaked"] == 0
+        assert stats["queued"] <= registered
+        assert len(gc.get_objects()) - objects < 1000
@@ -0,0 +1,151 @@
+import pytest
+from PySide6.QtWidgets import QApplication, QStackedWidget
+
+from components.layout.layout_base import FluentLayoutBase
+from core.base import FluentBaseWidget
+from core.enhanced_base import FluentPanel
+from core.theme_integration import ThemeAwareWidget
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class CountingWidget(ThemeAwareWidget):
+    def __init__(self, parent=None):
+        self.applied = 0
+        super().__init__(parent)
+
+    def _apply_theme_styles(self):
+        self.applied += 1
+
+
+class CountingBaseWidget(FluentBaseWidget):
+    def __init__(self, parent=None):
+        self.applied = 0
+        super().__init__(parent)
+
+    def _on_theme_changed(self):
+        self.applied += 1
+
+
+@pytest.fixture
+def pages(qtbot, app_instance):
+    """Stacked widget with a visible and a hidden page of themed widgets"""
+    stack = QStackedWidget()
+    qtbot.addWidget(stack)
+    visible_page = CountingWidget()
+    hidden_page = CountingWidget()
+    stack.addWidget(visible_page)
+    stack.addWidget(hidden_page)
+    visible = [CountingWidget(visible_page) for _ in range(3)]
+    hidden = [CountingWidget(hidden_page) for _ in range(3)]
+    stack.show()
+    assert not hidden_page.isVisible()
+    return stack, visible, hidden
+
+
+class TestVisibilityAwareTheming:
+    def test_visible_widgets_rethemed_immediately(self, pages, instant_theme, other_mode):
+        stack, visible, hidden = pages
+        applied = [widget.applied for widget in visible + hidden]
+
+        instant_theme.set_theme_mode(other_mode(instant_theme))
+
+        assert [w.applied for w in visible] == [n + 1 for n in applied[:3]]
+        assert [w.applied for w in hidden] == applied[3:]
+        assert instant_theme.pending_theme_updates() >= len(hidden)
+
+    def test_hidden_widgets_rethemed_on_show(self, pages, instant_theme, other_mode):
+        stack, visible, hidden = pages
+        applied = [widget.applied for widget in hidden]
+        instant_theme.set_theme_mode(other_mode(instant_theme))
+
+        stack.setCurrentIndex(1)
+
+        assert [w.applied for w in hidden] == [n + 1 for n in applied]
+        # The queued updates are now no-ops for the shown widgets
+        instant_theme.flush_theme_updates()
+        assert [w.applied for w in hidden] == [n + 1 for n in applied]
+
+    def test_hidden_widgets_rethemed_in_slices(self, qtbot, pages, instant_theme, other_mode):
+        stack, visible, hidden = pages
+        applied = [widget.applied for widget in hidden]
+
+        instant_theme.set_theme_mode(other_mode(instant_theme))
+
+        qtbot.waitUntil(lambda: instant_theme.pending_theme_updates() == 0)
+        assert [w.applied for w in hidden] == [n + 1 for n in applied]
+
+    def test_repeated_switches_queue_once(self, pages, instant_theme, other_mode):
+        stack, visible, hidden = pages
+        applied = [widget.applied for widget in hidden]
+
+        instant_theme.set_theme_mode(other_mode(instant_theme))
+        instant_theme.set_theme_mode(other_mode(instant_theme))
+        instant_theme.flush_theme_updates()
+
+        assert [w.applied for w in hidden] == [n + 1 for n in applied]
+        assert instant_theme.pending_theme_updates() == 0
+
+    def test_transition_signals_forwarded_to_listeners(self, qtbot, app_instance, instant_theme, other_mode):
+        widget = CountingWidget()
+        qtbot.addWidget(widget)
+        finished = []
+        widget.transition_finished.connect(lambda: finished.append(True))
+
+        instant_theme.set_theme_mode(other_mode(instant_theme))
+
+        assert finished == [True]
+
+
+class TestFluentBaseWidgetScheduling:
+    def test_rethemed_once_per_switch(self, qtbot, app_instance, instant_theme, other_mode):
+        stack = QStackedWidget()
+        qtbot.addWidget(stack)
+        visible = CountingBaseWidget()
+        hidden = CountingBaseWidget()
+        stack.addWidget(visible)
+        stack.addWidget(hidden)
+        stack.show()
+
+        instant_theme.set_theme_mode(other_mode(instant_theme))
+        assert visible.applied == 1
+        assert hidden.applied == 0
+
+        stack.setCurrentWidget(hidden)
+        assert hidden.applied == 1
+        instant_theme.flush_theme_updates()
+        assert (visible.applied, hidden.applied) == (1, 1)
+
+    def test_restyled_components_follow_the_scheduler(self, qtbot, app_instance, instant_theme,
+                                                       other_mode, monkeypatch):
+        calls = []
+        monkeypatch.setattr(FluentPanel, "_apply_styling",
+                            lambda self: calls.append(self.objectName()))
+        monkeypatch.setattr(FluentLayoutBase, "_apply_layout_theme",
+                            lambda self: calls.append(self.objectName()))
+        layout = FluentLayoutBase()
+        layout.setObjectName("layout")
+        qtbot.addWidget(layout)
+        layout.show()
+        stack = QStackedWidget()
+        qtbot.addWidget(stack)
+        for name in ("panel", "hidden"):
+            panel = FluentPanel(name)
+            panel.setObjectName(name)
+            stack.addWidget(panel)
+        stack.show()
+        calls.clear()
+
+        instant_theme.set_theme_mode(other_mode(instant_theme))
+        assert sorted(calls) == ["layout", "panel"]
+
+        stack.setCurrentIndex(1)
+        assert sorted(calls) == ["hidden", "layout", "panel"]
+        instant_theme.flush_theme_updates()
+        assert sorted(calls) == ["hidden", "layout", "panel"]
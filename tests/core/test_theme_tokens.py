@@ -0,0 +1,60 @@
+import pytest
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class TestColorTokens:
+    def test_tokens_are_shared(self, instant_theme):
+        token = instant_theme.token("primary")
+        assert instant_theme.token("primary") is token
+        assert instant_theme.tokens() is instant_theme.tokens()
+        assert instant_theme.tokens().pen("primary") is token.pen
+        assert instant_theme.tokens().color("primary") is token.color
+
+    def test_token_matches_get_color(self, instant_theme):
+        tokens = instant_theme.tokens()
+        for name in ("primary", "surface", "border", "text_primary"):
+            color = instant_theme.get_color(name)
+            assert tokens.color(name) == color
+            assert tokens.hex(name) == color.name()
+            assert tokens.pen(name).color() == color
+            assert tokens.brush(name).color() == color
+
+    def test_translucent_token_qss(self, instant_theme):
+        token = instant_theme.token("overlay")
+        assert token.color.alpha() < 255
+        assert token.qss.startswith("rgba(")
+        assert instant_theme.get_style_tokens()["overlay"] == token.qss
+
+    def test_unknown_name_falls_back_to_black(self, instant_theme):
+        tokens = instant_theme.tokens()
+        assert tokens.color("no_such_color") == QColor("#000000")
+        assert "no_such_color" not in tokens
+
+    def test_snapshot_replaced_on_theme_change(self, instant_theme, other_mode):
+        tokens = instant_theme.tokens()
+        token = instant_theme.token("background")
+
+        instant_theme.set_theme_mode(other_mode(instant_theme))
+
+        assert instant_theme.tokens() is not tokens
+        assert instant_theme.tokens().version > tokens.version
+        assert instant_theme.token("background") is not token
+        assert instant_theme.tokens().color("background") != token.color
+
+    def test_custom_color_replaces_snapshot(self, instant_theme):
+        tokens = instant_theme.tokens()
+
+        instant_theme.set_custom_color("brand_token", QColor("#123456"))
+
+        assert instant_theme.tokens() is not tokens
+        assert instant_theme.tokens().hex("brand_token") == "#123456"
+        assert instant_theme.token("brand_token").qss == "#123456"
@@ -0,0 +1,75 @@
+import pytest
+from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget
+
+from core.theme_integration import ThemeAwareWidget
+from core.theme_transition import ThemeCrossFadeOverlay
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def app_instance():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class CountingWidget(ThemeAwareWidget):
+    def __init__(self, parent=None):
+        self.applied = 0
+        super().__init__(parent)
+
+    def _apply_theme_styles(self):
+        self.applied += 1
+
+
+@pytest.fixture
+def window(qtbot, app_instance):
+    window = QWidget()
+    qtbot.addWidget(window)
+    layout = QVBoxLayout(window)
+    widgets = [CountingWidget() for _ in range(50)]
+    for widget in widgets:
+        layout.addWidget(widget)
+    window.resize(200, 400)
+    window.show()
+    qtbot.waitExposed(window)
+    return window, widgets
+
+
+class TestWindowCrossFade:
+    def test_one_overlay_per_window(self, qtbot, window, fading_theme, other_mode):
+        window, widgets = window
+
+        with qtbot.waitSignal(fading_theme.theme_changed):
+            fading_theme.set_theme_mode(other_mode(fading_theme))
+
+        assert len(ThemeCrossFadeOverlay.overlays(window)) == 1
+
+    def test_components_restyle_without_own_animations(self, qtbot, window, fading_theme, other_mode):
+        window, widgets = window
+        applied = [widget.applied for widget in widgets]
+
+        with qtbot.waitSignal(fading_theme.theme_changed):
+            fading_theme.set_theme_mode(other_mode(fading_theme))
+
+        assert [w.applied for w in widgets] == [n + 1 for n in applied]
+        assert all(fading_theme._registered_components[w].animations == {}
+                   for w in widgets)
+
+    def test_overlay_removed_after_fade(self, qtbot, window, fading_theme, other_mode):
+        window, widgets = window
+
+        with qtbot.waitSignal(fading_theme.theme_changed):
+            fading_theme.set_theme_mode(other_mode(fading_theme))
+        assert ThemeCrossFadeOverlay.overlays(window)
+
+        qtbot.waitUntil(lambda: not ThemeCrossFadeOverlay.overlays(window))
+
+    def test_rapid_switches_share_one_overlay(self, qtbot, window, fading_theme, other_mode):
+        window, widgets = window
+
+        with qtbot.waitSignal(fading_theme.theme_changed):
+            fading_theme.set_theme_mode(other_mode(fading_theme))
+            fading_theme.set_theme_mode(other_mode(fading_theme))
+
+        assert len(ThemeCrossFadeOverlay.overlays(window)) == 1
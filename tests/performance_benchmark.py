@@ -1,467 +1,521 @@
 #!/usr/bin/env python3
 """
-Performance Benchmark for Fluent UI Components
+Performance Benchmark Suite for Fluent UI Components
 
-This module provides comprehensive performance benchmarks for all Fluent UI components
-to ensure optimal performance in enterprise scenarios.
+Times construction, painting, theme switching, filtering and sorting, layout
+and chart rendering of the major components under offscreen Qt. Every
+benchmark gets warmup runs and repeated samples, and the results (min, median,
+mean, standard deviation and 95th percentile per operation) can be written as
+JSON and checked against a baseline:
+
+    python tests/performance_benchmark.py --output baseline.json
+    python tests/performance_benchmark.py --baseline baseline.json --check
 """
 
-import sys
+import argparse
+import fnmatch
+import gc
+import importlib
+import json
+import math
 import os
+import platform
+import statistics
+import sys
 import time
-import psutil
-import gc
-from typing import Dict, List, Any, Callable
-from PySide6.QtWidgets import QApplication, QWidget, QMainWindow
-from PySide6.QtCore import QTimer, QThread, Signal
-
-# Add the project root to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-
-# Import all component modules
-try:
-    from components.data.charts import (
-        FluentProgressRing, FluentBarChart, FluentLineChart, FluentPieChart
-    )
-    from components.data.entry import (
-        FluentMaskedLineEdit, FluentAutoCompleteEdit, FluentRichTextEditor,
-        FluentDateTimePicker, FluentSlider, FluentFileSelector
-    )
-    from components.data.tree import (
-        FluentTreeWidget, FluentHierarchicalView, FluentOrgChart
-    )
-    from components.data.status import (
-        FluentStatusIndicator, FluentProgressTracker, FluentNotification,
-        FluentNotificationManager, FluentBadge
-    )
-    from components.layout.containers import (
-        FluentCard, FluentExpander, FluentSplitter, FluentTabWidget,
-        FluentInfoBar, FluentPivot
-    )
-    from components.media.players import (
-        FluentImageViewer, FluentMediaPlayer, FluentRichContentViewer,
-        FluentThumbnailGallery
-    )
-    from components.command.bars import (
-        FluentCommandBar, FluentToolbar, FluentRibbon,
-        FluentQuickAccessToolbar
-    )
-    COMPONENTS_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Could not import all components: {e}")
-    COMPONENTS_AVAILABLE = False
-
-
-class BenchmarkResult:
-    """Container for benchmark results"""
-    
-    def __init__(self, name: str):
-        self.name = name
-        self.execution_times: List[float] = []
-        self.memory_usage: List[float] = []
-        self.cpu_usage: List[float] = []
-        self.errors: List[str] = []
-    
-    def add_measurement(self, execution_time: float, memory_mb: float, cpu_percent: float):
-        """Add a measurement to the benchmark"""
-        self.execution_times.append(execution_time)
-        self.memory_usage.append(memory_mb)
-        self.cpu_usage.append(cpu_percent)
-    
-    def add_error(self, error: str):
-        """Add an error to the benchmark"""
-        self.errors.append(error)
-    
-    def get_average_execution_time(self) -> float:
-        """Get average execution time in seconds"""
-        return sum(self.execution_times) / len(self.execution_times) if self.execution_times else 0
-    
-    def get_max_execution_time(self) -> float:
-        """Get maximum execution time in seconds"""
-        return max(self.execution_times) if self.execution_times else 0
-    
-    def get_average_memory_usage(self) -> float:
-        """Get average memory usage in MB"""
-        return sum(self.memory_usage) / len(self.memory_usage) if self.memory_usage else 0
-    
-    def get_max_memory_usage(self) -> float:
-        """Get maximum memory usage in MB"""
-        return max(self.memory_usage) if self.memory_usage else 0
-    
-    def get_average_cpu_usage(self) -> float:
-        """Get average CPU usage percentage"""
-        return sum(self.cpu_usage) / len(self.cpu_usage) if self.cpu_usage else 0
-    
-    def has_errors(self) -> bool:
-        """Check if benchmark has errors"""
-        return len(self.errors) > 0
-    
-    def get_summary(self) -> str:
-        """Get a summary of the benchmark results"""
-        if self.has_errors():
-            return f"{self.name}: FAILED - {len(self.errors)} errors"
-        
-        avg_time = self.get_average_execution_time() * 1000  # Convert to ms
-        max_time = self.get_max_execution_time() * 1000
-        avg_memory = self.get_average_memory_usage()
-        max_memory = self.get_max_memory_usage()
-        avg_cpu = self.get_average_cpu_usage()
-        
-        return (f"{self.name}: "
-                f"Avg: {avg_time:.2f}ms, Max: {max_time:.2f}ms, "
-                f"Memory: {avg_memory:.1f}MB (max: {max_memory:.1f}MB), "
-                f"CPU: {avg_cpu:.1f}%")
-
-
-class PerformanceBenchmark:
-    """Performance benchmark runner for Fluent UI components"""
-    
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import __version__ as PYSIDE_VERSION
+from PySide6.QtCore import QEvent, QSize, qVersion
+from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QApplication, QPushButton, QVBoxLayout, QWidget
+
+# Add the project root to the path, ahead of the tests' own components and
+# core packages
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+RESULTS_FORMAT_VERSION = 1
+
+# A sample repeats the operation until it takes at least this long
+MIN_SAMPLE_MS = 5.0
+MAX_NUMBER = 1000
+
+# name -> (module, constructor arguments) of the components every group covers
+COMPONENTS: Dict[str, Tuple[str, tuple]] = {
+    "FluentButton": ("components.basic.forms.button", ("Button",)),
+    "FluentLineEdit": ("components.basic.forms.textbox", ()),
+    "FluentCheckBox": ("components.basic.forms.checkbox", ("Check",)),
+    "FluentComboBox": ("components.basic.forms.combobox", ()),
+    "FluentSwitch": ("components.basic.forms.switch", ()),
+    "FluentSlider": ("components.basic.forms.slider", ()),
+    "FluentCard": ("components.basic.display.card", ()),
+    "FluentBadge": ("components.basic.display.badge", ()),
+    "FluentProgressRing": ("components.basic.display.loading", ()),
+    "FluentAvatar": ("components.basic.visual.avatar", ()),
+    "FluentPagination": ("components.basic.navigation.pagination", ()),
+    "FluentTabWidget": ("components.basic.navigation.tabs", ()),
+    "FluentTableWidget": ("components.data.display.table", ()),
+    "FluentDataGrid": ("components.data.display.table", ()),
+    "FluentTreeWidget": ("components.data.display.tree", ()),
+    "FluentSettingsPanel": ("components.composite.containers.panels", ()),
+    "FluentPropertiesEditor": ("components.composite.containers.panels", ()),
+    "FluentCommandPalette": ("components.interface.command.menus", ()),
+    "FluentNavigationView": ("components.interface.navigation.navigationview", ()),
+}
+
+CHARTS: Dict[str, str] = {
+    "FluentSimpleBarChart": "components.data.charts.charts",
+    "FluentSimpleLineChart": "components.data.charts.charts",
+    "FluentSimplePieChart": "components.data.charts.charts",
+    "FluentGaugeChart": "components.data.charts.charts",
+    "FluentAreaChart": "components.data.charts.advanced_charts",
+    "FluentScatterChart": "components.data.charts.advanced_charts",
+    "FluentHeatMap": "components.data.charts.advanced_charts",
+}
+
+# A setup function returns the operation to time, or yields it and cleans up
+# after the yield
+Setup = Callable[[], Any]
+BENCHMARKS: Dict[str, Setup] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function under a "group/subject" name"""
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def component(name: str, module: str):
+    return getattr(importlib.import_module(module), name)
+
+
+def create(name: str) -> QWidget:
+    module, args = COMPONENTS[name]
+    return component(name, module)(*args)
+
+
+def dispose(*widgets):
+    for widget in widgets:
+        if isinstance(widget, QWidget):
+            widget.close()
+            widget.deleteLater()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def render(widget: QWidget, image: QImage):
+    widget.render(image)
+
+
+def show_sized(widget: QWidget, size: QSize) -> QImage:
+    """Show widget at size, and get an image to render it into"""
+    widget.resize(widget.sizeHint().expandedTo(size))
+    widget.show()
+    app.processEvents()
+    return QImage(widget.size(), QImage.Format.Format_ARGB32_Premultiplied)
+
+
+def cycle(values: list) -> Callable[[], Any]:
+    state = {"index": -1}
+
+    def next_value():
+        state["index"] = (state["index"] + 1) % len(values)
+        return values[state["index"]]
+    return next_value
+
+
+# Construction and paint of every major component
+
+def _register_component(name: str):
+    @benchmark(f"construct/{name}")
+    def construct():
+        widgets = []
+        yield lambda: widgets.append(create(name))
+        dispose(*widgets)
+
+    @benchmark(f"paint/{name}")
+    def paint():
+        widget = create(name)
+        image = show_sized(widget, QSize(320, 200))
+        yield lambda: render(widget, image)
+        dispose(widget)
+
+
+for _name in COMPONENTS:
+    _register_component(_name)
+
+
+# Theme switch
+
+@benchmark("theme/switch")
+def theme_switch():
+    from core.theme import ThemeMode, get_theme_manager
+    theme = get_theme_manager()
+    original = theme.get_theme_mode()
+
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    for name in COMPONENTS:
+        try:
+            layout.addWidget(create(name))
+        except Exception:
+            # A broken component is reported by its construct benchmark
+            pass
+    window.resize(1200, 2400)
+    window.show()
+    app.processEvents()
+
+    def switch():
+        dark = theme.get_theme_mode() != ThemeMode.DARK
+        theme.set_theme_mode(ThemeMode.DARK if dark else ThemeMode.LIGHT)
+        app.processEvents()
+
+    yield switch
+    theme.set_theme_mode(original)
+    app.processEvents()
+    dispose(window)
+
+
+# Filter and sort
+
+ROWS = 2000
+
+
+def _table_rows(count: int) -> List[List[str]]:
+    return [[f"Item {i}", f"{(i * 7919) % 1000}", f"Group {i % 17}", f"{i % 2 == 0}",
+             f"note {i * 31 % 97}"] for i in range(count)]
+
+
+@benchmark("sort/FluentTableWidget")
+def table_sort():
+    from components.data.display.table import FluentTableWidget, SortOrder
+    table = FluentTableWidget()
+    table.set_headers(["Name", "Value", "Group", "Flag", "Note"])
+    rows = _table_rows(ROWS)
+    table.add_data_rows(rows, list(range(len(rows))))
+    show_sized(table, QSize(800, 600))
+    orders = cycle([(1, SortOrder.ASCENDING), (1, SortOrder.DESCENDING),
+                    (0, SortOrder.ASCENDING), (2, SortOrder.DESCENDING)])
+    yield lambda: table.sort_by_column(*orders())
+    dispose(table)
+
+
+@benchmark("filter/FluentDataGrid")
+def grid_filter():
+    grid = create("FluentDataGrid")
+    grid.set_data(["Name", "Value", "Group", "Flag", "Note"], _table_rows(ROWS))
+    show_sized(grid, QSize(800, 600))
+    queries = cycle(["item 1", "group 3", "", "note 9", ""])
+    yield lambda: grid._filter_data(queries())
+    dispose(grid)
+
+
+@benchmark("filter/FluentTreeWidget")
+def tree_filter():
+    tree = create("FluentTreeWidget")
+    for i in range(200):
+        tree.addTopLevelItemFromDict({
+            "text": f"Folder {i}",
+            "children": [{"text": f"File {i}.{j}"} for j in range(10)],
+        })
+    show_sized(tree, QSize(400, 600))
+    queries = cycle(["file 1", "folder 42", "", ".7", ""])
+
+    def filter_items():
+        # What the debounced setSearchText() ends up running
+        tree._search_text = queries()
+        tree._filter_items()
+
+    yield filter_items
+    dispose(tree)
+
+
+@benchmark("filter/FluentCommandPalette")
+def palette_filter():
+    palette = create("FluentCommandPalette")
+    for i in range(300):
+        palette.add_command(f"command.{i}", f"Command {i}", f"Runs action {i * 13 % 50}",
+                            f"Category {i % 12}")
+    show_sized(palette, QSize(500, 400))
+    queries = cycle(["command 1", "action 7", "", "category 3", ""])
+    yield lambda: palette.filter_commands(queries())
+    dispose(palette)
+
+
+# Layout
+
+ITEMS = 120
+
+
+def _relayout(container: QWidget, sizes: Callable[[], QSize]):
+    container.resize(sizes())
+    if hasattr(container, "request_layout_update"):
+        container.request_layout_update()
+    if container.layout() is not None:
+        container.layout().activate()
+
+
+def _register_layout(name: str, module: str, add: Callable[[Any, QWidget], None]):
+    @benchmark(f"layout/{name}")
+    def layout():
+        container = component(name, module)()
+        if hasattr(container, "set_layout_animations_enabled"):
+            # Lay out at once instead of behind a throttling timer
+            container.set_layout_animations_enabled(False)
+        for i in range(ITEMS):
+            add(container, QPushButton(f"Item {i}"))
+        show_sized(container, QSize(800, 600))
+        sizes = cycle([QSize(1200, 800), QSize(640, 900), QSize(960, 700)])
+        yield lambda: _relayout(container, sizes)
+        dispose(container)
+
+
+_register_layout("FluentGrid", "components.layout.grid",
+                 lambda grid, widget: grid.add_item(widget))
+_register_layout("FluentFlexLayout", "components.layout.flex_layout",
+                 lambda flex, widget: flex.add_widget(widget))
+_register_layout("FluentUniformGrid", "components.layout.additional_layouts",
+                 lambda grid, widget: grid.add_widget(widget))
+_register_layout("FluentStackPanel", "components.layout.stack_panel",
+                 lambda stack, widget: stack.add_widget(widget))
+_register_layout("FluentWrapPanel", "components.layout.stack_panel",
+                 lambda wrap, widget: wrap.add_widget(widget))
+
+
+# Chart render
+
+def _chart_data(name: str, chart: QWidget):
+    if name == "FluentSimpleBarChart":
+        chart.setData([(f"Q{i}", (i * 37) % 100 + 5, None) for i in range(40)])
+    elif name == "FluentSimpleLineChart":
+        for series in range(3):
+            chart.addDataSeries(f"Series {series}",
+                                [(x, math.sin(x / 10 + series) * 50 + 50) for x in range(200)])
+    elif name == "FluentSimplePieChart":
+        chart.setData([(f"Slice {i}", i + 1, None) for i in range(12)])
+    elif name == "FluentGaugeChart":
+        chart.setValue(72, animate=False)
+    elif name == "FluentAreaChart":
+        for series in range(3):
+            chart.add_series(f"Series {series}",
+                             [(x, (x * 13 + series * 29) % 90 + 5) for x in range(100)])
+    elif name == "FluentScatterChart":
+        chart.set_data([{"x": (i * 7) % 100, "y": (i * 13) % 100, "size": 6,
+                         "color": QColor(0, 120, 212), "label": "", "data": None} for i in range(500)])
+    elif name == "FluentHeatMap":
+        chart.set_data([[(row * col) % 10 for col in range(30)] for row in range(30)])
+
+
+def _register_chart(name: str):
+    @benchmark(f"chart/{name}")
+    def chart_render():
+        chart = component(name, CHARTS[name])()
+        _chart_data(name, chart)
+        image = show_sized(chart, QSize(600, 400))
+        yield lambda: render(chart, image)
+        dispose(chart)
+
+
+for _name in CHARTS:
+    _register_chart(_name)
+
+
+# Runner
+
+class Stats(NamedTuple):
+    number: int  # operations per sample
+    samples_ms: List[float]  # time per operation of each sample
+    min_ms: float
+    median_ms: float
+    mean_ms: float
+    stdev_ms: float
+    p95_ms: float
+
+
+def summarize(number: int, samples_ms: List[float]) -> Stats:
+    ordered = sorted(samples_ms)
+    p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+    stdev = statistics.stdev(ordered) if len(ordered) > 1 else 0.0
+    return Stats(number, samples_ms, ordered[0], statistics.median(ordered),
+                 statistics.fmean(ordered), stdev, p95)
+
+
+def _time(operation: Callable[[], Any], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        operation()
+    return (time.perf_counter() - start) * 1000 / number
+
+
+class CallbackErrors:
+    """Collects exceptions raised in Qt event handlers and slots
+
+    Qt prints those and carries on, which would time a failing component as
+    if it worked.
+    """
+
     def __init__(self):
-        self.app = None
-        self.results: Dict[str, BenchmarkResult] = {}
-        self.widgets: List[QWidget] = []
-        
-    def setup(self):
-        """Setup the benchmark environment"""
-        if not QApplication.instance():
-            self.app = QApplication(sys.argv)
-        else:
-            self.app = QApplication.instance()
-        
-        # Force garbage collection before starting
-        gc.collect()
-    
-    def cleanup(self):
-        """Cleanup after benchmarks"""
-        for widget in self.widgets:
-            if widget and hasattr(widget, 'close'):
-                widget.close()
-        self.widgets.clear()
-        QApplication.processEvents()
-        gc.collect()
-    
-    def measure_performance(self, name: str, func: Callable, iterations: int = 10) -> BenchmarkResult:
-        """Measure performance of a function"""
-        result = BenchmarkResult(name)
-        
-        for i in range(iterations):
-            # Get initial memory and CPU
-            process = psutil.Process()
-            initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-            
-            try:
-                # Measure execution time
-                start_time = time.time()
-                func()
-                end_time = time.time()
-                
-                # Process events to ensure UI updates
-                QApplication.processEvents()
-                
-                # Get final memory and CPU
-                final_memory = process.memory_info().rss / 1024 / 1024  # MB
-                cpu_percent = process.cpu_percent()
-                
-                execution_time = end_time - start_time
-                memory_usage = final_memory - initial_memory
-                
-                result.add_measurement(execution_time, memory_usage, cpu_percent)
-                
-            except Exception as e:
-                result.add_error(f"Iteration {i}: {str(e)}")
-        
-        self.results[name] = result
-        return result
-    
-    def benchmark_component_creation(self):
-        """Benchmark component creation performance"""
-        if not COMPONENTS_AVAILABLE:
-            return
-        
-        component_classes = [
-            ("ProgressRing", FluentProgressRing),
-            ("BarChart", FluentBarChart),
-            ("LineChart", FluentLineChart),
-            ("PieChart", FluentPieChart),
-            ("MaskedLineEdit", FluentMaskedLineEdit),
-            ("AutoCompleteEdit", FluentAutoCompleteEdit),
-            ("RichTextEditor", FluentRichTextEditor),
-            ("DateTimePicker", FluentDateTimePicker),
-            ("Slider", FluentSlider),
-            ("FileSelector", FluentFileSelector),
-            ("TreeWidget", FluentTreeWidget),
-            ("StatusIndicator", FluentStatusIndicator),
-            ("ProgressTracker", FluentProgressTracker),
-            ("Badge", FluentBadge),
-            ("Card", FluentCard),
-            ("Expander", FluentExpander),
-            ("InfoBar", FluentInfoBar),
-            ("ImageViewer", FluentImageViewer),
-            ("RichContentViewer", FluentRichContentViewer),
-            ("CommandBar", FluentCommandBar),
-            ("Toolbar", FluentToolbar),
-            ("QuickAccessToolbar", FluentQuickAccessToolbar)
-        ]
-        
-        for name, component_class in component_classes:
-            def create_component():
-                try:
-                    if component_class == FluentSlider:
-                        widget = component_class(orientation=1)  # Qt.Horizontal
-                    elif component_class == FluentStatusIndicator:
-                        widget = component_class("info")
-                    elif component_class == FluentInfoBar:
-                        widget = component_class("info")
-                    else:
-                        widget = component_class()
-                    
-                    self.widgets.append(widget)
-                    return widget
-                except Exception as e:
-                    print(f"Error creating {name}: {e}")
-                    return None
-            
-            self.measure_performance(f"Create {name}", create_component, 5)
-    
-    def benchmark_data_operations(self):
-        """Benchmark data operations performance"""
-        if not COMPONENTS_AVAILABLE:
-            return
-        
-        # Benchmark Bar Chart with large dataset
-        bar_chart = FluentBarChart()
-        self.widgets.append(bar_chart)
-        
-        def set_large_bar_data():
-            data = [
-                {"label": f"Item {i}", "value": i * 10, "color": "#0078d4"}
-                for i in range(100)
-            ]
-            bar_chart.setData(data)
-        
-        self.measure_performance("BarChart Large Dataset", set_large_bar_data, 3)
-        
-        # Benchmark Line Chart with many points
-        line_chart = FluentLineChart()
-        self.widgets.append(line_chart)
-        
-        def set_large_line_data():
-            data = [{"x": i, "y": i * 2 + (i % 10)} for i in range(200)]
-            line_chart.setData(data)
-        
-        self.measure_performance("LineChart Large Dataset", set_large_line_data, 3)
-        
-        # Benchmark Tree Widget with many items
-        tree_widget = FluentTreeWidget()
-        self.widgets.append(tree_widget)
-        
-        def populate_large_tree():
-            tree_widget.clear()
-            for i in range(50):
-                parent = tree_widget.createItem([f"Parent {i}"])
-                tree_widget.addTopLevelItem(parent)
-                for j in range(10):
-                    child = tree_widget.createItem([f"Child {i}-{j}"])
-                    parent.addChild(child)
-        
-        self.measure_performance("TreeWidget Large Dataset", populate_large_tree, 3)
-    
-    def benchmark_ui_interactions(self):
-        """Benchmark UI interaction performance"""
-        if not COMPONENTS_AVAILABLE:
-            return
-        
-        # Benchmark Progress Ring updates
-        progress_ring = FluentProgressRing()
-        self.widgets.append(progress_ring)
-        
-        def update_progress():
-            for i in range(0, 101, 10):
-                progress_ring.setValue(i)
-                progress_ring.setText(f"{i}%")
-                QApplication.processEvents()
-        
-        self.measure_performance("ProgressRing Updates", update_progress, 5)
-        
-        # Benchmark Expander expand/collapse
-        expander = FluentExpander()
-        expander.setTitle("Test Expander")
-        expander_content = QWidget()
-        expander.setContent(expander_content)
-        self.widgets.append(expander)
-        
-        def toggle_expander():
-            for _ in range(10):
-                expander.setExpanded(True)
-                QApplication.processEvents()
-                expander.setExpanded(False)
-                QApplication.processEvents()
-        
-        self.measure_performance("Expander Toggle", toggle_expander, 3)
-        
-        # Benchmark Status Indicator animation
-        status_indicator = FluentStatusIndicator("info")
-        status_indicator.setAnimated(True)
-        self.widgets.append(status_indicator)
-        
-        def animate_status():
-            status_indicator.show()
-            # Let animation run for a bit
-            start_time = time.time()
-            while time.time() - start_time < 0.5:  # 500ms
-                QApplication.processEvents()
-        
-        self.measure_performance("StatusIndicator Animation", animate_status, 5)
-    
-    def benchmark_memory_usage(self):
-        """Benchmark memory usage patterns"""
-        if not COMPONENTS_AVAILABLE:
-            return
-        
-        def create_and_destroy_components():
-            temp_widgets = []
-            
-            # Create many components
-            for _ in range(20):
-                temp_widgets.extend([
-                    FluentProgressRing(),
-                    FluentMaskedLineEdit(),
-                    FluentCard(),
-                    FluentStatusIndicator("info")
-                ])
-            
-            # Process events
-            QApplication.processEvents()
-            
-            # Destroy components
-            for widget in temp_widgets:
-                if hasattr(widget, 'close'):
-                    widget.close()
-            
-            # Force garbage collection
-            del temp_widgets
+        self.errors: List[BaseException] = []
+
+    def __enter__(self):
+        self._excepthook = sys.excepthook
+        sys.excepthook = lambda kind, error, traceback: self.errors.append(error)
+        return self
+
+    def __exit__(self, kind, error, traceback):
+        sys.excepthook = self._excepthook
+        if error is None and self.errors:
+            first = self.errors[0]
+            raise RuntimeError(f"{len(self.errors)} error(s) in Qt callbacks, first "
+                               f"{type(first).__name__}: {first}")
+        return False
+
+
+def measure(setup: Setup, warmup: int, repeat: int) -> Stats:
+    """Run a benchmark: set up, warm up, then time repeat samples"""
+    with CallbackErrors():
+        return _measure(setup, warmup, repeat)
+
+
+def _measure(setup: Setup, warmup: int, repeat: int) -> Stats:
+    created = setup()
+    generator: Optional[Iterator] = created if hasattr(created, "__next__") else None
+    operation = next(generator) if generator is not None else created
+    try:
+        # Warmup also picks how often to run the operation per sample
+        first_ms = _time(operation, 1)
+        number = max(1, min(MAX_NUMBER, math.ceil(MIN_SAMPLE_MS / max(first_ms, 1e-3))))
+        for _ in range(max(0, warmup - 1)):
+            _time(operation, number)
+
+        samples = []
+        gc_enabled = gc.isenabled()
+        for _ in range(repeat):
             gc.collect()
-        
-        self.measure_performance("Memory Stress Test", create_and_destroy_components, 5)
-    
-    def run_all_benchmarks(self) -> Dict[str, BenchmarkResult]:
-        """Run all performance benchmarks"""
-        print("🚀 Starting Fluent UI Performance Benchmarks...\n")
-        
-        self.setup()
-        
+            gc.disable()
+            try:
+                samples.append(_time(operation, number))
+            finally:
+                if gc_enabled:
+                    gc.enable()
+            app.processEvents()
+        return summarize(number, samples)
+    finally:
+        if generator is not None:
+            next(generator, None)
+
+
+def run(patterns: List[str], warmup: int, repeat: int) -> Dict[str, Any]:
+    """Run the benchmarks whose names match one of patterns"""
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for name, setup in BENCHMARKS.items():
+        if patterns and not any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+            continue
         try:
-            print("📊 Benchmarking component creation...")
-            self.benchmark_component_creation()
-            self.cleanup()
-            
-            print("📈 Benchmarking data operations...")
-            self.benchmark_data_operations()
-            self.cleanup()
-            
-            print("🖱️ Benchmarking UI interactions...")
-            self.benchmark_ui_interactions()
-            self.cleanup()
-            
-            print("🧠 Benchmarking memory usage...")
-            self.benchmark_memory_usage()
-            self.cleanup()
-            
-        except Exception as e:
-            print(f"❌ Benchmark error: {e}")
-        
-        return self.results
-    
-    def print_results(self):
-        """Print benchmark results"""
-        print("\n" + "="*80)
-        print("🏆 FLUENT UI COMPONENT PERFORMANCE BENCHMARK RESULTS")
-        print("="*80)
-        
-        if not self.results:
-            print("❌ No benchmark results available.")
-            return
-        
-        # Group results by category
-        categories = {
-            "Component Creation": [k for k in self.results.keys() if k.startswith("Create")],
-            "Data Operations": [k for k in self.results.keys() if "Dataset" in k],
-            "UI Interactions": [k for k in self.results.keys() if k in ["ProgressRing Updates", "Expander Toggle", "StatusIndicator Animation"]],
-            "Memory Tests": [k for k in self.results.keys() if "Memory" in k]
-        }
-        
-        for category, result_names in categories.items():
-            if result_names:
-                print(f"\n📋 {category}:")
-                print("-" * 60)
-                
-                for name in result_names:
-                    if name in self.results:
-                        result = self.results[name]
-                        print(f"  {result.get_summary()}")
-                        
-                        if result.has_errors():
-                            print(f"    ⚠️ Errors: {len(result.errors)}")
-        
-        # Overall performance summary
-        print(f"\n📊 Overall Performance Summary:")
-        print("-" * 60)
-        
-        total_tests = len(self.results)
-        failed_tests = sum(1 for r in self.results.values() if r.has_errors())
-        passed_tests = total_tests - failed_tests
-        
-        print(f"  Total Tests: {total_tests}")
-        print(f"  Passed: {passed_tests}")
-        print(f"  Failed: {failed_tests}")
-        
-        if passed_tests > 0:
-            avg_times = [r.get_average_execution_time() * 1000 for r in self.results.values() if not r.has_errors()]
-            avg_memory = [r.get_average_memory_usage() for r in self.results.values() if not r.has_errors()]
-            
-            if avg_times:
-                print(f"  Average Execution Time: {sum(avg_times) / len(avg_times):.2f}ms")
-            if avg_memory:
-                print(f"  Average Memory Impact: {sum(avg_memory) / len(avg_memory):.2f}MB")
-        
-        # Performance recommendations
-        print(f"\n💡 Performance Recommendations:")
-        print("-" * 60)
-        
-        slow_operations = [
-            (name, result) for name, result in self.results.items()
-            if result.get_average_execution_time() > 0.1 and not result.has_errors()
-        ]
-        
-        if slow_operations:
-            print("  Consider optimizing these operations:")
-            for name, result in slow_operations:
-                print(f"    • {name}: {result.get_average_execution_time() * 1000:.2f}ms average")
-        else:
-            print("  ✅ All operations are performing well!")
-        
-        high_memory = [
-            (name, result) for name, result in self.results.items()
-            if result.get_average_memory_usage() > 10 and not result.has_errors()
-        ]
-        
-        if high_memory:
-            print("  Consider optimizing memory usage for:")
-            for name, result in high_memory:
-                print(f"    • {name}: {result.get_average_memory_usage():.1f}MB average")
+            stats = measure(setup, warmup, repeat)
+        except Exception as error:
+            errors[name] = f"{type(error).__name__}: {error}"
+            print(f"{name:<44} ERROR {errors[name]}")
+            continue
+        results[name] = stats._asdict()
+        print(f"{name:<44} {stats.median_ms:>9.3f} ms  min {stats.min_ms:>8.3f}  "
+              f"p95 {stats.p95_ms:>8.3f}  sd {stats.stdev_ms:>7.3f}  x{stats.number}")
+
+    return {
+        "format": RESULTS_FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": {
+            "python": sys.version.split()[0],
+            "pyside": PYSIDE_VERSION,
+            "qt": qVersion(),
+            "qpa": app.platformName(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "settings": {"warmup": warmup, "repeat": repeat, "min_sample_ms": MIN_SAMPLE_MS},
+        "results": results,
+        "errors": errors,
+    }
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline_ms: float
+    current_ms: float
+    change: float  # relative change of the median
+    regression: bool
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = 0.15, min_ms: float = 0.01) -> List[Comparison]:
+    """Compare the medians of benchmarks both result sets have
+
+    A benchmark regressed when its median grew by more than threshold (a
+    fraction) and by more than min_ms.
+    """
+    comparisons = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        old, new = base["median_ms"], result["median_ms"]
+        change = (new - old) / old if old else 0.0
+        comparisons.append(Comparison(name, old, new, change,
+                                      new - old > min_ms and change > threshold))
+    return comparisons
 
 
 def main():
-    """Main entry point for performance benchmarks"""
-    benchmark = PerformanceBenchmark()
-    
-    # Run all benchmarks
-    results = benchmark.run_all_benchmarks()
-    
-    # Print results
-    benchmark.print_results()
-    
-    print("\n🎯 Benchmark completed!")
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("patterns", nargs="*",
+                        help="benchmarks to run, as glob patterns (e.g. 'chart/*')")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    parser.add_argument("--warmup", type=int, default=3, help="warmup runs per benchmark")
+    parser.add_argument("--repeat", type=int, default=15, help="timed samples per benchmark")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=15.0,
+                        help="percent slowdown of a median that counts as a regression")
+    parser.add_argument("--check", action="store_true",
+                        help="exit with status 1 on regressions or benchmark errors")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(name for name in BENCHMARKS
+                        if not args.patterns
+                        or any(fnmatch.fnmatch(name, pattern) for pattern in args.patterns)))
+        return
+
+    print(f"offscreen benchmarks ({app.platformName()}), "
+          f"{args.warmup} warmup runs, {args.repeat} samples, median per operation")
+    current = run(args.patterns, args.warmup, args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(current, file, indent=2)
+        print(f"results written to {args.output}")
+
+    failed = bool(current["errors"])
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        comparisons = compare(baseline, current, args.threshold / 100)
+        regressions = [comparison for comparison in comparisons if comparison.regression]
+        print(f"\ncompared with {args.baseline}: {len(regressions)} regression(s)")
+        for comparison in sorted(comparisons, key=lambda comparison: -comparison.change):
+            if comparison.regression or abs(comparison.change) > args.threshold / 100:
+                flag = "  REGRESSION" if comparison.regression else ""
+                print(f"{comparison.name:<44} {comparison.baseline_ms:>9.3f} -> "
+                      f"{comparison.current_ms:>9.3f} ms {comparison.change:>+7.1%}{flag}")
+        failed = failed or bool(regressions)
+
+    if args.check and failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Startup Report Comparison for Fluent UI Components
+
+Compares two startup reports written with FLUENT_STARTUP_PROFILE and exits
+with status 1 when the new one is slower, so CI can catch startup regressions:
+
+    FLUENT_STARTUP_PROFILE=new.json python app.py
+    python tools/compare_startup.py base.json new.json
+"""
+
+import argparse
+import os
+import sys
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from core.startup_profile import compare_reports, load_report
+
+
+def _ms(value):
+    return "-" if value is None else f"{value:.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("old", help="baseline report")
+    parser.add_argument("new", help="report to check")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="percent slowdown that counts as a regression (default: 10)")
+    parser.add_argument("--min-ms", type=float, default=1.0,
+                        help="ignore slowdowns of at most this many ms (default: 1)")
+    parser.add_argument("--all", action="store_true",
+                        help="list every phase and class, not only changed ones")
+    args = parser.parse_args()
+
+    deltas = compare_reports(load_report(args.old), load_report(args.new),
+                             args.threshold / 100, args.min_ms)
+
+    print(f"{'section':<8} {'name':<48} {'old ms':>9} {'new ms':>9} {'change':>8}")
+    for delta in deltas:
+        old_ms, new_ms = delta.old_ms or 0.0, delta.new_ms or 0.0
+        if not (args.all or delta.regression or delta.section == "total"
+                or abs(new_ms - old_ms) > args.min_ms):
+            continue
+        change = f"{(new_ms - old_ms) / old_ms * 100:+.0f}%" if old_ms else "new"
+        flag = "  REGRESSION" if delta.regression else ""
+        print(f"{delta.section:<8} {delta.name:<48} {_ms(delta.old_ms):>9} "
+              f"{_ms(delta.new_ms):>9} {change:>8}{flag}")
+
+    regressions = [delta for delta in deltas if delta.regression]
+    if regressions:
+        print(f"{len(regressions)} startup regression(s)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
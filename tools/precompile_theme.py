@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Theme Precompiler for Fluent UI Components
+
+Compiles the theme tokens and component stylesheets of every theme mode into
+the on-disk style cache, so the first start of an application loads them with
+one read instead of generating them.
+"""
+
+import argparse
+import os
+import sys
+
+from PySide6.QtCore import QCoreApplication
+
+# Add the project root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from core.theme import get_theme_manager
+from core.theme_precompile import default_cache_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="cache file to write "
+                        "(default: the application's user cache directory)")
+    parser.add_argument("--app-name", help="application name the default "
+                        "cache directory is derived from")
+    parser.add_argument("--organization", help="organization name the "
+                        "default cache directory is derived from")
+    args = parser.parse_args()
+
+    if args.app_name:
+        QCoreApplication.setApplicationName(args.app_name)
+    if args.organization:
+        QCoreApplication.setOrganizationName(args.organization)
+
+    theme = get_theme_manager()
+    theme.set_style_cache_path(args.output or default_cache_path())
+    compiled = theme.precompile_styles()
+    print(f"Precompiled {compiled} stylesheets into {theme.style_cache().path()}")
+
+
+if __name__ == "__main__":
+    main()